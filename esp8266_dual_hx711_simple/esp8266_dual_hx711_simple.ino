@@ -30,6 +30,14 @@ HX711 scale_HL;  // Hinten Links
 HX711 scale_HR;  // Hinten Rechts
 ESP8266WebServer server(80);
 
+// Live-Stream (Server-Sent Events) - ersetzt das Abfragen von /live-values-data
+#define MAX_STREAM_CLIENTS 2
+const unsigned long STREAM_INTERVAL = 100;   // 10 Messwerte pro Sekunde
+const unsigned long STREAM_PING = 1000;      // Heartbeat, damit der Pi tote Verbindungen erkennt
+WiFiClient streamClients[MAX_STREAM_CLIENTS];
+unsigned long lastStreamSend = 0;
+unsigned long lastStreamPing = 0;
+
 void setup() {
   Serial.begin(115200);
   Serial.println("\nESP8266 Quad-HX711 Tester gestartet");
@@ -113,6 +121,7 @@ void setupWebServer() {
   server.on("/hardware-test", handleHardwareTest);
   server.on("/live-values", handleLiveValues);  // Neue Live-Werte Anzeige
   server.on("/live-values-data", handleLiveValuesData);  // JSON API für Live-Daten  // ECHTER Hardware-Test
+  server.on("/live-values-stream", handleLiveValuesStream);  // Dieselben Daten als Push-Stream (SSE)
 }
 
 void handleMainPage() {
@@ -695,6 +704,57 @@ void handleLiveValues() {
 }
 
 void handleLiveValuesData() {
+  server.sendHeader("Access-Control-Allow-Origin", "*");  // CORS für AJAX
+  server.send(200, "application/json", buildLiveValuesJson());
+}
+
+void handleLiveValuesStream() {
+  // Freien Platz suchen - die Verbindung bleibt offen, loop() schreibt hinein
+  for (int i = 0; i < MAX_STREAM_CLIENTS; i++) {
+    if (!streamClients[i] || !streamClients[i].connected()) {
+      streamClients[i] = server.client();
+      streamClients[i].setNoDelay(true);
+      streamClients[i].print("HTTP/1.1 200 OK\r\n"
+                             "Content-Type: text/event-stream\r\n"
+                             "Cache-Control: no-cache\r\n"
+                             "Connection: keep-alive\r\n"
+                             "Access-Control-Allow-Origin: *\r\n\r\n");
+      Serial.println("Live-Stream Client verbunden (Slot " + String(i) + ")");
+      return;
+    }
+  }
+  server.send(503, "text/plain", "Zu viele Live-Stream Clients");
+}
+
+void serviceLiveStreams() {
+  unsigned long now = millis();
+  bool sendData = now - lastStreamSend >= STREAM_INTERVAL;
+  bool sendPing = now - lastStreamPing >= STREAM_PING;
+  if (!sendData && !sendPing) return;
+  
+  bool anyClient = false;
+  for (int i = 0; i < MAX_STREAM_CLIENTS; i++) {
+    if (streamClients[i] && streamClients[i].connected()) {
+      anyClient = true;
+    } else if (streamClients[i]) {
+      streamClients[i].stop();
+      streamClients[i] = WiFiClient();
+    }
+  }
+  if (!anyClient) return;
+  
+  // Einmal messen, an alle Clients senden
+  String event = sendData ? "data: " + buildLiveValuesJson() + "\n\n" : ": ping\n\n";
+  for (int i = 0; i < MAX_STREAM_CLIENTS; i++) {
+    if (streamClients[i] && streamClients[i].connected()) {
+      streamClients[i].print(event);
+    }
+  }
+  if (sendData) lastStreamSend = now;
+  lastStreamPing = now;
+}
+
+String buildLiveValuesJson() {
   // VL Werte lesen
   bool vl_ready = scale_VL.is_ready();
   long vl_raw = 0;
@@ -736,8 +796,7 @@ void handleLiveValuesData() {
   json += "\"timestamp\":" + String(millis());
   json += "}";
   
-  server.sendHeader("Access-Control-Allow-Origin", "*");  // CORS für AJAX
-  server.send(200, "application/json", json);
+  return json;
 }
 
 bool testLoadCell(String name, bool hx711_present) {
@@ -836,6 +895,7 @@ bool testRealHX711(int dt_pin, int sck_pin, String name) {
 
 void loop() {
   server.handleClient();
+  serviceLiveStreams();
   
   static unsigned long lastDebug = 0;
   if (millis() - lastDebug > 10000) {
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+CellHealthTracker - Zustandsüberwachung der 4 Wägezellen
+
+Bewertet jedes kalibrierte Sample (kg) pro Zelle:
+- Fehler/Timeout: Zelle lieferte keinen Wert (None/NaN)
+- Hänger: Wert bleibt stehen, während sich die übrigen Zellen bewegen
+  (DT-Leitung tot) - steht der ganze Wagen still, ist das kein Hänger
+- Ausreißer: Sprung einer einzelnen Zelle, während die anderen ruhig sind
+
+Fällt eine Zelle aus, wird sie von der Summe ausgeschlossen und ihr
+Anteil aus den drei übrigen Zellen geschätzt (gelernte Lastverteilung).
+Nach einer Serie guter Samples wird sie automatisch wieder aufgenommen.
+
+Der WeightManager kalibriert vor update(): Roh-Counts des HX711 liegen
+um Größenordnungen über den kg-Schwellen (outlier_jump, Mindestlast
+beim Lernen der Lastverteilung) und würden jede Laständerung einer
+einzelnen Zelle als Ausreißer verwerfen.
+"""
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional, List, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CELL_NAMES = ['VL', 'VR', 'HL', 'HR']
+
+
+@dataclass
+class CellHealth:
+    """Gesundheitszustand einer Wägezelle"""
+    name: str
+    excluded: bool = False
+    reason: Optional[str] = None   # Ausschlussgrund ('errors', 'stuck')
+    error_rate: float = 0.0        # Anteil fehlerhafter Samples im Fenster
+    errors_total: int = 0
+    outliers_total: int = 0
+    stuck_samples: int = 0         # Samples ohne Änderung, während die anderen sich bewegen
+    share: float = 0.25            # Gelernter Anteil am Gesamtgewicht
+
+
+class CellHealthTracker:
+    """
+    Überwacht die Zellen und ersetzt ausgefallene Werte durch Schätzungen
+
+    Args:
+        channels: Anzahl Zellen
+        error_window: Samples für die Fehlerrate
+        max_error_rate: Ausschluss ab dieser Fehlerrate
+        stuck_limit: Ausschluss nach so vielen Samples ohne Änderung, in
+            denen sich die Mehrheit der übrigen Zellen bewegt
+        stuck_tolerance: Änderung in kg, die noch als "unverändert" gilt
+            (unter der 0.01 kg-Rundung des ESP32)
+        outlier_jump: Sprung in kg, ab dem ein Einzelzellen-Sprung als Ausreißer gilt
+        recover_after: Gute Samples in Folge bis zur Wiederaufnahme
+        share_alpha: Lernrate der Lastverteilung
+    """
+
+    def __init__(self, channels: int = 4, error_window: int = 20, max_error_rate: float = 0.5,
+                 stuck_limit: int = 50, stuck_tolerance: float = 0.005, outlier_jump: float = 50.0,
+                 recover_after: int = 20, share_alpha: float = 0.05):
+        self.channels = channels
+        self.error_window = error_window
+        self.max_error_rate = max_error_rate
+        self.stuck_limit = stuck_limit
+        self.stuck_tolerance = stuck_tolerance
+        self.outlier_jump = outlier_jump
+        self.recover_after = recover_after
+        self.share_alpha = share_alpha
+        self.reset()
+
+    def reset(self):
+        """Setzt alle Zellen auf gesund zurück"""
+        names = CELL_NAMES if self.channels == len(CELL_NAMES) else [f"Zelle_{i + 1}" for i in range(self.channels)]
+        self._cells = [CellHealth(name, share=1.0 / self.channels) for name in names]
+        self._errors = [deque(maxlen=self.error_window) for _ in range(self.channels)]
+        self._good_streak = [0] * self.channels
+        self._last_raw: List[Optional[float]] = [None] * self.channels
+        self._previous: Optional[np.ndarray] = None   # Letzte gültige Werte (Sprungerkennung)
+        self._last_output = np.zeros(self.channels)
+
+    @property
+    def excluded(self) -> List[bool]:
+        return [cell.excluded for cell in self._cells]
+
+    def update(self, raw: Sequence[Optional[float]]) -> np.ndarray:
+        """
+        Bewertet ein kalibriertes Sample und liefert korrigierte Zellwerte
+
+        Args:
+            raw: Ein Wert pro Zelle in kg, None/NaN bei Fehler oder Timeout
+
+        Returns:
+            Array (channels,) - ausgeschlossene/fehlende Zellen geschätzt
+        """
+        values = np.array([np.nan if v is None else float(v) for v in raw], dtype=np.float64)
+        valid = np.isfinite(values)
+
+        # Ausreißer: eine Zelle springt, die übrigen bewegen sich kaum
+        if self._previous is not None:
+            jumps = np.abs(values - self._previous)
+            for i in np.flatnonzero(valid & (jumps > self.outlier_jump)):
+                others = np.delete(jumps, i)[np.delete(valid, i)]
+                if len(others) and np.median(others) < self.outlier_jump * 0.1:
+                    valid[i] = False
+                    self._cells[i].outliers_total += 1
+            # Bleibt der neue Wert stehen, ist er im nächsten Sample kein Sprung mehr
+            self._previous = np.where(np.isfinite(values), values, self._previous)
+        elif valid.all():
+            self._previous = values.copy()
+
+        # Hänger nur zählen, während sich die Mehrheit der übrigen Zellen bewegt
+        last = np.array([np.nan if v is None else v for v in self._last_raw], dtype=np.float64)
+        with np.errstate(invalid='ignore'):
+            changed = np.abs(values - last) > self.stuck_tolerance
+        moving_needed = (self.channels - 1) // 2 + 1
+
+        for i, cell in enumerate(self._cells):
+            others_moving = int(changed.sum() - changed[i]) >= moving_needed
+            self._assess(i, cell, valid[i], values[i] if np.isfinite(values[i]) else None,
+                         bool(changed[i]), others_moving)
+
+        usable = valid & ~np.array(self.excluded)
+        result = self._estimate(values, usable)
+        self._learn_shares(result, usable)
+        self._last_output = result
+        return result.copy()
+
+    def _assess(self, i: int, cell: CellHealth, ok: bool, raw: Optional[float],
+                changed: bool, others_moving: bool):
+        """Aktualisiert Fehlerrate/Hänger-Zähler und entscheidet über Ausschluss"""
+        self._errors[i].append(not ok)
+        if not ok:
+            cell.errors_total += 1
+        cell.error_rate = sum(self._errors[i]) / len(self._errors[i])
+
+        if raw is None or changed:
+            cell.stuck_samples = 0
+        elif others_moving:
+            cell.stuck_samples += 1
+        if raw is not None:
+            self._last_raw[i] = raw
+
+        if cell.excluded and cell.reason == 'stuck' and changed:
+            # Hänger löst sich mit der ersten Änderung - nicht erst nach recover_after
+            cell.excluded = False
+            cell.reason = None
+            self._good_streak[i] = 0
+            logger.info(f"Wägezelle {cell.name} bewegt sich wieder - wieder aufgenommen")
+
+        reason = None
+        if len(self._errors[i]) >= min(self.error_window, 5) and cell.error_rate > self.max_error_rate:
+            reason = 'errors'
+        elif cell.stuck_samples >= self.stuck_limit:
+            reason = 'stuck'
+
+        if reason:
+            self._good_streak[i] = 0
+            if not cell.excluded:
+                cell.excluded = True
+                cell.reason = reason
+                logger.warning(f"Wägezelle {cell.name} ausgeschlossen ({reason}) - Anteil wird geschätzt")
+            return
+
+        self._good_streak[i] = self._good_streak[i] + 1 if ok else 0
+        if cell.excluded and self._good_streak[i] >= self.recover_after:
+            cell.excluded = False
+            cell.reason = None
+            logger.info(f"Wägezelle {cell.name} wieder aufgenommen")
+
+    def _estimate(self, values: np.ndarray, usable: np.ndarray) -> np.ndarray:
+        """Ersetzt unbrauchbare Zellen anhand der gelernten Lastverteilung"""
+        if usable.all():
+            return values
+        if not usable.any():
+            return self._last_output.copy()
+
+        shares = np.array([cell.share for cell in self._cells])
+        known_share = shares[usable].sum()
+        if known_share <= 0:
+            return np.where(usable, values, self._last_output)
+
+        estimated_total = values[usable].sum() / known_share
+        return np.where(usable, values, estimated_total * shares)
+
+    def _learn_shares(self, values: np.ndarray, usable: np.ndarray):
+        """Lernt die Lastverteilung nur aus Samples mit allen Zellen gesund"""
+        total = values.sum()
+        if not usable.all() or not math.isfinite(total) or abs(total) < 1.0:
+            return
+        for cell, value in zip(self._cells, values):
+            cell.share += self.share_alpha * (value / total - cell.share)
+
+    def get_status(self) -> List[dict]:
+        """Gesundheitsvektor für WeightManager.get_status()"""
+        return [asdict(cell) for cell in self._cells]
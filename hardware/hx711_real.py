@@ -16,7 +16,10 @@ offsets = [0, 0, 0, 0]               # Nullpunkt-Offsets
 # Hardware-Konfiguration: Standard HX711 Library für 4-Sensor Setup
 # Zukünftige Erweiterung: Multi-HX711 Library für bessere Performance
 # from hx711_multi import HX711  # Option für Multi-Sensor Hardware
-from hx711 import HX711  # Standard HX711 Library (aktuell verwendet)
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # HX711 Konfiguration für 4 Wägezellen (Option 1: 4x separate Module)
 # Jede Wägezelle hat ihr eigenes HX711-Modul für maximale Zuverlässigkeit
@@ -94,11 +97,13 @@ class SingleHX711:
             print(f"FEHLER: {self.config['name']}: Tara-Fehler: {e}")
             
     def calibrate(self, known_weight):
-        """Kalibriert die Wägezelle mit bekanntem Gewicht"""
+        """
+        Kalibriert die Wägezelle mit bekanntem Gewicht
+        
+        Das Gewicht muss bereits aufliegen - keine Rückfrage mehr über
+        input(), damit die Funktion auch aus GUI/Threads nutzbar ist.
+        """
         try:
-            print(f"Lege {known_weight}kg auf {self.config['name']} und drücke Enter...")
-            input()
-            
             raw_value = self.hx.read_average(10)
             if raw_value != 0:
                 self.scale = known_weight / raw_value
@@ -115,16 +120,32 @@ class SingleHX711:
 # HX711-Instanzen (werden bei Initialisierung erstellt)
 hx_sensors = []
 
-def init_hx711_sensors():
-    """Initialisiert 4x separate HX711-Module für 4 Wägezellen"""
-    global hx_sensors
+# Worker-Pool für paralleles Auslesen (ein Worker pro Wägezelle)
+_sampler_pool = None
+_sampler_pool_lock = threading.Lock()
+_pending_reads = {}  # Sensor-Index -> noch laufende Messung (hängende DT-Leitung)
+
+# Späte Initialisierung: GPIO-Setup erst beim ersten Bedarf, nicht beim Import
+_init_lock = threading.Lock()
+_init_done = False
+
+def init_hx711_sensors(progress_callback=None):
+    """
+    Initialisiert 4x separate HX711-Module für 4 Wägezellen
     
+    Args:
+        progress_callback: Optional, wird nach jedem Modul mit
+            (index, anzahl, name) aufgerufen
+    """
     if not HX711_AVAILABLE:
         raise RuntimeError("HX711 Library nicht verfügbar!")
     
-    hx_sensors = []
+    # Alten Worker-Pool verwerfen - Größe hängt von der Sensoranzahl ab
+    beende_parallel_sampler()
+    # Liste in-place leeren: importierte Referenzen bleiben gültig
+    hx_sensors.clear()
     
-    for config in hx711_configs:
+    for index, config in enumerate(hx711_configs):
         try:
             sensor = SingleHX711(
                 dt_pin=config['dt_pin'],
@@ -135,39 +156,145 @@ def init_hx711_sensors():
             print(f"HX711 {config['name']} erfolgreich initialisiert")
         except Exception as e:
             print(f"Fehler bei HX711 {config['name']}: {e}")
+        
+        if progress_callback:
+            progress_callback(index + 1, len(hx711_configs), config['name'])
 
-def lese_gewicht_hx711():
-    """Liest das Gesamtgewicht aller 4 Wägezellen"""
-    if not hx_sensors:
-        raise RuntimeError("HX711-Sensoren nicht initialisiert!")
+def ensure_hx711_initialized(progress_callback=None):
+    """
+    Initialisiert die HX711-Module beim ersten Aufruf (thread-sicher)
     
-    gesamtgewicht = 0.0
+    Weitere Aufrufe kehren sofort zurück. GPIO-Reset und Sensor-Test
+    laufen damit nicht mehr beim Import, sondern erst, wenn der
+    WeightManager die Hardware im Hintergrund hochfährt.
     
-    for sensor in hx_sensors:
-        try:
-            gewicht = sensor.read_weight(samples=3)
-            gesamtgewicht += gewicht
-        except Exception as e:
-            print(f"Fehler beim Lesen von {sensor.config['name']}: {e}")
+    Returns:
+        True wenn mindestens ein Sensor bereit ist
+    """
+    global _init_done
+    
+    with _init_lock:
+        if not _init_done:
+            try:
+                if HX711_AVAILABLE:
+                    init_hx711_sensors(progress_callback)
+                    print("🔌 HX711 4-Sensor System initialisiert")
+                else:
+                    print("WARNUNG: HX711 Library nicht verfügbar - Simulation verwenden")
+            except Exception as e:
+                print(f"WARNUNG: HX711-Initialisierung fehlgeschlagen: {e}")
+                hx_sensors.clear()
+            _init_done = True
     
-    return gesamtgewicht
+    return bool(hx_sensors)
 
-def lese_einzelzellwerte_hx711():
-    """Liest alle 4 Wägezellen einzeln"""
+def _get_sampler_pool():
+    """Gibt den Worker-Pool zurück (wird beim ersten Zugriff erstellt)"""
+    global _sampler_pool
+    
+    with _sampler_pool_lock:
+        if _sampler_pool is None:
+            _sampler_pool = ThreadPoolExecutor(
+                max_workers=max(1, len(hx_sensors)),
+                thread_name_prefix="HX711"
+            )
+        return _sampler_pool
+
+def beende_parallel_sampler():
+    """Beendet den Worker-Pool (z.B. vor Neu-Initialisierung)"""
+    global _sampler_pool
+    
+    with _sampler_pool_lock:
+        if _sampler_pool is not None:
+            # Nicht auf hängende Messungen warten
+            _sampler_pool.shutdown(wait=not _pending_reads)
+            _sampler_pool = None
+        _pending_reads.clear()
+
+def lese_zellen_counts(samples=3, timeout=None):
+    """
+    Liest die Roh-Counts aller 4 Wägezellen gleichzeitig mit Zeitlimit
+    
+    Hängt eine Zelle (z.B. DT-Leitung bleibt high), wird für sie None
+    geliefert statt auf sie zu warten. Solange ihre alte Messung noch
+    läuft, wird keine neue eingereiht - die übrigen Zellen bleiben
+    damit unabhängig von der hängenden.
+    
+    Args:
+        samples: Mittelwert über so viele Wandlungen pro Zelle
+        timeout: Maximale Wartezeit in Sekunden für die ganze Runde
+        
+    Returns:
+        Liste [VL, VR, HL, HR] in HX711-Counts, None für Fehler/Timeout
+    """
     if not hx_sensors:
         raise RuntimeError("HX711-Sensoren nicht initialisiert!")
     
-    gewichte = []
+    pool = _get_sampler_pool()
+    futures = []
+    for index, sensor in enumerate(hx_sensors):
+        pending = _pending_reads.get(index)
+        if pending is not None and not pending.done():
+            futures.append(None)  # Vorherige Messung hängt noch
+            continue
+        future = pool.submit(sensor.hx.read_average, samples)
+        _pending_reads[index] = future
+        futures.append(future)
     
-    for sensor in hx_sensors:
+    deadline = None if timeout is None else time.monotonic() + timeout
+    werte = []
+    for sensor, future in zip(hx_sensors, futures):
+        if future is None:
+            werte.append(None)
+            continue
         try:
-            gewicht = sensor.read_weight(samples=3)
-            gewichte.append(gewicht)
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            werte.append(future.result(timeout=remaining))
+        except FutureTimeoutError:
+            werte.append(None)
         except Exception as e:
             print(f"Fehler beim Lesen von {sensor.config['name']}: {e}")
-            gewichte.append(0.0)  # Fallback-Wert
+            werte.append(None)
     
-    return gewichte  # [VL, VR, HL, HR]
+    return werte
+
+def counts_zu_gewicht(counts):
+    """Rechnet Roh-Counts mit Offset/Skala der Sensoren in Gewichte um (None bleibt None)"""
+    return [None if count is None else (count - sensor.offset) * sensor.scale
+            for sensor, count in zip(hx_sensors, counts)]
+
+def lese_zellen_roh(samples=3, timeout=None):
+    """
+    Liest alle 4 Wägezellen gleichzeitig mit Zeitlimit
+    
+    Returns:
+        Liste [VL, VR, HL, HR], None für Fehler/Timeout
+    """
+    return counts_zu_gewicht(lese_zellen_counts(samples, timeout))
+
+def lese_zellen_parallel(samples=3):
+    """
+    Liest alle 4 Wägezellen gleichzeitig
+    
+    Jede Zelle hat eigene DT/SCK-Pins, die 4 HX711 wandeln also
+    unabhängig voneinander. Ein Worker pro Zelle wartet parallel auf
+    die jeweilige Wandlung - eine komplette Messung dauert damit etwa
+    eine statt vier Wandlungszeiten.
+    
+    Returns:
+        Tupel (VL, VR, HL, HR) aus derselben Wandlungsrunde
+    """
+    werte = lese_zellen_roh(samples)
+    # Fallback-Wert 0.0 für fehlerhafte Zellen
+    return tuple(0.0 if wert is None else wert for wert in werte)
+
+def lese_gewicht_hx711(samples=3):
+    """Liest das Gesamtgewicht aller 4 Wägezellen"""
+    return sum(lese_zellen_parallel(samples))
+
+def lese_einzelzellwerte_hx711(samples=3):
+    """Liest alle 4 Wägezellen einzeln"""
+    return list(lese_zellen_parallel(samples))  # [VL, VR, HL, HR]
 
 def kalibriere_einzelzelle(sensor_index, bekanntes_gewicht):
     """Kalibriert eine spezifische Wägezelle"""
@@ -178,12 +305,16 @@ def kalibriere_einzelzelle(sensor_index, bekanntes_gewicht):
     return sensor.calibrate(bekanntes_gewicht)
 
 def nullpunkt_setzen_alle():
-    """Setzt Nullpunkt für alle 4 Wägezellen"""
-    print("NULLPUNKT-KALIBRIERUNG: Karren leeren und Enter drücken...")
-    input()
+    """
+    Setzt Nullpunkt für alle 4 Wägezellen (Karren muss leer sein)
     
-    for sensor in hx_sensors:
-        sensor.tare()
+    Die Zellen werden gleichzeitig genullt. Im laufenden Betrieb
+    stattdessen WeightManager.tare_async() verwenden - das nutzt die
+    bereits erfassten Samples statt neu zu messen.
+    """
+    pool = _get_sampler_pool()
+    for future in [pool.submit(sensor.tare) for sensor in hx_sensors]:
+        future.result()
 
 def teste_alle_sensoren():
     """Testet alle HX711-Sensoren auf Funktion"""
@@ -195,15 +326,3 @@ def teste_alle_sensoren():
             print(f"ERFOLG: Sensor {i+1} ({sensor.config['name']}): {raw_value}")
         except Exception as e:
             print(f"FEHLER: Sensor {i+1} ({sensor.config['name']}): Fehler - {e}")
-
-# Initialisierung beim Import (falls HX711 verfügbar)
-try:
-    if HX711_AVAILABLE:
-        init_hx711_sensors()
-        print("🔌 HX711 4-Sensor System initialisiert")
-    else:
-        hx_sensors = []
-        print("WARNUNG: HX711 Library nicht verfügbar - Simulation verwenden")
-except Exception as e:
-    print(f"WARNUNG: HX711-Initialisierung fehlgeschlagen: {e}")
-    hx_sensors = []
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Lastverteilung und Schwerpunkt aus den 4 Eckzellen
+
+Zellen sitzen an den Ecken des Karrens: VL (vorne links), VR (vorne
+rechts), HL (hinten links), HR (hinten rechts). Daraus ergeben sich
+Achslasten, Seitenlasten und der Schwerpunkt - vektorisiert über ein
+ganzes Sample-Fenster aus dem Ringpuffer.
+
+Schwerpunkt normiert auf -1..1:
+    cog_x = (rechts - links) / gesamt     (+1 = ganz rechts)
+    cog_y = (vorne - hinten) / gesamt     (+1 = ganz vorne)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+VL, VR, HL, HR = range(4)
+
+
+@dataclass(frozen=True)
+class CartGeometry:
+    """Abstände der Wägezellen in Metern"""
+    track_width: float = 0.6   # links <-> rechts
+    wheelbase: float = 1.0     # vorne <-> hinten
+
+
+@dataclass(frozen=True)
+class LoadDistribution:
+    """Lastverteilung über ein Sample-Fenster (Mittelwerte)"""
+    total: float                  # kg
+    front: float                  # Vorderachse kg (VL + VR)
+    rear: float                   # Hinterachse kg (HL + HR)
+    left: float                   # VL + HL
+    right: float                  # VR + HR
+    cog_x: float                  # normiert -1 (links) .. +1 (rechts)
+    cog_y: float                  # normiert -1 (hinten) .. +1 (vorne)
+    cog_x_m: float                # Abstand von der Mitte in Metern
+    cog_y_m: float
+    one_sided: bool = False       # Einseitige Beladung verfälscht die Messung
+    tipping_risk: bool = False    # Eine Ecke nahezu unbelastet - Karren kann kippen
+    warning: Optional[str] = None
+
+
+def axle_loads(cells: np.ndarray) -> dict:
+    """
+    Achs-/Seitenlasten und Schwerpunkt pro Sample
+
+    Args:
+        cells: (N, 4) Zellwerte [VL, VR, HL, HR] in kg
+
+    Returns:
+        Dict mit Arrays (N,): total, front, rear, left, right, cog_x, cog_y
+        (Schwerpunkt NaN bei Gesamtgewicht ~0)
+    """
+    cells = np.atleast_2d(np.asarray(cells, dtype=np.float64))
+    total = cells.sum(axis=1)
+    front = cells[:, VL] + cells[:, VR]
+    rear = cells[:, HL] + cells[:, HR]
+    left = cells[:, VL] + cells[:, HL]
+    right = cells[:, VR] + cells[:, HR]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loaded = np.abs(total) > 1e-6
+        cog_x = np.where(loaded, (right - left) / total, np.nan)
+        cog_y = np.where(loaded, (front - rear) / total, np.nan)
+
+    return {'total': total, 'front': front, 'rear': rear, 'left': left, 'right': right,
+            'cog_x': cog_x, 'cog_y': cog_y}
+
+
+class LoadAnalyzer:
+    """
+    Bewertet die Lastverteilung eines Sample-Fensters
+
+    Args:
+        geometry: Zellabstände für den Schwerpunkt in Metern
+        min_total: Unterhalb dieses Gesamtgewichts keine Bewertung (kg)
+        max_offset: Einseitig ab |cog| > max_offset (0.5 = 75/25-Verteilung)
+        min_corner_share: Kipp-Warnung, wenn eine Ecke weniger trägt
+    """
+
+    def __init__(self, geometry: CartGeometry = CartGeometry(), min_total: float = 5.0,
+                 max_offset: float = 0.5, min_corner_share: float = 0.03):
+        self.geometry = geometry
+        self.min_total = min_total
+        self.max_offset = max_offset
+        self.min_corner_share = min_corner_share
+
+    def analyze(self, cells: np.ndarray) -> Optional[LoadDistribution]:
+        """
+        Lastverteilung über das Fenster; Warnungen nur wenn sie in der
+        Mehrheit der Samples zutreffen (einzelne Stöße lösen nichts aus)
+
+        Returns:
+            LoadDistribution oder None bei leerem Fenster
+        """
+        cells = np.atleast_2d(np.asarray(cells, dtype=np.float64))
+        cells = cells[np.isfinite(cells).all(axis=1)]
+        if cells.size == 0:
+            return None
+
+        loads = axle_loads(cells)
+        total = float(loads['total'].mean())
+        loaded = loads['total'] >= self.min_total
+
+        cog_x = float(np.nanmean(loads['cog_x'])) if np.isfinite(loads['cog_x']).any() else 0.0
+        cog_y = float(np.nanmean(loads['cog_y'])) if np.isfinite(loads['cog_y']).any() else 0.0
+
+        one_sided = tipping = False
+        warning = None
+        if loaded.any():
+            offset = np.maximum(np.abs(loads['cog_x']), np.abs(loads['cog_y']))[loaded]
+            one_sided = bool(np.mean(offset > self.max_offset) > 0.5)
+
+            shares = cells[loaded] / loads['total'][loaded, None]
+            tipping = bool(np.mean(shares.min(axis=1) < self.min_corner_share) > 0.5)
+
+            if tipping:
+                corner = ['VL', 'VR', 'HL', 'HR'][int(np.argmin(shares.mean(axis=0)))]
+                warning = f"Kippgefahr: Ecke {corner} fast unbelastet"
+            elif one_sided:
+                side = self._side(cog_x, cog_y)
+                warning = f"Einseitig beladen ({side}) - Messung kann verfälscht sein"
+
+        return LoadDistribution(
+            total=total,
+            front=float(loads['front'].mean()),
+            rear=float(loads['rear'].mean()),
+            left=float(loads['left'].mean()),
+            right=float(loads['right'].mean()),
+            cog_x=cog_x,
+            cog_y=cog_y,
+            cog_x_m=cog_x * self.geometry.track_width / 2.0,
+            cog_y_m=cog_y * self.geometry.wheelbase / 2.0,
+            one_sided=one_sided,
+            tipping_risk=tipping,
+            warning=warning
+        )
+
+    @staticmethod
+    def _side(cog_x: float, cog_y: float) -> str:
+        if abs(cog_x) >= abs(cog_y):
+            return "rechts" if cog_x > 0 else "links"
+        return "vorne" if cog_y > 0 else "hinten"
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Laufzeit-Messwerte für den Lesepfad des WeightManagers
+
+Billig genug für den Dauerbetrieb: pro Messung ein Schreibzugriff in ein
+festes NumPy-Array. Histogramme und Perzentile werden erst bei der
+Abfrage (Diagnose-Seite, get_status) berechnet.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+# Obergrenzen der Histogramm-Klassen in Millisekunden
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+class LatencyHistogram:
+    """
+    Rollierende Latenz-Statistik über die letzten window Messungen
+
+    record() wird nur von einem Thread aufgerufen (Erfassungs-Thread),
+    summary() darf aus jedem Thread kommen - ein gleichzeitig geschriebener
+    Wert verfälscht höchstens eine Messung.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._values = np.zeros(window)
+        self.reset()
+
+    def reset(self):
+        self._count = 0
+        self._max = 0.0
+
+    def record(self, seconds: float):
+        """Nimmt eine Dauer in Sekunden auf"""
+        self._values[self._count % self.window] = seconds
+        self._count += 1
+        if seconds > self._max:
+            self._max = seconds
+
+    def summary(self) -> dict:
+        """Perzentile und Histogramm in Millisekunden"""
+        n = min(self._count, self.window)
+        if n == 0:
+            return {'count': 0}
+
+        ms = self._values[:n] * 1000.0
+        counts = np.histogram(ms, bins=(0.0, *LATENCY_BUCKETS_MS, np.inf))[0]
+        labels = [f"<{b:g}ms" for b in LATENCY_BUCKETS_MS] + [f">={LATENCY_BUCKETS_MS[-1]:g}ms"]
+        p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+        return {
+            'count': self._count,
+            'mean_ms': float(ms.mean()),
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'p99_ms': float(p99),
+            'max_ms': float(ms.max()),
+            'max_ever_ms': self._max * 1000.0,
+            'histogram': dict(zip(labels, counts.tolist()))
+        }
+
+
+class CellRateMeter:
+    """
+    Effektive Samples pro Sekunde je Zelle über die letzten window Erfassungen
+
+    Zählt nur Samples, in denen die Zelle tatsächlich einen Wert geliefert hat.
+    """
+
+    def __init__(self, channels: int = 4, window: int = 256):
+        self.channels = channels
+        self.window = window
+        self._times = np.zeros(window)
+        self._valid = np.zeros((window, channels), dtype=bool)
+        self._count = 0
+
+    def reset(self):
+        self._count = 0
+
+    def record(self, timestamp: float, valid: Sequence[bool]):
+        slot = self._count % self.window
+        self._times[slot] = timestamp
+        self._valid[slot] = valid
+        self._count += 1
+
+    def rates(self) -> list:
+        """Samples/s pro Zelle (0.0 solange zu wenig Daten vorliegen)"""
+        n = min(self._count, self.window)
+        if n < 2:
+            return [0.0] * self.channels
+        times = self._times[:n]
+        span = float(times.max() - times.min())
+        if span <= 0:
+            return [0.0] * self.channels
+        overall = (n - 1) / span
+        return (self._valid[:n].mean(axis=0) * overall).tolist()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+FeedRemovalDetector - Erkennt Futterentnahmen im Gewichtsstrom
+
+Eine Entnahme ist ein negativer Gewichtssprung zwischen zwei ruhigen
+Phasen: Die Waage ist stabil, jemand greift eine Portion heraus (Bewegung)
+und danach beruhigt sich das Gewicht auf einem niedrigeren Niveau.
+Der Detektor setzt auf dem SettleDetector des WeightManagers auf und
+meldet Menge, Beginn/Ende der Entnahme und eine Konfidenz.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from hardware.settle_detector import SettleEvent
+
+
+@dataclass(frozen=True)
+class RemovalEvent:
+    """Erkannte Futterentnahme"""
+    amount: float          # Entnommene Menge (kg)
+    weight_before: float   # Stabiles Gewicht vor der Entnahme (kg)
+    weight_after: float    # Stabiles Gewicht nach der Entnahme (kg)
+    start_time: float      # Letzter ruhiger Zeitpunkt vor der Bewegung
+    end_time: float        # Zeitpunkt der erneuten Beruhigung
+    confidence: float      # 0.0 - 1.0
+
+    @property
+    def duration(self) -> float:
+        """Dauer der Entnahme in Sekunden"""
+        return self.end_time - self.start_time
+
+
+class FeedRemovalDetector:
+    """
+    Stufenerkennung auf den Ruhe-Zuständen des SettleDetectors
+
+    Args:
+        min_amount: Kleinste gemeldete Entnahme in kg (kleinere Stufen = Drift/Anlehnen)
+        max_duration: Entnahmen, die länger dauern, erhalten halbe Konfidenz
+    """
+
+    def __init__(self, min_amount: float = 0.3, max_duration: float = 60.0):
+        self.min_amount = min_amount
+        self.max_duration = max_duration
+        self.reset()
+
+    def reset(self):
+        """Vergisst das aktuelle Plateau (z.B. nach Tara oder Sensorwechsel)"""
+        self._plateau: Optional[SettleEvent] = None
+        self._motion_start: Optional[float] = None
+
+    def update(self, timestamp: float, settled: Optional[SettleEvent]) -> Optional[RemovalEvent]:
+        """
+        Verarbeitet den Ruhe-Zustand nach einem neuen Sample
+
+        Args:
+            timestamp: Zeitpunkt des Samples
+            settled: SettleDetector.current (None während Bewegung)
+
+        Returns:
+            RemovalEvent sobald sich das Gewicht nach einer Entnahme beruhigt hat
+        """
+        if settled is None:
+            if self._plateau is not None and self._motion_start is None:
+                self._motion_start = self._plateau.timestamp
+            return None
+
+        if self._motion_start is None:
+            # Weiterhin ruhig - Plateau nachführen, damit langsame Drift nicht als Stufe zählt
+            self._plateau = settled
+            return None
+
+        before, start = self._plateau, self._motion_start
+        self._plateau = settled
+        self._motion_start = None
+
+        amount = before.value - settled.value
+        if amount < self.min_amount:
+            return None
+
+        return RemovalEvent(
+            amount=amount,
+            weight_before=before.value,
+            weight_after=settled.value,
+            start_time=start,
+            end_time=settled.timestamp,
+            confidence=self._confidence(amount, before, settled, settled.timestamp - start)
+        )
+
+    def _confidence(self, amount: float, before: SettleEvent, after: SettleEvent,
+                    duration: float) -> float:
+        """Große Stufe, ruhige Plateaus und kurze Dauer ergeben hohe Konfidenz"""
+        step_score = min(1.0, amount / (2.0 * self.min_amount))
+        noise = math.sqrt(max(0.0, before.variance) + max(0.0, after.variance))
+        noise_score = amount / (amount + 10.0 * noise)
+        duration_score = 1.0 if duration <= self.max_duration else 0.5
+        return round(step_score * noise_score * duration_score, 3)
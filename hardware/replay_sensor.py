@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+ReplayWeightSensor - Aufgezeichnete Wägezellen-Daten abspielen
+
+Ermöglicht Benchmarks und Fehler-Reproduktion ohne HX711-Hardware:
+- SampleRecorder zeichnet die kalibrierten Samples der 4 Zellen auf (NPZ-Datei)
+- ReplayWeightSensor spielt eine Aufnahme in Echtzeit, beschleunigt
+  oder Sample für Sample ab und wird per WeightManager.use_sensor()
+  anstelle der HX711-Hardware eingesetzt
+
+Dateiformat (np.savez_compressed):
+    timestamps: float64 (N,)   Sekunden relativ zum ersten Sample
+    cells:      float64 (N, 4) VL, VR, HL, HR in kg (kalibriert, vor der Zell-Überwachung)
+
+Aufgezeichnet wird nach Tara/Skalierung der jeweiligen Quelle: die
+Wiedergabe braucht keine Kalibrierung und die kg-Schwellen von
+Ruhe-Erkennung und Zell-Überwachung greifen unverändert. Version-1-
+Dateien enthalten noch Rohwerte in der Einheit der Quelle.
+
+Benchmark auf dem Entwicklungsrechner:
+    python -m hardware.replay_sensor aufnahme.npz --speed 10
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from hardware.weight_manager import WeightSensorInterface
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2   # 1: Rohwerte der Quelle, 2: kalibrierte kg
+
+
+def load_recording(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lädt eine Aufnahme
+
+    Returns:
+        (timestamps (N,), cells (N, 4))
+    """
+    with np.load(path) as data:
+        timestamps = np.asarray(data['timestamps'], dtype=np.float64)
+        cells = np.asarray(data['cells'], dtype=np.float64)
+        version = int(data['version']) if 'version' in data.files else 1
+
+    if version < FORMAT_VERSION:
+        logger.warning(f"Aufnahme {path} hat Format {version} (Rohwerte) - "
+                       f"vor dem Abspielen Kalibrierung mit set_calibration(source='sensor') setzen")
+
+    if cells.ndim != 2 or len(cells) != len(timestamps):
+        raise ValueError(f"Ungültige Aufnahme {path}: {cells.shape} / {timestamps.shape}")
+    return timestamps, cells
+
+
+class SampleRecorder:
+    """
+    Sammelt kalibrierte Samples (kg) aus dem Erfassungs-Thread
+
+    append() wird nur vom Erfassungs-Thread aufgerufen, save() aus
+    beliebigem Thread - die Puffer werden dafür unter Lock kopiert.
+    """
+
+    def __init__(self, max_samples: int = 100000):
+        self.max_samples = max_samples
+        # deque(maxlen) verwirft das älteste Sample in O(1)
+        self._timestamps = deque(maxlen=max_samples)
+        self._cells = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def append(self, cells, timestamp: float):
+        """Nimmt ein Sample auf (ältere Samples fallen ab max_samples heraus)"""
+        with self._lock:
+            self._timestamps.append(float(timestamp))
+            # Fehlende Werte (Timeout) als NaN - bleiben beim Abspielen erhalten
+            self._cells.append([float('nan') if v is None else float(v) for v in cells])
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def save(self, path: str) -> int:
+        """
+        Schreibt die Aufnahme als komprimierte NPZ-Datei
+
+        Returns:
+            Anzahl gespeicherter Samples
+        """
+        with self._lock:
+            timestamps = np.array(self._timestamps, dtype=np.float64)
+            cells = np.array(self._cells, dtype=np.float64).reshape(-1, 4)
+
+        if len(timestamps):
+            timestamps -= timestamps[0]
+        np.savez_compressed(path, timestamps=timestamps, cells=cells,
+                            version=np.int32(FORMAT_VERSION))
+        logger.info(f"Aufnahme gespeichert: {path} ({len(timestamps)} Samples)")
+        return len(timestamps)
+
+
+class ReplayWeightSensor(WeightSensorInterface):
+    """
+    Spielt eine Aufnahme als Gewichtssensor ab
+
+    Die Erfassung liest über read_samples() jedes aufgezeichnete Sample,
+    auch wenn sie seltener abfragt als abgespielt wird (Beschleunigung,
+    Ruhe-Intervall) - read_cells() liefert nur das aktuelle.
+
+    Args:
+        source: Pfad zur NPZ-Datei oder Tupel (timestamps, cells)
+        speed: Abspielgeschwindigkeit (1.0 = Echtzeit, 10.0 = zehnfach);
+            0 = Schrittmodus, jeder Lesezugriff liefert das nächste Sample
+        loop: Nach dem Ende wieder von vorne beginnen
+    """
+
+    def __init__(self, source: Union[str, Tuple[np.ndarray, np.ndarray]],
+                 speed: float = 1.0, loop: bool = False):
+        if isinstance(source, str):
+            self._timestamps, self._cells = load_recording(source)
+        else:
+            self._timestamps = np.asarray(source[0], dtype=np.float64)
+            self._cells = np.asarray(source[1], dtype=np.float64)
+
+        if len(self._timestamps) == 0:
+            raise ValueError("Aufnahme enthält keine Samples")
+
+        self.speed = speed
+        self.loop = loop
+        self._duration = float(self._timestamps[-1] - self._timestamps[0])
+        self.reset()
+
+    def reset(self):
+        """Startet die Wiedergabe von vorne"""
+        self._started: Optional[float] = None
+        self._started_wall = 0.0
+        self._step = 0
+        self._delivered = 0   # Von read_samples() gelieferte Samples (über alle Durchläufe)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def finished(self) -> bool:
+        """True wenn das letzte Sample erreicht ist (nie bei loop=True)"""
+        if self.loop:
+            return False
+        return self._current_index() >= len(self._timestamps) - 1
+
+    def _current_index(self) -> int:
+        """Index des Samples, das zum jetzigen Zeitpunkt aktuell ist"""
+        n = len(self._timestamps)
+        if self.speed <= 0:
+            return self._step % n if self.loop else min(self._step, n - 1)
+
+        if self._started is None:
+            return 0
+        position = (time.monotonic() - self._started) * self.speed
+        if self.loop and self._duration > 0:
+            position %= self._duration
+        index = int(np.searchsorted(self._timestamps, self._timestamps[0] + position, side='right')) - 1
+        return min(max(index, 0), n - 1)
+
+    def read_cells(self) -> list[float]:
+        """Liefert die 4 Zellwerte an der aktuellen Wiedergabeposition"""
+        if self._started is None:
+            self._started = time.monotonic()
+        index = self._current_index()
+        if self.speed <= 0:
+            self._step += 1
+        return [float(v) for v in self._cells[index]]
+
+    def read_samples(self) -> List[Tuple[float, list]]:
+        """
+        Alle Samples zwischen letztem Aufruf und aktueller Wiedergabeposition
+
+        Zeitstempel ist die Unix-Zeit, zu der das Sample abgespielt wurde
+        (Aufnahme-Abstände geteilt durch speed). Im Schrittmodus genau ein
+        Sample pro Aufruf, nach dem Ende einer Aufnahme ohne loop keines mehr.
+        """
+        if self.speed <= 0 or (self.loop and self._duration <= 0):
+            return [(time.time(), self.read_cells())]
+
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+            self._started_wall = time.time()
+        played = self._played_count((now - self._started) * self.speed)
+
+        first, self._delivered = self._delivered, max(self._delivered, played)
+        return [(self._started_wall + self._offset(k) / self.speed,
+                 [float(v) for v in self._cells[self._row(k)]])
+                for k in range(first, played)]
+
+    def _cycle_rows(self) -> int:
+        """Samples pro Durchlauf - mit loop fällt das letzte auf das erste des nächsten"""
+        n = len(self._timestamps)
+        return n - 1 if self.loop and n > 1 else n
+
+    def _row(self, k: int) -> int:
+        return k % self._cycle_rows() if self.loop else k
+
+    def _offset(self, k: int) -> float:
+        """Aufnahmezeit des k-ten gelieferten Samples relativ zum Start"""
+        row = self._row(k)
+        cycle = k // self._cycle_rows() if self.loop else 0
+        return cycle * self._duration + float(self._timestamps[row] - self._timestamps[0])
+
+    def _played_count(self, position: float) -> int:
+        """Anzahl Samples, deren Aufnahmezeit bis position (Sekunden) abgespielt ist"""
+        relative = self._timestamps - self._timestamps[0]
+        if not self.loop:
+            return int(np.searchsorted(relative, position, side='right'))
+        rows = self._cycle_rows()
+        cycles = int(position // self._duration)
+        within = position - cycles * self._duration
+        return cycles * rows + int(np.searchsorted(relative[:rows], within, side='right'))
+
+    def read_weight(self) -> float:
+        """Gesamtgewicht an der aktuellen Wiedergabeposition"""
+        return sum(self.read_cells())
+
+
+def _benchmark(path: str, speed: float, loop: bool):
+    """Spielt eine Aufnahme durch den kompletten WeightManager-Pfad"""
+    from hardware.weight_manager import get_weight_manager
+
+    sensor = ReplayWeightSensor(path, speed=speed, loop=loop)
+    manager = get_weight_manager()
+
+    latencies = []
+
+    def observer(weight: float):
+        latencies.append(time.time() - manager.get_snapshot().timestamp)
+
+    manager.register_observer("replay_benchmark", observer)
+    manager.use_sensor(sensor)
+    started = time.time()
+    try:
+        while not sensor.finished:
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.cleanup()
+
+    elapsed = time.time() - started
+    status = manager.get_status()
+    print(f"Samples abgespielt:   {status['samples_total']} in {elapsed:.1f}s")
+    if latencies:
+        werte = np.array(latencies) * 1000.0
+        print(f"Observer-Latenz (ms): median {np.median(werte):.2f}, p99 {np.percentile(werte, 99):.2f}")
+    print(f"Letztes Gewicht:      {status['current_weight']:.2f} kg")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aufgezeichnete Wägezellen-Daten abspielen")
+    parser.add_argument("datei", help="NPZ-Aufnahme (WeightManager.stop_recording)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Abspielgeschwindigkeit (0 = Schrittmodus)")
+    parser.add_argument("--loop", action="store_true", help="Endlos wiederholen (Abbruch mit Strg+C)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    _benchmark(args.datei, args.speed, args.loop)
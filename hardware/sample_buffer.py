@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+SampleRingBuffer - Vorallokierter Ringpuffer für Wägezellen-Samples
+
+Ein Schreiber (Erfassungs-Thread), beliebig viele Leser:
+- Speicher wird einmalig beim Start reserviert (keine Allokation pro Sample)
+- Schreiben ohne Lock: Sample zuerst in den Slot, danach Zähler erhöhen
+- Leser sehen nur vollständig geschriebene Samples
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SampleRingBuffer:
+    """
+    Ringpuffer für Zeitstempel + Werte pro Wägezelle
+
+    Der Schreibzähler wird erst nach dem Kopieren des Samples erhöht.
+    Da es genau einen Schreiber gibt, braucht weder push() noch latest()
+    einen Lock. Fenster-Leser sollten deutlich weniger als `capacity`
+    Samples anfordern, damit der Schreiber sie nicht überholt.
+    """
+
+    def __init__(self, capacity: int = 256, channels: int = 4):
+        if capacity < 2:
+            raise ValueError("Ringpuffer braucht mindestens 2 Slots")
+
+        self.capacity = capacity
+        self.channels = channels
+        self._values = np.zeros((capacity, channels), dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._count = 0  # Gesamtanzahl geschriebener Samples (monoton)
+
+    def push(self, values, timestamp: float):
+        """Schreibt ein Sample (nur vom Erfassungs-Thread aufrufen)"""
+        slot = self._count % self.capacity
+        self._values[slot] = values
+        self._timestamps[slot] = timestamp
+        # Veröffentlichung: erst jetzt ist das Sample für Leser sichtbar
+        self._count += 1
+
+    def latest(self) -> Optional[Tuple[float, np.ndarray]]:
+        """Gibt das neueste Sample als (timestamp, werte) zurück"""
+        count = self._count
+        if count == 0:
+            return None
+        slot = (count - 1) % self.capacity
+        return float(self._timestamps[slot]), self._values[slot].copy()
+
+    def window(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gibt die letzten n Samples chronologisch sortiert zurück
+
+        Returns:
+            (timestamps[n], werte[n, channels]) - immer Kopien
+        """
+        count = self._count
+        n = max(0, min(n, count, self.capacity))
+        if n == 0:
+            return np.empty(0), np.empty((0, self.channels))
+
+        end = count % self.capacity
+        start = (count - n) % self.capacity
+        if start < end:
+            return self._timestamps[start:end].copy(), self._values[start:end].copy()
+
+        # Umbruch am Pufferende
+        timestamps = np.concatenate((self._timestamps[start:], self._timestamps[:end]))
+        values = np.concatenate((self._values[start:], self._values[:end]))
+        return timestamps, values
+
+    @property
+    def total_count(self) -> int:
+        """Anzahl aller jemals geschriebenen Samples"""
+        return self._count
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def clear(self):
+        """Verwirft alle Samples (nur bei gestopptem Schreiber aufrufen)"""
+        self._count = 0
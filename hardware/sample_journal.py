@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+SampleJournal - Memory-mapped Ringjournal der HX711-Rohwerte
+
+Der Erfassungs-Thread schreibt jedes Roh-Sample (int32 Counts pro Zelle
+plus Unix-Zeit) in eine Datei fester Größe. Die Datei ist per mmap
+eingeblendet - ein Sample kostet nur einen Speicher-Schreibzugriff, das
+Zurückschreiben übernimmt das Betriebssystem.
+
+Ein separates Analyse-Werkzeug liest die Datei parallel zur laufenden
+App (Drift, Rauschen über einen ganzen Tag):
+    python -m hardware.sample_journal logs/hx711_samples.journal --stats
+    python -m hardware.sample_journal logs/hx711_samples.journal --npz tag.npz
+
+Dateiformat: 64-Byte-Header, danach capacity Datensätze à 24 Byte
+(float64 Unix-Zeit, 4x int32 Counts). 'total' im Header zählt alle jemals
+geschriebenen Samples und wird erst nach dem Datensatz erhöht.
+
+Jeder Datensatz trägt seine eigene Uhrzeit: Samples aus der Zeit vor
+einem Neustart bleiben beim Export richtig datiert, auch wenn die
+monotone Uhr danach neu beginnt. Version-1-Dateien (monotone Zeit plus
+ein einziger Offset im Header) werden beim Öffnen neu angelegt.
+"""
+
+import logging
+import mmap
+import os
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'FKJ1'
+VERSION = 2
+HEADER_SIZE = 64
+MISSING = np.iinfo(np.int32).min   # Zelle lieferte keinen Wert (Timeout/Fehler)
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u4'),
+    ('channels', '<u4'),
+    ('capacity', '<u4'),
+    ('total', '<u8'),            # Anzahl geschriebener Samples (monoton steigend)
+    ('reserved', '<f8'),         # Version 1: Offset monotone Zeit -> Unix-Zeit
+])
+
+
+def _record_dtype(channels: int) -> np.dtype:
+    return np.dtype([('t', '<f8'), ('counts', '<i4', (channels,))])
+
+
+class SampleJournal:
+    """
+    Schreibseite des Journals (nur vom Erfassungs-Thread benutzen)
+
+    Args:
+        path: Journal-Datei (wird angelegt bzw. bei passendem Format fortgesetzt)
+        capacity: Anzahl Datensätze im Ring (864000 = 1 Tag bei 10 Hz, ~20 MB)
+        channels: Zellen pro Sample
+    """
+
+    def __init__(self, path: str, capacity: int = 864000, channels: int = 4):
+        self.path = path
+        self.channels = channels
+        self._record_dtype = _record_dtype(channels)
+        size = HEADER_SIZE + capacity * self._record_dtype.itemsize
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        reuse = os.path.exists(path) and os.path.getsize(path) == size
+        with open(path, 'r+b' if reuse else 'w+b') as f:
+            if not reuse:
+                f.truncate(size)
+            self._mmap = mmap.mmap(f.fileno(), size)
+
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._mmap)
+        self._records = np.ndarray((capacity,), dtype=self._record_dtype,
+                                   buffer=self._mmap, offset=HEADER_SIZE)
+
+        if not (reuse and self._header['magic'] == MAGIC and self._header['version'] == VERSION
+                and self._header['channels'] == channels and self._header['capacity'] == capacity):
+            self._header['magic'] = MAGIC
+            self._header['version'] = VERSION
+            self._header['channels'] = channels
+            self._header['capacity'] = capacity
+            self._header['total'] = 0
+            self._header['reserved'] = 0.0
+
+        self.capacity = capacity
+        self._total = int(self._header['total'])
+        logger.info(f"Sample-Journal geöffnet: {path} ({capacity} Slots, {self._total} bisher)")
+
+    def append(self, timestamp: float, counts: Sequence[Optional[int]]):
+        """
+        Schreibt ein Roh-Sample
+
+        Args:
+            timestamp: time.time() der Messung
+            counts: Roh-Counts pro Zelle, None für fehlende Werte
+        """
+        slot = self._total % self.capacity
+        self._records['t'][slot] = timestamp
+        self._records['counts'][slot] = [MISSING if c is None else int(c) for c in counts]
+        self._total += 1
+        self._header['total'] = self._total   # erst nach dem Datensatz veröffentlichen
+
+    @property
+    def total_count(self) -> int:
+        return self._total
+
+    def close(self):
+        """Schreibt ausstehende Seiten zurück und schließt die Datei"""
+        if self._mmap is None:
+            return
+        self._mmap.flush()
+        del self._header, self._records
+        self._mmap.close()
+        self._mmap = None
+
+
+class JournalReader:
+    """Leseseite - kann jederzeit parallel zur laufenden App geöffnet werden"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._mmap)
+        if self._header['magic'] != MAGIC:
+            raise ValueError(f"{path} ist kein Sample-Journal")
+        if self._header['version'] != VERSION:
+            raise ValueError(f"{path}: Journal-Version {int(self._header['version'])} wird nicht unterstützt")
+
+        self.channels = int(self._header['channels'])
+        self.capacity = int(self._header['capacity'])
+        self._records = np.ndarray((self.capacity,), dtype=_record_dtype(self.channels),
+                                   buffer=self._mmap, offset=HEADER_SIZE)
+
+    @property
+    def total_count(self) -> int:
+        return int(self._header['total'])
+
+    def snapshot(self, last_n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Konsistente Kopie der neuesten Samples in zeitlicher Reihenfolge
+
+        Datensätze, die der Schreiber während des Kopierens überschrieben
+        haben könnte, werden verworfen.
+
+        Returns:
+            (Unix-Zeitstempel (N,), counts (N, channels) als float64 mit NaN für fehlende Werte)
+        """
+        total = self.total_count
+        n = min(total, self.capacity, last_n if last_n is not None else self.capacity)
+        start = total - n
+        indices = np.arange(start, total) % self.capacity
+        data = self._records[indices]   # Fancy-Indexing kopiert
+
+        # Während des Kopierens weitergeschriebene Slots sind unzuverlässig
+        # (+1: der Slot, den der Schreiber gerade füllt)
+        clobbered = self.total_count - total + 1 - (self.capacity - n)
+        if clobbered > 0:
+            data = data[min(clobbered, len(data)):]
+
+        counts = data['counts'].astype(np.float64)
+        counts[data['counts'] == MISSING] = np.nan
+        return data['t'].copy(), counts
+
+    def close(self):
+        del self._header, self._records
+        self._mmap.close()
+
+
+def journal_stats(timestamps: np.ndarray, counts: np.ndarray) -> dict:
+    """Rauschen und Drift pro Zelle (Drift als lineare Steigung in Counts/Stunde)"""
+    stats = {'samples': len(timestamps)}
+    if len(timestamps) < 2:
+        return stats
+
+    hours = (timestamps - timestamps[0]) / 3600.0
+    valid = np.isfinite(counts)
+    stats['duration_h'] = float(hours[-1])
+    stats['missing'] = (~valid).sum(axis=0).tolist()
+    stats['mean'] = np.nanmean(counts, axis=0).tolist()
+    stats['noise_std'] = np.nanstd(np.diff(counts, axis=0), axis=0).tolist()
+
+    drift = []
+    for ch in range(counts.shape[1]):
+        ok = valid[:, ch]
+        drift.append(float(np.polyfit(hours[ok], counts[ok, ch], 1)[0]) if ok.sum() > 1 and hours[-1] > 0 else 0.0)
+    stats['drift_per_h'] = drift
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HX711 Sample-Journal auswerten (läuft parallel zur App)")
+    parser.add_argument("datei", help="Journal-Datei, z.B. logs/hx711_samples.journal")
+    parser.add_argument("--last", type=int, default=None, help="Nur die letzten N Samples")
+    parser.add_argument("--stats", action="store_true", help="Rauschen/Drift pro Zelle ausgeben")
+    parser.add_argument("--npz", help="Samples als NPZ exportieren")
+    args = parser.parse_args()
+
+    reader = JournalReader(args.datei)
+    timestamps, counts = reader.snapshot(args.last)
+    print(f"{len(timestamps)} Samples ({reader.total_count} insgesamt, Kapazität {reader.capacity})")
+
+    if args.stats:
+        for key, value in journal_stats(timestamps, counts).items():
+            print(f"{key:>12}: {value}")
+    if args.npz:
+        np.savez_compressed(args.npz, timestamps=timestamps, counts=counts)
+        print(f"Exportiert: {args.npz}")
+    reader.close()
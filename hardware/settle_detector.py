@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+SettleDetector - Erkennt, wann das Gewicht zur Ruhe gekommen ist
+
+Beobachtet den Strom gefilterter Gesamtgewichte und meldet ein
+"stabil"-Ereignis, sobald die Varianz über ein gleitendes Fenster unter
+einen Schwellwert fällt. Eine Hysterese verhindert Flattern zwischen
+stabil/instabil bei Werten nahe der Schwelle.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SettleEvent:
+    """Ergebnis einer Beruhigung"""
+    value: float           # Mittelwert über das Fenster (kg)
+    variance: float        # Varianz über das Fenster (kg²)
+    time_to_settle: float  # Sekunden von Bewegungsbeginn bis stabil
+    timestamp: float       # Zeitpunkt der Stabil-Meldung
+
+
+class SettleDetector:
+    """
+    Varianz-basierter Ruhe-Detektor
+
+    Args:
+        window: Anzahl Samples im Varianzfenster
+        variance_threshold: Stabil sobald Varianz darunter (kg²)
+        hysteresis: Instabil erst ab variance_threshold * hysteresis
+    """
+
+    def __init__(self, window: int = 10, variance_threshold: float = 0.0025,
+                 hysteresis: float = 4.0):
+        self.window = window
+        self.variance_threshold = variance_threshold
+        self.hysteresis = hysteresis
+        self._values = np.zeros(window)
+        self.reset()
+
+    def reset(self):
+        """Setzt den Detektor zurück (z.B. nach Tara)"""
+        self._count = 0
+        self._stable = False
+        self._motion_start: Optional[float] = None
+        self._current: Optional[SettleEvent] = None
+
+    @property
+    def is_stable(self) -> bool:
+        return self._stable
+
+    @property
+    def current(self) -> Optional[SettleEvent]:
+        """Aktueller stabiler Zustand (Wert wird laufend nachgeführt) oder None"""
+        return self._current if self._stable else None
+
+    def update(self, timestamp: float, weight: float) -> Optional[SettleEvent]:
+        """
+        Verarbeitet ein neues Gesamtgewicht
+
+        Returns:
+            SettleEvent beim Übergang instabil -> stabil, sonst None
+        """
+        self._values[self._count % self.window] = weight
+        self._count += 1
+        if self._motion_start is None:
+            self._motion_start = timestamp
+
+        if self._count < self.window:
+            return None
+
+        variance = float(self._values.var())
+        value = float(self._values.mean())
+
+        if self._stable:
+            if variance > self.variance_threshold * self.hysteresis:
+                # Bewegung erkannt - neue Beruhigungsphase beginnt
+                self._stable = False
+                self._current = None
+                self._motion_start = timestamp
+            else:
+                self._current = SettleEvent(value, variance,
+                                            self._current.time_to_settle, timestamp)
+            return None
+
+        if variance < self.variance_threshold:
+            self._stable = True
+            self._current = SettleEvent(
+                value=value,
+                variance=variance,
+                time_to_settle=timestamp - self._motion_start,
+                timestamp=timestamp
+            )
+            return self._current
+
+        return None
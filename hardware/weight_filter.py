@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+WeightFilterPipeline - Vektorisierte Filterkette für Wägezellen-Samples
+
+Arbeitet auf NumPy-Arrays der Form (N, 4) - alle 4 Zellen gleichzeitig:
+1. Gleitender Median (Ausreißer/Spikes entfernen)
+2. Exponentieller gleitender Mittelwert (EMA)
+3. Optional: 1-D Kalman-Filter pro Zelle (Random-Walk-Modell)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+EMA_MAX_CHUNK = 4096   # Zeilen pro vektorisiertem EMA-Block
+EMA_MIN_SCALE = 1e-12  # kleinster Gewichtsfaktor d^j innerhalb eines Blocks
+
+
+@dataclass
+class FilterConfig:
+    """Parameter der Filterkette"""
+    median_window: int = 5              # Samples für Spike-Unterdrückung
+    ema_alpha: float = 0.3              # 0 < alpha <= 1 (1 = keine Glättung)
+    use_kalman: bool = False            # Kalman statt EMA verwenden
+    kalman_process_noise: float = 1e-3  # Q: erwartete Gewichtsänderung pro Sample
+    kalman_measurement_noise: float = 1e-2  # R: Messrauschen pro Sample
+
+
+def rolling_median(samples: np.ndarray, window: int) -> np.ndarray:
+    """
+    Gleitender Median entlang der Zeitachse
+
+    Die ersten window-1 Zeilen werden mit dem ersten Sample aufgefüllt,
+    das Ergebnis hat daher dieselbe Form wie die Eingabe.
+    """
+    if window <= 1 or len(samples) == 0:
+        return samples.astype(np.float64, copy=True)
+
+    padded = np.concatenate((np.repeat(samples[:1], window - 1, axis=0), samples))
+    windows = sliding_window_view(padded, window, axis=0)  # (N, kanäle, window)
+    return np.median(windows, axis=-1)
+
+
+def exponential_moving_average(samples: np.ndarray, alpha: float,
+                               initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    EMA über alle Zeilen in O(N), blockweise vektorisiert
+
+    Innerhalb eines Blocks gilt mit d = 1-alpha
+        y[i] = d^(i+1) * y0 + alpha * d^i * cumsum(x[j] / d^j)
+    Die Blocklänge ist so begrenzt, dass d^-j nicht überläuft; der
+    letzte Wert eines Blocks ist der Startwert des nächsten.
+    Ohne Startwert wird mit dem ersten Sample initialisiert.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    n = len(samples)
+    if n == 0:
+        return samples.copy()
+
+    decay = 1.0 - alpha
+    state = np.asarray(samples[0] if initial is None else initial, dtype=np.float64)
+    if decay <= 0.0:
+        return samples.copy()
+
+    chunk = _ema_chunk_length(decay)
+    powers = np.power(decay, np.arange(min(chunk, n) + 1))  # d^0 .. d^chunk
+    result = np.empty_like(samples)
+    for start in range(0, n, chunk):
+        block = samples[start:start + chunk]
+        m = len(block)
+        scale = powers[:m, None]
+        weighted = np.cumsum(block / scale, axis=0)
+        result[start:start + m] = powers[1:m + 1, None] * state + alpha * scale * weighted
+        state = result[start + m - 1]
+    return result
+
+
+def _ema_chunk_length(decay: float) -> int:
+    """Blocklänge, bei der d^-j noch weit unter dem Überlauf bleibt"""
+    if decay >= 1.0:
+        return EMA_MAX_CHUNK
+    length = int(np.log(EMA_MIN_SCALE) / np.log(decay))
+    return max(1, min(EMA_MAX_CHUNK, length))
+
+
+class WeightFilterPipeline:
+    """
+    Filterkette für den Erfassungs-Thread
+
+    process() filtert einen kompletten Block (N, 4), step() verarbeitet
+    inkrementell das jeweils neueste Median-Fenster und behält den
+    EMA/Kalman-Zustand zwischen den Aufrufen.
+    """
+
+    def __init__(self, config: Optional[FilterConfig] = None, channels: int = 4):
+        self.config = config or FilterConfig()
+        self.channels = channels
+        self.reset()
+
+    def reset(self):
+        """Verwirft den Filterzustand (z.B. nach Tara)"""
+        self._state: Optional[np.ndarray] = None
+        self._kalman_variance = np.ones(self.channels)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Filtert einen Block von Samples
+
+        Args:
+            samples: Array (N, 4) mit Rohwerten pro Zelle
+
+        Returns:
+            Gefiltertes Array (N, 4); der Filterzustand zeigt danach
+            auf das letzte Sample des Blocks
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        if len(samples) == 0:
+            return samples.reshape(0, self.channels)
+
+        median = rolling_median(samples, self.config.median_window)
+
+        if self.config.use_kalman:
+            filtered = np.empty_like(median)
+            for i, row in enumerate(median):
+                filtered[i] = self._kalman_step(row)
+        else:
+            filtered = exponential_moving_average(median, self.config.ema_alpha, self._state)
+            self._state = filtered[-1].copy()
+
+        return filtered
+
+    def step(self, window: np.ndarray) -> np.ndarray:
+        """
+        Verarbeitet das neueste Sample inkrementell
+
+        Args:
+            window: Die letzten Samples (M, 4), neuestes zuletzt; für den
+                Median werden höchstens median_window Zeilen verwendet
+
+        Returns:
+            Gefilterter Wert pro Zelle (4,)
+        """
+        window = np.asarray(window, dtype=np.float64)
+        median = np.median(window[-self.config.median_window:], axis=0)
+
+        if self.config.use_kalman:
+            return self._kalman_step(median)
+
+        if self._state is None:
+            self._state = median
+        else:
+            alpha = self.config.ema_alpha
+            self._state = alpha * median + (1.0 - alpha) * self._state
+        return self._state.copy()
+
+    def _kalman_step(self, measurement: np.ndarray) -> np.ndarray:
+        """Ein Kalman-Schritt für alle Zellen gleichzeitig"""
+        if self._state is None:
+            self._state = measurement.copy()
+            return self._state.copy()
+
+        # Vorhersage (Random Walk): Zustand bleibt, Unsicherheit wächst
+        variance = self._kalman_variance + self.config.kalman_process_noise
+        # Korrektur
+        gain = variance / (variance + self.config.kalman_measurement_noise)
+        self._state = self._state + gain * (measurement - self._state)
+        self._kalman_variance = (1.0 - gain) * variance
+        return self._state.copy()
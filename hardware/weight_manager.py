@@ -3,21 +3,36 @@
 WeightManager - Zentrale Gewichtsverwaltung (Hardware-Only)
 Singleton Pattern für einheitliche Gewichts-Datenquelle
 
-Version: 1.5.0 (Hardware-Ready)
+Version: 1.7.0 (Hardware-Ready)
 - Simulation komplett entfernt
 - Direkte HX711-Hardware Integration
 - Resource-optimiert für Pi5
+- Hintergrund-Erfassung: GPIO-Zugriffe laufen nicht mehr im GUI-Thread
+- Hardware-Bring-up im Hintergrund: GUI startet ohne auf GPIO zu warten
 """
 
 import logging
+import math
+import os
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Callable, Any
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Callable, Any, List, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from threading import Lock
 
+import numpy as np
+
+from hardware.sample_buffer import SampleRingBuffer
+from hardware.weight_filter import WeightFilterPipeline, FilterConfig
+from hardware.settle_detector import SettleDetector, SettleEvent
+from hardware.cell_health import CellHealthTracker
+from hardware.removal_detector import FeedRemovalDetector, RemovalEvent
+from hardware.perf_stats import LatencyHistogram, CellRateMeter
+from hardware.load_distribution import LoadAnalyzer, LoadDistribution, CartGeometry
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,16 +41,72 @@ class WeightSensorInterface(ABC):
     @abstractmethod
     def read_weight(self) -> float:
         pass
+    
+    def read_cells(self) -> list[float]:
+        """Einzelwerte [VL, VR, HL, HR] - Standard: Gewicht gleichmäßig verteilt"""
+        return [self.read_weight() / 4.0] * 4
 
 @dataclass
 class WeightState:
-    """Hardware-Gewichtszustand"""
-    current_weight: float = 0.0
-    last_update: float = field(default_factory=time.time)
+    """Hardware-Zustand (Gewichtswerte stehen im WeightSnapshot)"""
     hardware_available: bool = False
     error_count: int = 0
     last_error: Optional[str] = None
 
+@dataclass(frozen=True)
+class WeightSnapshot:
+    """
+    Unveränderlicher Gewichtszustand
+    
+    Wird nur als Ganzes ersetzt (eine Referenzzuweisung) - Leser in
+    beliebigen Threads sehen ohne Lock immer zusammenpassende Werte.
+    """
+    seq: int = 0                                     # Steigt mit jeder Veröffentlichung
+    total: float = 0.0                               # Gesamtgewicht kg (nie negativ)
+    cells: tuple = (0.0, 0.0, 0.0, 0.0)              # [VL, VR, HL, HR] kg
+    timestamp: float = 0.0                           # Zeitpunkt der Messung
+    stable: bool = False                             # Ruhe-Detektor meldet stabil
+    estimated: tuple = (False, False, False, False)  # Zelle ausgefallen, Wert geschätzt
+    source: str = '-'                                # Gewichtsquelle
+
+@dataclass
+class HardwareStatus:
+    """Fortschritt des Hardware-Bring-ups"""
+    state: str = 'pending'     # pending | initializing | ready | failed
+    message: str = "Hardware noch nicht gestartet"
+    progress: float = 0.0      # 0.0 - 1.0
+
+@dataclass
+class ObserverSubscription:
+    """Registrierter Gewichts-Observer mit Benachrichtigungs-Optionen"""
+    callback: Callable[[float], None]
+    min_delta: float = 0.0          # Mindeständerung in kg seit letzter Meldung
+    min_interval: float = 0.0       # Mindestabstand in Sekunden (1 / max_rate)
+    last_value: Optional[float] = None
+    last_time: float = 0.0
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """Ergebnis von tare_async() / calibrate_async()"""
+    success: bool
+    message: str
+    tare: tuple = ()       # kg-Nullpunkt pro Zelle [VL, VR, HL, HR]
+    gain: tuple = ()       # Skalenfaktor pro Zelle
+    samples: int = 0       # Anzahl gemittelter Samples
+    source: Optional[str] = None   # Gewichtsquelle, deren Kalibrierung gesetzt wurde
+
+# Erfassungs-Parameter (Standardwerte, überschrieben durch HardwareSettings)
+ACQUISITION_INTERVAL = 0.1   # Sekunden zwischen zwei Erfassungen (aktiv)
+IDLE_INTERVAL = 1.0          # Sekunden zwischen zwei Erfassungen (Ruhe)
+IDLE_AFTER = 3.0             # Sekunden stabil bis zum Wechsel in den Ruhe-Modus
+BUFFER_CAPACITY = 256        # Slots im Ringpuffer
+CELL_TIMEOUT = 0.5           # Sekunden, nach denen eine hängende Zelle als Fehler zählt
+SENSOR_CALIBRATION = 'sensor'  # Kalibrier-Schlüssel für per use_sensor() eingesetzte Sensoren
+LOAD_WINDOW = 20             # Samples pro Lastverteilungs-Auswertung
+LOAD_EVERY = 5               # Lastverteilung nur jedes n-te Sample neu berechnen
+JOURNAL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'logs', 'hx711_samples.journal')
+
 class WeightManager:
     """
     Singleton für Hardware-Gewichtsverwaltung
@@ -43,6 +114,7 @@ class WeightManager:
     Nur für echte HX711 Hardware (4 Wägezellen)
     - Keine Simulation mehr
     - Direkte Hardware-Integration
+    - Erfassungs-Thread füllt Ringpuffer, read_weight() liest nur den Snapshot
     """
     
     _instance: Optional['WeightManager'] = None
@@ -63,18 +135,214 @@ class WeightManager:
             
         self._initialized = True
         self.state = WeightState()
-        self._observers: Dict[str, Callable[[float], None]] = {}
+        self._observers: Dict[str, ObserverSubscription] = {}
+        
+        # Hintergrund-Erfassung
+        self._buffer = SampleRingBuffer(capacity=BUFFER_CAPACITY, channels=4)
+        self._snapshot = WeightSnapshot()
+        self._filter = WeightFilterPipeline(channels=4)
+        self._acquisition_thread: Optional[threading.Thread] = None
+        self._acquisition_stop = threading.Event()
         
-        # Hardware-Verfügbarkeit prüfen
+        # Zell-Überwachung: Ausfälle erkennen, Anteil defekter Zellen schätzen
+        self._cell_health = CellHealthTracker(channels=4)
+        
+        # Kalibrierung pro Gewichtsquelle (Name aus der Registry bzw. SENSOR_CALIBRATION):
+        # zelle_kg = (wert - tare) * gain - die Quellen liefern verschiedene Einheiten
+        # (HX711-Counts, ESP8266-Rohwerte, ESP32 kg). Tupel werden getauscht, nie in-place geändert
+        self._calibrations: Dict[Optional[str], Tuple[np.ndarray, np.ndarray]] = {}
+        self._calibration_pool: Optional[ThreadPoolExecutor] = None
+        self._reset_requested = threading.Event()
+        self._load_calibration()
+        
+        # Ruhe-Erkennung ("stabil"-Ereignisse)
+        self._settle_detector = SettleDetector()
+        self._settle_observers: Dict[str, Callable[[SettleEvent], None]] = {}
+        self._stable_event = threading.Event()
+        self._stable_since: Optional[float] = None
+        
+        # Entnahme-Erkennung (negative Stufe zwischen zwei Ruhephasen)
+        self._removal_detector = FeedRemovalDetector()
+        self._removal_observers: Dict[str, Callable[[RemovalEvent], None]] = {}
+        self._last_removal: Optional[RemovalEvent] = None
+        
+        # Lastverteilung/Schwerpunkt - im Erfassungs-Thread berechnet, UI liest nur
+        self._load_analyzer = LoadAnalyzer()
+        self._load_distribution: Optional[LoadDistribution] = None
+        
+        # Laufzeit-Messwerte des Lesepfads (Diagnose-Seite, get_status)
+        self._latency = {name: LatencyHistogram() for name in ('read', 'conversion', 'filter', 'dispatch')}
+        self._cell_rates = CellRateMeter(channels=4)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._worst_stall = 0.0          # Größte Verspätung eines Samples gegenüber dem Intervall
+        self._worst_stall_at: Optional[float] = None
+        self._last_cycle: Optional[tuple] = None  # (Startzeit, geplantes Intervall) der letzten Runde
+        
+        # Adaptive Abtastrate: schnell bei Bewegung, langsam in Ruhe
+        self._active_interval = ACQUISITION_INTERVAL
+        self._idle_interval = IDLE_INTERVAL
+        self._idle_after = IDLE_AFTER
+        self._load_sampling_settings()
+        
+        # Hardware-Bring-up: wird explizit (main.py) oder beim ersten
+        # Lesezugriff im Hintergrund gestartet - nie im Konstruktor
+        self._hardware_status = HardwareStatus()
+        self._hardware_observers: Dict[str, Callable[[HardwareStatus], None]] = {}
+        self._hardware_thread: Optional[threading.Thread] = None
+        self._hardware_done = threading.Event()
+        self._hardware_lock = Lock()
+        
+        # Optionaler Ersatz-Sensor (z.B. ReplayWeightSensor) und Aufnahme
+        self._sensor: Optional[WeightSensorInterface] = None
+        self._recorder = None
+        self._journal = None  # Roh-Count-Journal (nur HX711-Pfad)
+        
+        # Gewichtsquellen mit Failover: lokale HX711 bevorzugt, Funk-Waagen als Ersatz
+        from hardware.weight_sources import WeightSourceRegistry, HX711Source
+        self._hx711_source = HX711Source(timeout=CELL_TIMEOUT)
+        self._sources = WeightSourceRegistry()
+        self._sources.register_observer("weight_manager", self._on_source_changed)
+        
+        logger.info("WeightManager initialisiert - Hardware-Start ausstehend")
+    
+    def start_hardware(self):
+        """
+        Startet den Hardware-Bring-up im Hintergrund (idempotent)
+        
+        Kehrt sofort zurück. Fortschritt und Ergebnis werden über
+        get_hardware_status() und die Hardware-Observer gemeldet.
+        """
+        with self._hardware_lock:
+            if self._hardware_status.state != 'pending':
+                return
+            self._hardware_status = HardwareStatus('initializing', "HX711-Treiber wird geladen...", 0.0)
+            self._hardware_thread = threading.Thread(
+                target=self._hardware_bringup,
+                name="HardwareBringup",
+                daemon=True
+            )
+        
+        self._notify_hardware_observers()
+        self._hardware_thread.start()
+    
+    def use_sensor(self, sensor: WeightSensorInterface):
+        """
+        Ersetzt die HX711-Hardware durch einen anderen Sensor
+        
+        Für Benchmarks und Fehler-Reproduktion ohne Hardware, z.B. mit
+        einem ReplayWeightSensor. Filter und Ruhe-Erkennung werden
+        zurückgesetzt, die Erfassung läuft danach mit dem neuen Sensor.
+        """
+        self.stop_acquisition()
+        self._sensor = sensor
+        self._buffer.clear()
+        self._cell_health.reset()
+        self._filter.reset()
+        self._settle_detector.reset()
+        self._removal_detector.reset()
+        self._stable_event.clear()
+        self._stable_since = None
+        self.state.hardware_available = True
+        
+        with self._hardware_lock:
+            self._hardware_status = HardwareStatus('ready', f"Sensor {type(sensor).__name__} aktiv", 1.0)
+        self._hardware_done.set()
+        self._notify_hardware_observers()
+        
+        self.start_acquisition()
+        logger.info(f"Gewichtsquelle ersetzt: {type(sensor).__name__}")
+    
+    def start_recording(self, max_samples: int = 100000):
+        """Beginnt die Aufnahme der kalibrierten Samples in kg (für ReplayWeightSensor)"""
+        from hardware.replay_sensor import SampleRecorder
+        self._recorder = SampleRecorder(max_samples=max_samples)
+        logger.info("Sample-Aufnahme gestartet")
+    
+    def stop_recording(self, path: str) -> int:
+        """
+        Beendet die Aufnahme und speichert sie als NPZ-Datei
+        
+        Returns:
+            Anzahl gespeicherter Samples (0 wenn keine Aufnahme lief)
+        """
+        recorder = self._recorder
+        self._recorder = None
+        if recorder is None:
+            logger.warning("Keine laufende Sample-Aufnahme")
+            return 0
+        try:
+            return recorder.save(path)
+        except Exception as e:
+            logger.error(f"Aufnahme konnte nicht gespeichert werden: {e}")
+            return 0
+    
+    def _hardware_bringup(self):
+        """Hintergrund-Thread: Hardware erkennen, initialisieren, Erfassung starten"""
+        started = time.time()
         self._detect_hardware()
         
-        logger.info(f"WeightManager initialisiert - Hardware verfügbar: {self.state.hardware_available}")
+        if self._sensor is not None:
+            # Während des Bring-ups per use_sensor() ersetzt - Status steht bereits
+            self._hardware_done.set()
+            return
+        
+        if self.state.hardware_available:
+            self._open_journal()
+            # Aktiviert die Quelle sofort -> _on_source_changed startet die Erfassung
+            self._sources.register('hx711', self._hx711_source, priority=0, healthy=True)
+        self._register_wireless_sources()
+        
+        if self._sources.active_name is None:
+            message = self.state.last_error or "HX711-Sensoren nicht verfügbar"
+            if self._sources.get_status():
+                message += " - suche Funk-Waage"
+            self._set_hardware_status('failed', message, 1.0)
+        
+        logger.info(f"Hardware-Bring-up nach {time.time() - started:.2f}s abgeschlossen - "
+                    f"Hardware verfügbar: {self.state.hardware_available}")
+        self._hardware_done.set()
+    
+    def _register_wireless_sources(self):
+        """Registriert die konfigurierten Funk-Waagen als Ersatzquellen (Prüfung im Hintergrund)"""
+        try:
+            from utils.settings_manager import get_settings_manager
+            from hardware.weight_sources import ESP8266HttpSource, ESP32WebSocketSource
+            hardware = get_settings_manager().hardware
+            if hardware.esp8266_hosts:
+                self._sources.register('esp8266', ESP8266HttpSource(hardware.esp8266_hosts), priority=1)
+            if hardware.esp32_host:
+                self._sources.register('esp32', ESP32WebSocketSource(hardware.esp32_host), priority=2)
+        except Exception as e:
+            logger.warning(f"Funk-Waagen nicht registrierbar: {e}")
+    
+    def _on_source_changed(self, name: Optional[str]):
+        """Quellen-Observer: Failover/Failback auf eine andere Gewichtsquelle"""
+        if self._sensor is not None:
+            return  # Ersatz-Sensor aktiv - Registry wird nicht gelesen
+        
+        if name is None:
+            self.state.hardware_available = False
+            self._set_hardware_status('failed', "Keine Gewichtsquelle erreichbar", 1.0)
+            return
+        
+        self.state.hardware_available = True
+        self._reset_requested.set()  # Samples verschiedener Quellen nicht vermischen
+        self.start_acquisition()
+        self._set_hardware_status('ready', f"Waage bereit ({name})", 1.0)
     
     def _detect_hardware(self):
         """Prüft Hardware-Verfügbarkeit und initialisiert entsprechend"""
+        def progress(index: int, total: int, name: str):
+            self._set_hardware_status('initializing', f"Wägezelle {name} initialisiert", index / (total + 1))
+        
+        if self._sensor is not None:
+            self.state.hardware_available = True
+            return
+        
         try:
-            from hardware.hx711_real import lese_gewicht_hx711, hx_sensors
-            if hx_sensors:  # Hardware erfolgreich initialisiert
+            from hardware.hx711_real import ensure_hx711_initialized
+            if ensure_hx711_initialized(progress):  # Hardware erfolgreich initialisiert
                 self.state.hardware_available = True
                 logger.info("✅ HX711 Hardware erkannt und initialisiert")
             else:
@@ -84,13 +352,380 @@ class WeightManager:
         except ImportError as e:
             logger.error(f"❌ Hardware-Module nicht importierbar: {e}")
             self.state.hardware_available = False
+            self.state.last_error = str(e)
         except Exception as e:
             logger.error(f"❌ Hardware-Erkennung fehlgeschlagen: {e}")
             self.state.hardware_available = False
+            self.state.last_error = str(e)
+    
+    def _set_hardware_status(self, state: str, message: str, progress: float):
+        """Setzt den Bring-up-Status und benachrichtigt die Hardware-Observer"""
+        self._hardware_status = HardwareStatus(state, message, progress)
+        self._notify_hardware_observers()
+    
+    def _notify_hardware_observers(self):
+        """Meldet den aktuellen Bring-up-Status an alle Hardware-Observer"""
+        status = self._hardware_status
+        for name, callback in list(self._hardware_observers.items()):
+            try:
+                callback(status)
+            except Exception as e:
+                logger.error(f"Hardware-Observer '{name}' Fehler: {e}")
+    
+    def get_hardware_status(self) -> HardwareStatus:
+        """Aktueller Stand des Hardware-Bring-ups"""
+        return self._hardware_status
+    
+    @property
+    def hardware_ready(self) -> bool:
+        """True sobald die Hardware initialisiert ist und erfasst wird"""
+        return self._hardware_status.state == 'ready'
+    
+    def wait_for_hardware(self, timeout: Optional[float] = None) -> bool:
+        """
+        Startet den Bring-up falls nötig und wartet auf sein Ende
+        
+        Für Skripte und Tests - im GUI-Thread stattdessen den
+        Hardware-Observer bzw. das Qt-Signal verwenden.
+        
+        Returns:
+            True wenn die Hardware verfügbar ist
+        """
+        self.start_hardware()
+        self._hardware_done.wait(timeout)
+        return self.state.hardware_available
+    
+    def register_hardware_observer(self, name: str, callback: Callable[[HardwareStatus], None]):
+        """
+        Registriert einen Observer für den Hardware-Bring-up
+        
+        Der Callback erhält den aktuellen HardwareStatus sofort und danach
+        bei jeder Änderung - aus dem Bring-up-Thread, nicht dem GUI-Thread.
+        """
+        self._hardware_observers[name] = callback
+        logger.debug(f"Hardware-Observer '{name}' registriert")
+        try:
+            callback(self._hardware_status)
+        except Exception as e:
+            logger.error(f"Hardware-Observer '{name}' Fehler: {e}")
+    
+    def unregister_hardware_observer(self, name: str):
+        """Entfernt einen Hardware-Observer"""
+        if name in self._hardware_observers:
+            del self._hardware_observers[name]
+            logger.debug(f"Hardware-Observer '{name}' entfernt")
+    
+    def start_acquisition(self):
+        """Startet den Erfassungs-Thread (idempotent)"""
+        if self.is_acquiring:
+            return
+        if not self.state.hardware_available:
+            logger.warning("Erfassung nicht gestartet - Hardware nicht verfügbar")
+            return
+        
+        self._acquisition_stop.clear()
+        self._last_cycle = None  # Pause zwischen Stop und Start ist keine Verspätung
+        self._acquisition_thread = threading.Thread(
+            target=self._acquisition_loop,
+            name="WeightAcquisition",
+            daemon=True
+        )
+        self._acquisition_thread.start()
+        logger.info("Gewichts-Erfassung im Hintergrund gestartet")
+    
+    def stop_acquisition(self, timeout: float = 2.0):
+        """Stoppt den Erfassungs-Thread und wartet auf sein Ende"""
+        thread = self._acquisition_thread
+        if thread is None:
+            return
+        
+        self._acquisition_stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._acquisition_thread = None
+        logger.info("Gewichts-Erfassung gestoppt")
+    
+    @property
+    def is_acquiring(self) -> bool:
+        """True solange der Erfassungs-Thread läuft"""
+        thread = self._acquisition_thread
+        return thread is not None and thread.is_alive()
+    
+    def _open_journal(self):
+        """Öffnet das memory-mapped Roh-Sample-Journal (falls aktiviert)"""
+        try:
+            from utils.settings_manager import get_settings_manager
+            hardware = get_settings_manager().hardware
+            if not hardware.journal_enabled:
+                return
+            from hardware.sample_journal import SampleJournal
+            self._journal = SampleJournal(JOURNAL_PATH, capacity=hardware.journal_capacity, channels=4)
+            self._hx711_source.journal = self._journal
+        except Exception as e:
+            logger.warning(f"Sample-Journal nicht verfügbar: {e}")
+            self._journal = None
+    
+    def _read_samples(self) -> List[Tuple[float, list]]:
+        """
+        Neue Roh-Samples aller 4 Zellen mit Messzeit (None für Fehler/Timeout)
+        
+        Ein Ersatz-Sensor ohne read_samples() liefert ein Sample pro Runde,
+        die Registry alle neuen Samples der aktiven Quelle.
+        """
+        if self._sensor is not None:
+            read_samples = getattr(self._sensor, 'read_samples', None)
+            if read_samples is None:
+                return [(time.time(), self._sensor.read_cells())]
+            return read_samples()
+        return self._sources.read_samples()
+    
+    def _calibration_source(self, last_read: bool = False) -> Optional[str]:
+        """
+        Quelle, deren Kalibrierung gilt (SENSOR_CALIBRATION bei Ersatz-Sensor)
+        
+        Args:
+            last_read: Quelle des zuletzt gelesenen Samples statt der aktiven -
+                nach einem Quellenwechsel passt die Einheit damit zum Sample
+        """
+        if self._sensor is not None:
+            return SENSOR_CALIBRATION
+        return self._sources.last_read_name if last_read else self._sources.active_name
+    
+    def _calibration_for(self, source: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Nullpunkt/Skalenfaktoren einer Quelle (unkalibriert: Werte unverändert)"""
+        calibration = self._calibrations.get(source)
+        if calibration is None:
+            return np.zeros(4), np.ones(4)
+        return calibration
+    
+    def _acquisition_loop(self):
+        """Erfassungs-Thread: liest fortlaufend alle 4 Zellen in den Ringpuffer"""
+        while not self._acquisition_stop.is_set():
+            started = time.time()
+            if self._reset_requested.is_set():
+                # Nach Tara/Kalibrierung: alte Samples passen nicht mehr zur Skala
+                self._reset_requested.clear()
+                self._buffer.clear()
+                self._filter.reset()
+                self._settle_detector.reset()
+                self._removal_detector.reset()
+                self._load_distribution = None
+                self._stable_event.clear()
+                self._stable_since = None
+            self._track_stall(started)
+            try:
+                t0 = time.perf_counter()
+                samples = self._read_samples()
+                t1 = time.perf_counter()
+                self._latency['read'].record(t1 - t0)
+                
+                # Erst kalibrieren (Quelleinheit -> kg), dann defekte/hängende Zellen schätzen -
+                # die Schwellen der Zell-Überwachung sind in kg angegeben
+                tare, gain = self._calibration_for(self._calibration_source(last_read=True))
+                for timestamp, raw in samples:
+                    t2 = time.perf_counter()
+                    self._cell_rates.record(timestamp, [v is not None for v in raw])
+                    
+                    values = np.array([np.nan if v is None else v for v in raw], dtype=np.float64)
+                    calibrated = (values - tare) * gain
+                    recorder = self._recorder
+                    if recorder is not None:
+                        # In kg aufzeichnen - die Wiedergabe läuft ohne Kalibrierung der Quelle
+                        recorder.append(calibrated, timestamp)
+                    cells = self._cell_health.update(calibrated)
+                    estimated = tuple(v is None or not math.isfinite(v) or excluded
+                                      for v, excluded in zip(raw, self._cell_health.excluded))
+                    self._buffer.push(cells, timestamp)
+                    self._latency['conversion'].record(time.perf_counter() - t2)
+                    self._publish_snapshot(estimated)
+            except Exception as e:
+                self.state.error_count += 1
+                self.state.last_error = str(e)
+                logger.error(f"Gewichtserfassung fehlgeschlagen: {e}")
+            
+            # Restzeit des Intervalls warten (abbrechbar)
+            elapsed = time.time() - started
+            interval = self._current_interval()
+            self._last_cycle = (started, max(interval, elapsed))
+            self._acquisition_stop.wait(max(0.0, interval - elapsed))
+    
+    def _track_stall(self, started: float):
+        """Merkt sich die größte Verspätung einer Runde gegenüber ihrem Zeitplan"""
+        if self._last_cycle is None:
+            return
+        previous, planned = self._last_cycle
+        stall = started - previous - planned
+        if stall > self._worst_stall:
+            self._worst_stall = stall
+            self._worst_stall_at = started
+    
+    def _load_sampling_settings(self, category: str = 'hardware'):
+        """Übernimmt die Abtastraten aus den HardwareSettings"""
+        try:
+            from utils.settings_manager import get_settings_manager
+            settings = get_settings_manager()
+            hardware = settings.hardware
+            
+            # hx711_update_rate ist die Obergrenze: kürzestes erlaubtes Intervall
+            self._active_interval = max(0.01, hardware.hx711_update_rate / 1000.0)
+            self._idle_interval = max(self._active_interval, hardware.hx711_idle_rate / 1000.0)
+            self._idle_after = max(0.0, hardware.hx711_idle_after / 1000.0)
+            self._load_analyzer.geometry = CartGeometry(
+                track_width=hardware.cart_track_width,
+                wheelbase=hardware.cart_wheelbase
+            )
+            
+            if not hasattr(self, '_sampling_callback_registered'):
+                settings.register_change_callback('hardware', self._load_sampling_settings)
+                self._sampling_callback_registered = True
+                
+        except Exception as e:
+            logger.warning(f"Abtastraten aus Settings nicht ladbar - verwende Standardwerte: {e}")
+    
+    @property
+    def sampling_mode(self) -> str:
+        """'active' bei Bewegung, 'idle' wenn die Waage länger ruhig ist"""
+        if self._stable_since is None:
+            return 'active'
+        if time.time() - self._stable_since < self._idle_after:
+            return 'active'
+        return 'idle'
+    
+    def _current_interval(self) -> float:
+        """Erfassungsintervall passend zum aktuellen Abtast-Modus"""
+        if self.sampling_mode == 'idle':
+            return self._idle_interval
+        return self._active_interval
+    
+    def configure_filter(self, config: FilterConfig):
+        """Ersetzt die Filter-Parameter (Zustand wird zurückgesetzt)"""
+        self._filter = WeightFilterPipeline(config, channels=4)
+        logger.info(f"Filter konfiguriert: {config}")
+    
+    def _publish_snapshot(self, estimated: tuple = (False, False, False, False)):
+        """Filtert das neueste Sample und veröffentlicht den Snapshot"""
+        t0 = time.perf_counter()
+        timestamps, values = self._buffer.window(self._filter.config.median_window)
+        cells = self._filter.step(values)
+        weight = float(cells.sum())
+        timestamp = float(timestamps[-1])
+        t1 = time.perf_counter()
+        
+        self.state.error_count = 0
+        self.state.last_error = None
+        
+        # Ruhe-Erkennung zuerst, damit der Snapshot den aktuellen stabil-Zustand trägt
+        self._update_settle_state(timestamp, weight)
+        snapshot = self._publish(weight, cells, timestamp, estimated)
+        if self._buffer.total_count % LOAD_EVERY == 0:
+            self._update_load_distribution()
+        
+        # Observer benachrichtigen (läuft im Erfassungs-Thread!)
+        self._notify_observers(snapshot.total)
+        self._latency['filter'].record(t1 - t0)
+        self._latency['dispatch'].record(time.perf_counter() - t1)
+    
+    def _publish(self, weight: float, cells, timestamp: float,
+                 estimated: tuple = (False, False, False, False)) -> WeightSnapshot:
+        """Ersetzt den Snapshot atomar (nur ein schreibender Thread zur Zeit)"""
+        snapshot = WeightSnapshot(
+            seq=self._snapshot.seq + 1,
+            total=max(0.0, weight),  # Negative Gewichte verhindern
+            cells=tuple(float(v) for v in cells),
+            timestamp=timestamp,
+            stable=self._settle_detector.is_stable,
+            estimated=tuple(estimated),
+            source=type(self._sensor).__name__ if self._sensor else (self._sources.active_name or '-')
+        )
+        self._snapshot = snapshot
+        return snapshot
+    
+    def _update_load_distribution(self):
+        """Wertet die Lastverteilung über die letzten Samples aus und warnt bei Änderung"""
+        _, values = self._buffer.window(LOAD_WINDOW)
+        distribution = self._load_analyzer.analyze(values)
+        previous = self._load_distribution
+        self._load_distribution = distribution
+        
+        warning = distribution.warning if distribution else None
+        if warning and warning != (previous.warning if previous else None):
+            logger.warning(warning)
+    
+    def get_snapshot(self) -> WeightSnapshot:
+        """
+        Aktueller Gewichtszustand - aus jedem Thread ohne Lock lesbar
+        
+        Über snapshot.seq lässt sich billig prüfen, ob seit dem letzten
+        Abruf ein neuer Wert veröffentlicht wurde.
+        """
+        return self._snapshot
+    
+    def _update_settle_state(self, timestamp: float, weight: float):
+        """Füttert den Ruhe-Detektor und meldet neue stabil-Ereignisse"""
+        event = self._settle_detector.update(timestamp, weight)
+        
+        if self._settle_detector.is_stable:
+            self._stable_event.set()
+            if self._stable_since is None:
+                self._stable_since = timestamp
+        else:
+            self._stable_event.clear()
+            if self._stable_since is not None:
+                logger.debug("Bewegung erkannt - schnelle Abtastung")
+            self._stable_since = None
+        
+        if event:
+            logger.debug(f"Gewicht stabil: {event.value:.2f} kg nach {event.time_to_settle:.2f}s")
+            for name, callback in list(self._settle_observers.items()):
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Settle-Observer '{name}' Fehler: {e}")
+        
+        removal = self._removal_detector.update(timestamp, self._settle_detector.current)
+        if removal:
+            self._last_removal = removal
+            logger.info(f"Entnahme erkannt: {removal.amount:.2f} kg in {removal.duration:.1f}s "
+                        f"(Konfidenz {removal.confidence:.2f})")
+            for name, callback in list(self._removal_observers.items()):
+                try:
+                    callback(removal)
+                except Exception as e:
+                    logger.error(f"Entnahme-Observer '{name}' Fehler: {e}")
+    
+    @property
+    def is_stable(self) -> bool:
+        """True solange das Gewicht als ruhig erkannt ist"""
+        return self._settle_detector.is_stable
+    
+    def get_stable_weight(self) -> Optional[SettleEvent]:
+        """Aktueller stabiler Zustand oder None während Bewegung"""
+        return self._settle_detector.current
+    
+    def wait_for_stable(self, timeout: float = 3.0) -> Optional[SettleEvent]:
+        """
+        Wartet bis das Gewicht stabil ist (kehrt sofort zurück wenn bereits stabil)
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+            
+        Returns:
+            SettleEvent oder None (Timeout bzw. keine laufende Erfassung)
+        """
+        if not self.is_acquiring:
+            return None
+        if self._stable_event.wait(timeout):
+            return self._settle_detector.current
+        logger.warning(f"Gewicht nach {timeout:.1f}s nicht stabil")
+        return None
     
     def read_weight(self, use_cache: bool = True) -> float:
         """
-        Liest aktuelles Gewicht von der Hardware
+        Liest aktuelles Gewicht
+        
+        Bei laufender Erfassung wird nur der letzte Snapshot zurückgegeben
+        (O(1), kein GPIO-Zugriff). Ohne Erfassungs-Thread wird wie bisher
+        direkt von der Hardware gelesen.
         
         Args:
             use_cache: Verwende zwischengespeicherten Wert wenn verfügbar
@@ -99,36 +734,44 @@ class WeightManager:
             Gewicht in kg
         """
         if not self.state.hardware_available:
-            logger.warning("Hardware nicht verfügbar - gebe 0.0 zurück")
+            # Erster Zugriff ohne expliziten Start: Bring-up im Hintergrund anstoßen
+            self.start_hardware()
+            if self._hardware_status.state == 'failed':
+                logger.warning("Hardware nicht verfügbar - gebe 0.0 zurück")
             return 0.0
+        
+        snapshot = self._snapshot
+        if self.is_acquiring:
+            self._cache_hits += 1
+            return snapshot.total
             
         current_time = time.time()
         
         # Cache-Logik: Nur alle 100ms neu lesen (Performance)
-        if use_cache and (current_time - self.state.last_update) < 0.1:
-            return self.state.current_weight
+        if use_cache and (current_time - snapshot.timestamp) < 0.1:
+            self._cache_hits += 1
+            return snapshot.total
         
+        self._cache_misses += 1
         try:
-            from hardware.hx711_real import lese_gewicht_hx711
-            weight = lese_gewicht_hx711()
+            from hardware.hx711_real import lese_einzelzellwerte_hx711
+            cells = lese_einzelzellwerte_hx711()
             
-            # State aktualisieren
-            self.state.current_weight = max(0.0, weight)  # Negative Gewichte verhindern
-            self.state.last_update = current_time
             self.state.error_count = 0
             self.state.last_error = None
+            snapshot = self._publish(sum(cells), cells, current_time)
             
             # Observer benachrichtigen
-            self._notify_observers(self.state.current_weight)
+            self._notify_observers(snapshot.total)
             
-            return self.state.current_weight
+            return snapshot.total
             
         except Exception as e:
             self.state.error_count += 1
             self.state.last_error = str(e)
             logger.error(f"Gewichtslesung fehlgeschlagen: {e}")
             
-            return self.state.current_weight  # Letzten gültigen Wert zurückgeben
+            return snapshot.total  # Letzten gültigen Wert zurückgeben
     
     def read_individual_cells(self) -> list[float]:
         """
@@ -138,7 +781,11 @@ class WeightManager:
             Liste mit 4 Gewichtswerten [VL, VR, HL, HR]
         """
         if not self.state.hardware_available:
+            self.start_hardware()
             return [0.0, 0.0, 0.0, 0.0]
+        
+        if self.is_acquiring:
+            return list(self._snapshot.cells)
             
         try:
             from hardware.hx711_real import lese_einzelzellwerte_hx711
@@ -148,16 +795,36 @@ class WeightManager:
             logger.error(f"Einzelzellwerte nicht lesbar: {e}")
             return [0.0, 0.0, 0.0, 0.0]
     
-    def register_observer(self, name: str, callback: Callable[[float], None]):
+    def get_load_distribution(self) -> Optional[LoadDistribution]:
+        """
+        Achslasten und Schwerpunkt über die letzten Samples
+        
+        Returns:
+            LoadDistribution (mit one_sided/tipping_risk-Warnung) oder None,
+            solange die Erfassung noch keine Samples geliefert hat
+        """
+        return self._load_distribution
+    
+    def register_observer(self, name: str, callback: Callable[[float], None],
+                          min_delta: float = 0.0, max_rate: Optional[float] = None):
         """
         Registriert einen Observer für Gewichtsupdates
         
+        Hinweis: Bei laufender Erfassung wird der Callback im
+        Erfassungs-Thread aufgerufen, nicht im GUI-Thread. Für Widgets
+        stattdessen get_weight_signals().weight_channel() verwenden.
+        
         Args:
             name: Eindeutige ID des Observers
             callback: Funktion die bei Gewichtsänderung aufgerufen wird
+            min_delta: Nur melden wenn sich das Gewicht seit der letzten
+                Meldung um mindestens so viele kg geändert hat
+            max_rate: Höchstens so viele Meldungen pro Sekunde; unterdrückte
+                Änderungen werden mit dem nächsten Sample nachgeliefert
         """
-        self._observers[name] = callback
-        logger.debug(f"Observer '{name}' registriert")
+        min_interval = 1.0 / max_rate if max_rate else 0.0
+        self._observers[name] = ObserverSubscription(callback, min_delta, min_interval)
+        logger.debug(f"Observer '{name}' registriert (min_delta={min_delta}, max_rate={max_rate})")
     
     def unregister_observer(self, name: str):
         """Entfernt einen Observer"""
@@ -166,13 +833,91 @@ class WeightManager:
             logger.debug(f"Observer '{name}' entfernt")
     
     def _notify_observers(self, weight: float):
-        """Benachrichtigt alle Observer über Gewichtsänderung"""
-        for name, callback in self._observers.items():
+        """Benachrichtigt alle Observer über Gewichtsänderung (gemäß ihren Optionen)"""
+        now = time.monotonic()
+        # Kopie: Observer können aus anderen Threads (de)registriert werden
+        for name, subscription in list(self._observers.items()):
+            if subscription.last_value is not None:
+                if abs(weight - subscription.last_value) < subscription.min_delta:
+                    continue
+                if now - subscription.last_time < subscription.min_interval:
+                    continue
+            
+            subscription.last_value = weight
+            subscription.last_time = now
             try:
-                callback(weight)
+                subscription.callback(weight)
             except Exception as e:
                 logger.error(f"Observer '{name}' Fehler: {e}")
     
+    def register_settle_observer(self, name: str, callback: Callable[[SettleEvent], None]):
+        """
+        Registriert einen Observer für "stabil"-Ereignisse
+        
+        Der Callback läuft im Erfassungs-Thread und erhält ein SettleEvent
+        (Wert, Varianz, Zeit bis zur Beruhigung).
+        """
+        self._settle_observers[name] = callback
+        logger.debug(f"Settle-Observer '{name}' registriert")
+    
+    def unregister_settle_observer(self, name: str):
+        """Entfernt einen Settle-Observer"""
+        if name in self._settle_observers:
+            del self._settle_observers[name]
+            logger.debug(f"Settle-Observer '{name}' entfernt")
+    
+    def register_removal_observer(self, name: str, callback: Callable[[RemovalEvent], None]):
+        """
+        Registriert einen Observer für erkannte Futterentnahmen
+        
+        Der Callback läuft im Erfassungs-Thread und erhält ein RemovalEvent
+        (Menge, Beginn/Ende, Konfidenz).
+        """
+        self._removal_observers[name] = callback
+        logger.debug(f"Entnahme-Observer '{name}' registriert")
+    
+    def unregister_removal_observer(self, name: str):
+        """Entfernt einen Entnahme-Observer"""
+        if name in self._removal_observers:
+            del self._removal_observers[name]
+            logger.debug(f"Entnahme-Observer '{name}' entfernt")
+    
+    def get_last_removal(self) -> Optional[RemovalEvent]:
+        """Zuletzt erkannte Futterentnahme oder None"""
+        return self._last_removal
+    
+    def get_performance(self) -> Dict[str, Any]:
+        """
+        Laufzeit-Messwerte des Lesepfads
+        
+        Returns:
+            latency: Histogramm/Perzentile je Stufe (read = Quelle/GPIO,
+                conversion = Zell-Überwachung + Kalibrierung, filter,
+                dispatch = Observer + Ruhe-/Entnahme-Erkennung)
+            cell_rates: Effektive Samples/s je Zelle [VL, VR, HL, HR]
+            cache_hit_ratio: Anteil read_weight()-Aufrufe ohne Hardware-Zugriff
+            worst_stall_ms: Größte Verspätung einer Erfassungsrunde
+        """
+        calls = self._cache_hits + self._cache_misses
+        return {
+            'latency': {name: hist.summary() for name, hist in self._latency.items()},
+            'cell_rates': self._cell_rates.rates(),
+            'cache_hits': self._cache_hits,
+            'cache_misses': self._cache_misses,
+            'cache_hit_ratio': self._cache_hits / calls if calls else None,
+            'worst_stall_ms': self._worst_stall * 1000.0,
+            'worst_stall_at': self._worst_stall_at
+        }
+    
+    def reset_performance(self):
+        """Setzt alle Laufzeit-Messwerte zurück"""
+        for hist in self._latency.values():
+            hist.reset()
+        self._cell_rates.reset()
+        self._cache_hits = self._cache_misses = 0
+        self._worst_stall = 0.0
+        self._worst_stall_at = None
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Gibt aktuellen Status zurück
@@ -182,17 +927,190 @@ class WeightManager:
         """
         return {
             'hardware_available': self.state.hardware_available,
-            'current_weight': self.state.current_weight,
-            'last_update': self.state.last_update,
+            'hardware_state': self._hardware_status.state,
+            'hardware_message': self._hardware_status.message,
+            'current_weight': self._snapshot.total,
+            'last_update': self._snapshot.timestamp,
+            'snapshot_seq': self._snapshot.seq,
             'error_count': self.state.error_count,
-            'last_error': self.state.last_error
+            'last_error': self.state.last_error,
+            'acquiring': self.is_acquiring,
+            'stable': self.is_stable,
+            'sampling_mode': self.sampling_mode,
+            'sampling_interval': self._current_interval(),
+            'samples_total': self._buffer.total_count,
+            'sensor': type(self._sensor).__name__ if self._sensor else (self._sources.active_name or '-'),
+            'sources': self._sources.get_status(),
+            'recording': self._recorder is not None,
+            'cells': self._cell_health.get_status(),
+            'calibration': self.get_calibration(),
+            'load_distribution': self._load_distribution,
+            'journal_samples': self._journal.total_count if self._journal else 0,
+            'performance': self.get_performance()
         }
     
+    def _load_calibration(self):
+        """Übernimmt Nullpunkt und Skalenfaktoren pro Quelle aus den CalibrationSettings"""
+        try:
+            from utils.settings_manager import get_settings_manager
+            calibration = get_settings_manager().calibration
+            stored = dict(calibration.source_calibrations or {})
+            if 'hx711' not in stored:
+                # Ältere Einstellungen: tare_values/scale_factors gehören zum HX711
+                stored['hx711'] = {'tare': calibration.tare_values, 'gain': calibration.scale_factors}
+            for source, values in stored.items():
+                tare = np.asarray(values['tare'][:4], dtype=np.float64)
+                gain = np.asarray(values['gain'][:4], dtype=np.float64)
+                if tare.shape == (4,) and gain.shape == (4,) and np.all(gain != 0):
+                    self._calibrations[source] = (tare, gain)
+        except Exception as e:
+            logger.warning(f"Kalibrierung aus Settings nicht ladbar - verwende Standardwerte: {e}")
+    
+    def _save_calibration(self, source: str, tare: np.ndarray, gain: np.ndarray):
+        """Speichert Nullpunkt und Skalenfaktoren einer Quelle in den CalibrationSettings"""
+        try:
+            from utils.settings_manager import get_settings_manager
+            settings = get_settings_manager()
+            stored = dict(settings.calibration.source_calibrations or {})
+            stored[source] = {'tare': [float(v) for v in tare], 'gain': [float(v) for v in gain]}
+            settings.set_setting('calibration', 'source_calibrations', stored, save=False)
+            if source == 'hx711':
+                # Kalibrierseite und ältere Versionen lesen weiterhin diese Felder
+                settings.set_setting('calibration', 'tare_values', stored[source]['tare'], save=False)
+                settings.set_setting('calibration', 'scale_factors', stored[source]['gain'], save=False)
+            settings.set_setting('calibration', 'last_calibration', datetime.now().isoformat())
+        except Exception as e:
+            logger.error(f"Kalibrierung konnte nicht gespeichert werden: {e}")
+    
+    def get_calibration(self) -> Dict[str, Any]:
+        """Kalibrierung der aktiven Quelle {'source': ..., 'tare': [...], 'gain': [...]}"""
+        source = self._calibration_source()
+        tare, gain = self._calibration_for(source)
+        return {'source': source, 'tare': tare.tolist(), 'gain': gain.tolist()}
+    
+    def set_calibration(self, tare, gain, persist: bool = True, source: Optional[str] = None):
+        """
+        Setzt Nullpunkt/Skalenfaktoren direkt (z.B. Zurücksetzen)
+        
+        Args:
+            source: Gewichtsquelle, deren Kalibrierung gesetzt wird
+                (Standard: die aktive Quelle)
+        """
+        if source is None:
+            source = self._calibration_source()
+        tare = np.asarray(tare, dtype=np.float64)
+        gain = np.asarray(gain, dtype=np.float64)
+        self._calibrations[source] = (tare, gain)
+        if source == self._calibration_source():
+            self._reset_requested.set()
+        if persist:
+            if source in (None, SENSOR_CALIBRATION):
+                logger.debug("Kalibrierung ohne Gewichtsquelle wird nicht gespeichert")
+            else:
+                self._save_calibration(source, tare, gain)
+    
+    def _submit_calibration(self, job: Callable[[], CalibrationResult]) -> Future:
+        """Führt einen Tara-/Kalibrier-Job im Hintergrund aus"""
+        with self._lock:
+            if self._calibration_pool is None:
+                self._calibration_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Calibration")
+        return self._calibration_pool.submit(job)
+    
+    def _stable_cell_means(self, timeout: float):
+        """
+        Wartet auf Ruhe und mittelt das Settle-Fenster aus dem Ringpuffer
+        
+        Returns:
+            (Mittelwert pro Zelle (4,), Anzahl Samples) oder (None, Fehlertext)
+        """
+        if not self.is_acquiring:
+            return None, "Erfassung läuft nicht - Hardware nicht verfügbar"
+        
+        # Nach vorheriger Tara erst die Samples mit neuer Skala abwarten
+        deadline = time.time() + timeout
+        while self._reset_requested.is_set() and time.time() < deadline:
+            time.sleep(0.01)
+        
+        if self.wait_for_stable(max(0.0, deadline - time.time())) is None:
+            return None, f"Gewicht nach {timeout:.1f}s nicht stabil"
+        
+        _, values = self._buffer.window(self._settle_detector.window)
+        if len(values) == 0:
+            return None, "Keine Samples im Puffer"
+        # Alle 4 Zellen gleichzeitig aus dem bereits erfassten Strom
+        return values.mean(axis=0), len(values)
+    
+    def tare_async(self, timeout: float = 3.0, persist: bool = True) -> Future:
+        """
+        Nullt die Waage ohne den Aufrufer zu blockieren
+        
+        Wartet im Hintergrund auf Ruhe, übernimmt den Mittelwert des
+        Settle-Fensters als neuen Nullpunkt aller 4 Zellen.
+        
+        Returns:
+            Future mit CalibrationResult
+        """
+        def job() -> CalibrationResult:
+            means, info = self._stable_cell_means(timeout)
+            if means is None:
+                logger.warning(f"Tara fehlgeschlagen: {info}")
+                return CalibrationResult(False, info)
+            
+            source = self._calibration_source()
+            tare, gain = self._calibration_for(source)
+            # Pufferwerte sind bereits kalibriert: zurück auf die Skala der Quelle umrechnen
+            new_tare = tare + means / gain
+            self.set_calibration(new_tare, gain, persist=persist, source=source)
+            logger.info(f"Tara gesetzt aus {info} Samples: {np.round(new_tare, 3).tolist()}")
+            return CalibrationResult(True, "Nullpunkt gesetzt", tuple(new_tare.tolist()),
+                                     tuple(gain.tolist()), info, source)
+        
+        return self._submit_calibration(job)
+    
+    def calibrate_async(self, known_weight: float, timeout: float = 3.0,
+                        persist: bool = True) -> Future:
+        """
+        Kalibriert mit bekanntem Referenzgewicht ohne den Aufrufer zu blockieren
+        
+        Da nur das Gesamtgewicht bekannt ist, wird ein gemeinsamer Faktor
+        k = Referenzgewicht / gemessene Summe auf alle Zellen angewendet.
+        Voraussetzung ist eine vorherige Tara mit leerem Karren.
+        
+        Returns:
+            Future mit CalibrationResult
+        """
+        def job() -> CalibrationResult:
+            if known_weight <= 0:
+                return CalibrationResult(False, "Referenzgewicht muss positiv sein")
+            
+            means, info = self._stable_cell_means(timeout)
+            if means is None:
+                logger.warning(f"Kalibrierung fehlgeschlagen: {info}")
+                return CalibrationResult(False, info)
+            
+            measured = float(means.sum())
+            if measured <= known_weight * 0.01:
+                return CalibrationResult(False, f"Gemessenes Gewicht zu klein ({measured:.3f} kg)")
+            
+            source = self._calibration_source()
+            tare, gain = self._calibration_for(source)
+            new_gain = gain * (known_weight / measured)
+            self.set_calibration(tare, new_gain, persist=persist, source=source)
+            logger.info(f"Kalibriert mit {known_weight} kg (gemessen {measured:.3f} kg): "
+                        f"{np.round(new_gain, 6).tolist()}")
+            return CalibrationResult(True, f"Kalibriert mit {known_weight} kg",
+                                     tuple(tare.tolist()), tuple(new_gain.tolist()), info, source)
+        
+        return self._submit_calibration(job)
+    
     def tare_scale(self):
-        """Nullt die Waage (Tara-Funktion)"""
+        """Nullt die Waage (Tara-Funktion) - blockiert bis zum Ergebnis, GUI: tare_async()"""
         if not self.state.hardware_available:
             logger.warning("Tara nicht möglich - Hardware nicht verfügbar")
             return False
+        
+        if self.is_acquiring:
+            return self.tare_async().result().success
             
         try:
             from hardware.hx711_real import nullpunkt_setzen_alle
@@ -208,8 +1126,25 @@ class WeightManager:
         """Aufräumen beim Programm-Ende"""
         logger.info("WeightManager Cleanup...")
         
+        # Erfassungs-Thread beenden
+        self.stop_acquisition()
+        
+        if self._calibration_pool is not None:
+            self._calibration_pool.shutdown(wait=False)
+            self._calibration_pool = None
+        
+        self._sources.close()
+        
+        if self._journal is not None:
+            self._hx711_source.journal = None
+            self._journal.close()
+            self._journal = None
+        
         # Observer entfernen
         self._observers.clear()
+        self._settle_observers.clear()
+        self._removal_observers.clear()
+        self._hardware_observers.clear()
         
         logger.info("WeightManager Cleanup abgeschlossen")
 
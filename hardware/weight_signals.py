@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+WeightSignals - Qt-Brücke für WeightManager-Ereignisse
+
+Die WeightManager-Observer laufen in Hintergrund-Threads (Bring-up,
+Erfassung). Dieses QObject lebt im GUI-Thread und leitet die Ereignisse
+als Qt-Signale weiter - Qt stellt sie automatisch per Queued Connection
+im GUI-Thread zu, Widgets können also direkt verbunden werden.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QMetaObject, Qt, pyqtSignal, pyqtSlot
+
+from hardware.weight_manager import get_weight_manager, HardwareStatus
+
+logger = logging.getLogger(__name__)
+
+
+class WeightChannel(QObject):
+    """
+    Gewichts-Abo für Widgets: gefiltert, gedrosselt und zusammengefasst
+    
+    Der WeightManager-Observer läuft im Erfassungs-Thread und merkt sich
+    nur den neuesten Wert. Pro Zustellung wird höchstens ein Event in die
+    GUI-Event-Loop gestellt - ist die GUI beschäftigt, sammeln sich keine
+    veralteten Werte an, weight_changed liefert immer den aktuellsten.
+    """
+
+    weight_changed = pyqtSignal(float)
+
+    def __init__(self, name: str, min_delta: float = 0.0, max_rate: Optional[float] = None,
+                 parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._pending: Optional[float] = None
+        self._pending_lock = threading.Lock()
+        get_weight_manager().register_observer(name, self._on_weight,
+                                               min_delta=min_delta, max_rate=max_rate)
+
+    def _on_weight(self, weight: float):
+        """WeightManager-Observer - läuft im Erfassungs-Thread"""
+        with self._pending_lock:
+            schedule = self._pending is None
+            self._pending = weight
+        if schedule:
+            QMetaObject.invokeMethod(self, "_deliver", Qt.QueuedConnection)
+
+    @pyqtSlot()
+    def _deliver(self):
+        """Stellt den neuesten Wert im GUI-Thread zu"""
+        with self._pending_lock:
+            weight = self._pending
+            self._pending = None
+        if weight is not None:
+            self.weight_changed.emit(weight)
+
+    def close(self):
+        """Meldet das Abo beim WeightManager ab"""
+        get_weight_manager().unregister_observer(self.name)
+
+
+class WeightSignals(QObject):
+    """Qt-Signale des WeightManagers (im GUI-Thread erstellen!)"""
+
+    hardware_status_changed = pyqtSignal(str, str, float)  # state, message, progress
+    hardware_ready = pyqtSignal(bool)                      # Bring-up beendet: verfügbar ja/nein
+    feed_removed = pyqtSignal(object)                      # RemovalEvent einer erkannten Entnahme
+    weight_settled = pyqtSignal(object)                    # SettleEvent: Gewicht wurde stabil
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        manager = get_weight_manager()
+        manager.register_hardware_observer("weight_signals", self._on_hardware_status)
+        manager.register_removal_observer("weight_signals", self.feed_removed.emit)
+        manager.register_settle_observer("weight_signals", self.weight_settled.emit)
+
+    def _on_hardware_status(self, status: HardwareStatus):
+        """Hardware-Observer - läuft im Bring-up-Thread"""
+        self.hardware_status_changed.emit(status.state, status.message, status.progress)
+        if status.state in ('ready', 'failed'):
+            self.hardware_ready.emit(status.state == 'ready')
+
+    def weight_channel(self, name: str, min_delta: float = 0.0,
+                       max_rate: Optional[float] = None) -> WeightChannel:
+        """
+        Erstellt ein Gewichts-Abo, dessen Signal im GUI-Thread ankommt
+
+        Args:
+            name: Eindeutige Observer-ID
+            min_delta: Mindeständerung in kg (z.B. Anzeigeauflösung)
+            max_rate: Höchstens so viele Signale pro Sekunde
+        """
+        return WeightChannel(name, min_delta, max_rate, parent=self)
+
+
+# Globale Instanz - späte Initialisierung
+_weight_signals_instance: Optional[WeightSignals] = None
+
+def get_weight_signals() -> WeightSignals:
+    """Gibt die globale WeightSignals-Instanz zurück (erster Aufruf im GUI-Thread)"""
+    global _weight_signals_instance
+    if _weight_signals_instance is None:
+        _weight_signals_instance = WeightSignals()
+    return _weight_signals_instance
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+WeightSourceRegistry - Gewichtsquellen mit automatischem Failover
+
+Alle Gewichtsquellen (lokale HX711 am GPIO, ESP8266 per HTTP, ESP32 per
+WebSocket) implementieren WeightSensorInterface und liefern ihre Zellwerte
+in dieselbe Erfassungs-Pipeline des WeightManagers (Ringpuffer, Filter,
+Ruhe-Erkennung). Die Registry liest immer die gesunde Quelle mit der
+höchsten Priorität:
+
+- Liefert die aktive Quelle mehrfach hintereinander nichts, wird sofort
+  auf die nächste gesunde Quelle umgeschaltet (Failover)
+- Ausgefallene und neu registrierte Quellen prüft ein eigener
+  Hintergrund-Thread - nie der GUI- oder Erfassungs-Thread
+- Erholt sich eine höher priorisierte Quelle, wird zu ihr zurückgewechselt
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Optional, Dict, Callable, List, Sequence, Tuple
+
+from hardware.weight_manager import WeightSensorInterface
+from wireless.live_frames import get_live_frame_cache
+
+logger = logging.getLogger(__name__)
+
+Sample = Tuple[float, list]   # (Unix-Zeit der Messung, Zellwerte)
+
+
+@dataclass
+class SourceHealth:
+    """Zustand einer registrierten Gewichtsquelle"""
+    name: str
+    priority: int                  # Kleiner = bevorzugt
+    healthy: bool = False
+    active: bool = False
+    failures: int = 0              # Fehlversuche in Folge
+    reads_total: int = 0
+    errors_total: int = 0
+    last_ok: float = 0.0
+    last_error: Optional[str] = None
+
+
+class HX711Source(WeightSensorInterface):
+    """Lokale HX711-Wägezellen am GPIO (schreibt optional das Roh-Sample-Journal)"""
+
+    def __init__(self, timeout: float = 0.5):
+        self.timeout = timeout
+        self.journal = None
+
+    def read_cells(self) -> list:
+        from hardware.hx711_real import lese_zellen_counts, counts_zu_gewicht
+        counts = lese_zellen_counts(samples=1, timeout=self.timeout)
+
+        journal = self.journal
+        if journal is not None:
+            try:
+                journal.append(time.time(), counts)
+            except Exception as e:
+                logger.error(f"Sample-Journal deaktiviert: {e}")
+                self.journal = None
+
+        return counts_zu_gewicht(counts)
+
+    def read_weight(self) -> float:
+        return sum(v for v in self.read_cells() if v is not None)
+
+
+class ESP8266HttpSource(WeightSensorInterface):
+    """
+    ESP8266 mit 4 HX711 - Messwerte per Live-Stream, sonst /live-values-data
+
+    Solange die Registry die Quelle liest (activate() bis deactivate()),
+    hält je Adresse ein Live-Stream (Server-Sent Events) die Verbindung
+    offen; read_cells() liest dann nur den zuletzt gepushten Frame. Ohne
+    Stream (inaktiv bzw. nur geprüft, ältere Firmware, Verbindung gerade
+    weg) wird wie bisher per HTTP abgefragt.
+
+    Args:
+        hosts: Bekannte Adressen (Stall-AP, Heimnetz) - die zuletzt
+            erreichbare wird zuerst gefragt
+        timeout: HTTP-Deadline pro Adresse in Sekunden (Keep-Alive über get_http_client)
+        scale: Rohwert -> kg (Feinkalibrierung über WeightManager Tara/Gain)
+        max_age: Frames aus dem gemeinsamen Cache, die jünger sind, werden
+            wiederverwendet statt neu abgefragt
+        stream: Live-Stream nutzen
+        stream_max_age: Höchstalter eines gepushten Frames in Sekunden
+    """
+
+    def __init__(self, hosts: Sequence[str], timeout: float = 1.0, scale: float = 100000.0,
+                 max_age: float = 0.05, stream: bool = True, stream_max_age: float = 1.0):
+        self.hosts = list(hosts)
+        self.timeout = timeout
+        self.scale = scale
+        self.max_age = max_age
+        self.stream = stream
+        self.stream_max_age = stream_max_age
+        self._streams: Dict[str, object] = {}
+        self._last_host: Optional[str] = None
+
+    def activate(self):
+        """Registry liest diese Quelle - Live-Streams öffnen"""
+        if not self.stream or self._streams:
+            return
+        from wireless.live_stream import get_live_stream
+        # Streams werden geteilt (Konfigurationsseite, Status-Anzeige) und gezählt freigegeben
+        self._streams = {host: get_live_stream(host) for host in self.hosts}
+
+    def deactivate(self):
+        """Andere Quelle aktiv - eigene Stream-Nutzung freigeben"""
+        streams, self._streams = self._streams, {}
+        if streams:
+            from wireless.live_stream import release_live_stream
+            for host in streams:
+                release_live_stream(host)
+
+    def stop(self):
+        self.deactivate()
+
+    def read_cells(self) -> list:
+        hosts = self.hosts
+        if self._last_host in hosts:
+            hosts = [self._last_host] + [h for h in hosts if h != self._last_host]
+
+        for host in hosts:
+            stream = self._streams.get(host)
+            frame = stream.latest(self.stream_max_age) if stream else None
+            if frame is None:
+                try:
+                    frame = get_live_frame_cache().get(host, max_age=self.max_age, timeout=self.timeout)
+                except (OSError, ValueError):
+                    continue
+            self._last_host = host
+            return frame.cells(self.scale)
+
+        self._last_host = None
+        raise ConnectionError(f"ESP8266 unter {', '.join(self.hosts)} nicht erreichbar")
+
+    def read_weight(self) -> float:
+        return sum(self.read_cells())
+
+    @property
+    def host(self) -> Optional[str]:
+        """Zuletzt erreichbare Adresse"""
+        return self._last_host
+
+
+class ESP32WebSocketSource(WeightSensorInterface):
+    """
+    ESP32-S3 Waage, die Gewichte per WebSocket pusht
+
+    Die Verbindung läuft im eigenen Thread des WirelessWeightManagerAdapter.
+    Empfangene Samples landen in einer Warteschlange; read_samples() gibt
+    der Erfassung jedes davon mit seiner Messzeit. Bei Binärframes sind das
+    alle Samples des Batches, zeitlich verteilt nach den ESP32-Zeitstempeln
+    (millis), nicht nur das letzte. read_cells() liefert den zuletzt
+    empfangenen Wert, solange er nicht älter als max_age ist.
+    """
+
+    MAX_QUEUED = 256      # Samples, falls die Erfassung gerade nicht liest
+    CLOCK_RESYNC = 1.0    # Sekunden Abweichung, ab der die ESP32-Uhr neu zugeordnet wird
+
+    def __init__(self, host: str, port: int = 81, max_age: float = 2.0):
+        self.host = host
+        self.port = port
+        self.max_age = max_age
+        self._adapter = None
+        self._latest: Optional[List[float]] = None
+        self._latest_time = 0.0
+        self._queue: deque = deque(maxlen=self.MAX_QUEUED)
+        self._clock_offset: Optional[float] = None   # Unix-Zeit - ESP32-millis/1000
+        self._batch_queued = False
+
+    def start(self):
+        if self._adapter is not None:
+            return
+        from wireless.wireless_weight_manager import WirelessWeightManagerAdapter
+        self._adapter = WirelessWeightManagerAdapter(self.host, self.port)
+        self._adapter.add_batch_observer(self._on_batch)
+        self._adapter.add_observer(self._on_data)
+        self._adapter.start()
+
+    def stop(self):
+        if self._adapter is not None:
+            self._adapter.stop()
+            self._adapter = None
+        self._queue.clear()
+        self._clock_offset = None
+
+    def _on_batch(self, frame):
+        """Batch-Observer (Binärframes) - läuft im WebSocket-Thread"""
+        received = time.time()
+        stamps = frame.timestamps_ms.astype(float) / 1000.0
+
+        # Kleinster Versatz = kürzeste Laufzeit; ein Sprung bedeutet Neustart/Neuverbindung
+        offset = received - stamps[-1]
+        if (self._clock_offset is None or offset < self._clock_offset
+                or offset - self._clock_offset > self.CLOCK_RESYNC):
+            self._clock_offset = offset
+
+        for stamp, cells in zip(stamps + self._clock_offset, frame.cells.tolist()):
+            self._queue.append((float(stamp), cells))
+        self._batch_queued = True
+
+    def _on_data(self, total_weight: float, corners: Optional[List[float]] = None):
+        """Adapter-Observer - läuft im WebSocket-Thread"""
+        if corners and len(corners) == 4:
+            self._latest = [float(v) for v in corners]
+        else:
+            self._latest = [float(total_weight) / 4.0] * 4
+        self._latest_time = time.time()
+
+        # Bei Binärframes folgt dieser Aufruf auf _on_batch - der Batch ist schon eingereiht
+        if self._batch_queued:
+            self._batch_queued = False
+        else:
+            self._queue.append((self._latest_time, self._latest))
+
+    def read_samples(self) -> List[Sample]:
+        """
+        Alle seit dem letzten Aufruf empfangenen Samples (älteste zuerst)
+
+        Eine leere Liste heißt: seit dem letzten Aufruf kam nichts - erst
+        wenn auch der letzte Wert älter als max_age ist, gilt das als Fehler.
+        """
+        samples = []
+        oldest = time.time() - self.max_age
+        while self._queue:
+            sample = self._queue.popleft()
+            if sample[0] >= oldest:
+                samples.append(sample)
+        if not samples and (self._latest is None or self._latest_time < oldest):
+            raise ConnectionError(f"Keine aktuellen Daten von ESP32 {self.host}")
+        return samples
+
+    def read_cells(self) -> list:
+        if self._latest is None or time.time() - self._latest_time > self.max_age:
+            raise ConnectionError(f"Keine aktuellen Daten von ESP32 {self.host}")
+        return list(self._latest)
+
+    def read_weight(self) -> float:
+        return sum(self.read_cells())
+
+
+class WeightSourceRegistry(WeightSensorInterface):
+    """
+    Liest die beste verfügbare Gewichtsquelle, schaltet bei Ausfall um
+
+    read_cells() wird nur vom Erfassungs-Thread aufgerufen. Liefert die
+    aktive Quelle keinen Wert, gibt die Registry None pro Zelle zurück -
+    die Zell-Überwachung des WeightManagers überbrückt einzelne Aussetzer.
+
+    Args:
+        max_failures: Fehlversuche in Folge bis zum Failover
+        probe_interval: Sekunden zwischen zwei Prüfungen ausgefallener Quellen
+        channels: Zellen pro Sample
+    """
+
+    def __init__(self, max_failures: int = 5, probe_interval: float = 10.0, channels: int = 4):
+        self.max_failures = max_failures
+        self.probe_interval = probe_interval
+        self.channels = channels
+        self._sources: Dict[str, WeightSensorInterface] = {}
+        self._health: Dict[str, SourceHealth] = {}
+        self._active: Optional[str] = None
+        self._last_read: Optional[str] = None
+        self._lock = Lock()
+        self._observers: Dict[str, Callable[[Optional[str]], None]] = {}
+        self._probe_thread: Optional[threading.Thread] = None
+        self._probe_stop = threading.Event()
+        self._probe_wakeup = threading.Event()
+
+    def register(self, name: str, source: WeightSensorInterface, priority: int = 0,
+                 healthy: bool = False):
+        """
+        Registriert eine Gewichtsquelle
+
+        Args:
+            name: Eindeutiger Name (z.B. 'hx711', 'esp8266')
+            source: Quelle; optionale start()/stop() werden aufgerufen,
+                optionale activate()/deactivate() beim Wechsel der aktiven Quelle
+            priority: Kleiner = bevorzugt
+            healthy: True wenn die Quelle bereits geprüft ist (sonst prüft
+                der Hintergrund-Thread sie zuerst)
+        """
+        start = getattr(source, 'start', None)
+        if start is not None:
+            try:
+                start()
+            except Exception as e:
+                logger.error(f"Gewichtsquelle '{name}' nicht startbar: {e}")
+                return
+
+        with self._lock:
+            self._sources[name] = source
+            self._health[name] = SourceHealth(name, priority, healthy=healthy)
+        logger.info(f"Gewichtsquelle '{name}' registriert (Priorität {priority})")
+
+        if healthy:
+            self._select()
+        else:
+            self._ensure_probe_thread()
+            self._probe_wakeup.set()
+
+    def unregister(self, name: str):
+        """Entfernt eine Gewichtsquelle (stoppt sie ggf.)"""
+        with self._lock:
+            source = self._sources.pop(name, None)
+            self._health.pop(name, None)
+        if source is None:
+            return
+        stop = getattr(source, 'stop', None)
+        if stop is not None:
+            try:
+                stop()
+            except Exception as e:
+                logger.error(f"Gewichtsquelle '{name}' Stop-Fehler: {e}")
+        self._select()
+
+    def register_observer(self, name: str, callback: Callable[[Optional[str]], None]):
+        """Observer für Wechsel der aktiven Quelle (erhält den Namen oder None)"""
+        self._observers[name] = callback
+
+    def unregister_observer(self, name: str):
+        if name in self._observers:
+            del self._observers[name]
+
+    @property
+    def active_name(self) -> Optional[str]:
+        """Name der aktuell gelesenen Quelle oder None"""
+        return self._active
+
+    @property
+    def last_read_name(self) -> Optional[str]:
+        """Quelle, aus der der letzte read_cells()-Aufruf stammt (Einheit der Werte)"""
+        return self._last_read
+
+    def read_cells(self) -> list:
+        name = self._active
+        self._last_read = name
+        if name is None:
+            return [None] * self.channels
+
+        source = self._sources.get(name)
+        health = self._health.get(name)
+        if source is None or health is None:
+            return [None] * self.channels
+
+        cells, error = self._read_source(source)
+        if self._record_read(name, health, error):
+            return cells
+        return [None] * self.channels
+
+    def read_samples(self) -> List[Sample]:
+        """
+        Neue Samples der aktiven Quelle mit Messzeit
+
+        Quellen mit eigenem read_samples() (ESP32-Binärframes) liefern alle
+        seit dem letzten Aufruf empfangenen Samples - auch keines; alle
+        anderen genau eins, gestempelt mit der Lesezeit. Fehler zählen wie
+        bei read_cells() und ergeben ein Sample mit None pro Zelle.
+        """
+        name = self._active
+        self._last_read = name
+        source = self._sources.get(name) if name is not None else None
+        health = self._health.get(name) if name is not None else None
+        if source is None or health is None:
+            return [(time.time(), [None] * self.channels)]
+
+        read_samples = getattr(source, 'read_samples', None)
+        if read_samples is None:
+            started = time.time()
+            cells, error = self._read_source(source)
+            samples = [(started, cells)]
+        else:
+            samples, error = self._read_source_samples(read_samples)
+        if self._record_read(name, health, error):
+            return samples
+        return [(time.time(), [None] * self.channels)]
+
+    def _record_read(self, name: str, health: SourceHealth, error: Optional[str]) -> bool:
+        """Zählt einen Leseversuch der aktiven Quelle, Failover nach max_failures Fehlern"""
+        health.reads_total += 1
+        if error is None:
+            health.failures = 0
+            health.last_ok = time.time()
+            return True
+
+        health.errors_total += 1
+        health.failures += 1
+        health.last_error = error
+        if health.failures >= self.max_failures:
+            logger.warning(f"Gewichtsquelle '{name}' ausgefallen ({error}) - Failover")
+            health.healthy = False
+            self._select()
+            # Ohne weitere Quelle lief noch kein Prüf-Thread (HX711 ist gleich gesund registriert)
+            self._ensure_probe_thread()
+            self._probe_wakeup.set()
+        return False
+
+    def read_weight(self) -> float:
+        return sum(v for v in self.read_cells() if v is not None)
+
+    def _read_source(self, source: WeightSensorInterface):
+        """Liest eine Quelle einmal: (Zellwerte, None) oder (None, Fehlertext)"""
+        try:
+            cells = list(source.read_cells())
+        except Exception as e:
+            return None, str(e)
+        if len(cells) != self.channels or all(v is None for v in cells):
+            return None, "keine Werte"
+        return cells, None
+
+    def _read_source_samples(self, read_samples: Callable[[], List[Sample]]):
+        """Wie _read_source(), für Quellen mit read_samples(): (Samples, None) oder (None, Fehlertext)"""
+        try:
+            samples = [(float(t), list(cells)) for t, cells in read_samples()]
+        except Exception as e:
+            return None, str(e)
+        valid = [s for s in samples if len(s[1]) == self.channels and not all(v is None for v in s[1])]
+        if samples and not valid:
+            return None, "keine Werte"
+        return valid, None
+
+    def _select(self):
+        """Aktiviert die gesunde Quelle mit der höchsten Priorität"""
+        with self._lock:
+            candidates = sorted((h for h in self._health.values() if h.healthy),
+                                key=lambda h: h.priority)
+            best = candidates[0].name if candidates else None
+            if best == self._active:
+                return
+            previous = self._active
+            for health in self._health.values():
+                health.active = health.name == best
+                if health.active:
+                    health.failures = 0
+            self._active = best
+            switched = [(self._sources.get(previous), 'deactivate'), (self._sources.get(best), 'activate')]
+
+        logger.info(f"Gewichtsquelle gewechselt: {previous or '-'} -> {best or '-'}")
+        for source, hook in switched:
+            method = getattr(source, hook, None)
+            if method is not None:
+                try:
+                    method()
+                except Exception as e:
+                    logger.error(f"Gewichtsquelle {hook}() Fehler: {e}")
+        for name, callback in list(self._observers.items()):
+            try:
+                callback(best)
+            except Exception as e:
+                logger.error(f"Quellen-Observer '{name}' Fehler: {e}")
+
+    def probe(self, name: str) -> bool:
+        """Prüft eine Quelle einmal (blockiert bis zum Timeout der Quelle)"""
+        source = self._sources.get(name)
+        health = self._health.get(name)
+        if source is None or health is None:
+            return False
+
+        _, error = self._read_source(source)
+        if error is None:
+            if not health.healthy:
+                logger.info(f"Gewichtsquelle '{name}' erreichbar")
+            health.healthy = True
+            health.failures = 0
+            health.last_ok = time.time()
+            health.last_error = None
+        else:
+            health.healthy = False
+            health.last_error = error
+        return health.healthy
+
+    def _ensure_probe_thread(self):
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+        self._probe_stop.clear()
+        self._probe_thread = threading.Thread(target=self._probe_loop, name="WeightSourceProbe",
+                                              daemon=True)
+        self._probe_thread.start()
+
+    def _probe_loop(self):
+        """Hintergrund-Thread: prüft ausgefallene Quellen, erlaubt Failback"""
+        while not self._probe_stop.is_set():
+            self._probe_wakeup.wait(self.probe_interval)
+            self._probe_wakeup.clear()
+            if self._probe_stop.is_set():
+                break
+
+            recovered = False
+            for health in list(self._health.values()):
+                if self._probe_stop.is_set():
+                    break
+                if not health.healthy and not health.active:
+                    recovered |= self.probe(health.name)
+            if recovered:
+                self._select()
+
+    def get_status(self) -> List[dict]:
+        """Zustand aller Quellen, nach Priorität sortiert"""
+        with self._lock:
+            return [asdict(h) for h in sorted(self._health.values(), key=lambda h: h.priority)]
+
+    def close(self):
+        """Stoppt den Prüf-Thread und alle Quellen"""
+        self._probe_stop.set()
+        self._probe_wakeup.set()
+        self._observers.clear()
+        for name in list(self._sources):
+            self.unregister(name)
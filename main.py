@@ -36,10 +36,9 @@ def main():
         # System-Metriken loggen
         pi5_logger.log_system_metrics()
         
-        # 1. Hardware initialisieren
-        startup_logger.info("⚙️ Hardware-Initialisierung...")
+        # 1. Sensor Manager anlegen (GPIO-Initialisierung erst nach GUI-Start)
         sensor_manager = SmartSensorManager()
-        startup_logger.info("✅ Sensor Manager initialisiert")
+        startup_logger.info("✅ Sensor Manager angelegt - Hardware-Start folgt im Hintergrund")
 
         # 2. Hardware-Modus aktivieren
         deployment_logger.info("🔧 Hardware-only Modus aktiviert")
@@ -63,6 +62,10 @@ def main():
         
         startup_logger.info("🎯 Futterkarre erfolgreich gestartet - GUI bereit")
         
+        # 5. Hardware im Hintergrund hochfahren, sobald die Event-Loop läuft
+        startup_logger.info("⚙️ Hardware-Initialisierung im Hintergrund...")
+        QtCore.QTimer.singleShot(0, sensor_manager.weight_manager.start_hardware)
+        
         # Event-Loop starten
         sys.exit(app.exec_())
         
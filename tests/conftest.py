@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Gemeinsame Fixtures der Test-Suite
+"""
+
+import pytest
+
+import hardware.weight_manager as weight_manager
+from hardware.weight_manager import WeightManager
+
+
+@pytest.fixture
+def frischer_manager(tmp_path, monkeypatch):
+    """
+    Eigene WeightManager-Instanz mit schneller Abtastung
+
+    Ohne gespeicherte Kalibrierung (alle Quellen liefern unverändert) und
+    mit Journal im Test-Verzeichnis; das Singleton wird danach
+    wiederhergestellt.
+    """
+    monkeypatch.setattr(weight_manager, "JOURNAL_PATH", str(tmp_path / "hx711_samples.journal"))
+    original = WeightManager._instance
+    WeightManager._instance = None
+    manager = WeightManager()
+    manager._active_interval = manager._idle_interval = 0.002
+    manager._calibrations.clear()
+    yield manager
+    manager.cleanup()
+    WeightManager._instance = original
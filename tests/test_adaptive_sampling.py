@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests für die adaptive Abtastrate des WeightManagers
+
+Eine Aufnahme wechselt zwischen Bewegung (Karre wird beladen) und
+Ruhe; das Erfassungsintervall muss dem folgen.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.replay_sensor import ReplayWeightSensor
+
+AKTIV = 0.002
+RUHE = 0.02
+
+
+def _bewegung_dann_ruhe():
+    """40 Samples Rampe 10 -> 100 -> 10 kg pro Zelle, danach 60 Samples konstant"""
+    rampe = np.concatenate((np.linspace(10.0, 100.0, 20), np.linspace(100.0, 10.0, 20)))
+    gesamt = np.concatenate((rampe, np.full(60, 10.0)))
+    return np.arange(len(gesamt)) * 0.1, np.repeat(gesamt[:, None], 4, axis=1)
+
+
+def test_intervall_folgt_bewegung_und_ruhe(frischer_manager):
+    frischer_manager._idle_interval = RUHE
+    frischer_manager._idle_after = RUHE
+
+    frischer_manager.use_sensor(ReplayWeightSensor(_bewegung_dann_ruhe(), speed=0, loop=True))
+
+    modi = ['active']
+    intervalle = {'active': set(), 'idle': set()}
+    deadline = time.monotonic() + 5.0
+    while len(modi) < 3 and time.monotonic() < deadline:
+        modus = frischer_manager.sampling_mode
+        intervalle[modus].add(frischer_manager._current_interval())
+        if modus != modi[-1]:
+            modi.append(modus)
+        time.sleep(0.001)
+
+    # Bewegung -> Ruhe (langsam) -> nach dem Schleifen der Aufnahme wieder Bewegung (schnell)
+    assert modi == ['active', 'idle', 'active']
+    assert intervalle['active'] == {AKTIV}
+    assert intervalle['idle'] == {RUHE}
+
+
+def test_ruhe_erst_nach_idle_after(frischer_manager):
+    frischer_manager._idle_interval = RUHE
+    frischer_manager._idle_after = 60.0
+
+    konstant = (np.arange(200) * 0.1, np.full((200, 4), 10.0))
+    frischer_manager.use_sensor(ReplayWeightSensor(konstant, speed=0, loop=True))
+
+    assert frischer_manager.wait_for_stable(timeout=2.0) is not None
+    time.sleep(0.05)
+    assert frischer_manager.sampling_mode == 'active'
+    assert frischer_manager._current_interval() == AKTIV
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Adaptive-Abtastrate Tests bestanden")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests für das binäre Gewichtsframe-Format (wireless/binary_frames.py)
+und dessen Verarbeitung im WirelessWeightManager
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from wireless.binary_frames import (HEADER, FrameFormatError, decode_frame, encode_frame,
+                                    lost_frames, sample_dtype)
+from wireless.wireless_weight_manager import WirelessWeightManager
+
+ZELLEN = [[10.0, 11.0, 12.0, 13.0],
+          [10.5, 11.5, 12.5, 13.5],
+          [11.0, 12.0, 13.0, 14.0]]
+
+
+def test_hin_und_zurueck():
+    daten = encode_frame(ZELLEN, [1000, 1100, 1200], sequence=7, battery_v=3.85, wifi_rssi=-61)
+    assert len(daten) == HEADER.size + 3 * sample_dtype(4).itemsize == 16 + 3 * 18
+
+    frame = decode_frame(daten)
+    assert len(frame) == 3
+    assert frame.sequence == 7
+    assert frame.battery_v == pytest.approx(3.85)
+    assert frame.wifi_rssi == -61
+    assert frame.timestamps_ms.tolist() == [1000, 1100, 1200]
+    np.testing.assert_allclose(frame.cells, ZELLEN)
+    np.testing.assert_allclose(frame.totals, [46.0, 48.0, 50.0])
+
+
+def test_dekodieren_ohne_kopie():
+    puffer = bytearray(encode_frame(ZELLEN, [0, 100, 200]))
+    frame = decode_frame(memoryview(puffer))
+    assert np.shares_memory(frame.cells, np.frombuffer(puffer, dtype=np.uint8))
+
+
+def test_kleiner_als_json():
+    fuenf = [[12.34, 23.45, 34.56, 45.67]] * 5
+    binaer = encode_frame(fuenf, [0, 100, 200, 300, 400])
+    als_json = "".join(json.dumps({"type": "weight_data", "timestamp": 123456, "total_kg": 116.02,
+                                   "corners": z, "battery_v": 3.85, "wifi_rssi": -61}) for z in fuenf)
+    assert len(binaer) * 5 < len(als_json)
+
+
+@pytest.mark.parametrize("daten", [
+    b"FK",                                          # kürzer als der Header
+    b"XX" + encode_frame(ZELLEN, [0, 1, 2])[2:],    # falsche Kennung
+    encode_frame(ZELLEN, [0, 1, 2])[:-1],           # abgeschnitten
+])
+def test_kaputte_frames(daten):
+    with pytest.raises(FrameFormatError):
+        decode_frame(daten)
+
+
+def test_verlorene_frames_mit_ueberlauf():
+    assert lost_frames(None, 5) == 0
+    assert lost_frames(5, 6) == 0
+    assert lost_frames(5, 9) == 3
+    assert lost_frames(0xFFFF, 0) == 0
+
+
+class _Esp32MitBinaer:
+    """WebSocket-Attrappe, die set_format beantwortet und dann Binärframes schickt"""
+
+    def __init__(self, kann_binaer=True):
+        self.kann_binaer = kann_binaer
+        self.eingang = asyncio.Queue()
+        self.gesendet = []
+
+    async def send(self, message):
+        command = json.loads(message)
+        self.gesendet.append(command)
+        status = "success" if self.kann_binaer else "error"
+        await self.eingang.put(json.dumps({"type": "response", "id": command["id"],
+                                           "command": command["command"], "status": status}))
+        if self.kann_binaer:
+            for sequence in (0, 1, 4):   # Frames 2 und 3 gehen verloren
+                await self.eingang.put(encode_frame(ZELLEN, [0, 100, 200], sequence=sequence))
+        await self.eingang.put(None)
+
+    async def recv(self):
+        message = await self.eingang.get()
+        if message is None:
+            raise ConnectionResetError("geschlossen")
+        return message
+
+    async def close(self):
+        await self.eingang.put(None)
+
+
+def _verbinden(manager, socket):
+    async def ablauf():
+        manager.websocket = socket
+        manager._is_connected = True
+        aushandlung = asyncio.create_task(manager._negotiate_format())
+        await manager._message_loop()
+        await aushandlung
+    asyncio.run(ablauf())
+
+
+def test_binaermodus_wird_ausgehandelt():
+    manager = WirelessWeightManager("10.0.0.7", batch_size=3)
+    formate, gewichte, batches = [], [], []
+    manager.add_observer(lambda total, corners: (gewichte.append(total), formate.append(manager.frame_format)))
+    manager.add_batch_observer(lambda frame: batches.append(len(frame)))
+
+    socket = _Esp32MitBinaer()
+    _verbinden(manager, socket)
+
+    assert socket.gesendet[0]["command"] == "set_format" and socket.gesendet[0]["batch"] == 3
+    assert formate == ["binary"] * 3
+    assert gewichte == [50.0] * 3     # Observer sehen das jeweils letzte Sample
+    assert batches == [3, 3, 3]       # Batch-Observer sehen alle Samples
+    assert manager.frames_lost == 2
+    assert manager.last_corners == [11.0, 12.0, 13.0, 14.0]
+    assert manager.frame_format == "json"  # nach dem Verbindungsende zurückgesetzt
+
+
+def test_alte_firmware_bleibt_bei_json():
+    manager = WirelessWeightManager("10.0.0.8")
+    formate = []
+    original = manager._negotiate_format
+
+    async def beobachten():
+        await original()
+        formate.append(manager.frame_format)
+
+    manager._negotiate_format = beobachten
+    _verbinden(manager, _Esp32MitBinaer(kann_binaer=False))
+    assert formate == ["json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Binärframe-Tests bestanden")
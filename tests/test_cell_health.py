@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests für die Zell-Überwachung (hardware/cell_health.py)
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.cell_health import CellHealthTracker
+from hardware.replay_sensor import ReplayWeightSensor
+from hardware.weight_manager import SENSOR_CALIBRATION
+
+# HX711-Skala: Nullpunkt 80000 Counts, 20000 Counts pro kg
+TARA_COUNTS = 80000.0
+COUNTS_PRO_KG = 20000.0
+
+
+def _rauschen(rng, basis):
+    return list(np.asarray(basis) + rng.normal(0.0, 0.01, size=4))
+
+
+def test_gesunde_zellen_unveraendert():
+    tracker = CellHealthTracker()
+    result = tracker.update([10.0, 20.0, 30.0, 40.0])
+    assert result.tolist() == [10.0, 20.0, 30.0, 40.0]
+    assert not any(tracker.excluded)
+
+
+def test_timeout_zelle_wird_geschaetzt_und_ausgeschlossen():
+    rng = np.random.default_rng(3)
+    tracker = CellHealthTracker(error_window=10)
+    basis = [10.0, 20.0, 30.0, 40.0]
+
+    # Lastverteilung lernen
+    for _ in range(200):
+        tracker.update(_rauschen(rng, basis))
+
+    result = None
+    for _ in range(10):
+        werte = _rauschen(rng, basis)
+        werte[3] = None  # HR liefert nichts mehr
+        result = tracker.update(werte)
+
+    assert tracker.excluded == [False, False, False, True]
+    assert tracker.get_status()[3]['reason'] == 'errors'
+    assert abs(result[3] - 40.0) < 1.0
+    assert abs(result.sum() - 100.0) < 1.0
+
+
+def test_haengende_zelle_wird_erkannt_und_wieder_aufgenommen():
+    rng = np.random.default_rng(5)
+    tracker = CellHealthTracker(stuck_limit=20, recover_after=5)
+    basis = [25.0, 25.0, 25.0, 25.0]
+
+    for _ in range(60):
+        werte = _rauschen(rng, basis)
+        werte[1] = 0.0  # VR hängt auf festem Wert
+        tracker.update(werte)
+    assert tracker.excluded[1]
+    assert tracker.get_status()[1]['reason'] == 'stuck'
+
+    # Erste Änderung nimmt die Zelle sofort wieder auf
+    result = tracker.update(_rauschen(rng, basis))
+    assert not tracker.excluded[1]
+    assert abs(result[1] - 25.0) < 0.1
+
+
+def test_gerundete_werte_im_stillstand_sind_kein_haenger():
+    # ESP32 rundet auf 0.01 kg - der leere Wagen liefert lange exakt 0.00
+    tracker = CellHealthTracker(recover_after=20)
+    for _ in range(60):
+        tracker.update([0.0, 0.0, 0.0, 0.0])
+    assert not any(tracker.excluded)
+
+    result = tracker.update([5.0, 5.0, 5.0, 5.0])   # 20 kg aufgeladen
+    assert result.sum() == pytest.approx(20.0)
+
+
+def test_gleichmaessig_verteilte_konstante_last_ist_kein_haenger():
+    # Fallback des ESP32 ohne Eckwerte: [total/4] * 4, Wagen steht mit Heu still
+    tracker = CellHealthTracker()
+    for _ in range(100):
+        tracker.update([80.0 / 4] * 4)
+    assert not any(tracker.excluded)
+    assert tracker.update([21.0] * 4).sum() == pytest.approx(84.0)
+
+
+def test_ausreisser_einer_zelle_wird_ersetzt():
+    rng = np.random.default_rng(9)
+    tracker = CellHealthTracker()
+    basis = [10.0, 10.0, 10.0, 10.0]
+    for _ in range(100):
+        tracker.update(_rauschen(rng, basis))
+
+    werte = _rauschen(rng, basis)
+    werte[0] = 900.0  # Spike auf VL
+    result = tracker.update(werte)
+
+    assert abs(result[0] - 10.0) < 1.0
+    assert tracker.get_status()[0]['outliers_total'] == 1
+    assert not tracker.excluded[0]  # ein einzelner Spike schließt nicht aus
+
+
+def test_gemeinsamer_sprung_ist_kein_ausreisser():
+    tracker = CellHealthTracker()
+    tracker.update([5.0, 5.0, 5.0, 5.0])
+    result = tracker.update([70.0, 70.0, 70.0, 70.0])  # Heuballen aufgeladen
+    assert result.tolist() == [70.0, 70.0, 70.0, 70.0]
+
+
+def test_lastaenderung_einer_zelle_in_counts_ist_kein_ausreisser(frischer_manager):
+    """Roh-Counts: 0.5 kg Schritte auf einer Zelle sind 10000 Counts - weit über outlier_jump"""
+    rng = np.random.default_rng(11)
+    kg = np.full((60, 4), 5.0)
+    kg[20:, 0] += np.minimum(np.arange(40), 8) * 0.5   # VL wird in 8 Schritten 4 kg schwerer
+    counts = TARA_COUNTS + kg * COUNTS_PRO_KG + rng.normal(0.0, 20.0, size=kg.shape)
+
+    frischer_manager.set_calibration(np.full(4, TARA_COUNTS), np.full(4, 1.0 / COUNTS_PRO_KG),
+                                     persist=False, source=SENSOR_CALIBRATION)
+    sensor = ReplayWeightSensor((np.arange(60) * 0.1, counts), speed=0)
+    frischer_manager.use_sensor(sensor)
+
+    deadline = time.monotonic() + 3.0
+    while not sensor.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    status = frischer_manager.get_status()['cells']
+    assert [zelle['outliers_total'] for zelle in status] == [0, 0, 0, 0]
+    assert not any(zelle['excluded'] for zelle in status)
+    snapshot = frischer_manager.get_snapshot()
+    assert snapshot.cells[0] == pytest.approx(9.0, abs=0.05)
+    assert snapshot.total == pytest.approx(24.0, abs=0.1)
+    assert snapshot.estimated == (False, False, False, False)
+
+
+if __name__ == "__main__":
+    test_gesunde_zellen_unveraendert()
+    test_timeout_zelle_wird_geschaetzt_und_ausgeschlossen()
+    test_haengende_zelle_wird_erkannt_und_wieder_aufgenommen()
+    test_gerundete_werte_im_stillstand_sind_kein_haenger()
+    test_gleichmaessig_verteilte_konstante_last_ist_kein_haenger()
+    test_ausreisser_einer_zelle_wird_ersetzt()
+    test_gemeinsamer_sprung_ist_kein_ausreisser()
+    pytest.main([__file__, "-q", "-k", "counts"])
+    print("✅ Zell-Überwachung Tests bestanden")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests für den persistenten Geräte-Cache (wireless/device_cache.py)
+und dessen Nutzung in ESP8266Discovery
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import wireless.esp8266_discovery as discovery_module
+from wireless.device_cache import PersistentDeviceCache
+from wireless.esp8266_discovery import ESP8266Discovery
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PersistentDeviceCache(str(tmp_path / "esp8266_device.json"))
+
+
+def test_speichern_und_laden(cache):
+    assert cache.load() is None
+    cache.save("192.168.4.1", "stall", rtt=0.012)
+    device = cache.load()
+    assert (device.ip, device.mode) == ("192.168.4.1", "stall")
+    assert abs(device.rtt - 0.012) < 1e-9
+    assert time.time() - device.last_seen < 5.0
+
+    cache.clear()
+    assert cache.load() is None
+
+
+def test_beschaedigte_datei_wird_ignoriert(cache):
+    with open(cache.path, "w") as f:
+        f.write("{kaputt")
+    assert cache.load() is None
+
+
+def _probe_ergebnis(erreichbar: bool, aufrufe: list):
+    async def probe(ip, **kwargs):
+        aufrufe.append(ip)
+        return {"device_name": "FutterWaage_ESP8266"} if erreichbar else None
+    return probe
+
+
+def test_bekannte_waage_ohne_discovery(cache, monkeypatch):
+    cache.save("192.168.2.42", "haus")
+    aufrufe = []
+    monkeypatch.setattr(discovery_module, "probe_status", _probe_ergebnis(True, aufrufe))
+    monkeypatch.setattr(discovery_module, "get_udp_discovery",
+                        lambda: pytest.fail("Discovery trotz erreichbarer Waage"))
+
+    discovery = ESP8266Discovery(device_cache=cache)
+    assert asyncio.run(discovery.find_esp8266(force_rescan=True)) == ("192.168.2.42", "haus")
+    assert aufrufe == ["192.168.2.42"]
+
+
+def test_volle_suche_nur_wenn_probe_scheitert(cache, monkeypatch):
+    cache.save("192.168.2.42", "haus")
+    aufrufe = []
+    monkeypatch.setattr(discovery_module, "probe_status", _probe_ergebnis(False, aufrufe))
+
+    class _Udp:
+        def find_scale(self):
+            from wireless.udp_discovery import DiscoveredDevice
+            return DiscoveredDevice("x", "FutterWaage_ESP8266", "192.168.4.1", "stall", rtt=0.004)
+
+    monkeypatch.setattr(discovery_module, "get_udp_discovery", lambda: _Udp())
+
+    discovery = ESP8266Discovery(device_cache=cache)
+    assert asyncio.run(discovery.find_esp8266()) == ("192.168.4.1", "stall")
+    assert aufrufe == ["192.168.2.42"]
+
+    # Neue Adresse ist persistiert - ein neuer Prozess fängt dort an
+    assert cache.load().ip == "192.168.4.1"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Geräte-Cache Tests bestanden")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests für den Hardware-Bring-up im Hintergrund (WeightManager.start_hardware)
+"""
+
+import threading
+import time
+
+import pytest
+
+import hardware.hx711_real as hx711_real
+
+
+def test_konstruktor_initialisiert_keine_hardware(frischer_manager, monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(hx711_real, "ensure_hx711_initialized", lambda *a: aufrufe.append(1))
+
+    assert frischer_manager.get_hardware_status().state == 'pending'
+    assert aufrufe == []
+
+
+def test_start_blockiert_nicht_und_meldet_fortschritt(frischer_manager, monkeypatch):
+    freigabe = threading.Event()
+
+    def langsame_init(progress_callback=None):
+        for i, name in enumerate(["VL", "VR", "HL", "HR"]):
+            freigabe.wait(2.0)
+            progress_callback(i + 1, 4, name)
+        return True
+
+    monkeypatch.setattr(hx711_real, "ensure_hx711_initialized", langsame_init)
+    monkeypatch.setattr(hx711_real, "lese_zellen_counts", lambda samples=1, timeout=None: [1, 1, 1, 1])
+    monkeypatch.setattr(hx711_real, "counts_zu_gewicht", lambda counts: [float(c) for c in counts])
+
+    meldungen = []
+    frischer_manager.register_hardware_observer("test", meldungen.append)
+
+    start = time.time()
+    frischer_manager.start_hardware()
+    assert time.time() - start < 0.5
+    assert frischer_manager.get_hardware_status().state == 'initializing'
+    assert frischer_manager.read_weight() == 0.0  # noch nicht bereit, blockiert nicht
+
+    freigabe.set()
+    assert frischer_manager.wait_for_hardware(timeout=5.0)
+    assert frischer_manager.hardware_ready
+    assert meldungen[-1].state == 'ready'
+    assert any("HR" in m.message for m in meldungen)
+
+
+def test_fehlende_hardware_meldet_failed(frischer_manager, monkeypatch):
+    monkeypatch.setattr(hx711_real, "ensure_hx711_initialized", lambda progress_callback=None: False)
+
+    assert not frischer_manager.wait_for_hardware(timeout=5.0)
+    assert frischer_manager.get_hardware_status().state == 'failed'
+    assert frischer_manager.get_status()['hardware_state'] == 'failed'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Hardware-Bring-up Tests bestanden")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests für den Keep-Alive HTTP-Client (wireless/http_client.py)
+
+Läuft gegen einen lokalen HTTP/1.1-Server statt gegen echte ESP8266-Hardware.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from wireless.http_client import DeviceHttpClient, HttpClientError
+
+
+class _EspHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    verbindungen = set()
+    schliessen_nach_antwort = False  # Keep-Alive "vergessen" wie ein neu gestarteter ESP
+
+    def log_message(self, *args):
+        pass
+
+    def _antwort(self, status: int, daten):
+        body = json.dumps(daten).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.schliessen_nach_antwort:
+            self.close_connection = True
+
+    def do_GET(self):
+        _EspHandler.verbindungen.add(self.client_address)
+        if self.path.startswith('/live-values-data'):
+            self._antwort(200, {'vl_value': 1, 'vr_value': 2, 'hl_value': 3, 'hr_value': 4})
+        elif self.path.startswith('/langsam'):
+            time.sleep(0.5)
+            self._antwort(200, {})
+        elif self.path.startswith('/calibrate'):
+            self._antwort(200, {'query': self.path.split('?', 1)[1]})
+        else:
+            self._antwort(404, {'error': 'unbekannt'})
+
+    def do_POST(self):
+        _EspHandler.verbindungen.add(self.client_address)
+        laenge = int(self.headers.get('Content-Length', 0))
+        daten = json.loads(self.rfile.read(laenge))
+        self._antwort(200, {'success': daten.get('mode') == 'stall'})
+
+
+@pytest.fixture
+def esp_server():
+    _EspHandler.verbindungen = set()
+    _EspHandler.schliessen_nach_antwort = False
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EspHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_verbindung_wird_wiederverwendet(esp_server):
+    host, port = esp_server
+    client = DeviceHttpClient()
+    for _ in range(5):
+        daten = client.get_json(host, '/live-values-data', timeout=2.0, port=port)
+        assert daten['hr_value'] == 4
+
+    stats = client.get_stats()
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] == 4
+    assert len(_EspHandler.verbindungen) == 1
+    client.close()
+
+
+def test_geschlossene_verbindung_wird_einmal_wiederholt(esp_server):
+    host, port = esp_server
+    _EspHandler.schliessen_nach_antwort = True
+    client = DeviceHttpClient()
+    client.get(host, '/live-values-data', timeout=2.0, port=port)
+    time.sleep(0.05)
+    response = client.get(host, '/live-values-data', timeout=2.0, port=port)
+    assert response.status == 200
+    assert client.get_stats()['connections_opened'] == 2
+    client.close()
+
+
+def test_deadline_gilt_pro_anfrage(esp_server):
+    host, port = esp_server
+    client = DeviceHttpClient()
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.get(host, '/langsam', timeout=0.1, port=port)
+    assert time.monotonic() - start < 0.4
+    assert client.get_stats()['errors'] == 1
+
+
+def test_status_fehler_und_parameter(esp_server):
+    host, port = esp_server
+    client = DeviceHttpClient()
+    assert client.get(host, '/gibtsnicht', port=port).status == 404
+    with pytest.raises(HttpClientError):
+        client.get_json(host, '/gibtsnicht', port=port)
+    assert client.get_json(host, '/calibrate', params={'weight': 20.0}, port=port) == {'query': 'weight=20.0'}
+    assert client.post_json(host, '/set_wifi_mode', {'mode': 'stall'}, port=port).json() == {'success': True}
+    client.close()
+
+
+def test_nicht_erreichbar_ist_oserror():
+    client = DeviceHttpClient()
+    with pytest.raises(OSError):
+        client.get('127.0.0.1', '/status', timeout=0.5, port=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ HTTP-Client Tests bestanden")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests für das parallele Auslesen der HX711-Zellen (hardware/hx711_real.py)
+
+Statt echter Module werden Attrappen in hx_sensors eingesetzt; eine
+davon hängt, bis der Test sie freigibt (DT-Leitung bleibt high).
+"""
+
+import threading
+import time
+import types
+
+import pytest
+
+import hardware.hx711_real as hx711_real
+
+
+class _Hx:
+    def __init__(self, wert, blockiert=None):
+        self.wert = wert
+        self.blockiert = blockiert
+        self.aufrufe = 0
+
+    def read_average(self, samples):
+        self.aufrufe += 1
+        if self.blockiert is not None:
+            self.blockiert.wait()
+        return self.wert
+
+
+def _sensor(name, hx):
+    return types.SimpleNamespace(hx=hx, config={'name': name}, offset=0, scale=1.0)
+
+
+@pytest.fixture
+def haengende_zelle(monkeypatch):
+    freigabe = threading.Event()
+    haengt = _Hx(4000, blockiert=freigabe)
+    sensoren = [_sensor('Vorne_Links', _Hx(1000)), _sensor('Vorne_Rechts', _Hx(2000)),
+                _sensor('Hinten_Links', _Hx(3000)), _sensor('Hinten_Rechts', haengt)]
+    hx711_real.beende_parallel_sampler()
+    monkeypatch.setattr(hx711_real, "hx_sensors", sensoren)
+    yield haengt
+    freigabe.set()
+    hx711_real.beende_parallel_sampler()
+
+
+def test_haengende_zelle_liefert_none_innerhalb_timeout(haengende_zelle):
+    start = time.monotonic()
+    werte = hx711_real.lese_zellen_counts(samples=1, timeout=0.1)
+    dauer = time.monotonic() - start
+
+    assert werte == [1000, 2000, 3000, None]
+    assert dauer < 0.5
+
+
+def test_keine_neuen_messungen_fuer_haengende_zelle(haengende_zelle):
+    for _ in range(20):
+        werte = hx711_real.lese_zellen_counts(samples=1, timeout=0.02)
+        assert werte[:3] == [1000, 2000, 3000]
+        assert werte[3] is None
+
+    # Pro Zelle höchstens eine offene Messung, die hängende wird nicht erneut eingereiht
+    assert len(hx711_real._pending_reads) <= len(hx711_real.hx_sensors)
+    assert haengende_zelle.aufrufe == 1
+    assert sum(not f.done() for f in hx711_real._pending_reads.values()) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ HX711-Sampler Tests bestanden")
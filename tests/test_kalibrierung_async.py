@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests für Tara/Kalibrierung aus dem Sample-Puffer (WeightManager.tare_async/calibrate_async)
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.replay_sensor import ReplayWeightSensor
+from hardware.weight_manager import WeightSensorInterface
+from utils.settings_manager import get_settings_manager
+
+
+def _sensor(zellwert, seed):
+    rng = np.random.default_rng(seed)
+    cells = zellwert + rng.normal(0.0, 0.001, size=(200, 4))
+    return ReplayWeightSensor((np.arange(200) * 0.01, cells), speed=0, loop=True)
+
+
+def _warte_auf_gewicht(manager, soll, timeout=3.0):
+    ende = time.time() + timeout
+    while time.time() < ende:
+        if abs(manager.read_weight() - soll) < 0.05:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_tara_und_kalibrierung(frischer_manager):
+    manager = frischer_manager
+
+    # Leerer Karren: 4 x 5 kg Eigengewicht
+    manager.use_sensor(_sensor(5.0, seed=1))
+    start = time.time()
+    result = manager.tare_async(timeout=3.0, persist=False).result(timeout=5.0)
+    assert result.success, result.message
+    assert time.time() - start < 3.0
+    assert np.allclose(result.tare, 5.0, atol=0.01)
+    assert _warte_auf_gewicht(manager, 0.0)
+
+    # Referenzgewicht 20 kg, unkalibriert gemessen: 4 x 2.5 kg
+    manager.use_sensor(_sensor(7.5, seed=2))
+    assert _warte_auf_gewicht(manager, 10.0)
+    result = manager.calibrate_async(20.0, timeout=3.0, persist=False).result(timeout=5.0)
+    assert result.success, result.message
+    assert np.allclose(result.gain, 2.0, atol=0.01)
+    assert _warte_auf_gewicht(manager, 20.0)
+
+
+def test_ohne_erfassung_schlaegt_fehl(frischer_manager):
+    result = frischer_manager.tare_async(timeout=0.1, persist=False).result(timeout=2.0)
+    assert not result.success
+
+
+def test_kalibrierung_ohne_last_schlaegt_fehl(frischer_manager):
+    frischer_manager.use_sensor(_sensor(0.0, seed=3))
+    result = frischer_manager.calibrate_async(20.0, timeout=3.0, persist=False).result(timeout=5.0)
+    assert not result.success
+
+
+class _Funkwaage(WeightSensorInterface):
+    """Registry-Quelle mit festem Zellwert"""
+
+    def read_cells(self):
+        return [5.0, 5.0, 5.0, 5.0]
+
+    def read_weight(self):
+        return 20.0
+
+
+def test_kalibrierung_der_aktiven_quelle_bleibt_nach_neustart(frischer_manager, tmp_path, monkeypatch):
+    settings = get_settings_manager()
+    monkeypatch.setattr(settings, "settings_file", tmp_path / "settings.json")
+    monkeypatch.setattr(settings, "backup_file", tmp_path / "settings_backup.json")
+    for feld in ("source_calibrations", "tare_values", "scale_factors", "last_calibration"):
+        monkeypatch.setattr(settings.calibration, feld, getattr(settings.calibration, feld))
+
+    manager = frischer_manager
+    manager._sources.register("esp32", _Funkwaage(), priority=0, healthy=True)
+    result = manager.tare_async(timeout=3.0, persist=False).result(timeout=5.0)
+    assert result.success, result.message
+    assert result.source == "esp32"
+
+    # So speichert die Kalibrierseite
+    manager.set_calibration(result.tare, result.gain, persist=True, source=result.source)
+
+    # Neustart: Kalibrierung kommt aus source_calibrations zurück
+    manager._calibrations.clear()
+    manager._load_calibration()
+    assert np.allclose(manager._calibration_for("esp32")[0], 5.0, atol=0.01)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Kalibrierungs-Tests bestanden")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests für den gemeinsamen Frame-Cache (wireless/live_frames.py)
+"""
+
+import threading
+import time
+
+import pytest
+
+from wireless.live_frames import LiveFrameCache
+
+
+class _ZaehlenderClient:
+    """Ersetzt den HTTP-Client und zählt die Anfragen"""
+
+    def __init__(self, verzoegerung: float = 0.0, fehler: bool = False):
+        self.anfragen = 0
+        self.verzoegerung = verzoegerung
+        self.fehler = fehler
+
+    def get_json(self, host, path, timeout=2.0):
+        self.anfragen += 1
+        time.sleep(self.verzoegerung)
+        if self.fehler:
+            raise ConnectionRefusedError(host)
+        return {'vl_value': 100000, 'vr_value': 200000, 'hl_value': 300000,
+                'hr_value': 400000 + self.anfragen}
+
+
+def test_gesamt_und_zellen_aus_einem_frame():
+    client = _ZaehlenderClient()
+    cache = LiveFrameCache(client=client)
+    frame = cache.get('192.168.4.1')
+    assert frame.cells(100000.0)[:3] == [1.0, 2.0, 3.0]
+    assert abs(frame.total(100000.0) - sum(frame.cells(100000.0))) < 1e-12
+    assert client.anfragen == 1
+
+
+def test_frames_werden_innerhalb_max_age_geteilt():
+    client = _ZaehlenderClient()
+    cache = LiveFrameCache(max_age=1.0, client=client)
+    erster = cache.get('192.168.4.1')
+    assert cache.get('192.168.4.1') is erster
+    assert client.anfragen == 1
+    assert cache.hits == 1
+
+    # max_age=0 erzwingt eine neue Abfrage
+    assert cache.get('192.168.4.1', max_age=0.0) is not erster
+    assert client.anfragen == 2
+
+
+def test_gleichzeitige_leser_loesen_nur_eine_anfrage_aus():
+    client = _ZaehlenderClient(verzoegerung=0.1)
+    cache = LiveFrameCache(client=client)
+    frames = []
+    threads = [threading.Thread(target=lambda: frames.append(cache.get('192.168.2.20')))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.anfragen == 1
+    assert len({id(f) for f in frames}) == 1
+
+
+def test_invalidate_und_latest():
+    client = _ZaehlenderClient()
+    cache = LiveFrameCache(client=client)
+    assert cache.latest() is None
+    frame = cache.get('192.168.4.1')
+    assert cache.latest() is frame
+    cache.invalidate('192.168.4.1')
+    assert cache.latest() is None
+    cache.get('192.168.4.1')
+    assert client.anfragen == 2
+
+
+def test_fehler_werden_nicht_gecacht():
+    client = _ZaehlenderClient(fehler=True)
+    cache = LiveFrameCache(client=client)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            cache.get('192.168.4.1')
+    assert client.anfragen == 2
+
+
+if __name__ == "__main__":
+    test_gesamt_und_zellen_aus_einem_frame()
+    test_frames_werden_innerhalb_max_age_geteilt()
+    test_gleichzeitige_leser_loesen_nur_eine_anfrage_aus()
+    test_invalidate_und_latest()
+    test_fehler_werden_nicht_gecacht()
+    print("✅ Frame-Cache Tests bestanden")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests für den ESP8266 Live-Stream (wireless/live_stream.py)
+
+Ein lokaler HTTP-Server spielt die Firmware mit /live-values-stream.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import wireless.live_stream as live_stream
+from hardware.weight_sources import ESP8266HttpSource
+from wireless.live_frames import LiveFrameCache
+from wireless.live_stream import LiveStreamClient, SseParser
+from wireless.wireless_weight_manager import ReconnectBackoff
+
+
+class _SseHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    modus = 'stream'   # 'stream', 'stumm' (Verbindung hängt) oder 'fehlt' (alte Firmware)
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.modus == 'fehlt':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        self.wfile.flush()
+        if self.modus == 'stumm':
+            time.sleep(2.0)
+            return
+
+        for i in range(3):
+            daten = {'vl_value': '100000', 'vr_value': '200000', 'hl_value': '300000',
+                     'hr_value': str(400000 + i), 'timestamp': i}
+            self.wfile.write(f": ping\n\ndata: {json.dumps(daten)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(0.02)
+        time.sleep(1.0)
+        self.close_connection = True
+
+
+@pytest.fixture
+def esp_stream():
+    _SseHandler.modus = 'stream'
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SseHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _KeinHttp:
+    """Frame-Cache-Client, der nie gebraucht werden darf"""
+
+    def get_json(self, host, path, timeout=2.0):
+        pytest.fail(f"HTTP-Abfrage {path} trotz Live-Stream")
+
+
+def _warte_bis(bedingung, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not bedingung() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return bedingung()
+
+
+def test_sse_parser():
+    parser = SseParser()
+    zeilen = [": ping\n", "\n", "event: werte\n", "data: {\"a\":\n", "data: 1}\r\n", "id: 7\n", "\n"]
+    events = [e for e in (parser.feed(z) for z in zeilen) if e is not None]
+    assert len(events) == 1
+    assert events[0].event == "werte" and events[0].id == "7"
+    assert json.loads(events[0].data) == {"a": 1}
+
+
+def test_werte_werden_gepusht(esp_stream):
+    cache = LiveFrameCache(client=_KeinHttp())
+    client = LiveStreamClient('127.0.0.1', port=esp_stream.server_port, cache=cache)
+    frames, zustaende = [], []
+    client.add_observer(frames.append)
+    client.add_state_observer(lambda verbunden, host: zustaende.append(verbunden))
+    client.start()
+    try:
+        assert client.wait_for_state(True, timeout=3.0)
+        assert _warte_bis(lambda: len(frames) >= 3)
+        assert client.supported is True
+        assert [f.data['timestamp'] for f in frames[:3]] == [0, 1, 2]
+        assert zustaende[0] is True
+
+        # Leser des gemeinsamen Caches bekommen den gepushten Frame ohne Anfrage
+        assert cache.get('127.0.0.1', max_age=1.0).data['hr_value'] == '400002'
+
+        source = ESP8266HttpSource(['127.0.0.1'], scale=100000.0)
+        source._streams = {'127.0.0.1': client}
+        assert source.read_cells() == [1.0, 2.0, 3.0, 4.00002]
+    finally:
+        client.stop()
+
+
+def test_toter_stream_wird_erkannt_und_neu_verbunden(esp_stream):
+    _SseHandler.modus = 'stumm'
+    client = LiveStreamClient('127.0.0.1', port=esp_stream.server_port, receive_timeout=0.2,
+                              cache=LiveFrameCache(client=_KeinHttp()),
+                              backoff=ReconnectBackoff(initial=0.01, maximum=0.02))
+    zustaende = []
+    client.add_state_observer(lambda verbunden, host: zustaende.append(verbunden))
+    client.start()
+    try:
+        assert _warte_bis(lambda: client.reconnects >= 2)
+        assert zustaende[:2] == [True, False]
+    finally:
+        client.stop()
+
+
+def test_firmware_ohne_stream(esp_stream):
+    _SseHandler.modus = 'fehlt'
+    client = LiveStreamClient('127.0.0.1', port=esp_stream.server_port,
+                              cache=LiveFrameCache(client=_KeinHttp()))
+    client.start()
+    assert _warte_bis(lambda: client.supported is False)
+    assert not client.connected
+
+    # stop() unterbricht die lange Wartezeit bis zum nächsten Versuch
+    start = time.monotonic()
+    client.stop()
+    assert time.monotonic() - start < 1.0
+
+
+def test_stream_laeuft_nur_solange_die_quelle_aktiv_ist(esp_stream, monkeypatch):
+    monkeypatch.setattr(live_stream, "LiveStreamClient", lambda host: LiveStreamClient(
+        host, port=esp_stream.server_port, cache=LiveFrameCache(client=_KeinHttp())))
+    source = ESP8266HttpSource(['127.0.0.1'])
+    try:
+        # Registriert, aber nicht aktiv: kein Stream-Thread
+        assert live_stream._live_streams == {}
+
+        source.activate()
+        client = source._streams['127.0.0.1']
+        assert client.wait_for_state(True, timeout=3.0)
+
+        # Zweiter Nutzer (z.B. Konfigurationsseite) hält den Stream am Leben
+        assert live_stream.get_live_stream('127.0.0.1') is client
+        source.stop()
+        assert client.is_running and source._streams == {}
+
+        live_stream.release_live_stream('127.0.0.1')
+        assert not client.is_running
+        assert live_stream._live_streams == {}
+    finally:
+        live_stream.stop_live_streams()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Live-Stream Tests bestanden")
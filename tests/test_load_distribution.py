@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests für Lastverteilung und Schwerpunkt (hardware/load_distribution.py)
+"""
+
+import time
+
+import numpy as np
+
+from hardware.load_distribution import LoadAnalyzer, CartGeometry, axle_loads
+from hardware.replay_sensor import ReplayWeightSensor
+
+
+def _fenster(vl, vr, hl, hr, n=20, rauschen=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.tile([vl, vr, hl, hr], (n, 1)) + rng.normal(0.0, rauschen, (n, 4))
+
+
+def test_gleichmaessige_last_im_zentrum():
+    verteilung = LoadAnalyzer().analyze(_fenster(10.0, 10.0, 10.0, 10.0, rauschen=0.01))
+    assert abs(verteilung.total - 40.0) < 0.05
+    assert abs(verteilung.front - 20.0) < 0.05
+    assert abs(verteilung.cog_x) < 0.01 and abs(verteilung.cog_y) < 0.01
+    assert not verteilung.one_sided and not verteilung.tipping_risk
+    assert verteilung.warning is None
+
+
+def test_schwerpunkt_in_metern():
+    # 3/4 der Last rechts -> cog_x = 0.5 -> 0.25 * Spurweite
+    analyzer = LoadAnalyzer(geometry=CartGeometry(track_width=0.8, wheelbase=1.2))
+    verteilung = analyzer.analyze(_fenster(5.0, 15.0, 5.0, 15.0))
+    assert abs(verteilung.cog_x - 0.5) < 1e-9
+    assert abs(verteilung.cog_x_m - 0.2) < 1e-9
+    assert verteilung.cog_y == 0.0
+
+
+def test_achslasten_vektorisiert():
+    cells = np.array([[1.0, 2.0, 3.0, 4.0], [0.0, 0.0, 0.0, 0.0]])
+    loads = axle_loads(cells)
+    assert loads['front'].tolist() == [3.0, 0.0]
+    assert loads['rear'].tolist() == [7.0, 0.0]
+    assert loads['left'].tolist() == [4.0, 0.0]
+    assert np.isnan(loads['cog_x'][1])  # Leere Waage: kein Schwerpunkt
+
+
+def test_einseitige_beladung():
+    verteilung = LoadAnalyzer().analyze(_fenster(2.0, 18.0, 2.0, 18.0))
+    assert verteilung.one_sided
+    assert not verteilung.tipping_risk
+    assert "rechts" in verteilung.warning
+
+
+def test_kippgefahr_bei_unbelasteter_ecke():
+    verteilung = LoadAnalyzer().analyze(_fenster(20.0, 20.0, 20.0, 0.2))
+    assert verteilung.tipping_risk
+    assert "HR" in verteilung.warning
+
+
+def test_einzelner_stoss_loest_keine_warnung_aus():
+    fenster = _fenster(10.0, 10.0, 10.0, 10.0)
+    fenster[-3:] = [1.0, 30.0, 1.0, 30.0]
+    assert LoadAnalyzer().analyze(fenster).warning is None
+
+
+def test_leere_waage_ohne_bewertung():
+    verteilung = LoadAnalyzer().analyze(_fenster(0.5, 0.0, 0.0, 0.0))
+    assert not verteilung.one_sided and not verteilung.tipping_risk
+    assert LoadAnalyzer().analyze(np.empty((0, 4))) is None
+
+
+def test_manager_berechnet_im_erfassungs_thread(frischer_manager):
+    cells = np.tile([4.0, 16.0, 4.0, 16.0], (50, 1))
+    frischer_manager.use_sensor(ReplayWeightSensor((np.arange(50) * 0.1, cells), speed=0, loop=True))
+
+    deadline = time.time() + 2.0
+    while frischer_manager.get_load_distribution() is None and time.time() < deadline:
+        time.sleep(0.01)
+
+    verteilung = frischer_manager.get_load_distribution()
+    assert verteilung is not None
+    assert abs(verteilung.cog_x - 0.6) < 1e-6
+    assert verteilung.one_sided
+    assert frischer_manager.get_status()['load_distribution'].one_sided
+
+
+if __name__ == "__main__":
+    test_gleichmaessige_last_im_zentrum()
+    test_schwerpunkt_in_metern()
+    test_achslasten_vektorisiert()
+    test_einseitige_beladung()
+    test_kippgefahr_bei_unbelasteter_ecke()
+    test_einzelner_stoss_loest_keine_warnung_aus()
+    test_leere_waage_ohne_bewertung()
+    print("✅ Lastverteilung Tests bestanden")
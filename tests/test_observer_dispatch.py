@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests für gefilterte/gedrosselte Observer-Benachrichtigung im WeightManager
+"""
+
+import sys
+import threading
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+
+def test_ohne_optionen_jeder_wert(frischer_manager):
+    werte = []
+    frischer_manager.register_observer("alle", werte.append)
+    for w in [1.0, 1.0, 1.001]:
+        frischer_manager._notify_observers(w)
+    assert werte == [1.0, 1.0, 1.001]
+
+
+def test_min_delta_unterdrueckt_rauschen(frischer_manager):
+    werte = []
+    frischer_manager.register_observer("delta", werte.append, min_delta=0.05)
+    for w in [10.0, 10.01, 10.04, 10.06, 10.02, 9.9]:
+        frischer_manager._notify_observers(w)
+    # Vergleich immer mit dem zuletzt gemeldeten Wert
+    assert werte == [10.0, 10.06, 9.9]
+
+
+def test_max_rate_drosselt(frischer_manager, monkeypatch):
+    jetzt = [100.0]
+    monkeypatch.setattr("hardware.weight_manager.time.monotonic", lambda: jetzt[0])
+
+    werte = []
+    frischer_manager.register_observer("rate", werte.append, max_rate=2.0)  # 0.5s Abstand
+    for i in range(10):
+        frischer_manager._notify_observers(float(i))
+        jetzt[0] += 0.25
+    assert werte == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def test_weight_channel_fasst_zusammen(frischer_manager):
+    app = QApplication.instance() or QApplication(sys.argv)
+    from hardware.weight_signals import WeightChannel
+
+    kanal = WeightChannel("test_kanal")
+    empfangen = []
+    kanal.weight_changed.connect(empfangen.append)
+
+    # Viele Werte aus einem Fremd-Thread, bevor die Event-Loop läuft
+    thread = threading.Thread(target=lambda: [frischer_manager._notify_observers(float(i))
+                                              for i in range(50)])
+    thread.start()
+    thread.join()
+    app.processEvents()
+
+    assert empfangen == [49.0]  # nur der neueste Wert wird zugestellt
+    kanal.close()
+    assert "test_kanal" not in frischer_manager._observers
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Observer-Dispatch Tests bestanden")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests für die Laufzeit-Messwerte (hardware/perf_stats.py, WeightManager.get_performance)
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.perf_stats import LatencyHistogram, CellRateMeter
+from hardware.replay_sensor import ReplayWeightSensor
+
+
+def test_histogramm_und_perzentile():
+    hist = LatencyHistogram(window=100)
+    assert hist.summary() == {'count': 0}
+
+    for ms in range(1, 101):
+        hist.record(ms / 1000.0)
+    summary = hist.summary()
+    assert summary['count'] == 100
+    assert abs(summary['p50_ms'] - 50.5) < 0.01
+    assert summary['max_ms'] == pytest.approx(100.0)
+    assert sum(summary['histogram'].values()) == 100
+    assert summary['histogram']['<2.5ms'] == 2  # 1 ms und 2 ms
+
+    # Rollierend: alte Messungen fallen heraus, das Allzeit-Maximum bleibt
+    for _ in range(100):
+        hist.record(0.002)
+    assert hist.summary()['max_ms'] == pytest.approx(2.0)
+    assert hist.summary()['max_ever_ms'] == pytest.approx(100.0)
+
+
+def test_zellraten():
+    meter = CellRateMeter(channels=4, window=50)
+    for i in range(50):
+        meter.record(i * 0.1, [True, i % 2 == 0, True, False])
+    raten = meter.rates()
+    assert raten[0] == pytest.approx(10.0)
+    assert raten[1] == pytest.approx(5.0)
+    assert raten[3] == 0.0
+
+
+def test_manager_status_enthaelt_messwerte(frischer_manager):
+    manager = frischer_manager
+    cells = np.full((20, 4), 5.0)
+    manager.use_sensor(ReplayWeightSensor((np.arange(20) * 0.01, cells), speed=0, loop=True))
+    time.sleep(0.2)
+    for _ in range(10):
+        manager.read_weight()
+
+    perf = manager.get_status()['performance']
+    assert perf['latency']['read']['count'] > 5
+    assert perf['latency']['dispatch']['count'] > 5
+    assert perf['cache_hit_ratio'] == 1.0
+    assert all(rate > 0 for rate in perf['cell_rates'])
+    assert perf['worst_stall_ms'] >= 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Laufzeit-Messwerte Tests bestanden")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests für die Entnahme-Erkennung (hardware/removal_detector.py)
+"""
+
+import numpy as np
+
+from hardware.removal_detector import FeedRemovalDetector
+from hardware.settle_detector import SettleDetector
+
+
+def _abspielen(gewichte, rate=10.0, seed=0, detector=None):
+    """Spielt einen Gewichtsverlauf durch SettleDetector + FeedRemovalDetector"""
+    rng = np.random.default_rng(seed)
+    settle = SettleDetector()
+    detector = detector or FeedRemovalDetector()
+    events = []
+    for i, gewicht in enumerate(gewichte):
+        t = i / rate
+        settle.update(t, gewicht + rng.normal(0.0, 0.005))
+        event = detector.update(t, settle.current)
+        if event:
+            events.append(event)
+    return events
+
+
+def _verlauf(*abschnitte):
+    """Abschnitte (Gewicht, Samples) oder ('rampe', von, bis, Samples)"""
+    werte = []
+    for abschnitt in abschnitte:
+        if abschnitt[0] == 'rampe':
+            werte.extend(np.linspace(abschnitt[1], abschnitt[2], abschnitt[3]))
+        else:
+            werte.extend([abschnitt[0]] * abschnitt[1])
+    return werte
+
+
+def test_entnahme_wird_erkannt():
+    # 80 kg ruhig, 3 s Greifen (wackelt), danach 75.5 kg ruhig
+    gewichte = _verlauf((80.0, 50), ('rampe', 80.0, 74.0, 15), ('rampe', 74.0, 75.5, 15), (75.5, 50))
+    events = _abspielen(gewichte)
+
+    assert len(events) == 1
+    event = events[0]
+    assert abs(event.amount - 4.5) < 0.05
+    assert abs(event.weight_before - 80.0) < 0.05
+    assert 0.0 < event.duration < 6.0
+    assert event.start_time <= 5.1 < event.end_time
+    assert event.confidence > 0.8
+
+
+def test_beladen_ist_keine_entnahme():
+    gewichte = _verlauf((20.0, 50), ('rampe', 20.0, 60.0, 20), (60.0, 50))
+    assert _abspielen(gewichte) == []
+
+
+def test_kleine_stufe_wird_ignoriert():
+    gewichte = _verlauf((50.0, 50), ('rampe', 50.0, 49.9, 10), (49.9, 50))
+    assert _abspielen(gewichte) == []
+
+
+def test_mehrere_entnahmen_nacheinander():
+    gewichte = _verlauf((60.0, 40), ('rampe', 60.0, 57.0, 10), (57.0, 40),
+                        ('rampe', 57.0, 55.0, 10), (55.0, 40))
+    events = _abspielen(gewichte)
+    assert [round(e.amount, 1) for e in events] == [3.0, 2.0]
+
+
+def test_lange_entnahme_halbe_konfidenz():
+    gewichte = _verlauf((60.0, 40), ('rampe', 60.0, 55.0, 30), (55.0, 40))
+    kurz = _abspielen(gewichte)[0]
+    lang = _abspielen(gewichte, detector=FeedRemovalDetector(max_duration=1.0))[0]
+    assert abs(lang.confidence - kurz.confidence / 2) < 0.01
+
+
+if __name__ == "__main__":
+    test_entnahme_wird_erkannt()
+    test_beladen_ist_keine_entnahme()
+    test_kleine_stufe_wird_ignoriert()
+    test_mehrere_entnahmen_nacheinander()
+    test_lange_entnahme_halbe_konfidenz()
+    print("✅ Entnahme-Erkennung Tests bestanden")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests für Aufnahme und Wiedergabe von Wägezellen-Samples (hardware/replay_sensor.py)
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.replay_sensor import ReplayWeightSensor, SampleRecorder, load_recording
+from hardware.weight_manager import SENSOR_CALIBRATION
+
+
+def _aufnahme(n=20):
+    timestamps = np.arange(n) * 0.1
+    cells = np.column_stack([np.arange(n, dtype=float)] * 4)
+    return timestamps, cells
+
+
+def test_recorder_roundtrip(tmp_path):
+    recorder = SampleRecorder()
+    for i in range(5):
+        recorder.append([i, i + 1, i + 2, i + 3], 1000.0 + i * 0.1)
+
+    pfad = str(tmp_path / "aufnahme.npz")
+    assert recorder.save(pfad) == 5
+
+    timestamps, cells = load_recording(pfad)
+    assert np.allclose(timestamps, np.arange(5) * 0.1)  # relativ zum ersten Sample
+    assert cells.shape == (5, 4)
+    assert cells[4].tolist() == [4.0, 5.0, 6.0, 7.0]
+
+
+def test_recorder_begrenzt_laenge():
+    recorder = SampleRecorder(max_samples=3)
+    for i in range(10):
+        recorder.append([i, 0, 0, 0], float(i))
+    assert len(recorder) == 3
+
+
+def test_schrittmodus_liefert_jedes_sample():
+    sensor = ReplayWeightSensor(_aufnahme(5), speed=0)
+    werte = [sensor.read_cells()[0] for _ in range(5)]
+    assert werte == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert sensor.finished
+    assert sensor.read_weight() == 16.0  # bleibt auf dem letzten Sample stehen
+
+
+def test_schrittmodus_mit_loop():
+    sensor = ReplayWeightSensor(_aufnahme(3), speed=0, loop=True)
+    werte = [sensor.read_cells()[0] for _ in range(5)]
+    assert werte == [0.0, 1.0, 2.0, 0.0, 1.0]
+    assert not sensor.finished
+
+
+def test_beschleunigte_wiedergabe():
+    sensor = ReplayWeightSensor(_aufnahme(20), speed=20.0)  # 1.9s Aufnahme in ~0.1s
+    assert sensor.read_cells()[0] == 0.0
+    time.sleep(0.15)
+    assert sensor.finished
+    assert sensor.read_cells()[0] == 19.0
+
+
+def test_beschleunigt_kommt_jedes_sample_an():
+    sensor = ReplayWeightSensor(_aufnahme(20), speed=50.0)  # 1.9s Aufnahme in ~40ms
+    samples = sensor.read_samples()
+    time.sleep(0.1)
+    samples += sensor.read_samples()   # Erfassung fragt seltener als abgespielt wird
+    assert [cells[0] for _, cells in samples] == [float(i) for i in range(20)]
+    assert np.diff([t for t, _ in samples]) == pytest.approx([0.1 / 50.0] * 19, abs=1e-6)
+    assert sensor.read_samples() == []   # Aufnahme zu Ende
+
+
+def test_beschleunigt_mit_loop_zaehlt_weiter():
+    sensor = ReplayWeightSensor(_aufnahme(5), speed=40.0, loop=True)   # 0.4s -> 10ms
+    sensor.read_samples()
+    time.sleep(0.05)
+    werte = [cells[0] for _, cells in sensor.read_samples()]
+    # Durchläufe 0,1,2,3 - das letzte Sample fällt auf das erste des nächsten Durchlaufs
+    assert werte[:7] == [1.0, 2.0, 3.0, 0.0, 1.0, 2.0, 3.0]
+
+
+def test_erfassung_verarbeitet_jedes_sample_bei_seltener_abfrage(frischer_manager):
+    frischer_manager._active_interval = frischer_manager._idle_interval = 0.05
+    cells = np.column_stack([np.arange(100, dtype=float)] * 4)
+    sensor = ReplayWeightSensor((np.arange(100) * 0.01, cells), speed=10.0)   # 1s in 0.1s
+    frischer_manager.use_sensor(sensor)
+    ende = time.time() + 3.0
+    while frischer_manager.get_status()['samples_total'] < 100 and time.time() < ende:
+        time.sleep(0.01)
+    assert frischer_manager.get_status()['samples_total'] == 100
+
+
+def test_leere_aufnahme_wird_abgelehnt():
+    with pytest.raises(ValueError):
+        ReplayWeightSensor((np.zeros(0), np.zeros((0, 4))))
+
+
+def test_weight_manager_mit_replay_sensor(frischer_manager, tmp_path):
+    manager = frischer_manager
+    timestamps = np.arange(50) * 0.1
+    cells = np.full((50, 4), 5.0)
+    manager.start_recording()
+    manager.use_sensor(ReplayWeightSensor((timestamps, cells), speed=0, loop=True))
+
+    assert manager.hardware_ready
+    ende = time.time() + 3.0
+    while manager.get_status()['samples_total'] < 3 and time.time() < ende:
+        time.sleep(0.05)
+
+    assert abs(manager.read_weight() - 20.0) < 1e-6
+    assert manager.read_individual_cells() == [5.0, 5.0, 5.0, 5.0]
+    assert manager.get_status()['sensor'] == 'ReplayWeightSensor'
+    assert manager.stop_recording(str(tmp_path / "live.npz")) >= 3
+
+
+def test_aufnahme_ist_kalibriert_in_kg(frischer_manager, tmp_path):
+    # Quelle liefert HX711-Counts: Nullpunkt 80000, 20000 Counts pro kg
+    counts = np.full((30, 4), 80000.0 + 5.0 * 20000.0)
+    frischer_manager.set_calibration(np.full(4, 80000.0), np.full(4, 1.0 / 20000.0),
+                                     persist=False, source=SENSOR_CALIBRATION)
+    frischer_manager.start_recording()
+    sensor = ReplayWeightSensor((np.arange(30) * 0.1, counts), speed=0)
+    frischer_manager.use_sensor(sensor)
+    ende = time.time() + 3.0
+    while not sensor.finished and time.time() < ende:
+        time.sleep(0.01)
+    time.sleep(0.05)   # letztes Sample bleibt stehen und wird weiter erfasst
+
+    pfad = str(tmp_path / "kg.npz")
+    assert frischer_manager.stop_recording(pfad) >= 30
+    _, cells = load_recording(pfad)
+    assert np.allclose(cells, 5.0)
+
+    # Wiedergabe ohne Kalibrierung liefert wieder kg
+    frischer_manager._calibrations.clear()
+    frischer_manager.use_sensor(ReplayWeightSensor(pfad, speed=0, loop=True))
+    ende = time.time() + 3.0
+    while frischer_manager.get_status()['samples_total'] < 3 and time.time() < ende:
+        time.sleep(0.01)
+    assert frischer_manager.read_weight() == pytest.approx(20.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Replay-Sensor Tests bestanden")
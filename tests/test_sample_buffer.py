@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests für den SampleRingBuffer der Gewichts-Erfassung
+"""
+
+from hardware.sample_buffer import SampleRingBuffer
+
+
+def test_leerer_puffer():
+    buffer = SampleRingBuffer(capacity=4)
+    assert buffer.latest() is None
+    timestamps, values = buffer.window(3)
+    assert len(timestamps) == 0
+    assert values.shape == (0, 4)
+
+
+def test_latest_und_fenster():
+    buffer = SampleRingBuffer(capacity=8)
+    for i in range(5):
+        buffer.push([i, i, i, i], float(i))
+
+    timestamp, values = buffer.latest()
+    assert timestamp == 4.0
+    assert list(values) == [4.0, 4.0, 4.0, 4.0]
+
+    timestamps, values = buffer.window(3)
+    assert list(timestamps) == [2.0, 3.0, 4.0]
+    assert values[:, 0].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_umbruch_am_pufferende():
+    buffer = SampleRingBuffer(capacity=4)
+    for i in range(10):
+        buffer.push([i, 0, 0, 0], float(i))
+
+    assert len(buffer) == 4
+    assert buffer.total_count == 10
+
+    timestamps, values = buffer.window(10)  # mehr als Kapazität angefordert
+    assert list(timestamps) == [6.0, 7.0, 8.0, 9.0]
+    assert values[:, 0].tolist() == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_fenster_ist_kopie():
+    buffer = SampleRingBuffer(capacity=4)
+    buffer.push([1, 2, 3, 4], 0.0)
+    _, values = buffer.window(1)
+    values[0, 0] = 99.0
+    assert buffer.latest()[1][0] == 1.0
+
+
+if __name__ == "__main__":
+    test_leerer_puffer()
+    test_latest_und_fenster()
+    test_umbruch_am_pufferende()
+    test_fenster_ist_kopie()
+    print("✅ SampleRingBuffer Tests bestanden")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests für das memory-mapped Roh-Sample-Journal (hardware/sample_journal.py)
+"""
+
+import numpy as np
+
+from hardware.sample_journal import SampleJournal, JournalReader, journal_stats
+
+
+def test_schreiben_und_lesen(tmp_path):
+    pfad = str(tmp_path / "test.journal")
+    journal = SampleJournal(pfad, capacity=100)
+    for i in range(10):
+        journal.append(float(i), [i, 2 * i, None, -i])
+
+    reader = JournalReader(pfad)  # parallel zum offenen Schreiber
+    timestamps, counts = reader.snapshot()
+    assert reader.total_count == 10
+    assert timestamps.tolist() == [float(i) for i in range(10)]
+    assert counts[:, 1].tolist() == [2.0 * i for i in range(10)]
+    assert np.isnan(counts[:, 2]).all()
+    assert reader.snapshot(last_n=3)[0].tolist() == [7.0, 8.0, 9.0]
+    reader.close()
+    journal.close()
+
+
+def test_ringueberlauf(tmp_path):
+    pfad = str(tmp_path / "ring.journal")
+    journal = SampleJournal(pfad, capacity=8)
+    for i in range(20):
+        journal.append(float(i), [i] * 4)
+
+    reader = JournalReader(pfad)
+    timestamps, counts = reader.snapshot()
+    # Der gerade beschreibbare Slot wird verworfen, Reihenfolge bleibt zeitlich
+    assert timestamps.tolist() == [float(i) for i in range(13, 20)]
+    assert counts[-1].tolist() == [19.0] * 4
+    reader.close()
+    journal.close()
+
+
+def test_fortsetzen_nach_neustart(tmp_path):
+    pfad = str(tmp_path / "neustart.journal")
+    journal = SampleJournal(pfad, capacity=50)
+    for i in range(5):
+        journal.append(float(i), [i] * 4)
+    journal.close()
+
+    journal = SampleJournal(pfad, capacity=50)
+    assert journal.total_count == 5
+    journal.append(5.0, [5] * 4)
+    journal.close()
+
+    reader = JournalReader(pfad)
+    assert reader.snapshot()[0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    reader.close()
+
+
+def test_zeitstempel_bleiben_ueber_neustart_gueltig(tmp_path):
+    pfad = str(tmp_path / "uhrzeit.journal")
+    vor_neustart = 1_700_000_000.0
+    journal = SampleJournal(pfad, capacity=50)
+    journal.append(vor_neustart, [1] * 4)
+    journal.close()
+
+    # Nach dem Neustart: weiter mit der aktuellen Uhrzeit, alte Datensätze unverändert
+    journal = SampleJournal(pfad, capacity=50)
+    journal.append(vor_neustart + 3600.0, [2] * 4)
+    journal.close()
+
+    reader = JournalReader(pfad)
+    assert reader.snapshot()[0].tolist() == [vor_neustart, vor_neustart + 3600.0]
+    reader.close()
+
+
+def test_altes_format_wird_neu_angelegt(tmp_path):
+    pfad = str(tmp_path / "alt.journal")
+    journal = SampleJournal(pfad, capacity=10)
+    journal.append(5.0, [1] * 4)
+    journal._header['version'] = 1   # Version 1: monotone Zeit + Offset im Header
+    journal.close()
+
+    journal = SampleJournal(pfad, capacity=10)
+    assert journal.total_count == 0
+    journal.close()
+
+
+def test_statistik_erkennt_drift():
+    timestamps = np.arange(3600) * 1.0          # eine Stunde, 1 Hz
+    counts = np.tile(np.arange(3600) * 0.1, (4, 1)).T
+    counts[:, 1] = 1000.0
+    stats = journal_stats(timestamps, counts)
+    assert abs(stats['drift_per_h'][0] - 360.0) < 1.0
+    assert abs(stats['drift_per_h'][1]) < 1e-6
+    assert stats['missing'] == [0, 0, 0, 0]
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-q"])
+    print("✅ Sample-Journal Tests bestanden")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests für die Ruhe-Erkennung (hardware/settle_detector.py)
+"""
+
+from hardware.settle_detector import SettleDetector
+
+
+def test_stabil_nach_beruhigung():
+    detector = SettleDetector(window=5, variance_threshold=0.01)
+
+    # Bewegung: Gabel hebt Heu ab
+    events = [detector.update(t * 0.1, 30.0 - t) for t in range(5)]
+    assert not any(events)
+    assert not detector.is_stable
+
+    # Ruhe bei 25 kg
+    event = None
+    for t in range(5, 15):
+        event = detector.update(t * 0.1, 25.0) or event
+
+    assert detector.is_stable
+    assert event is not None
+    assert abs(event.value - 25.0) < 1e-9
+    assert event.time_to_settle > 0.0
+
+
+def test_nur_ein_ereignis_pro_beruhigung():
+    detector = SettleDetector(window=3, variance_threshold=0.01)
+    events = [detector.update(t * 0.1, 10.0) for t in range(10)]
+    assert sum(1 for e in events if e) == 1
+
+
+def test_bewegung_beendet_stabil_zustand():
+    detector = SettleDetector(window=3, variance_threshold=0.01, hysteresis=2.0)
+    for t in range(5):
+        detector.update(t * 0.1, 10.0)
+    assert detector.is_stable
+
+    detector.update(0.6, 14.0)
+    assert not detector.is_stable
+    assert detector.current is None
+
+
+if __name__ == "__main__":
+    test_stabil_nach_beruhigung()
+    test_nur_ein_ereignis_pro_beruhigung()
+    test_bewegung_beendet_stabil_zustand()
+    print("✅ SettleDetector Tests bestanden")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests für den asynchronen ESP8266-Netzwerkscan (wireless/subnet_scan.py)
+
+Statt eines echten Heimnetzes werden Loopback-Adressen (127.0.0.x)
+gescannt, auf einzelnen davon lauschen kleine Test-Server.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from wireless.subnet_scan import parse_targets, scan_for_esp8266, probe_status
+
+
+def test_parse_targets():
+    assert parse_targets("192.168.2.100-102") == ["192.168.2.100", "192.168.2.101", "192.168.2.102"]
+    assert parse_targets("10.0.0.254-10.0.1.1") == ["10.0.0.254", "10.0.0.255", "10.0.1.0", "10.0.1.1"]
+    assert len(parse_targets("192.168.2.0/24")) == 254
+    assert parse_targets("192.168.4.1") == ["192.168.4.1"]
+    with pytest.raises(ValueError):
+        parse_targets("192.168.2.200-100")
+    with pytest.raises(ValueError):
+        parse_targets("kein.netz")
+
+
+async def _geraet(host: str, device_name: str = None):
+    """Minimaler HTTP-Server; device_name=None -> antwortet nie"""
+    async def handler(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        if device_name is None:
+            await asyncio.sleep(10)
+            return
+        body = json.dumps({"device_name": device_name, "uptime": 42}).encode()
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                     b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handler, host, 0)
+
+
+def test_scan_findet_waage_zwischen_anderen_geraeten():
+    async def ablauf():
+        waage = await _geraet("127.0.0.7", "FutterWaage_ESP8266")
+        port = waage.sockets[0].getsockname()[1]
+        # Fremdgerät auf demselben Port, das nie antwortet
+        fremd = await asyncio.start_server(lambda r, w: None, "127.0.0.3", port)
+        async with waage, fremd:
+            return await scan_for_esp8266("127.0.0.1-20", port=port, http_timeout=0.5)
+
+    start = time.monotonic()
+    ip, status = asyncio.run(ablauf())
+    assert ip == "127.0.0.7"
+    assert status["uptime"] == 42
+    assert time.monotonic() - start < 2.0
+
+
+def test_fremdes_geraet_wird_ignoriert():
+    async def ablauf():
+        server = await _geraet("127.0.0.9", "Drucker")
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await probe_status("127.0.0.9", port=port)
+
+    assert asyncio.run(ablauf()) is None
+
+
+def test_volles_24er_netz_in_wenigen_sekunden():
+    start = time.monotonic()
+    assert asyncio.run(scan_for_esp8266("127.0.1.0/24", port=9, connect_timeout=0.2)) is None
+    assert time.monotonic() - start < 3.0
+
+
+if __name__ == "__main__":
+    test_parse_targets()
+    test_scan_findet_waage_zwischen_anderen_geraeten()
+    test_fremdes_geraet_wird_ignoriert()
+    test_volles_24er_netz_in_wenigen_sekunden()
+    print("✅ Netzwerkscan Tests bestanden")
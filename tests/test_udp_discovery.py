@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests für die UDP-Discovery (wireless/udp_discovery.py)
+
+Die Waage wird durch den DiscoveryResponder auf 127.0.0.1 simuliert.
+"""
+
+import time
+
+import pytest
+
+from wireless.udp_discovery import UdpDiscovery, DiscoveryResponder, DeviceCache, DiscoveredDevice
+
+
+@pytest.fixture
+def waage():
+    responder = DiscoveryResponder(device_id="a1b2c3", mode="stall", bind="127.0.0.1", port=0)
+    responder.start()
+    yield responder
+    responder.stop()
+
+
+def test_eine_runde_findet_die_waage(waage):
+    discovery = UdpDiscovery(port=waage.port, broadcast_addrs=["127.0.0.1"], timeout=0.5)
+    start = time.monotonic()
+    devices = discovery.discover(first_only=True)
+
+    assert time.monotonic() - start < 0.4
+    assert len(devices) == 1
+    device = devices[0]
+    assert device.device_id == "a1b2c3"
+    assert device.ip == "127.0.0.1"  # Absenderadresse, da der Responder keine IP vorgibt
+    assert device.mode == "stall"
+    assert device.supports("live-values") and device.ws_port == 81
+    assert device.rtt < 0.4
+
+
+def test_find_scale_nutzt_den_ttl_cache(waage):
+    discovery = UdpDiscovery(port=waage.port, broadcast_addrs=["127.0.0.1"], ttl=60.0)
+    erster = discovery.find_scale()
+    zweiter = discovery.find_scale()
+    assert erster is zweiter
+    assert waage.queries == 1
+
+
+def test_find_scale_mit_max_age_fragt_neu(waage):
+    discovery = UdpDiscovery(port=waage.port, broadcast_addrs=["127.0.0.1"], timeout=0.2, ttl=60.0)
+    assert discovery.find_scale() is not None
+    assert discovery.find_scale(max_age=0.0) is not None
+    assert waage.queries == 2
+
+    # Waage ausgeschaltet: der Cache-Eintrag ist noch gültig, zählt für max_age aber nicht
+    waage.stop()
+    assert discovery.find_scale() is not None
+    assert discovery.find_scale(max_age=0.0) is None
+
+
+def test_cache_eintraege_laufen_ab():
+    cache = DeviceCache(ttl=0.05)
+    cache.put(DiscoveredDevice("x", "FutterWaage_ESP8266", "192.168.4.1", "stall", seen=time.monotonic()))
+    assert cache.get("x") is not None
+    time.sleep(0.1)
+    assert cache.get("x") is None
+    assert cache.devices() == []
+
+
+def test_ohne_antwort_leere_liste():
+    discovery = UdpDiscovery(port=9, broadcast_addrs=["127.0.0.1"], timeout=0.1)
+    assert discovery.discover() == []
+    assert discovery.find_scale() is None
+
+
+def test_fremde_antworten_werden_verworfen():
+    assert UdpDiscovery._parse(b'{"type": "futterkarre_announce", "nonce": "alt"}', "neu", "1.2.3.4", 0.0) is None
+    assert UdpDiscovery._parse(b'kein json', "n", "1.2.3.4", 0.0) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ UDP-Discovery Tests bestanden")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests für die vektorisierte Filterkette (hardware/weight_filter.py)
+"""
+
+import numpy as np
+import pytest
+
+from hardware.weight_filter import (
+    FilterConfig, WeightFilterPipeline, rolling_median, exponential_moving_average
+)
+
+
+def test_median_entfernt_spike():
+    samples = np.full((9, 4), 10.0)
+    samples[4, 2] = 500.0  # einzelner Ausreißer in Zelle HL
+    result = rolling_median(samples, 5)
+    assert result.shape == (9, 4)
+    assert np.allclose(result, 10.0)
+
+
+def test_ema_entspricht_rekursion():
+    rng = np.random.default_rng(42)
+    samples = rng.normal(5.0, 1.0, size=(20, 4))
+    alpha = 0.3
+
+    erwartet = np.empty_like(samples)
+    zustand = samples[0]
+    for i, row in enumerate(samples):
+        zustand = alpha * row + (1 - alpha) * zustand
+        erwartet[i] = zustand
+
+    assert np.allclose(exponential_moving_average(samples, alpha), erwartet)
+
+
+@pytest.mark.parametrize("alpha", [0.02, 0.3, 0.95, 1.0])
+def test_ema_lange_bloecke_ueber_mehrere_abschnitte(alpha):
+    rng = np.random.default_rng(7)
+    samples = rng.normal(50000.0, 300.0, size=(6000, 4))
+    start = np.full(4, 49000.0)
+
+    erwartet = np.empty_like(samples)
+    zustand = start
+    for i, row in enumerate(samples):
+        zustand = alpha * row + (1 - alpha) * zustand
+        erwartet[i] = zustand
+
+    result = exponential_moving_average(samples, alpha, start)
+    assert np.all(np.isfinite(result))
+    assert np.allclose(result, erwartet, rtol=1e-9)
+
+
+def test_step_und_process_liefern_gleiches_ergebnis():
+    rng = np.random.default_rng(1)
+    samples = rng.normal(10.0, 0.5, size=(30, 4))
+    config = FilterConfig(median_window=3, ema_alpha=0.4)
+
+    block = WeightFilterPipeline(config).process(samples)
+
+    inkrementell = WeightFilterPipeline(config)
+    letzte = None
+    for i in range(len(samples)):
+        # step() bekommt nur echte Samples - am Anfang also weniger als 3
+        letzte = inkrementell.step(samples[max(0, i - 2):i + 1])
+
+    # Am Blockende sind beide Varianten eingeschwungen
+    assert np.allclose(block[-1], letzte, atol=0.05)
+
+
+def test_kalman_glaettet_rauschen():
+    rng = np.random.default_rng(7)
+    samples = 20.0 + rng.normal(0.0, 0.5, size=(200, 4))
+    pipeline = WeightFilterPipeline(FilterConfig(median_window=1, use_kalman=True))
+    filtered = pipeline.process(samples)
+
+    assert filtered.shape == samples.shape
+    assert filtered[100:].std(axis=0).max() < samples[100:].std(axis=0).min()
+    assert np.allclose(filtered[100:].mean(axis=0), 20.0, atol=0.2)
+
+
+if __name__ == "__main__":
+    test_median_entfernt_spike()
+    test_ema_entspricht_rekursion()
+    for alpha in (0.02, 0.3, 0.95, 1.0):
+        test_ema_lange_bloecke_ueber_mehrere_abschnitte(alpha)
+    test_step_und_process_liefern_gleiches_ergebnis()
+    test_kalman_glaettet_rauschen()
+    print("✅ Filter-Tests bestanden")
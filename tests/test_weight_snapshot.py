@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests für die unveränderlichen Gewichts-Snapshots (WeightManager.get_snapshot)
+"""
+
+import dataclasses
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from hardware.replay_sensor import ReplayWeightSensor
+from hardware.weight_manager import WeightSnapshot
+
+
+def test_snapshot_ist_unveraenderlich():
+    snapshot = WeightSnapshot(seq=1, total=4.0, cells=(1.0, 1.0, 1.0, 1.0))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.total = 5.0
+
+
+def test_leser_sehen_konsistente_snapshots(frischer_manager):
+    # Zellwerte ändern sich mit jedem Sample - Summe muss immer zu den Zellen passen
+    cells = np.repeat(np.arange(1, 201, dtype=float)[:, None], 4, axis=1)
+    frischer_manager.use_sensor(ReplayWeightSensor((np.arange(200) * 0.01, cells), speed=0, loop=True))
+
+    fehler = []
+    gesehen = []
+
+    def leser():
+        letzte_seq = 0
+        ende = time.time() + 0.3
+        while time.time() < ende:
+            snapshot = frischer_manager.get_snapshot()
+            if snapshot.seq == letzte_seq:
+                continue  # Nichts Neues - Arbeit sparen
+            if snapshot.seq < letzte_seq or abs(sum(snapshot.cells) - snapshot.total) > 1e-9:
+                fehler.append(snapshot)
+            letzte_seq = snapshot.seq
+            gesehen.append(snapshot.seq)
+
+    threads = [threading.Thread(target=leser) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fehler == []
+    assert len(gesehen) > 10
+    assert frischer_manager.get_snapshot().source == 'ReplayWeightSensor'
+
+
+def test_fehlende_zelle_wird_markiert(frischer_manager):
+    cells = np.full((10, 4), 5.0)
+    cells[:, 2] = np.nan  # HL liefert nichts
+    frischer_manager.use_sensor(ReplayWeightSensor((np.arange(10) * 0.01, cells), speed=0, loop=True))
+    time.sleep(0.1)
+    assert frischer_manager.get_snapshot().estimated == (False, False, True, False)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Snapshot-Tests bestanden")
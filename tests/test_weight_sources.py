@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Tests für die Gewichtsquellen-Registry mit Failover (hardware/weight_sources.py)
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from hardware.weight_manager import WeightSensorInterface
+from hardware.weight_sources import ESP32WebSocketSource, WeightSourceRegistry
+from wireless.binary_frames import decode_frame, encode_frame
+
+
+class SchalterQuelle(WeightSensorInterface):
+    """Testquelle, die sich per Schalter ein- und ausschalten lässt"""
+
+    def __init__(self, wert):
+        self.wert = wert
+        self.online = True
+
+    def read_cells(self):
+        if not self.online:
+            raise ConnectionError("offline")
+        return [self.wert] * 4
+
+    def read_weight(self):
+        return sum(self.read_cells())
+
+
+def _warte_auf(bedingung, timeout=2.0):
+    ende = time.time() + timeout
+    while time.time() < ende:
+        if bedingung():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_failover_und_failback():
+    registry = WeightSourceRegistry(max_failures=3, probe_interval=0.05)
+    wechsel = []
+    registry.register_observer("test", wechsel.append)
+
+    lokal, funk = SchalterQuelle(1.0), SchalterQuelle(2.0)
+    registry.register("hx711", lokal, priority=0, healthy=True)
+    registry.register("esp8266", funk, priority=1)
+    try:
+        assert registry.read_cells() == [1.0] * 4
+        assert _warte_auf(lambda: registry.get_status()[1]['healthy'])
+
+        # Lokale Waage fällt aus: Aussetzer als None, dann Umschaltung
+        lokal.online = False
+        assert [registry.read_cells() for _ in range(3)] == [[None] * 4] * 3
+        assert registry.active_name == "esp8266"
+        assert registry.read_cells() == [2.0] * 4
+
+        # Lokale Waage wieder da: Hintergrund-Prüfung schaltet zurück
+        lokal.online = True
+        assert _warte_auf(lambda: registry.active_name == "hx711")
+        assert registry.read_cells() == [1.0] * 4
+        assert wechsel == ["hx711", "esp8266", "hx711"]
+    finally:
+        registry.close()
+
+
+class StreamQuelle(SchalterQuelle):
+    """Quelle, die mitzählt, wann die Registry sie aktiviert"""
+
+    def __init__(self, wert):
+        super().__init__(wert)
+        self.aktiv = False
+
+    def activate(self):
+        self.aktiv = True
+
+    def deactivate(self):
+        self.aktiv = False
+
+
+def test_nur_die_aktive_quelle_wird_aktiviert():
+    registry = WeightSourceRegistry(max_failures=1, probe_interval=0.05)
+    lokal, funk = StreamQuelle(1.0), StreamQuelle(2.0)
+    registry.register("hx711", lokal, priority=0, healthy=True)
+    registry.register("esp8266", funk, priority=1)
+    try:
+        assert _warte_auf(lambda: registry.get_status()[1]['healthy'])
+        assert lokal.aktiv and not funk.aktiv   # geprüft, aber nicht aktiv
+
+        lokal.online = False
+        registry.read_cells()
+        assert registry.active_name == "esp8266"
+        assert funk.aktiv and not lokal.aktiv
+    finally:
+        registry.close()
+
+
+def test_einzige_quelle_wird_nach_ausfall_wieder_gewaehlt():
+    registry = WeightSourceRegistry(max_failures=2, probe_interval=0.05)
+    lokal = SchalterQuelle(1.0)
+    registry.register("hx711", lokal, priority=0, healthy=True)
+    try:
+        lokal.online = False
+        registry.read_cells()
+        registry.read_cells()
+        assert registry.active_name is None
+
+        lokal.online = True
+        assert _warte_auf(lambda: registry.active_name == "hx711")
+        assert registry.read_cells() == [1.0] * 4
+    finally:
+        registry.close()
+
+
+def test_ohne_gesunde_quelle_nur_none():
+    registry = WeightSourceRegistry(probe_interval=0.05)
+    quelle = SchalterQuelle(1.0)
+    quelle.online = False
+    registry.register("esp8266", quelle, priority=1)
+    try:
+        assert registry.active_name is None
+        assert registry.read_cells() == [None] * 4
+
+        quelle.online = True
+        assert _warte_auf(lambda: registry.active_name == "esp8266")
+    finally:
+        registry.close()
+
+
+class CountQuelle(SchalterQuelle):
+    """HX711-artige Quelle: Roh-Counts (Nullpunkt 80000, 20000 Counts pro kg)"""
+
+    def read_cells(self):
+        return [80000.0 + wert * 20000.0 for wert in super().read_cells()]
+
+
+def test_failover_behaelt_gewicht_trotz_anderer_einheit(frischer_manager):
+    """HX711 liefert Counts, ESP32 kg - jede Quelle hat ihre eigene Kalibrierung"""
+    manager = frischer_manager
+    manager.set_calibration(np.full(4, 80000.0), np.full(4, 1.0 / 20000.0), persist=False, source="hx711")
+    manager._sources.max_failures = 2
+    manager._sources.probe_interval = 0.05
+
+    lokal, funk = CountQuelle(5.0), SchalterQuelle(5.0)
+    manager._sources.register("hx711", lokal, priority=0, healthy=True)
+    manager._sources.register("esp32", funk, priority=1)
+
+    def gewicht_bei(quelle):
+        return _warte_auf(lambda: manager.get_snapshot().source == quelle
+                          and abs(manager.get_snapshot().total - 20.0) < 0.01)
+
+    assert gewicht_bei("hx711")
+    assert manager.get_calibration()['source'] == "hx711"
+    assert _warte_auf(lambda: manager._sources.get_status()[1]['healthy'])
+
+    # Lokale Waage fällt aus: ESP32 übernimmt mit seiner (neutralen) Kalibrierung
+    lokal.online = False
+    assert gewicht_bei("esp32")
+    assert manager.get_calibration() == {'source': "esp32", 'tare': [0.0] * 4, 'gain': [1.0] * 4}
+    werte = []
+    for _ in range(50):
+        snapshot = manager.get_snapshot()
+        if snapshot.source == "esp32":
+            werte.append(snapshot.total)
+        time.sleep(0.002)
+    assert max(abs(w - 20.0) for w in werte) < 0.01
+
+    # Rückkehr zum HX711: wieder Counts mit dessen Kalibrierung
+    lokal.online = True
+    assert gewicht_bei("hx711")
+
+
+def test_esp32_batch_liefert_jedes_sample_mit_messzeit():
+    quelle = ESP32WebSocketSource("10.0.0.9")
+    zellen = [[1.0] * 4, [2.0] * 4, [3.0] * 4]
+    quelle._on_batch(decode_frame(encode_frame(zellen, [5000, 5100, 5200])))
+    quelle._on_data(12.0, [3.0] * 4)   # Observer sieht nur das letzte Sample
+
+    samples = quelle.read_samples()
+    assert [cells for _, cells in samples] == zellen
+    zeiten = [t for t, _ in samples]
+    assert np.diff(zeiten) == pytest.approx([0.1, 0.1], abs=1e-6)
+    assert abs(zeiten[-1] - time.time()) < 0.5
+
+    # Nächster Aufruf: nichts Neues, aber der letzte Wert ist noch frisch
+    assert quelle.read_samples() == []
+    quelle._latest_time -= 10.0
+    with pytest.raises(ConnectionError):
+        quelle.read_samples()
+
+
+class BatchQuelle(SchalterQuelle):
+    """Quelle, die pro Abruf einen Batch von 5 Samples mit eigener Messzeit liefert"""
+
+    def __init__(self):
+        super().__init__(1.0)
+        self.ausgegeben = []
+
+    def read_samples(self):
+        jetzt = time.time()
+        batch = [(jetzt - 0.05 + i * 0.01, [float(len(self.ausgegeben) + i)] * 4) for i in range(5)]
+        self.ausgegeben.extend(batch)
+        return batch
+
+
+def test_erfassung_uebernimmt_alle_batch_samples(frischer_manager):
+    manager = frischer_manager
+    quelle = BatchQuelle()
+    manager._sources.register("esp32", quelle, priority=0, healthy=True)
+
+    assert _warte_auf(lambda: len(quelle.ausgegeben) >= 20 and manager._buffer.total_count >= 20)
+    manager.stop_acquisition()
+    gepuffert = manager._buffer.total_count
+    zeiten, werte = manager._buffer.window(gepuffert)
+    erwartet = quelle.ausgegeben[-gepuffert:]
+    assert zeiten.tolist() == pytest.approx([t for t, _ in erwartet])
+    assert werte[:, 0].tolist() == [cells[0] for _, cells in erwartet]
+
+
+if __name__ == "__main__":
+    test_failover_und_failback()
+    test_einzige_quelle_wird_nach_ausfall_wieder_gewaehlt()
+    test_ohne_gesunde_quelle_nur_none()
+    test_esp32_batch_liefert_jedes_sample_mit_messzeit()
+    pytest.main([__file__, "-q", "-k", "einheit"])
+    print("✅ Gewichtsquellen Tests bestanden")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests für die Kommando-Zuordnung per ID (WirelessWeightManager.send_command)
+
+Der simulierte ESP32 antwortet verzögert, in beliebiger Reihenfolge und
+mischt Gewichtsdaten zwischen die Antworten.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from wireless.wireless_weight_manager import WirelessWeightManager
+
+
+class _SimulierterEsp32:
+    """WebSocket-Attrappe: Antworten laufen über recv() wie beim echten Socket"""
+
+    def __init__(self, verzoegerung=None, antwortet=True):
+        self.eingang = asyncio.Queue()
+        self.gesendet = []
+        self.verzoegerung = verzoegerung or {}
+        self.antwortet = antwortet
+
+    async def send(self, message):
+        command = json.loads(message)
+        self.gesendet.append(command)
+        if self.antwortet:
+            asyncio.get_running_loop().create_task(self._antworte(command))
+
+    async def _antworte(self, command):
+        await asyncio.sleep(self.verzoegerung.get(command["command"], 0.0))
+        # Vor jeder Antwort ein Gewichts-Frame, das früher als Antwort "gestohlen" wurde
+        await self.eingang.put(json.dumps({"type": "weight_data", "total_kg": 12.5, "corners": []}))
+        await self.eingang.put(json.dumps({"type": "response", "id": command["id"],
+                                           "command": command["command"], "status": "success"}))
+
+    async def recv(self):
+        message = await self.eingang.get()
+        if message is None:
+            raise ConnectionResetError("geschlossen")
+        return message
+
+    async def close(self):
+        # Wie beim echten Socket: ein wartendes recv() endet mit Fehler
+        await self.eingang.put(None)
+
+
+def _verbunden(socket):
+    manager = WirelessWeightManager("10.0.0.5")
+    manager.websocket = socket
+    manager._is_connected = True
+    manager.receive_timeout = 5.0
+    return manager
+
+
+def test_gleichzeitige_kommandos_bekommen_ihre_antwort():
+    socket = _SimulierterEsp32(verzoegerung={"tare": 0.05, "get_status": 0.0})
+    manager = _verbunden(socket)
+    gewichte = []
+    manager.add_observer(lambda total, corners: gewichte.append(total))
+
+    async def ablauf():
+        loop_task = asyncio.create_task(manager._message_loop())
+        # tare antwortet später als get_status - Antworten kommen vertauscht an
+        tare, status = await asyncio.gather(manager.send_tare(), manager.get_status())
+        await manager.disconnect()
+        await loop_task
+        return tare, status
+
+    tare, status = asyncio.run(ablauf())
+    assert tare["command"] == "tare" and status["command"] == "get_status"
+    assert [c["id"] for c in socket.gesendet] == [1, 2]
+    assert gewichte == [12.5, 12.5]  # Gewichte gehen an die Observer, nicht an send_command
+    assert manager._pending == {}
+
+
+def test_timeout_pro_kommando():
+    manager = _verbunden(_SimulierterEsp32(antwortet=False))
+
+    async def ablauf():
+        loop_task = asyncio.create_task(manager._message_loop())
+        ergebnis = await manager.send_command({"command": "tare"}, timeout=0.05)
+        await manager.disconnect()
+        await loop_task
+        return ergebnis
+
+    assert asyncio.run(ablauf()) is None
+    assert manager._pending == {}
+
+
+def test_verbindungsabbruch_beendet_offene_kommandos_sofort():
+    manager = _verbunden(_SimulierterEsp32(antwortet=False))
+    manager.receive_timeout = 0.05
+
+    async def ablauf():
+        loop_task = asyncio.create_task(manager._message_loop())
+        start = asyncio.get_running_loop().time()
+        ergebnis = await manager.send_command({"command": "get_status"}, timeout=5.0)
+        await loop_task
+        return ergebnis, asyncio.get_running_loop().time() - start
+
+    ergebnis, dauer = asyncio.run(ablauf())
+    assert ergebnis is None
+    assert dauer < 1.0  # nicht erst nach 5 s Timeout
+
+
+def test_tare_laenger_als_empfangs_timeout():
+    # ESP32 misst beim Tare mehrere Sekunden und schickt solange keine Gewichte
+    socket = _SimulierterEsp32(verzoegerung={"tare": 0.3})
+    manager = _verbunden(socket)
+    manager.receive_timeout = 0.05
+
+    async def ablauf():
+        loop_task = asyncio.create_task(manager._message_loop())
+        await asyncio.sleep(0.02)   # Message-Loop wartet schon mit kurzem Timeout
+        tare = await manager.send_tare()
+        verbunden = manager.is_connected
+        await loop_task             # danach kommt nichts mehr -> Link gilt als tot
+        return tare, verbunden
+
+    tare, verbunden = asyncio.run(ablauf())
+    assert tare["status"] == "success"
+    assert verbunden
+    assert not manager.is_connected
+
+
+def test_antwort_ohne_id_von_alter_firmware():
+    manager = _verbunden(_SimulierterEsp32(antwortet=False))
+
+    async def ablauf():
+        aufgabe = asyncio.create_task(manager.get_status())
+        await asyncio.sleep(0)
+        await manager._handle_message(json.dumps({"type": "status", "wifi_rssi": -60}))
+        return await aufgabe
+
+    assert asyncio.run(ablauf())["wifi_rssi"] == -60
+    assert manager.wifi_rssi == -60
+
+
+def test_ohne_verbindung_fehler():
+    manager = WirelessWeightManager("10.0.0.6")
+    with pytest.raises(ConnectionError):
+        asyncio.run(manager.send_tare())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Kommando-Tests bestanden")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests für die selbstheilende WebSocket-Verbindung
+(wireless/wireless_weight_manager.py)
+
+Statt eines ESP32 wird das websockets-Modul durch eine Attrappe ersetzt.
+"""
+
+import asyncio
+import json
+import time
+import types
+
+import pytest
+
+import wireless.wireless_weight_manager as wwm
+from wireless.wireless_weight_manager import (ReconnectBackoff, WirelessWeightManager,
+                                              WirelessWeightManagerAdapter)
+
+
+class _FakeSocket:
+    """Liefert vorgegebene Nachrichten und schweigt danach (toter Link)"""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.sent = []
+        self.closed = False
+
+    async def recv(self):
+        if self.messages:
+            return self.messages.pop(0)
+        await asyncio.sleep(60)
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_websockets(sockets, verbindungen):
+    async def connect(uri, **kwargs):
+        verbindungen.append(kwargs)
+        if not sockets:
+            raise ConnectionRefusedError(uri)
+        return sockets.pop(0)
+    return types.SimpleNamespace(connect=connect)
+
+
+def _gewicht(total):
+    return json.dumps({"type": "weight_data", "total_kg": total, "corners": [total / 4] * 4})
+
+
+def test_backoff_exponentiell_mit_obergrenze():
+    backoff = ReconnectBackoff(initial=0.1, maximum=1.0, jitter=0.5, rng=lambda: 0.0)
+    assert [round(backoff.next_delay(), 3) for _ in range(6)] == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+    backoff.reset()
+    assert backoff.next_delay() == 0.1
+
+    mit_jitter = ReconnectBackoff(initial=0.1, maximum=1.0, jitter=0.5, rng=lambda: 1.0)
+    assert mit_jitter.next_delay() == pytest.approx(0.05)
+
+
+def test_toter_link_wird_erkannt_und_abos_erneuert(monkeypatch):
+    socket = _FakeSocket([_gewicht(40.0)])
+    verbindungen = []
+    monkeypatch.setattr(wwm, "websockets", _fake_websockets([socket], verbindungen))
+    monkeypatch.setattr(wwm, "WEBSOCKETS_AVAILABLE", True)
+
+    manager = WirelessWeightManager("10.0.0.2", prefer_binary=False)
+    manager.receive_timeout = 0.1
+    manager.subscriptions.append({"command": "get_status"})
+
+    start = time.monotonic()
+    asyncio.run(manager.connect())
+
+    # connect() endet von selbst, weil nach dem ersten Wert nichts mehr kommt
+    assert time.monotonic() - start < 1.0
+    assert not manager.is_connected and socket.closed
+    assert socket.sent == [{"command": "get_status"}]
+    assert verbindungen[0]["ping_interval"] == wwm.HEARTBEAT_INTERVAL
+
+    reading = manager.get_reading()
+    assert reading.total == 40.0
+    assert reading.age < 1.0
+    assert reading.is_stale(max_age=0.0) and not reading.is_stale(max_age=5.0)
+
+
+def test_supervisor_verbindet_unbegrenzt_neu(monkeypatch):
+    # Zwei Verbindungen brechen ab, dazwischen viele Fehlversuche - mehr als die alten 5
+    sockets = [_FakeSocket([_gewicht(10.0)]), _FakeSocket([_gewicht(20.0)])]
+    verbindungen = []
+    fake = _fake_websockets(sockets, verbindungen)
+    fehlversuche = [0]
+
+    async def connect(uri, **kwargs):
+        if len(verbindungen) == 1 and fehlversuche[0] < 8:
+            fehlversuche[0] += 1
+            raise ConnectionRefusedError(uri)
+        return await fake.connect(uri, **kwargs)
+
+    monkeypatch.setattr(wwm, "websockets", types.SimpleNamespace(connect=connect))
+    monkeypatch.setattr(wwm, "WEBSOCKETS_AVAILABLE", True)
+
+    adapter = WirelessWeightManagerAdapter("10.0.0.3")
+    adapter.wireless_manager.receive_timeout = 0.05
+    adapter.backoff = ReconnectBackoff(initial=0.005, maximum=0.02)
+    werte = []
+    adapter.add_observer(lambda total, corners: werte.append(total))
+    adapter.start()
+
+    deadline = time.monotonic() + 3.0
+    while werte != [10.0, 20.0] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    adapter.stop()
+
+    assert werte == [10.0, 20.0]  # Observer überleben die Wiederverbindung
+    assert fehlversuche[0] == 8
+    assert adapter.reconnects >= 9
+    assert adapter.get_connection_status()['status'] == "stopped"
+
+
+def test_stop_unterbricht_backoff(monkeypatch):
+    monkeypatch.setattr(wwm, "WEBSOCKETS_AVAILABLE", False)
+    adapter = WirelessWeightManagerAdapter("10.0.0.4")
+    adapter.backoff = ReconnectBackoff(initial=30.0, maximum=30.0, jitter=0.0)
+    adapter.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    adapter.stop()
+    assert time.monotonic() - start < 1.0
+    assert not adapter._thread.is_alive()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
+    print("✅ Wiederverbindungs-Tests bestanden")
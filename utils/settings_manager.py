@@ -40,6 +40,9 @@ class CalibrationSettings:
     calibration_weights: list = field(default_factory=lambda: [20.0, 20.0, 20.0, 20.0])
     last_calibration: str = ""
     auto_tare_on_startup: bool = True
+    # Pro Gewichtsquelle {'tare': [...], 'gain': [...]} - die Quellen liefern
+    # unterschiedliche Einheiten (HX711-Counts, ESP8266-Rohwerte, ESP32 kg)
+    source_calibrations: dict = field(default_factory=dict)
 
 @dataclass
 class FeedingSettings:
@@ -56,7 +59,15 @@ class FeedingSettings:
 class HardwareSettings:
     """Hardware-Einstellungen"""
     use_simulation: bool = True
-    hx711_update_rate: int = 500  # ms
+    hx711_update_rate: int = 100  # ms - kürzestes Erfassungsintervall (Obergrenze der Rate)
+    hx711_idle_rate: int = 1000   # ms - Erfassungsintervall bei ruhender Waage
+    hx711_idle_after: int = 3000  # ms - so lange stabil bevor auf Idle umgeschaltet wird
+    journal_enabled: bool = True  # Roh-Samples in logs/hx711_samples.journal mitschreiben
+    journal_capacity: int = 864000  # Samples im Ring-Journal (1 Tag bei 10 Hz, ~20 MB)
+    esp8266_hosts: list = field(default_factory=lambda: ["192.168.4.1", "192.168.2.20"])  # Funk-Waage (Stall-AP, Heimnetz)
+    esp32_host: str = ""          # ESP32-WebSocket-Waage, leer = deaktiviert
+    cart_track_width: float = 0.6  # m - Abstand linke/rechte Wägezellen
+    cart_wheelbase: float = 1.0    # m - Abstand vordere/hintere Wägezellen
     sensor_timeout: int = 5000    # ms
     auto_hardware_detection: bool = True
     backup_to_usb: bool = False
@@ -155,7 +166,7 @@ class SettingsManager:
                 if 'hardware' in data:
                     # Robuste Filterung für HardwareSettings - nur bekannte Parameter
                     hardware_data = {}
-                    valid_hardware_keys = {'use_simulation', 'hx711_update_rate', 'sensor_timeout', 
+                    valid_hardware_keys = {'use_simulation', 'hx711_update_rate', 'hx711_idle_rate', 'hx711_idle_after', 'journal_enabled', 'journal_capacity', 'esp8266_hosts', 'esp32_host', 'cart_track_width', 'cart_wheelbase', 'sensor_timeout', 
                                          'auto_hardware_detection', 'backup_to_usb', 'debug_mode'}
                     for key, value in data['hardware'].items():
                         if key in valid_hardware_keys:
@@ -406,7 +417,7 @@ class SettingsManager:
             if 'hardware' in data:
                 # Robuste Filterung für HardwareSettings - nur bekannte Parameter
                 hardware_data = {}
-                valid_hardware_keys = {'use_simulation', 'hx711_update_rate', 'sensor_timeout', 
+                valid_hardware_keys = {'use_simulation', 'hx711_update_rate', 'hx711_idle_rate', 'hx711_idle_after', 'journal_enabled', 'journal_capacity', 'esp8266_hosts', 'esp32_host', 'cart_track_width', 'cart_wheelbase', 'sensor_timeout', 
                                      'auto_hardware_detection', 'backup_to_usb', 'debug_mode'}
                 for key, value in data['hardware'].items():
                     if key in valid_hardware_keys:
@@ -93,6 +93,27 @@ class UIUtils:
             logger.error(f"Fehler bei Widget-Update {attribute} ({reason}): {e}")
 
 
+    @staticmethod
+    def set_label_if_changed(label, text: str, style: Optional[str] = None) -> bool:
+        """
+        Setzt Text/Stylesheet nur wenn sich die Anzeige ändert.
+        
+        setText/setStyleSheet lösen auch bei gleichem Wert Relayout bzw.
+        Style-Neuberechnung aus - bei zyklischen Updates unnötige Arbeit.
+        
+        Returns:
+            True wenn neu gezeichnet wird
+        """
+        changed = False
+        if label.text() != text:
+            label.setText(text)
+            changed = True
+        if style is not None and label.styleSheet() != style:
+            label.setStyleSheet(style)
+            changed = True
+        return changed
+
+
 class UITiming:
     """Spezielle Timing-Utilities für UI-Responsivität"""
     
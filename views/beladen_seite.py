@@ -8,6 +8,7 @@ from PyQt5.QtCore import QTimer
 from hardware.weight_manager import get_weight_manager
 from utils.theme_manager import get_theme_manager
 from utils.base_ui_widget import BaseViewWidget
+from utils.ui_utils import UIUtils
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,21 @@ class BeladenSeite(BaseViewWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_weight)
 
+        # Gewichts-Abo nur solange die Seite sichtbar ist (siehe start_live_updates)
+        self.weight_channel = None
+        try:
+            from hardware.weight_signals import get_weight_signals
+            # Stabil-Ereignisse kommen als Signal im GUI-Thread an
+            get_weight_signals().weight_settled.connect(self._gewicht_stabil)
+        except Exception as e:
+            logger.error(f"Stabil-Signal für BeladenSeite nicht verfügbar: {e}")
+
+        # Bestätigen wartet ohne Blockieren auf ein ruhiges Gewicht
+        self._warte_auf_stabil = False
+        self.stabil_timer = QTimer(self)
+        self.stabil_timer.setSingleShot(True)
+        self.stabil_timer.timeout.connect(self._stabil_timeout)
+
         # Button-Gruppe für HEU/HEULAGE einrichten
         self.setup_futter_buttons()
 
@@ -213,6 +229,46 @@ class BeladenSeite(BaseViewWidget):
         except Exception as e:
             logger.error(f"Fehler beim Nullen der Waage: {e}")
 
+    def showEvent(self, event):
+        """Seite sichtbar - Live-Anzeige starten"""
+        super().showEvent(event)
+        self.start_live_updates()
+
+    def hideEvent(self, event):
+        """Seite versteckt - Gewichts-Abo und wartende Bestätigung beenden"""
+        self.stop_live_updates()
+        self._warte_auf_stabil = False
+        self.stabil_timer.stop()
+        super().hideEvent(event)
+
+    def start_live_updates(self):
+        """
+        Startet die Live-Gewichtsanzeige
+
+        Läuft die Erfassung, wird jede sichtbare Änderung gepusht (Anzeige
+        2 Nachkommastellen, höchstens 10 pro Sekunde) und der Abfrage-Timer
+        ruht. Ohne Erfassung bleibt es beim Timer.
+        """
+        if self.weight_manager.is_acquiring and self.weight_channel is None:
+            try:
+                from hardware.weight_signals import get_weight_signals
+                self.weight_channel = get_weight_signals().weight_channel(
+                    "beladen_seite", min_delta=0.005, max_rate=10.0)
+                self.weight_channel.weight_changed.connect(self.zeige_gewicht)
+                self._weight_observer_registered = True
+            except Exception as e:
+                logger.error(f"Gewichts-Abo für BeladenSeite nicht möglich: {e}")
+                self.weight_channel = None
+        self.update_weight()
+
+    def stop_live_updates(self):
+        """Meldet das Gewichts-Abo ab"""
+        if self.weight_channel is not None:
+            self.weight_channel.close()
+            self.weight_channel.deleteLater()
+            self.weight_channel = None
+            self._weight_observer_registered = False
+
     def start_timer(self):
         """Legacy-Methode - jetzt über TimerManager"""
         # Timer wird automatisch über MainWindow.timer_manager.set_active_page() gestartet
@@ -247,12 +303,52 @@ class BeladenSeite(BaseViewWidget):
             f"Beladen-Seite: Kontext erhalten - Pferd {self.pferd_nummer}, Restgewicht: {self.restgewicht:.2f} kg")
 
     def beladen_fertig(self):
+        """
+        Beladung bestätigen - wartet ohne Blockieren auf ein stabiles Gewicht
+
+        Ist das Gewicht schon ruhig, geht es sofort weiter. Sonst wird
+        auf das nächste Stabil-Ereignis gewartet (höchstens 3 Sekunden),
+        die GUI bleibt dabei bedienbar.
+        """
+        if not self.navigation or self._warte_auf_stabil:
+            return
+
+        if self.weight_manager.is_acquiring and not self.weight_manager.get_snapshot().stable:
+            logger.info("Warte auf stabiles Gewicht - Karre schwingt noch")
+            self._warte_auf_stabil = True
+            self.stabil_timer.start(3000)
+            return
+
+        self._beladen_abschliessen(self.weight_manager.get_stable_weight())
+
+    def _gewicht_stabil(self, event):
+        """Stabil-Ereignis (GUI-Thread) - schließt eine wartende Bestätigung ab"""
+        if not self._warte_auf_stabil:
+            return
+        self._warte_auf_stabil = False
+        self.stabil_timer.stop()
+        self._beladen_abschliessen(event)
+
+    def _stabil_timeout(self):
+        """Gewicht wurde nicht rechtzeitig ruhig - mit aktuellem Wert weiter"""
+        if not self._warte_auf_stabil:
+            return
+        self._warte_auf_stabil = False
+        logger.warning("Gewicht nach 3.0s nicht stabil")
+        self._beladen_abschliessen(None)
+
+    def _beladen_abschliessen(self, stabil):
         """Navigation zurück zur Füttern-Seite"""
         if self.navigation:
             try:
                 
-                # Aktuelles Gewicht lesen (WeightManager - einheitlich)
-                aktuelles_gewicht = self.weight_manager.read_weight(use_cache=False)
+                # Beruhigtes Gewicht verwenden
+                if stabil:
+                    aktuelles_gewicht = stabil.value
+                    logger.info(f"Stabiles Gewicht: {aktuelles_gewicht:.2f} kg (Varianz {stabil.variance:.4f})")
+                else:
+                    # Fallback: aktueller Wert (keine Erfassung oder Timeout)
+                    aktuelles_gewicht = self.weight_manager.read_weight(use_cache=False)
 
                 # HEU-ZWISCHENSTOPP: Rückkehr zur Füttern-Seite
                 if getattr(self, 'zwischenstopp_modus', False):
@@ -301,25 +397,14 @@ class BeladenSeite(BaseViewWidget):
 
     def update_weight(self):
         """Aktualisiert Gewichtsanzeige mit WeightManager"""
+        if self.weight_channel is not None:
+            # TimerManager startet den Timer beim Seitenwechsel neu - das Abo liefert bereits
+            self.timer_manager.stop_timer("beladen_weight_update")
+            self.timer.stop()
         try:
             # WeightManager für Gewichtsquelle
             aktuelles_gewicht = self.weight_manager.read_weight()
-            print(f"UPDATE: UPDATE_WEIGHT AUFGERUFEN: {aktuelles_gewicht:.2f} kg")
-
-            # Hauptgewichtsanzeige aktualisieren
-            if hasattr(self, 'label_karre_gewicht'):
-                old_text = self.label_karre_gewicht.text()
-                self.label_karre_gewicht.setText(f"{aktuelles_gewicht:.2f}")
-                print(f"📝 LABEL UPDATE: {old_text} -> {aktuelles_gewicht:.2f}")
-                
-                # Force UI refresh
-                self.label_karre_gewicht.update()
-                self.label_karre_gewicht.repaint()
-                print(f"🖼️ UI REFRESH erzwungen")
-            else:
-                print("FEHLER: FEHLER: label_karre_gewicht nicht gefunden!")
-                # Debug: Alle verfügbaren Attribute anzeigen
-                print(f"📋 Verfügbare Label-Attribute: {[attr for attr in dir(self) if 'label' in attr.lower()]}")
+            self.zeige_gewicht(aktuelles_gewicht)
 
         except Exception as e:
             logger.error(f"Fehler beim Wiegen: {e}")
@@ -327,6 +412,13 @@ class BeladenSeite(BaseViewWidget):
             if hasattr(self, 'label_karre_gewicht'):
                 self.label_karre_gewicht.setText("Error")
 
+    def zeige_gewicht(self, gewicht: float):
+        """Zeigt das Gewicht an - neu gezeichnet wird nur bei geänderter Anzeige"""
+        if hasattr(self, 'label_karre_gewicht'):
+            UIUtils.set_label_if_changed(self.label_karre_gewicht, f"{gewicht:.2f}")
+        else:
+            logger.error("label_karre_gewicht nicht gefunden!")
+
     def create_ui_in_code(self):
         """Fallback UI wenn beladen_seite.ui nicht existiert"""
         layout = QVBoxLayout()
@@ -590,18 +590,50 @@ class EinstellungenSeite(BaseViewWidget):
             logger.error(f"Waagenkalibrierung Fallback fehlgeschlagen: {e}")
     
     def test_weights(self):
-        """Testet aktuelle Gewichtswerte"""
+        """Zeigt die Waagen-Diagnose (Gewicht, Quelle, Laufzeiten des Lesepfads)"""
         try:
+            from hardware.weight_manager import get_weight_manager
+            status = get_weight_manager().get_status()
+            
             if hasattr(self, 'status_label'):
-                self.status_label.setText("Gewichte werden getestet...")
+                self.status_label.setText(f"Gewicht: {status['current_weight']:.2f} kg "
+                                          f"({status['hardware_state']}, Quelle {status['sensor']})")
             
-            QTimer.singleShot(3000, lambda: self.status_label.setText("Gewichts-Test abgeschlossen") if hasattr(self, 'status_label') else None)
+            QMessageBox.information(self, "Waagen-Diagnose", self.format_waagen_diagnose(status))
             
         except Exception as e:
             logger.error(f"Gewichts-Test Fehler: {e}")
             if hasattr(self, 'status_label'):
                 self.status_label.setText(f"Test Fehler: {e}")
     
+    @staticmethod
+    def format_waagen_diagnose(status: dict) -> str:
+        """Bereitet WeightManager.get_status() als Diagnose-Text auf"""
+        perf = status.get('performance', {})
+        zeilen = [
+            f"Gewicht: {status['current_weight']:.2f} kg - {status['hardware_message']}",
+            f"Quelle: {status['sensor']} | Abtastung: {status['sampling_mode']} "
+            f"({status['sampling_interval'] * 1000:.0f} ms) | Samples: {status['samples_total']}",
+            "",
+            "Latenz (ms)      p50     p95     p99     max",
+        ]
+        for stufe, werte in perf.get('latency', {}).items():
+            if werte.get('count'):
+                zeilen.append(f"{stufe:<12} {werte['p50_ms']:7.2f} {werte['p95_ms']:7.2f} "
+                              f"{werte['p99_ms']:7.2f} {werte['max_ms']:7.2f}")
+            else:
+                zeilen.append(f"{stufe:<12}   keine Messungen")
+        
+        raten = perf.get('cell_rates', [])
+        if raten:
+            zeilen.append("")
+            zeilen.append("Samples/s: " + ", ".join(f"{name} {rate:.1f}"
+                                                    for name, rate in zip(['VL', 'VR', 'HL', 'HR'], raten)))
+        quote = perf.get('cache_hit_ratio')
+        zeilen.append(f"Cache-Trefferquote: {quote * 100:.1f}%" if quote is not None else "Cache-Trefferquote: -")
+        zeilen.append(f"Größte Verzögerung: {perf.get('worst_stall_ms', 0.0):.1f} ms")
+        return "\n".join(zeilen)
+    
     def on_settings_changed(self, category: str):
         """Callback für Einstellungsänderungen"""
         logger.debug(f"Einstellungen geändert: {category}")
@@ -704,18 +736,17 @@ class EinstellungenSeite(BaseViewWidget):
         try:
             if hasattr(self, 'txt_fu_sim_toggle'):
                 try:
-                    # ESP8266 Discovery verwenden
-                    from wireless.esp8266_discovery import ESP8266Discovery
+                    # Gemeinsame Discovery-Instanz: 30 s Speicher-Cache, danach
+                    # Probe auf die zuletzt bekannte Waage vor jeder vollen Suche
+                    from wireless.esp8266_discovery import esp8266_discovery as discovery
                     import asyncio
                     
-                    discovery = ESP8266Discovery()
-                    
                     # Asynchrone ESP8266-Suche in Thread
                     def check_esp8266():
                         try:
                             loop = asyncio.new_event_loop()
                             asyncio.set_event_loop(loop)
-                            result = loop.run_until_complete(discovery.find_esp8266(force_rescan=True))
+                            result = loop.run_until_complete(discovery.find_esp8266())
                             loop.close()
                             
                             if result:
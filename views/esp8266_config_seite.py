@@ -6,7 +6,6 @@ Ermöglicht die Konfiguration der ESP8266 WiFi-Waage
 
 import logging
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -17,6 +16,8 @@ from PyQt5.QtGui import *
 
 from utils.base_ui_widget import BaseViewWidget
 from utils.settings_manager import SettingsManager
+from wireless.http_client import get_http_client
+from wireless.live_frames import get_live_frame_cache
 
 # Wireless-Module optional laden
 try:
@@ -49,23 +50,15 @@ class ESP8266StatusThread(QThread):
         while self.running:
             try:
                 # DIREKTE ESP8266-Suche ohne Discovery
-                import urllib.request
-                import json
-                
                 test_ips = ["192.168.2.20", "192.168.4.1"]
                 esp8266_found = False
                 
                 for ip in test_ips:
                     try:
-                        url = f"http://{ip}/live-values-data"
-                        req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                        
-                        with urllib.request.urlopen(req, timeout=5) as response:
-                            if response.status == 200:
-                                data = json.loads(response.read().decode())
-                                self.connection_changed.emit(True, ip)
-                                esp8266_found = True
-                                break
+                        get_live_frame_cache().get(ip, timeout=5)
+                        self.connection_changed.emit(True, ip)
+                        esp8266_found = True
+                        break
                     except:
                         continue
                 
@@ -93,6 +86,8 @@ class ESP8266StatusThread(QThread):
 class ESP8266ConfigSeite(BaseViewWidget):
     """ESP8266 Wireless Konfigurationsseite"""
     
+    _stream_status_changed = pyqtSignal(bool, str)  # Live-Stream-Wechsel aus dem Stream-Thread
+    
     def __init__(self, parent=None):
         super().__init__(parent, ui_filename="esp8266_config_seite_dual_mode.ui", page_name="esp8266_config")
         
@@ -115,6 +110,11 @@ class ESP8266ConfigSeite(BaseViewWidget):
         # Status Thread
         self.status_thread = None
         
+        # Live-Stream ersetzt die Status-Abfrage, sobald er verbunden ist
+        self.live_stream = None
+        self.status_timer = None
+        self._stream_status_changed.connect(self._on_stream_status)
+        
         # Aktueller ESP8266 Status
         self.current_esp_ip = None
         self.current_status = {}
@@ -243,37 +243,24 @@ class ESP8266ConfigSeite(BaseViewWidget):
         """ESP8266 Verbindung testen - EINFACHER ANSATZ"""
         try:
             self.log_message("🔍 Teste ESP8266 unter 192.168.2.20...")
-            
-            import urllib.request
-            import json
-            
+
             # DIREKT testen - wie curl
             try:
-                url = "http://192.168.2.20/live-values-data"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode())
-                        self.log_message(f"✅ ESP8266 gefunden! VL={data.get('vl_value', '?')}, VR={data.get('vr_value', '?')}, HL={data.get('hl_value', '?')}, HR={data.get('hr_value', '?')}")
-                        self.current_esp_ip = "192.168.2.20"
-                        self.update_connection_status(True, "192.168.2.20")
-                        return
+                data = get_live_frame_cache().get("192.168.2.20", timeout=10).data
+                self.log_message(f"✅ ESP8266 gefunden! VL={data.get('vl_value', '?')}, VR={data.get('vr_value', '?')}, HL={data.get('hl_value', '?')}, HR={data.get('hr_value', '?')}")
+                self.current_esp_ip = "192.168.2.20"
+                self.update_connection_status(True, "192.168.2.20")
+                return
             except Exception as e:
                 self.log_message(f"❌ ESP8266 192.168.2.20 Fehler: {e}")
             
             # Fallback auf AP-Modus
             try:
-                url = "http://192.168.4.1/live-values-data"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode())
-                        self.log_message(f"✅ ESP8266 AP-Modus! VL={data.get('vl_value', '?')}, VR={data.get('vr_value', '?')}, HL={data.get('hl_value', '?')}, HR={data.get('hr_value', '?')}")
-                        self.current_esp_ip = "192.168.4.1"
-                        self.update_connection_status(True, "192.168.4.1")
-                        return
+                data = get_live_frame_cache().get("192.168.4.1", timeout=5).data
+                self.log_message(f"✅ ESP8266 AP-Modus! VL={data.get('vl_value', '?')}, VR={data.get('vr_value', '?')}, HL={data.get('hl_value', '?')}, HR={data.get('hr_value', '?')}")
+                self.current_esp_ip = "192.168.4.1"
+                self.update_connection_status(True, "192.168.4.1")
+                return
             except Exception as e:
                 self.log_message(f"❌ ESP8266 192.168.4.1 Fehler: {e}")
             
@@ -336,18 +323,13 @@ class ESP8266ConfigSeite(BaseViewWidget):
             self.log_message("🔄 Tare Kommando senden...")
             
             # DIREKTE HTTP-Anfrage für Tare
-            import urllib.request
-            import urllib.parse
-            
             try:
-                url = f"http://{self.current_esp_ip}/tare"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        self.log_message("✅ Waage erfolgreich getart")
-                    else:
-                        self.log_message("❌ Tare fehlgeschlagen")
+                response = get_http_client().get(self.current_esp_ip, "/tare", timeout=10)
+                if response.status == 200:
+                    self.log_message("✅ Waage erfolgreich getart")
+                    get_live_frame_cache().invalidate(self.current_esp_ip)
+                else:
+                    self.log_message("❌ Tare fehlgeschlagen")
             except Exception as e:
                 self.log_message(f"❌ Tare Fehler: {e}")
             
@@ -364,29 +346,21 @@ class ESP8266ConfigSeite(BaseViewWidget):
             
             if self.current_esp_ip:
                 # Status direkt über HTTP abrufen - wie curl
-                import urllib.request
-                import json
-                
                 try:
-                    url = f"http://{self.current_esp_ip}/live-values-data"
-                    req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                    
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        if response.status == 200:
-                            data = json.loads(response.read().decode())
+                    data = get_live_frame_cache().get(self.current_esp_ip, timeout=10).data
                             
-                            # Status anzeigen
-                            vl = data.get('vl_value', '?')
-                            vr = data.get('vr_value', '?')
-                            hl = data.get('hl_value', '?')
-                            hr = data.get('hr_value', '?')
-                            vl_ready = '✅' if data.get('vl_ready', False) else '❌'
-                            vr_ready = '✅' if data.get('vr_ready', False) else '❌'
-                            hl_ready = '✅' if data.get('hl_ready', False) else '❌'
-                            hr_ready = '✅' if data.get('hr_ready', False) else '❌'
+                    # Status anzeigen
+                    vl = data.get('vl_value', '?')
+                    vr = data.get('vr_value', '?')
+                    hl = data.get('hl_value', '?')
+                    hr = data.get('hr_value', '?')
+                    vl_ready = '✅' if data.get('vl_ready', False) else '❌'
+                    vr_ready = '✅' if data.get('vr_ready', False) else '❌'
+                    hl_ready = '✅' if data.get('hl_ready', False) else '❌'
+                    hr_ready = '✅' if data.get('hr_ready', False) else '❌'
                             
-                            self.log_message(f"📊 ESP8266 Status: VL={vl} {vl_ready}, VR={vr} {vr_ready}, HL={hl} {hl_ready}, HR={hr} {hr_ready}")
-                            return
+                    self.log_message(f"📊 ESP8266 Status: VL={vl} {vl_ready}, VR={vr} {vr_ready}, HL={hl} {hl_ready}, HR={hr} {hr_ready}")
+                    return
                             
                 except Exception as e:
                     self.log_message(f"❌ Status-Abruf fehlgeschlagen: {e}")
@@ -417,20 +391,15 @@ class ESP8266ConfigSeite(BaseViewWidget):
             self.log_message(f"🎯 Kalibriere mit {cal_weight} kg...")
             
             # DIREKTE HTTP-Anfrage für Kalibrierung
-            import urllib.request
-            import urllib.parse
-            
             try:
                 # Kalibriergewicht als URL-Parameter
-                params = urllib.parse.urlencode({'weight': cal_weight})
-                url = f"http://{self.current_esp_ip}/calibrate?{params}"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=15) as response:
-                    if response.status == 200:
-                        self.log_message(f"✅ Kalibrierung mit {cal_weight} kg erfolgreich")
-                    else:
-                        self.log_message("❌ Kalibrierung fehlgeschlagen")
+                params = {'weight': cal_weight}
+                response = get_http_client().get(self.current_esp_ip, "/calibrate", params=params, timeout=15)
+                if response.status == 200:
+                    self.log_message(f"✅ Kalibrierung mit {cal_weight} kg erfolgreich")
+                    get_live_frame_cache().invalidate(self.current_esp_ip)
+                else:
+                    self.log_message("❌ Kalibrierung fehlgeschlagen")
             except Exception as e:
                 self.log_message(f"❌ Kalibrierung Fehler: {e}")
             
@@ -458,18 +427,14 @@ class ESP8266ConfigSeite(BaseViewWidget):
                 self.log_message("😴 Deep Sleep aktivieren...")
                 
                 # DIREKTE HTTP-Anfrage für Deep Sleep
-                import urllib.request
-                
                 try:
-                    url = f"http://{self.current_esp_ip}/deep-sleep"
-                    req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                    
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        if response.status == 200:
-                            self.log_message("✅ Deep Sleep aktiviert - ESP8266 schläft 1h")
-                            self.update_connection_status(False, "")
-                        else:
-                            self.log_message("❌ Deep Sleep Aktivierung fehlgeschlagen")
+                    response = get_http_client().get(self.current_esp_ip, "/deep-sleep", timeout=10)
+                    if response.status == 200:
+                        self.log_message("✅ Deep Sleep aktiviert - ESP8266 schläft 1h")
+                        get_http_client().close_host(self.current_esp_ip)
+                        self.update_connection_status(False, "")
+                    else:
+                        self.log_message("❌ Deep Sleep Aktivierung fehlgeschlagen")
                 except Exception as e:
                     self.log_message(f"❌ Deep Sleep Fehler: {e}")
             
@@ -592,39 +557,84 @@ class ESP8266ConfigSeite(BaseViewWidget):
             logger.error(f"Fehler beim Auto-Update Toggle: {e}")
     
     def start_status_monitoring(self):
-        """Status-Monitoring starten - QTimer statt QThread für bessere Signal-Stabilität"""
+        """
+        Status-Monitoring starten
+        
+        Die Waage wird einmal gesucht, danach meldet der Live-Stream jeden
+        Verbindungswechsel. Die 10-Sekunden-Abfrage läuft nur, solange kein
+        Stream verbunden ist (Suche, Verbindungsabbruch, ältere Firmware).
+        """
         try:
-            if not hasattr(self, 'status_timer'):
-                from PyQt5.QtCore import QTimer
-                self.status_timer = QTimer()
-                self.status_timer.timeout.connect(self.check_esp8266_status)
-                self.status_timer.start(10000)  # 10 Sekunden
-                logger.info("📡 ESP8266 Auto-Monitor gestartet (QTimer-basiert)")
-            
+            self._start_status_timer()
+            self.check_esp8266_status()
         except Exception as e:
             logger.error(f"Fehler beim Starten des Status-Monitoring: {e}")
     
+    def _start_status_timer(self):
+        """Abfrage-Timer als Rückfallebene ohne verbundenen Live-Stream"""
+        if self.status_timer is None:
+            self.status_timer = QTimer()
+            self.status_timer.timeout.connect(self.check_esp8266_status)
+        if not self.status_timer.isActive():
+            self.status_timer.start(10000)  # 10 Sekunden
+            logger.info("📡 ESP8266 Auto-Monitor: Abfrage alle 10s bis der Live-Stream steht")
+    
+    def _stop_status_timer(self):
+        if self.status_timer is not None:
+            self.status_timer.stop()
+    
+    def _attach_live_stream(self, ip: str):
+        """Live-Stream des gefundenen ESP8266 abonnieren"""
+        if self.live_stream is not None:
+            if self.live_stream.host == ip:
+                return
+            self._detach_live_stream()
+        from wireless.live_stream import get_live_stream
+        self.live_stream = get_live_stream(ip)
+        self.live_stream.add_state_observer(self._emit_stream_status)
+        if self.live_stream.connected:
+            self._on_stream_status(True, ip)
+    
+    def _detach_live_stream(self):
+        if self.live_stream is not None:
+            # Stream endet erst, wenn ihn auch die anderen Leser freigeben
+            from wireless.live_stream import release_live_stream
+            self.live_stream.remove_state_observer(self._emit_stream_status)
+            release_live_stream(self.live_stream.host)
+            self.live_stream = None
+    
+    def _emit_stream_status(self, connected: bool, ip_address: str):
+        """State-Observer des Streams - läuft im Stream-Thread"""
+        self._stream_status_changed.emit(connected, ip_address)
+    
+    def _on_stream_status(self, connected: bool, ip_address: str):
+        """Verbindungswechsel des Live-Streams (im GUI-Thread)"""
+        if connected:
+            self._stop_status_timer()
+            self.update_connection_status(True, ip_address)
+            self.log_message(f"📡 Live-Stream von {ip_address} aktiv")
+        else:
+            self.update_connection_status(False, "")
+            self._start_status_timer()
+    
     def check_esp8266_status(self):
         """ESP8266 Status prüfen - läuft im Main-Thread"""
         try:
-            # DIREKTE ESP8266-Prüfung ohne Discovery
-            import urllib.request
-            import json
+            if self.live_stream is not None and self.live_stream.connected:
+                self._stop_status_timer()
+                return
             
+            # DIREKTE ESP8266-Prüfung ohne Discovery
             test_ips = ["192.168.2.20", "192.168.4.1"]  # Bekannte ESP8266 IPs
             
             for test_ip in test_ips:
                 try:
-                    url = f"http://{test_ip}/live-values-data"
-                    req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                    
-                    with urllib.request.urlopen(req, timeout=3) as response:
-                        if response.status == 200:
-                            data = json.loads(response.read().decode())
-                            # Erfolg - Status updaten
-                            self.current_esp_ip = test_ip
-                            self.update_connection_status(True, test_ip)
-                            return
+                    get_live_frame_cache().get(test_ip, timeout=3)
+                    # Erfolg - Status updaten und auf den Live-Stream umsteigen
+                    self.current_esp_ip = test_ip
+                    self.update_connection_status(True, test_ip)
+                    self._attach_live_stream(test_ip)
+                    return
                 except:
                     continue
             
@@ -637,6 +647,8 @@ class ESP8266ConfigSeite(BaseViewWidget):
     def stop_status_monitoring(self):
         """Status-Monitoring stoppen"""
         try:
+            self._stop_status_timer()
+            self._detach_live_stream()
             if self.status_thread and self.status_thread.isRunning():
                 self.status_thread.stop()
                 self.status_thread = None
@@ -893,19 +905,11 @@ class ESP8266ConfigSeite(BaseViewWidget):
             self.log_message(f"🔍 Teste AP-Verbindung: {ap_ip}")
             
             # DIREKTE HTTP-Prüfung ohne Discovery
-            import urllib.request
-            import json
-            
             try:
-                url = f"http://{ap_ip}/live-values-data"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode())
-                        self.log_message("✅ AP-Verbindung erfolgreich - Stall-Modus bereit!")
-                        self.update_connection_status(True, ap_ip)
-                        return
+                get_live_frame_cache().get(ap_ip, timeout=10)
+                self.log_message("✅ AP-Verbindung erfolgreich - Stall-Modus bereit!")
+                self.update_connection_status(True, ap_ip)
+                return
             except:
                 pass
             
@@ -920,19 +924,11 @@ class ESP8266ConfigSeite(BaseViewWidget):
             self.log_message(f"🔍 Teste Station-Verbindung: {station_ip}")
             
             # DIREKTE HTTP-Prüfung ohne Discovery
-            import urllib.request
-            import json
-            
             try:
-                url = f"http://{station_ip}/live-values-data"
-                req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        data = json.loads(response.read().decode())
-                        self.log_message("✅ Station-Verbindung erfolgreich - Haus-Modus bereit!")
-                        self.update_connection_status(True, station_ip)
-                        return
+                get_live_frame_cache().get(station_ip, timeout=10)
+                self.log_message("✅ Station-Verbindung erfolgreich - Haus-Modus bereit!")
+                self.update_connection_status(True, station_ip)
+                return
             except:
                 pass
             
@@ -943,21 +939,18 @@ class ESP8266ConfigSeite(BaseViewWidget):
     def send_wifi_mode_command(self, ip: str, mode: str) -> bool:
         """WiFi-Modus-Wechsel-Befehl an ESP8266 senden"""
         try:
-            import requests
-            
             # HTTP POST mit Modus-Parameter
-            url = f"http://{ip}/set_wifi_mode"
             data = {"mode": mode}  # "stall" oder "home"
             
             logger.info(f"📡 Sende WiFi-Modus-Befehl: {mode} an {ip}")
             
-            response = requests.post(url, json=data, timeout=5)
+            response = get_http_client().post_json(ip, "/set_wifi_mode", data, timeout=5)
             
-            if response.status_code == 200:
+            if response.status == 200:
                 result = response.json()
                 return result.get("success", False)
             else:
-                logger.error(f"HTTP Error: {response.status_code}")
+                logger.error(f"HTTP Error: {response.status}")
                 return False
                 
         except Exception as e:
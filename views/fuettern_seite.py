@@ -1,6 +1,7 @@
 # views/fuettern_seite.py - Mit WeightManager Integration
 import logging
 import os
+import time
 from PyQt5.QtCore import QTimer, QThread, pyqtSignal
 from PyQt5 import uic
 
@@ -21,9 +22,18 @@ class WiFiStatusThread(QThread):
         self.esp8266_discovery = None
         
     def run(self):
-        """Überprüft ESP8266 Verbindung alle 5 Sekunden"""
+        """
+        Meldet den ESP8266-Verbindungsstatus
+        
+        Ist die Waage gefunden, hält der Live-Stream die Verbindung offen und
+        der Thread wartet nur noch auf dessen Verbindungswechsel. Abgefragt
+        wird alle 5 Sekunden nur noch, solange keine Waage gefunden ist oder
+        die Firmware keinen Stream anbietet.
+        """
         try:
             from wireless.esp8266_discovery import ESP8266Discovery
+            from wireless.udp_discovery import get_udp_discovery
+            from wireless.live_stream import get_live_stream, release_live_stream, STREAM_TIMEOUT
             self.esp8266_discovery = ESP8266Discovery()
         except ImportError:
             logger.error("ESP8266Discovery nicht verfügbar - WiFi Status deaktiviert")
@@ -32,31 +42,67 @@ class WiFiStatusThread(QThread):
         self.running = True
         while self.running:
             try:
-                # ESP8266 per HTTP-Status testen
-                known_ips = ["192.168.2.20", "192.168.4.1"]
+                # Zuerst UDP-Discovery - immer eine neue Runde: ein Cache-Eintrag
+                # würde "verbunden" noch bis zu ttl Sekunden nach dem Ausschalten melden
                 found_ip = None
-                
-                for test_ip in known_ips:
-                    status = self.esp8266_discovery.test_http_status(test_ip)
-                    if status and isinstance(status, dict):
-                        found_ip = test_ip
-                        break
-                
-                if found_ip:
-                    self.wifi_status_changed.emit(True, found_ip)
-                    logger.debug(f"ESP8266 gefunden: {found_ip}")
+                device = get_udp_discovery().find_scale(max_age=0.0)
+                if device:
+                    found_ip = device.ip
                 else:
+                    # Ältere Firmware ohne Discovery: bekannte IPs per HTTP-Status testen
+                    known_ips = ["192.168.2.20", "192.168.4.1"]
+                    for test_ip in known_ips:
+                        status = self.esp8266_discovery.test_http_status(test_ip)
+                        if status and isinstance(status, dict):
+                            found_ip = test_ip
+                            break
+                
+                if not found_ip:
                     self.wifi_status_changed.emit(False, "")
                     logger.debug("ESP8266 nicht erreichbar")
-                    
-                # 5 Sekunden warten vor nächster Überprüfung
-                self.msleep(5000)
+                    self.msleep(5000)
+                    continue
+                
+                self.wifi_status_changed.emit(True, found_ip)
+                logger.debug(f"ESP8266 gefunden: {found_ip}")
+                
+                stream = get_live_stream(found_ip)
+                try:
+                    connected = stream.wait_for_state(True, timeout=STREAM_TIMEOUT)
+                    if connected:
+                        self._follow_stream(stream)
+                finally:
+                    release_live_stream(found_ip)
+                if not connected:
+                    # Firmware ohne Live-Stream: wie bisher alle 5 Sekunden prüfen
+                    self.msleep(5000)
                 
             except Exception as e:
                 logger.error(f"Fehler beim WiFi Status Check: {e}")
                 self.wifi_status_changed.emit(False, "")
                 self.msleep(5000)
                 
+    def _follow_stream(self, stream, rediscover_after: float = 30.0):
+        """
+        Meldet nur noch Verbindungswechsel des Live-Streams (kein Netzwerkverkehr)
+        
+        Kehrt zurück, wenn der Stream länger als rediscover_after getrennt
+        ist - die Waage hat dann eventuell eine andere Adresse.
+        """
+        connected = True
+        lost_since = 0.0
+        while self.running:
+            if not stream.wait_for_state(not connected, timeout=1.0):
+                if not connected and time.monotonic() - lost_since > rediscover_after:
+                    return
+                continue
+            connected = not connected
+            if connected:
+                self.wifi_status_changed.emit(True, stream.host)
+            else:
+                lost_since = time.monotonic()
+                self.wifi_status_changed.emit(False, "")
+    
     def stop(self):
         """Stoppt den WiFi Status Thread"""
         self.running = False
@@ -88,6 +134,9 @@ class FuetternSeite(BaseViewWidget):
         self.karre_gewicht = 0.0  # Aktuelles Karre-Gewicht
         self.entnommenes_gewicht = 0.0  # Letztes entnommenes Gewicht
         self.start_gewicht = 0.0  # Gewicht beim Beladen
+        self._entnahme_start = None  # Beginn der ersten erkannten Entnahme (aktuelles Pferd)
+        self._entnahme_ende = None   # Ende der letzten erkannten Entnahme
+        self._angezeigte_seq = -1    # Snapshot-Nummer der zuletzt angezeigten Werte
 
         # Kontext-Variablen
         self.aktuelle_pferd_nummer = 1
@@ -114,6 +163,13 @@ class FuetternSeite(BaseViewWidget):
         
         self.connect_buttons()
 
+        # Automatische Entnahme-Erkennung: füllt entnommenes_gewicht vor
+        try:
+            from hardware.weight_signals import get_weight_signals
+            get_weight_signals().feed_removed.connect(self.on_feed_removed)
+        except Exception as e:
+            logger.error(f"Entnahme-Erkennung für FuetternSeite nicht möglich: {e}")
+
         # Timer für Echtzeit-Updates
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_displays)
@@ -340,15 +396,15 @@ class FuetternSeite(BaseViewWidget):
             farbe = self.get_naehrwert_farbe(rohprotein_g, 
                                            richtwerte['rohprotein_min'], 
                                            richtwerte['rohprotein_max'])
-            self.label_h_rohprotein.setText(f"{rohprotein_g:.0f}g")
-            self.label_h_rohprotein.setStyleSheet(f"color: {farbe}; font-weight: bold;")
+            UIUtils.set_label_if_changed(self.label_h_rohprotein, f"{rohprotein_g:.0f}g",
+                                         f"color: {farbe}; font-weight: bold;")
             
         if hasattr(self, 'label_h_rohfaser'):
             farbe = self.get_naehrwert_farbe(rohfaser_g, 
                                            richtwerte['rohfaser_min'], 
                                            richtwerte['rohfaser_max'])
-            self.label_h_rohfaser.setText(f"{rohfaser_g:.0f}g")
-            self.label_h_rohfaser.setStyleSheet(f"color: {farbe}; font-weight: bold;")
+            UIUtils.set_label_if_changed(self.label_h_rohfaser, f"{rohfaser_g:.0f}g",
+                                         f"color: {farbe}; font-weight: bold;")
             
         # FRUKTAN - nur Obergrenze prüfen (viel = gefährlich bei Hufrehe)
         if hasattr(self, 'label_h_fruktan'):
@@ -358,8 +414,8 @@ class FuetternSeite(BaseViewWidget):
                 farbe = "orange"  # Vorsicht bei hohem Fruktan
             else:
                 farbe = "green"  # Fruktan OK
-            self.label_h_fruktan.setText(f"{fruktan_g:.0f}g")
-            self.label_h_fruktan.setStyleSheet(f"color: {farbe}; font-weight: bold;")
+            UIUtils.set_label_if_changed(self.label_h_fruktan, f"{fruktan_g:.0f}g",
+                                         f"color: {farbe}; font-weight: bold;")
             
     def get_naehrwert_farbe(self, ist_wert, min_wert, max_wert):
         """Gibt Farbe basierend auf ernährungsphysiologischen Richtwerten zurück"""
@@ -379,57 +435,74 @@ class FuetternSeite(BaseViewWidget):
 
     # Simuliere_fuetterung entfernt - wird jetzt automatisch über btn_next_rgv gehandhabt
 
+    def on_feed_removed(self, event):
+        """Übernimmt eine erkannte Entnahme (RemovalEvent) - mehrere Griffe pro Pferd werden addiert"""
+        if not self.isVisible():
+            return
+        self.entnommenes_gewicht += event.amount
+        if self._entnahme_start is None:
+            self._entnahme_start = event.start_time
+        self._entnahme_ende = event.end_time
+        logger.info(f"Entnahme übernommen: +{event.amount:.2f} kg (Konfidenz {event.confidence:.2f}), "
+                    f"gesamt {self.entnommenes_gewicht:.2f} kg")
+        self.update_gewichts_anzeigen()
+
+    def entnahme_dauer(self):
+        """Sekunden von der ersten bis zur letzten erkannten Entnahme oder None"""
+        if self._entnahme_start is None or self._entnahme_ende is None:
+            return None
+        return int(round(self._entnahme_ende - self._entnahme_start))
+
+    def reset_entnahme(self):
+        """Setzt die Entnahme für das nächste Pferd zurück"""
+        self.entnommenes_gewicht = 0.0
+        self._entnahme_start = None
+        self._entnahme_ende = None
+
     def update_gewichts_anzeigen(self):
         """Aktualisiert alle Gewichts-Anzeigen"""
         try:
             # Hardware: Aktuelles Gewicht vom WeightManager
             aktuelles_gewicht = self.weight_manager.read_weight()
             self.karre_gewicht = aktuelles_gewicht
-            print(f"DEBUG: Karre-Gewicht: {self.karre_gewicht:.2f} kg")
             
-            # Karre-Gewicht anzeigen
+            # Karre-Gewicht anzeigen (nur bei geänderter Anzeige neu zeichnen)
             if hasattr(self, 'label_karre_gewicht_anzeigen'):
-                self.label_karre_gewicht_anzeigen.setText(f"{self.karre_gewicht:.2f}")
+                UIUtils.set_label_if_changed(self.label_karre_gewicht_anzeigen, f"{self.karre_gewicht:.2f}")
 
             # Entnommenes Gewicht anzeigen
             if hasattr(self, 'label_fu_entnommen'):
-                self.label_fu_entnommen.setText(f"{self.entnommenes_gewicht:.2f}")
+                UIUtils.set_label_if_changed(self.label_fu_entnommen, f"{self.entnommenes_gewicht:.2f}")
 
             # NÄHRWERTE DYNAMISCH aktualisieren basierend auf entnommenem Gewicht
             if hasattr(self, 'aktuelle_futter_daten') and self.aktuelle_futter_daten:
                 # Dynamische Berechnung: Bei 0.0kg entnommen = 0.0g Nährwerte
                 if self.entnommenes_gewicht == 0.0:
                     # Alle Nährwerte auf 0.0g setzen
-                    if hasattr(self, 'label_h_rohprotein'):
-                        self.label_h_rohprotein.setText("0.0g")
-                        self.label_h_rohprotein.setStyleSheet("color: gray;")
-                    if hasattr(self, 'label_h_rohfaser'):
-                        self.label_h_rohfaser.setText("0.0g")  
-                        self.label_h_rohfaser.setStyleSheet("color: gray;")
-                    if hasattr(self, 'label_h_fruktan'):
-                        self.label_h_fruktan.setText("0.0g")
-                        self.label_h_fruktan.setStyleSheet("color: gray;")
+                    for name in ('label_h_rohprotein', 'label_h_rohfaser', 'label_h_fruktan'):
+                        if hasattr(self, name):
+                            UIUtils.set_label_if_changed(getattr(self, name), "0.0g", "color: gray;")
                 else:
                     # Echte Berechnung basierend auf entnommener Menge
                     self.zeige_futter_analysewerte(self.aktuelle_futter_daten, self.entnommenes_gewicht)
-
-            # Debug-Ausgabe
-            print(f"DEBUG: Entnommen: {self.entnommenes_gewicht:.2f} kg")
             
         except Exception as e:
             logger.error(f"Fehler beim Aktualisieren der Gewichtsanzeige: {e}")
-        print(f"DEBUG: Label 'label_fu_entnommen' aktualisiert")
 
     def update_displays(self):
         """Echtzeit-Updates für alle Anzeigen INKLUSIVE Ernährungscontrolling"""
         try:
-            # Gewichts-Anzeigen aktualisieren
+            # Kein neuer Snapshot seit dem letzten Tick: nichts neu zu berechnen
+            if self.weight_manager.is_acquiring:
+                seq = self.weight_manager.get_snapshot().seq
+                if seq == self._angezeigte_seq:
+                    return
+                self._angezeigte_seq = seq
+
+            # Gewichts-Anzeigen aktualisieren - inkl. ECHTZEIT-ERNÄHRUNGSCONTROLLING
+            # (Analysewerte werden dort bereits mit aktueller Entnahme neu berechnet)
             self.update_gewichts_anzeigen()
 
-            # ECHTZEIT-ERNÄHRUNGSCONTROLLING: Analysewerte mit aktueller Entnahme neu berechnen
-            if hasattr(self, 'aktuelle_futter_daten') and self.aktuelle_futter_daten and self.entnommenes_gewicht > 0:
-                self.zeige_futter_analysewerte(self.aktuelle_futter_daten, self.entnommenes_gewicht)
-
             # Zellen-Anzeigen (falls HX711 aktiv)
             if hasattr(self, 'navigation') and self.navigation:
                 # Hier könnten Sie echte Sensor-Daten anzeigen
@@ -523,7 +596,8 @@ class FuetternSeite(BaseViewWidget):
         if self.navigation and hasattr(self.navigation, 'registriere_fuetterung'):
             gefuetterte_menge = getattr(self, 'entnommenes_gewicht', 4.5)
             if gefuetterte_menge > 0:
-                self.navigation.registriere_fuetterung(self.gewaehlter_futtertyp, gefuetterte_menge)
+                self.navigation.registriere_fuetterung(self.gewaehlter_futtertyp, gefuetterte_menge,
+                                                       duration_seconds=self.entnahme_dauer())
         
         # EXTRA-HEU RÜCKKEHR: Nach EXTRA-Heu zum ursprünglichen Futtertyp zurück
         if hasattr(self, 'original_futtertyp') and self.original_futtertyp:
@@ -544,6 +618,9 @@ class FuetternSeite(BaseViewWidget):
         if self.aktuelle_futter_daten:
             self.zeige_futter_analysewerte(self.aktuelle_futter_daten, self.entnommenes_gewicht)
         
+        # Entnahme ist registriert - nächstes Pferd beginnt bei 0
+        self.reset_entnahme()
+        
         # Zum nächsten Pferd wechseln - Navigation entscheidet über Ende/Heulage-Wechsel
         if self.navigation:
             naechstes_pferd = self.navigation.naechstes_pferd()
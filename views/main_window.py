@@ -193,6 +193,12 @@ class MainWindow(QMainWindow):
             if self.waagen_kalibrierung:
                 self.waagen_kalibrierung.kalibrierung_abgeschlossen.connect(self.on_kalibrierung_abgeschlossen)
             
+            # Hardware-Bring-up (läuft im Hintergrund, Signale kommen im GUI-Thread an)
+            from hardware.weight_signals import get_weight_signals
+            weight_signals = get_weight_signals()
+            weight_signals.hardware_status_changed.connect(self.on_hardware_status_changed)
+            weight_signals.hardware_ready.connect(self.on_hardware_ready)
+            
             logger.info("Signal-Verbindungen erfolgreich eingerichtet")
             
         except Exception as e:
@@ -258,6 +264,29 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Fehler bei Kalibrierungs-Abschluss: {e}")
 
+    def on_hardware_status_changed(self, state: str, message: str, progress: float):
+        """Fortschritt des Hardware-Bring-ups"""
+        logger.info(f"Hardware [{state}] {progress:.0%}: {message}")
+
+    def on_hardware_ready(self, verfuegbar: bool):
+        """Callback wenn der Hardware-Bring-up abgeschlossen ist"""
+        try:
+            if verfuegbar:
+                logger.info("Waage bereit - Gewichtsanzeige aktiv")
+            else:
+                logger.warning("Waage nicht verfügbar - Gewichtsanzeige zeigt 0.0 kg")
+            
+            self.database_manager.log_system_event(
+                "hardware_ready",
+                f"Hardware-Bring-up {'erfolgreich' if verfuegbar else 'fehlgeschlagen'}",
+                {
+                    "success": verfuegbar,
+                    "timestamp": datetime.now().isoformat()
+                }
+            )
+        except Exception as e:
+            logger.error(f"Fehler bei Hardware-Status: {e}")
+
     def set_futter_daten(self, heu_liste=None, heulage_liste=None, pellet_liste=None):
         """Empfängt Futter-Daten von der Konfigurationsseite"""
         if heu_liste:
@@ -516,8 +545,15 @@ class MainWindow(QMainWindow):
                 return aktuelles_pferd
         return None
         
-    def registriere_fuetterung(self, futtertyp, menge_kg):
-        """Registriert eine Fütterung für separate Statistiken UND Datenbank"""
+    def registriere_fuetterung(self, futtertyp, menge_kg, duration_seconds=None):
+        """
+        Registriert eine Fütterung für separate Statistiken UND Datenbank
+        
+        Args:
+            futtertyp: Futtertyp der Fütterung
+            menge_kg: Entnommene Menge (aus der Entnahme-Erkennung)
+            duration_seconds: Dauer der Entnahme, None = Standardwert
+        """
         aktuelles_pferd = self.get_aktuelles_pferd()
         
         # Lokale Statistiken (bestehend)
@@ -547,7 +583,8 @@ class MainWindow(QMainWindow):
                     feed_type=futtertyp,
                     planned_amount=menge_kg,  # Geplante Menge
                     actual_amount=menge_kg,   # Tatsächliche Menge (hier gleich)
-                    duration_seconds=getattr(self, '_feeding_duration', 120),  # Default 2 min
+                    duration_seconds=(duration_seconds if duration_seconds is not None
+                                      else getattr(self, '_feeding_duration', 120)),  # Default 2 min
                     notes=f"Box {aktuelles_pferd.box}",
                     load_weight_before=last_weight,
                     load_weight_after=current_weight
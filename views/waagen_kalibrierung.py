@@ -20,7 +20,6 @@ from PyQt5.QtCore import pyqtSignal, QTimer
 from PyQt5.QtWidgets import QMessageBox, QTabWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QProgressBar, QLabel
 import os
 import subprocess
-import time
 import json
 from pathlib import Path
 
@@ -32,226 +31,9 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.base_ui_widget import BaseViewWidget
 from utils.settings_manager import get_settings_manager
-# ESP8266 Wireless-Module verwenden statt lokale HX711-Hardware
-try:
-    from wireless.esp8266_discovery import ESP8266Discovery, get_esp8266_status
-    import urllib.request
-    import urllib.error
-    import json
-    
-    ESP8266_AVAILABLE = True
-    esp8266_discovery = ESP8266Discovery()
-    
-    def lese_gewicht_hx711():
-        """Liest Gesamtgewicht vom ESP8266 via HTTP (alle 4 HX711)"""
-        try:
-            # ESP8266 Dual-Mode IPs (Stall + Haus)
-            test_ips = ["192.168.4.1", "192.168.2.20"]
-            
-            for ip in test_ips:
-                try:
-                    url = f"http://{ip}/live-values-data"
-                    req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                    
-                    with urllib.request.urlopen(req, timeout=2) as response:
-                        data = json.loads(response.read().decode('utf-8'))
-                        
-                        # Alle 4 HX711-Werte aufsummieren
-                        vl_val = float(data.get('vl_value', '0'))
-                        vr_val = float(data.get('vr_value', '0'))
-                        hl_val = float(data.get('hl_value', '0'))
-                        hr_val = float(data.get('hr_value', '0'))
-                        
-                        # Umrechnung von Raw-Werten zu kg (vereinfacht)
-                        # TODO: Echte Kalibrierungsfaktoren verwenden
-                        total_raw = vl_val + vr_val + hl_val + hr_val
-                        total_kg = total_raw / 100000.0  # Vereinfachte Skalierung
-                        
-                        logger.info(f"ESP8266 ({ip}): VL={vl_val}, VR={vr_val}, HL={hl_val}, HR={hr_val} → {total_kg:.3f}kg")
-                        return total_kg
-                        
-                except urllib.error.URLError:
-                    continue  # Nächste IP probieren
-                except Exception as e:
-                    logger.warning(f"ESP8266 {ip} Fehler: {e}")
-                    continue
-            
-            logger.warning("Kein ESP8266 unter bekannten IPs erreichbar")
-            return 0.0
-        except Exception as e:
-            logger.error(f"ESP8266 Gewicht-Fehler: {e}")
-            return 0.0
-    
-    def lese_einzelzellwerte_hx711():
-        """Liest alle 4 Einzelzellen vom ESP8266 via HTTP"""
-        try:
-            # ESP8266 Dual-Mode IPs (Stall + Haus)
-            test_ips = ["192.168.4.1", "192.168.2.20"]
-            
-            for ip in test_ips:
-                try:
-                    url = f"http://{ip}/live-values-data"
-                    req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                    
-                    with urllib.request.urlopen(req, timeout=2) as response:
-                        data = json.loads(response.read().decode('utf-8'))
-                        
-                        # Raw-Werte von allen 4 HX711
-                        vl_raw = float(data.get('vl_value', '0'))
-                        vr_raw = float(data.get('vr_value', '0'))
-                        hl_raw = float(data.get('hl_value', '0'))
-                        hr_raw = float(data.get('hr_value', '0'))
-                        
-                        # Umrechnung zu kg (vereinfacht)
-                        scale_factor = 100000.0  # TODO: Echte Kalibrierung
-                        
-                        weights = [
-                            vl_raw / scale_factor,  # VL (Vorne Links)
-                            vr_raw / scale_factor,  # VR (Vorne Rechts)
-                            hl_raw / scale_factor,  # HL (Hinten Links)
-                            hr_raw / scale_factor   # HR (Hinten Rechts)
-                        ]
-                        
-                        logger.info(f"ESP8266 Einzelzellen: {weights}")
-                        return weights
-                        
-                except urllib.error.URLError:
-                    continue  # Nächste IP probieren
-                except Exception as e:
-                    logger.warning(f"ESP8266 {ip} Fehler: {e}")
-                    continue
-            
-            logger.warning("Kein ESP8266 für Einzelzellwerte erreichbar")
-            return [0.0, 0.0, 0.0, 0.0]
-        except Exception as e:
-            logger.error(f"ESP8266 Einzelzell-Fehler: {e}")
-            return [0.0, 0.0, 0.0, 0.0]
-    
-    def nullpunkt_setzen_alle():
-        """Sendet Tare-Kommando an alle 4 HX711 über ESP8266"""
-        try:
-            test_ips = ["192.168.2.20", "192.168.4.1"]
-            
-            for ip in test_ips:
-                try:
-                    # ESP8266 hat noch kein /tare-Endpoint
-                    # Für jetzt nur Logging
-                    logger.info(f"ESP8266 ({ip}): Tare-Funktion noch nicht implementiert")
-                    
-                    # TODO: ESP8266-Firmware um /tare-Endpoint erweitern
-                    # url = f"http://{ip}/tare-all"
-                    # req = urllib.request.Request(url, method='POST')
-                    # urllib.request.urlopen(req, timeout=5)
-                    
-                    return True
-                    
-                except Exception as e:
-                    logger.warning(f"ESP8266 {ip} Tare-Fehler: {e}")
-                    continue
-            
-            logger.warning("Kein ESP8266 für Tare erreichbar")
-            return False
-        except Exception as e:
-            logger.error(f"ESP8266 Tare-Fehler: {e}")
-            return False
-    
-    def kalibriere_einzelzelle(index, gewicht):
-        """Sendet Kalibrierungs-Kommando an ESP8266"""
-        try:
-            test_ips = ["192.168.2.20", "192.168.4.1"]
-            
-            zellen_namen = ["VL", "VR", "HL", "HR"]
-            if index >= len(zellen_namen):
-                logger.error(f"Ungültiger Zellen-Index: {index}")
-                return False
-            
-            for ip in test_ips:
-                try:
-                    # ESP8266 hat noch kein Kalibrierungs-Endpoint
-                    logger.info(f"ESP8266 ({ip}): Kalibrierung für {zellen_namen[index]} mit {gewicht}kg noch nicht implementiert")
-                    
-                    # TODO: ESP8266-Firmware um /calibrate-Endpoint erweitern
-                    # data = json.dumps({'cell': index, 'weight': gewicht})
-                    # req = urllib.request.Request(f"http://{ip}/calibrate", data=data.encode(), method='POST')
-                    # urllib.request.urlopen(req, timeout=5)
-                    
-                    return True
-                    
-                except Exception as e:
-                    logger.warning(f"ESP8266 {ip} Kalibrierungs-Fehler: {e}")
-                    continue
-            
-            return False
-        except Exception as e:
-            logger.error(f"ESP8266 Kalibrierungs-Fehler: {e}")
-            return False
-    
-    def nullpunkt_setzen_alle():
-        """Setzt Nullpunkt für alle ESP8266-HX711-Zellen"""
-        try:
-            test_ips = ["192.168.4.1", "192.168.2.20"]
-            
-            for ip in test_ips:
-                try:
-                    url = f"http://{ip}/tare"
-                    req = urllib.request.Request(url, method='POST')
-                    
-                    with urllib.request.urlopen(req, timeout=5) as response:
-                        if response.status == 200:
-                            logger.info(f"✅ ESP8266 Nullpunkt gesetzt: {ip}")
-                            return True
-                except Exception:
-                    continue
-                    
-            logger.error("❌ ESP8266 Nullpunkt-Setzung fehlgeschlagen")
-            return False
-        except Exception as e:
-            logger.error(f"ESP8266 Tare-Fehler: {e}")
-            return False
-    
-    def kalibriere_einzelzelle(index, gewicht):
-        """Sendet Kalibrierungs-Kommando an ESP8266"""
-        try:
-            test_ips = ["192.168.2.20", "192.168.4.1"]
-            
-            for ip in test_ips:
-                try:
-                    url = f"http://{ip}/calibrate"
-                    data = json.dumps({"weight": gewicht}).encode('utf-8')
-                    req = urllib.request.Request(url, data=data, method='POST')
-                    req.add_header('Content-Type', 'application/json')
-                    
-                    with urllib.request.urlopen(req, timeout=5) as response:
-                        if response.status == 200:
-                            logger.info(f"✅ ESP8266 kalibriert mit {gewicht}kg: {ip}")
-                            return True
-                except Exception:
-                    continue
-                    
-            logger.error(f"❌ ESP8266 Kalibrierung fehlgeschlagen: {gewicht}kg")
-            return False
-        except Exception as e:
-            logger.error(f"ESP8266 Kalibrierungs-Fehler: {e}")
-            return False
-
-except ImportError as e:
-    logger.warning(f"ESP8266-Discovery nicht verfügbar: {e}")
-    # Fallback für Entwicklung
-    ESP8266_AVAILABLE = False
-    
-    def lese_gewicht_hx711():
-        return 0.0
-    
-    def lese_einzelzellwerte_hx711():
-        return [0.0, 0.0, 0.0, 0.0]
-    
-    def nullpunkt_setzen_alle():
-        logger.warning("ESP8266 nicht verfügbar")
-        return False
-    
-    def kalibriere_einzelzelle(index, gewicht):
-        logger.warning("ESP8266 nicht verfügbar")
-        return False
+from hardware.weight_manager import get_weight_manager, CalibrationResult, SENSOR_CALIBRATION
+# Gewicht kommt ausschließlich vom WeightManager (HX711 lokal oder Funk-Waage,
+# Failover über die WeightSourceRegistry) - keine eigene Netzwerk-Abfrage mehr
 
 logger = logging.getLogger(__name__)
 
@@ -409,7 +191,9 @@ class Pi5SystemTester:
             # HX711 Import Test
             hx711_import_ok = False
             try:
-                from hardware.hx711_real import hx_sensors, lese_gewicht_hx711, lese_einzelzellwerte_hx711, HX711_AVAILABLE
+                from hardware.hx711_real import hx_sensors, lese_gewicht_hx711, HX711_AVAILABLE
+                from hardware.hx711_real import ensure_hx711_initialized
+                ensure_hx711_initialized()  # Sensoren werden nicht mehr beim Import initialisiert
                 self.log_message(f"✅ HX711 Module Import: OK")
                 self.log_message(f"📋 HX711_AVAILABLE Flag: {HX711_AVAILABLE}")
                 hx711_import_ok = True
@@ -547,17 +331,16 @@ class Pi5SystemTester:
                 self.log_message(f"❌ Weight Manager: {e}")
                 weight_ok = False
             
-            # ESP8266 Test (falls verfügbar)
+            # Gewichtsquellen (HX711 lokal, Funk-Waagen) aus der Registry
             esp8266_ok = False
-            if ESP8266_AVAILABLE:
-                try:
-                    esp_weight = lese_gewicht_hx711()
-                    self.log_message(f"📡 ESP8266 Gewicht: {esp_weight:.2f}kg")
-                    esp8266_ok = True
-                except Exception as e:
-                    self.log_message(f"❌ ESP8266: {e}")
-            else:
-                self.log_message("⚠️ ESP8266: Nicht verfügbar")
+            try:
+                for quelle in get_weight_manager().get_status().get('sources', []):
+                    zustand = "aktiv" if quelle['active'] else ("bereit" if quelle['healthy'] else "nicht erreichbar")
+                    self.log_message(f"{'✅' if quelle['healthy'] else '⚠️'} Quelle {quelle['name']}: {zustand}")
+                    if quelle['name'] == 'esp8266' and quelle['healthy']:
+                        esp8266_ok = True
+            except Exception as e:
+                self.log_message(f"❌ Gewichtsquellen: {e}")
             
             self.results['tests']['weight_system'] = {
                 'status': 'PASS' if weight_ok else 'FAIL',
@@ -644,6 +427,8 @@ class WaagenKalibrierung(BaseViewWidget):
     
     # Signale
     kalibrierung_abgeschlossen = pyqtSignal(bool)  # Erfolgreich ja/nein
+    _tara_fertig = pyqtSignal(object)              # CalibrationResult aus Hintergrund-Thread
+    _kalibrierung_fertig = pyqtSignal(object)      # CalibrationResult aus Hintergrund-Thread
     
     def __init__(self, parent=None):
         # BaseViewWidget mit UI-Datei initialisieren  
@@ -656,12 +441,19 @@ class WaagenKalibrierung(BaseViewWidget):
         self.kalibrierung_schritt = 0  # 0=Start, 1=Tara, 2=Kalibriert, 3=Getestet
         self.tara_werte = [0.0, 0.0, 0.0, 0.0]  # Nullpunkt-Werte für 4 Sensoren
         self.kalibrier_faktoren = [1.0, 1.0, 1.0, 1.0]  # Skalenfaktoren
+        self.kalibrier_quelle = None  # Gewichtsquelle, auf der Tara/Kalibrierung liefen
         self.referenz_gewicht = 20.0  # Standard 20kg
         self.toleranz = 0.05  # ±50g Toleranz
         
-        # Timer für Live-Updates
+        # Live-Updates: Gewichts-Abo bei laufender Erfassung, sonst Timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_live_anzeige)
+        self.weight_channel = None
+        
+        # Tara/Kalibrierung laufen im WeightManager-Hintergrund, Ergebnis per Signal
+        self._tara_fertig.connect(self.tara_abgeschlossen)
+        self._kalibrierung_fertig.connect(self.kalibrierung_abgeschlossen_intern)
+        self._live_war_aktiv = False
         
         # UI initialisieren
         self.init_ui()
@@ -764,30 +556,51 @@ class WaagenKalibrierung(BaseViewWidget):
             self.update_status(f"Lade-Fehler: {e}")
     
     def start_live_updates(self):
-        """Startet Live-Gewichtsanzeige"""
-        if ESP8266_AVAILABLE:
+        """
+        Startet Live-Gewichtsanzeige
+        
+        Läuft die Erfassung, wird jeder neue Snapshot gepusht (höchstens
+        10 pro Sekunde) - die Anzeige folgt der Waage ohne Abfrage-Timer.
+        Ohne Erfassung wird wie bisher jede Sekunde gelesen.
+        """
+        weight_manager = get_weight_manager()
+        if weight_manager.is_acquiring and self.weight_channel is None:
+            try:
+                from hardware.weight_signals import get_weight_signals
+                self.weight_channel = get_weight_signals().weight_channel(
+                    "waagen_kalibrierung", min_delta=0.005, max_rate=10.0)
+                self.weight_channel.weight_changed.connect(lambda _gewicht: self.update_live_anzeige())
+            except Exception as e:
+                logger.error(f"Gewichts-Abo für Kalibrierung nicht möglich: {e}")
+                self.weight_channel = None
+        if self.weight_channel is None:
             self.update_timer.start(1000)  # 1 Sekunde Intervall
-            self.update_status("Live-Updates gestartet - ESP8266 Wireless")
-        else:
-            self.update_status("WARNUNG: ESP8266 nicht verfügbar")
-            self.update_timer.start(1000)  # Timer trotzdem starten für Fallback
+        self.update_live_anzeige()
+        quelle = weight_manager.get_status().get('sensor', '-')
+        self.update_status(f"Live-Updates gestartet - Quelle: {quelle}")
     
     def stop_live_updates(self):
         """Stoppt Live-Updates"""
         self.update_timer.stop()
+        if self.weight_channel is not None:
+            self.weight_channel.close()
+            self.weight_channel.deleteLater()
+            self.weight_channel = None
         self.update_status("Live-Updates gestoppt")
     
+    def _live_updates_aktiv(self) -> bool:
+        return self.update_timer.isActive() or self.weight_channel is not None
+    
     def update_live_anzeige(self):
         """Aktualisiert Live-Gewichtsanzeige"""
         try:
-            if ESP8266_AVAILABLE:
-                # ESP8266 Wireless-Daten
-                gesamtgewicht = lese_gewicht_hx711()
-                einzelwerte = lese_einzelzellwerte_hx711()
-            else:
-                # Fallback wenn ESP8266 nicht verfügbar
-                gesamtgewicht = 0.0
-                einzelwerte = [0.0, 0.0, 0.0, 0.0]
+            # Ein Snapshot pro Tick: Gesamt- und Einzelwerte stammen aus derselben Messung.
+            # read_weight() frischt den Snapshot nur auf, wenn die Erfassung nicht läuft.
+            weight_manager = get_weight_manager()
+            weight_manager.read_weight()
+            snapshot = weight_manager.get_snapshot()
+            gesamtgewicht = snapshot.total
+            einzelwerte = snapshot.cells
             
             # Gesamtgewicht anzeigen
             if hasattr(self, 'lbl_gesamtgewicht_wert'):
@@ -820,47 +633,82 @@ class WaagenKalibrierung(BaseViewWidget):
             if reply != QMessageBox.Yes:
                 return
             
-            self.update_status("Tara wird durchgeführt...")
+            self.update_status("Tara wird durchgeführt - warte auf ruhige Waage...")
             
             # Live-Updates temporär stoppen
-            was_running = self.update_timer.isActive()
-            if was_running:
+            self._live_war_aktiv = self._live_updates_aktiv()
+            if self._live_war_aktiv:
                 self.stop_live_updates()
             
-            if HX711_AVAILABLE and hx_sensors:
-                # Echte Hardware-Tara
-                nullpunkt_setzen_alle()
-                
-                # Tara-Werte aus Sensoren lesen
-                import time
-                time.sleep(1)  # Kurz warten
-                self.tara_werte = lese_einzelzellwerte_hx711()
-                
-                success = True
+            weight_manager = get_weight_manager()
+            if weight_manager.is_acquiring:
+                # Nullpunkt aus dem laufenden Sample-Strom - GUI bleibt bedienbar
+                self.set_kalibrierungs_buttons_aktiv(False)
+                future = weight_manager.tare_async(timeout=3.0, persist=False)
+                future.add_done_callback(lambda f: self._tara_fertig.emit(self._future_ergebnis(f)))
             else:
                 # Simulation
                 self.tara_werte = [0.0, 0.0, 0.0, 0.0]
-                success = True
-            
-            if success:
-                self.kalibrierung_schritt = 1
-                self.update_status("ERFOLG: Tara erfolgreich - bereit für Kalibrierung mit Referenzgewicht")
-                QMessageBox.information(self, "Tara", "Nullpunkt erfolgreich gesetzt!")
-            else:
-                self.update_status("FEHLER: Tara fehlgeschlagen")
-                QMessageBox.critical(self, "Fehler", "Tara konnte nicht durchgeführt werden!")
-            
-            # Live-Updates wieder starten
-            if was_running:
-                self.start_live_updates()
-            
-            self.update_kalibrierungs_buttons()
+                self.tara_abgeschlossen(CalibrationResult(True, "Simulation"))
             
         except Exception as e:
             logger.error(f"Tara-Fehler: {e}")
             self.update_status(f"Tara-Fehler: {e}")
             QMessageBox.critical(self, "Fehler", f"Tara-Fehler: {e}")
     
+    def _future_ergebnis(self, future):
+        """Ergebnis eines Tara-/Kalibrier-Futures (Exceptions als Fehlschlag)"""
+        try:
+            return future.result()
+        except Exception as e:
+            return CalibrationResult(False, str(e))
+    
+    def set_kalibrierungs_buttons_aktiv(self, aktiv: bool):
+        """Sperrt die Kalibrier-Buttons während ein Hintergrund-Job läuft"""
+        for name in ('btn_tara', 'btn_kalibrieren', 'btn_test', 'btn_speichern'):
+            if hasattr(self, name):
+                getattr(self, name).setEnabled(aktiv)
+        if aktiv:
+            self.update_kalibrierungs_buttons()
+    
+    def tara_abgeschlossen(self, result):
+        """Tara-Ergebnis (im GUI-Thread)"""
+        if result.success:
+            if result.tare:
+                self.tara_werte = list(result.tare)
+            self.kalibrier_quelle = result.source
+            self.kalibrierung_schritt = 1
+            self.update_status("ERFOLG: Tara erfolgreich - bereit für Kalibrierung mit Referenzgewicht")
+            QMessageBox.information(self, "Tara", "Nullpunkt erfolgreich gesetzt!")
+        else:
+            self.update_status(f"FEHLER: Tara fehlgeschlagen - {result.message}")
+            QMessageBox.critical(self, "Fehler", f"Tara konnte nicht durchgeführt werden!\n\n{result.message}")
+        
+        # Live-Updates wieder starten
+        if self._live_war_aktiv:
+            self.start_live_updates()
+        
+        self.set_kalibrierungs_buttons_aktiv(True)
+    
+    def kalibrierung_abgeschlossen_intern(self, result):
+        """Kalibrier-Ergebnis (im GUI-Thread)"""
+        if result.success:
+            if result.gain:
+                self.kalibrier_faktoren = list(result.gain)
+            self.kalibrier_quelle = result.source
+            self.kalibrierung_schritt = 2
+            self.update_status("ERFOLG: Kalibrierung erfolgreich - bereit für Test")
+            QMessageBox.information(self, "Kalibrierung", "Kalibrierung erfolgreich abgeschlossen!")
+        else:
+            self.update_status(f"FEHLER: Kalibrierung fehlgeschlagen - {result.message}")
+            QMessageBox.critical(self, "Fehler", f"Kalibrierung konnte nicht durchgeführt werden!\n\n{result.message}")
+        
+        # Live-Updates wieder starten
+        if self._live_war_aktiv:
+            self.start_live_updates()
+        
+        self.set_kalibrierungs_buttons_aktiv(True)
+    
     def kalibrierung_durchfuehren(self):
         """Führt Kalibrierung mit Referenzgewicht durch"""
         try:
@@ -888,62 +736,23 @@ class WaagenKalibrierung(BaseViewWidget):
             if reply != QMessageBox.Yes:
                 return
             
-            self.update_status(f"Kalibrierung mit {self.referenz_gewicht} kg...")
+            self.update_status(f"Kalibrierung mit {self.referenz_gewicht} kg - warte auf ruhige Waage...")
             
             # Live-Updates stoppen
-            was_running = self.update_timer.isActive()
-            if was_running:
+            self._live_war_aktiv = self._live_updates_aktiv()
+            if self._live_war_aktiv:
                 self.stop_live_updates()
             
-            if HX711_AVAILABLE and hx_sensors:
-                # Echte Hardware-Kalibrierung
-                success_count = 0
-                
-                for i, sensor in enumerate(hx_sensors):
-                    try:
-                        # Rohwert lesen
-                        import time
-                        time.sleep(0.5)
-                        rohwerte = []
-                        for _ in range(10):  # 10 Messungen für Durchschnitt
-                            rohwert = sensor.hx.read()
-                            rohwerte.append(rohwert)
-                            time.sleep(0.1)
-                        
-                        durchschnitt = sum(rohwerte) / len(rohwerte)
-                        
-                        # Kalibrierfaktor berechnen
-                        if durchschnitt != self.tara_werte[i]:
-                            # Pro Sensor 1/4 des Gesamtgewichts angenommen
-                            erwarteter_wert = self.referenz_gewicht / 4.0
-                            self.kalibrier_faktoren[i] = erwarteter_wert / (durchschnitt - self.tara_werte[i])
-                            success_count += 1
-                            
-                            logger.info(f"Sensor {i}: Faktor = {self.kalibrier_faktoren[i]:.6f}")
-                        
-                    except Exception as sensor_err:
-                        logger.error(f"Kalibrierung Sensor {i} fehlgeschlagen: {sensor_err}")
-                
-                success = success_count >= 3  # Mindestens 3 von 4 Sensoren erfolgreich
-                
+            weight_manager = get_weight_manager()
+            if weight_manager.is_acquiring:
+                # Alle 4 Zellen aus dem gepufferten Sample-Strom (ein Settle-Fenster)
+                self.set_kalibrierungs_buttons_aktiv(False)
+                future = weight_manager.calibrate_async(self.referenz_gewicht, timeout=3.0, persist=False)
+                future.add_done_callback(lambda f: self._kalibrierung_fertig.emit(self._future_ergebnis(f)))
             else:
                 # Simulation
                 self.kalibrier_faktoren = [0.1, 0.1, 0.1, 0.1]  # Beispielwerte
-                success = True
-            
-            if success:
-                self.kalibrierung_schritt = 2
-                self.update_status("ERFOLG: Kalibrierung erfolgreich - bereit für Test")
-                QMessageBox.information(self, "Kalibrierung", "Kalibrierung erfolgreich abgeschlossen!")
-            else:
-                self.update_status("FEHLER: Kalibrierung fehlgeschlagen")
-                QMessageBox.critical(self, "Fehler", "Kalibrierung konnte nicht durchgeführt werden!")
-            
-            # Live-Updates wieder starten
-            if was_running:
-                self.start_live_updates()
-            
-            self.update_kalibrierungs_buttons()
+                self.kalibrierung_abgeschlossen_intern(CalibrationResult(True, "Simulation"))
             
         except Exception as e:
             logger.error(f"Kalibrierungs-Fehler: {e}")
@@ -975,8 +784,10 @@ class WaagenKalibrierung(BaseViewWidget):
             )
             
             # Gewicht messen
-            if HX711_AVAILABLE and hx_sensors:
-                gemessenes_gewicht = lese_gewicht_hx711()
+            weight_manager = get_weight_manager()
+            if weight_manager.is_acquiring:
+                stabil = weight_manager.get_stable_weight()
+                gemessenes_gewicht = stabil.value if stabil else weight_manager.read_weight()
             else:
                 # Simulation: Zufällige Abweichung
                 import random
@@ -1024,26 +835,18 @@ Status: {'BESTANDEN' if toleranz_ok else 'NICHT BESTANDEN'}
                 QMessageBox.warning(self, "Warnung", "Keine Kalibrierungswerte zum Speichern vorhanden!")
                 return
             
-            # In Settings speichern
-            if hasattr(self.settings_manager, 'calibration'):
-                cal_data = self.settings_manager.calibration
-                
-                # Werte setzen
-                cal_data.tare_values = self.tara_werte
-                cal_data.scale_factors = self.kalibrier_faktoren
-                cal_data.last_reference_weight = self.referenz_gewicht
-                cal_data.calibration_date = datetime.now().isoformat()
-                cal_data.is_valid = True
-                
-                # Speichern
-                if self.settings_manager.save_settings():
-                    self.update_status("GESPEICHERT: Kalibrierungswerte erfolgreich gespeichert")
-                    QMessageBox.information(self, "Gespeichert", "Kalibrierungswerte wurden erfolgreich gespeichert!")
-                    
-                    # Signal senden
-                    self.kalibrierung_abgeschlossen.emit(True)
-                else:
-                    raise Exception("Settings konnten nicht gespeichert werden")
+            if self.kalibrier_quelle in (None, SENSOR_CALIBRATION):
+                raise Exception("Keine Gewichtsquelle aktiv - Kalibrierung nicht speicherbar")
+            
+            # Über den WeightManager speichern: landet bei der Quelle, auf der kalibriert wurde
+            # (source_calibrations), und gilt nach dem Neustart weiter
+            get_weight_manager().set_calibration(self.tara_werte, self.kalibrier_faktoren,
+                                                 persist=True, source=self.kalibrier_quelle)
+            self.update_status(f"GESPEICHERT: Kalibrierungswerte für {self.kalibrier_quelle} gespeichert")
+            QMessageBox.information(self, "Gespeichert", "Kalibrierungswerte wurden erfolgreich gespeichert!")
+            
+            # Signal senden
+            self.kalibrierung_abgeschlossen.emit(True)
             
         except Exception as e:
             logger.error(f"Speichern-Fehler: {e}")
@@ -1064,6 +867,7 @@ Status: {'BESTANDEN' if toleranz_ok else 'NICHT BESTANDEN'}
                 self.kalibrierung_schritt = 0
                 self.tara_werte = [0.0, 0.0, 0.0, 0.0]
                 self.kalibrier_faktoren = [1.0, 1.0, 1.0, 1.0]
+                get_weight_manager().set_calibration(self.tara_werte, self.kalibrier_faktoren, persist=False)
                 
                 # UI aktualisieren
                 self.update_status("ZURÜCKGESETZT: Kalibrierung zurückgesetzt - bitte neu durchführen")
@@ -1177,54 +981,18 @@ Status: {'BESTANDEN' if toleranz_ok else 'NICHT BESTANDEN'}
             # Status für jede Zelle prüfen
             zell_status = [False, False, False, False]  # Default: nicht gefunden
             
-            if ESP8266_AVAILABLE:
-                # ESP8266 Status direkt abfragen
-                test_ips = ["192.168.4.1", "192.168.2.20"]
-                
-                for ip in test_ips:
-                    try:
-                        url = f"http://{ip}/live-values-data"
-                        req = urllib.request.Request(url, headers={'User-Agent': 'Futterkarre-Pi5'})
-                        
-                        with urllib.request.urlopen(req, timeout=3) as response:
-                            data = json.loads(response.read().decode('utf-8'))
-                            
-                            # Raw-Werte direkt prüfen (nicht konvertiert)
-                            raw_values = [
-                                data.get('vl_value', 0),  # VL
-                                data.get('vr_value', 0),  # VR  
-                                data.get('hl_value', 0),  # HL
-                                data.get('hr_value', 0)   # HR
-                            ]
-                            
-                            for i, raw_val in enumerate(raw_values):
-                                try:
-                                    val = float(raw_val)
-                                    # HX711 ist angeschlossen wenn Raw-Wert > 1000 (echte Messung, kein Rauschen)
-                                    # Kleine Werte können Rauschen/Drift sein
-                                    if abs(val) > 1000:
-                                        zell_status[i] = True
-                                    logger.info(f"HX711-{i} ({zell_namen[i]}): Raw={val:.0f} → {'✅ ANGESCHLOSSEN' if zell_status[i] else '❌ NICHT ANGESCHLOSSEN'}")
-                                except (ValueError, TypeError):
-                                    logger.warning(f"HX711-{i}: Ungültiger Wert '{raw_val}'")
-                                    zell_status[i] = False
-                            
-                            # Erfolgreich - ESP8266 gefunden
-                            logger.info(f"ESP8266 unter {ip} gefunden - Status: {sum(zell_status)}/4 HX711 aktiv")
-                            break
-                            
-                    except urllib.error.URLError:
-                        logger.debug(f"ESP8266 unter {ip} nicht erreichbar")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"ESP8266 {ip} Fehler: {e}")
-                        continue
-                else:
-                    logger.warning("Kein ESP8266 unter bekannten IPs erreichbar")
+            # Zell-Zustand aus der Zell-Überwachung des WeightManagers
+            # (gilt für jede Gewichtsquelle, keine eigene Netzwerk-Abfrage)
+            weight_manager = get_weight_manager()
+            status = weight_manager.get_status()
+            if weight_manager.hardware_ready:
+                for i, zelle in enumerate(status.get('cells', [])[:4]):
+                    zell_status[i] = not zelle['excluded']
+                    logger.info(f"HX711-{i} ({zell_namen[i]}): "
+                                f"{'✅ ANGESCHLOSSEN' if zell_status[i] else '❌ AUSGEFALLEN (' + str(zelle['reason']) + ')'}")
+                logger.info(f"Gewichtsquelle {status.get('sensor')}: {sum(zell_status)}/4 HX711 aktiv")
             else:
-                logger.warning("ESP8266 nicht verfügbar - simuliere HX711-Status")
-                # Simulation: 2 von 4 Zellen "gefunden"
-                zell_status = [True, True, False, False]
+                logger.warning(f"Keine Gewichtsquelle bereit: {status.get('hardware_message')}")
             
             # UI-Status-LEDs aktualisieren
             self.update_hx711_status_leds(zell_status, zell_namen)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Kompaktes Binärformat für Gewichtsdaten der ESP32-Waage
+
+Im JSON-Modus schickt der ESP32 pro Messung ein eigenes Objekt
+(~150 Byte Text, ein json.loads() pro Sample). Im Binärmodus sammelt er
+N Samples und sendet sie als ein WebSocket-Binärframe:
+
+    Header (16 Byte, little-endian):
+        magic      2s   b"FK"
+        version    u8   FRAME_VERSION
+        cells      u8   Zellen pro Sample (4)
+        count      u16  Anzahl Samples
+        sequence   u16  Frame-Zähler (Lücken = verlorene Frames)
+        base_ms    u32  millis() des ersten Samples
+        battery_mv u16  Akkuspannung in mV
+        rssi       i8   WLAN-Signal in dBm
+        reserved   u8
+
+    Pro Sample (2 + 4 * cells Byte):
+        dt_ms      u16  Abstand zu base_ms
+        cells      f32[cells]  Zellgewichte in kg
+
+Ein Frame mit 5 Samples à 4 Zellen hat 106 Byte statt ~750 Byte JSON.
+decode_frame() kopiert die Samples nicht: die Zellwerte sind eine
+NumPy-Sicht direkt auf den empfangenen Puffer.
+
+Ausgehandelt wird das Format per Kommando
+    {"command": "set_format", "format": "binary", "batch": 5}
+Antwortet die Firmware nicht mit "success", bleibt es bei JSON.
+"""
+
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+FRAME_MAGIC = b"FK"
+FRAME_VERSION = 1
+HEADER = struct.Struct("<2sBBHHIHbx")
+DEFAULT_BATCH = 5      # Samples pro Frame (10 Hz Messrate -> 2 Frames/s)
+MAX_BATCH = 32         # Puffergröße in der Firmware
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class FrameFormatError(ValueError):
+    """Binärframe ist beschädigt oder hat ein unbekanntes Format"""
+
+
+@lru_cache(maxsize=8)
+def sample_dtype(cells: int = 4) -> np.dtype:
+    """NumPy-Datentyp eines Samples (gepackt, little-endian)"""
+    return np.dtype([('dt_ms', '<u2'), ('cells', '<f4', (cells,))])
+
+
+@dataclass(frozen=True)
+class BinaryFrame:
+    """Dekodierter Binärframe - samples ist eine Sicht auf den Empfangspuffer"""
+    sequence: int
+    base_ms: int
+    battery_v: float
+    wifi_rssi: int
+    samples: np.ndarray        # strukturiert: dt_ms, cells
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Zellgewichte (N, cells) in kg - ohne Kopie"""
+        return self.samples['cells']
+
+    @property
+    def timestamps_ms(self) -> np.ndarray:
+        """ESP32-Zeitstempel (millis) jedes Samples"""
+        return self.base_ms + self.samples['dt_ms'].astype(np.uint32)
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Gesamtgewicht pro Sample in kg"""
+        return self.cells.sum(axis=1, dtype=np.float64)
+
+
+def decode_frame(data: Buffer) -> BinaryFrame:
+    """
+    Binärframe dekodieren
+
+    Raises:
+        FrameFormatError: Falsche Kennung/Version oder Länge passt nicht
+    """
+    view = memoryview(data)
+    if view.nbytes < HEADER.size:
+        raise FrameFormatError(f"Frame zu kurz ({view.nbytes} Byte)")
+
+    magic, version, cells, count, sequence, base_ms, battery_mv, rssi = HEADER.unpack_from(view)
+    if magic != FRAME_MAGIC:
+        raise FrameFormatError(f"Unbekannte Frame-Kennung {magic!r}")
+    if version != FRAME_VERSION:
+        raise FrameFormatError(f"Frame-Version {version} wird nicht unterstützt")
+    if cells == 0:
+        raise FrameFormatError("Frame ohne Zellen")
+
+    dtype = sample_dtype(cells)
+    expected = HEADER.size + count * dtype.itemsize
+    if view.nbytes != expected:
+        raise FrameFormatError(f"Frame-Länge {view.nbytes} statt {expected} Byte")
+
+    samples = np.frombuffer(view, dtype=dtype, count=count, offset=HEADER.size)
+    return BinaryFrame(sequence=sequence, base_ms=base_ms, battery_v=battery_mv / 1000.0,
+                       wifi_rssi=rssi, samples=samples)
+
+
+def encode_frame(cells: Sequence[Sequence[float]], timestamps_ms: Sequence[int], sequence: int = 0,
+                 battery_v: float = 0.0, wifi_rssi: int = 0) -> bytes:
+    """
+    Binärframe erzeugen (Gegenstück zur Firmware, für Tests und Simulation)
+
+    Args:
+        cells: Zellgewichte (N, Zellen) in kg
+        timestamps_ms: millis() je Sample, aufsteigend
+    """
+    values = np.asarray(cells, dtype=np.float32)
+    if values.ndim != 2 or len(values) != len(timestamps_ms):
+        raise ValueError("cells muss (N, Zellen) sein und zu timestamps_ms passen")
+
+    stamps = np.asarray(timestamps_ms, dtype=np.int64)
+    base_ms = int(stamps[0]) if len(stamps) else 0
+    samples = np.empty(len(values), dtype=sample_dtype(values.shape[1]))
+    samples['dt_ms'] = stamps - base_ms
+    samples['cells'] = values
+
+    header = HEADER.pack(FRAME_MAGIC, FRAME_VERSION, values.shape[1], len(values), sequence & 0xFFFF,
+                         base_ms & 0xFFFFFFFF, int(round(battery_v * 1000)), int(wifi_rssi))
+    return header + samples.tobytes()
+
+
+def lost_frames(previous: Optional[int], sequence: int) -> int:
+    """Anzahl verlorener Frames zwischen zwei Sequenznummern (mit Überlauf)"""
+    if previous is None:
+        return 0
+    return (sequence - previous - 1) & 0xFFFF
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Zuletzt bekannte Waage über Programmstarts hinweg merken
+
+ESP8266Discovery hielt die gefundene IP nur im Speicher - jeder Start und
+jede neue Instanz suchte von vorne. Hier werden IP, Modus, Zeitpunkt und
+gemessene Antwortzeit in config/esp8266_device.json abgelegt. Beim Start
+genügt dann eine schnelle Probe auf diese Adresse; nur wenn sie scheitert,
+läuft die volle Discovery.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEVICE_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 'config', 'esp8266_device.json')
+
+
+@dataclass(frozen=True)
+class KnownDevice:
+    """Zuletzt erreichte Waage"""
+    ip: str
+    mode: str           # "stall" oder "haus"
+    last_seen: float    # Unix-Zeit der letzten erfolgreichen Verbindung
+    rtt: float          # Antwortzeit der letzten Probe in Sekunden
+
+
+class PersistentDeviceCache:
+    """
+    JSON-Datei mit genau einem Eintrag (der zuletzt erreichten Waage)
+
+    Schreibzugriffe sind atomar (temporäre Datei + os.replace), damit ein
+    Stromausfall auf dem Pi keine halbe Datei hinterlässt.
+    """
+
+    def __init__(self, path: str = DEVICE_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[KnownDevice]:
+        """Gespeicherte Waage oder None (fehlende/beschädigte Datei)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return KnownDevice(ip=str(data['ip']), mode=str(data['mode']),
+                               last_seen=float(data.get('last_seen', 0.0)),
+                               rtt=float(data.get('rtt', 0.0)))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Geräte-Cache {self.path} unlesbar - wird ignoriert: {e}")
+            return None
+
+    def save(self, ip: str, mode: str, rtt: float = 0.0) -> KnownDevice:
+        """Speichert die gerade erreichte Waage"""
+        device = KnownDevice(ip=ip, mode=mode, last_seen=time.time(), rtt=rtt)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(asdict(device), f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error(f"Geräte-Cache konnte nicht gespeichert werden: {e}")
+        return device
+
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"Geräte-Cache konnte nicht gelöscht werden: {e}")
+
+
+# Globale Instanz - späte Initialisierung
+_device_cache_instance: Optional[PersistentDeviceCache] = None
+
+def get_device_cache() -> PersistentDeviceCache:
+    """Gibt den gemeinsamen Geräte-Cache zurück (Lazy Loading)"""
+    global _device_cache_instance
+    if _device_cache_instance is None:
+        _device_cache_instance = PersistentDeviceCache()
+    return _device_cache_instance
@@ -9,7 +9,7 @@
  * 
  * Features:
  * - WiFi Kommunikation mit Pi5
- * - JSON WebSocket Protokoll  
+ * - JSON WebSocket Protokoll (optional kompakte Binärframes, siehe wireless/binary_frames.py)
  * - 4-Punkt Gewichtsmessung
  * - Akku-Monitoring
  * - Deep Sleep Power-Management
@@ -94,7 +94,58 @@ CalibrationData calibration;
 bool wifiConnected = false;
 bool systemReady = false;
 unsigned long lastMeasurement = 0;
+unsigned long lastJsonSend = 0;
 const unsigned long MEASUREMENT_INTERVAL = 500; // 500ms = 2Hz
+const unsigned long BINARY_SAMPLE_INTERVAL = 100; // 100ms = 10Hz, sobald ein Client Binärframes will
+
+// =================== BINÄRFRAMES ===================
+// Layout muss zu wireless/binary_frames.py passen (little-endian, gepackt)
+
+#define FRAME_VERSION 1
+#define MAX_BATCH 32
+
+struct __attribute__((packed)) FrameHeader {
+  char magic[2];        // "FK"
+  uint8_t version;
+  uint8_t cells;
+  uint16_t count;
+  uint16_t sequence;
+  uint32_t base_ms;
+  uint16_t battery_mv;
+  int8_t rssi;
+  uint8_t reserved;
+};
+
+struct __attribute__((packed)) FrameSample {
+  uint16_t dt_ms;
+  float cells[4];
+};
+
+uint32_t binaryClients = 0;     // Bitmaske: Clients, die Binärframes empfangen
+uint8_t binaryBatch = 5;        // Samples pro Frame
+FrameSample batchSamples[MAX_BATCH];
+uint8_t batchCount = 0;
+uint32_t batchBase = 0;
+uint16_t frameSequence = 0;
+
+// =================== LANGE KOMMANDOS ===================
+// Tare/Kalibrierung messen mehrere Sekunden. Sie laufen nicht im
+// WebSocket-Callback, sondern aus loop() heraus, und rufen zwischen den
+// Einzelmessungen webSocket.loop() auf - so beantwortet der ESP32 weiter
+// Pings und der Pi hält die Verbindung nicht für tot.
+
+#define CALIBRATION_READINGS 10
+
+struct PendingCommand {
+  bool active = false;
+  bool isTare = true;
+  uint8_t clientNum = 0;
+  long requestId = -1;
+  float weight = 0.0;
+};
+
+PendingCommand pendingCommand;
+bool commandRunning = false;
 
 // =================== SETUP ===================
 
@@ -125,11 +176,25 @@ void loop() {
   // WebSocket Events verarbeiten
   webSocket.loop();
   
-  // Periodische Gewichtsmessung
-  if (millis() - lastMeasurement >= MEASUREMENT_INTERVAL) {
-    measureWeight();
-    sendWeightData();
+  // Tare/Kalibrierung außerhalb des WebSocket-Callbacks ausführen
+  if (pendingCommand.active) {
+    runPendingCommand();
+  }
+  
+  // Periodische Gewichtsmessung - schneller, wenn Binärframes gesammelt werden
+  unsigned long interval = binaryClients ? BINARY_SAMPLE_INTERVAL : MEASUREMENT_INTERVAL;
+  if (millis() - lastMeasurement >= interval) {
+    // Im Binärmodus Einzelwerte - gemittelt wird auf dem Pi
+    measureWeight(binaryClients ? 1 : 3);
     lastMeasurement = millis();
+    
+    if (binaryClients) {
+      appendSample();
+    }
+    if (millis() - lastJsonSend >= MEASUREMENT_INTERVAL) {
+      sendWeightData();
+      lastJsonSend = millis();
+    }
   }
   
   // WiFi-Status überwachen
@@ -228,6 +293,7 @@ void webSocketEvent(uint8_t num, WStype_t type, uint8_t * payload, size_t length
   switch(type) {
     case WStype_DISCONNECTED:
       Serial.printf("👋 Client #%u getrennt\n", num);
+      binaryClients &= ~(1UL << num);
       break;
       
     case WStype_CONNECTED: {
@@ -261,40 +327,54 @@ void handleWebSocketMessage(uint8_t clientNum, String message) {
   }
   
   String command = doc["command"];
+  long requestId = doc["id"] | -1L;  // Vom Pi vergeben, wird in der Antwort zurückgeschickt
   
   // Kommandos verarbeiten
-  if (command == "tare") {
-    performTare();
-    sendResponse(clientNum, "tare", "success", "Waage genullt");
-    
-  } else if (command == "calibrate") {
-    float knownWeight = doc["weight"];
-    performCalibration(knownWeight);
-    sendResponse(clientNum, "calibrate", "success", "Kalibrierung abgeschlossen");
+  if (command == "tare" || command == "calibrate") {
+    if (pendingCommand.active || commandRunning) {
+      sendResponse(clientNum, command, "error", "Anderes Kommando läuft noch", requestId);
+      return;
+    }
+    // Antwort folgt aus runPendingCommand(), sobald die Messung fertig ist
+    pendingCommand.active = true;
+    pendingCommand.isTare = (command == "tare");
+    pendingCommand.clientNum = clientNum;
+    pendingCommand.requestId = requestId;
+    pendingCommand.weight = doc["weight"] | 0.0;
     
   } else if (command == "get_status") {
-    sendStatusData(clientNum);
+    sendStatusData(clientNum, requestId);
+    
+  } else if (command == "set_format") {
+    String format = doc["format"] | "json";
+    if (format == "binary") {
+      binaryClients |= (1UL << clientNum);
+      binaryBatch = constrain((int)(doc["batch"] | 5), 1, MAX_BATCH);
+    } else {
+      binaryClients &= ~(1UL << clientNum);
+    }
+    sendResponse(clientNum, "set_format", "success", format, requestId);
     
   } else if (command == "deep_sleep") {
-    sendResponse(clientNum, "deep_sleep", "success", "Gehe in Deep Sleep...");
+    sendResponse(clientNum, "deep_sleep", "success", "Gehe in Deep Sleep...", requestId);
     delay(100);  // Message senden lassen
     enterDeepSleep();
     
   } else {
-    sendResponse(clientNum, command, "error", "Unbekanntes Kommando");
+    sendResponse(clientNum, command, "error", "Unbekanntes Kommando", requestId);
   }
 }
 
 // =================== GEWICHTSMESSUNG ===================
 
-void measureWeight() {
+void measureWeight(int readings) {
   if (!systemReady) return;
   
   // Alle 4 Ecken messen
-  if (scale_1.is_ready()) currentWeight.corner_1 = scale_1.get_units(3);
-  if (scale_2.is_ready()) currentWeight.corner_2 = scale_2.get_units(3);
-  if (scale_3.is_ready()) currentWeight.corner_3 = scale_3.get_units(3);
-  if (scale_4.is_ready()) currentWeight.corner_4 = scale_4.get_units(3);
+  if (scale_1.is_ready()) currentWeight.corner_1 = scale_1.get_units(readings);
+  if (scale_2.is_ready()) currentWeight.corner_2 = scale_2.get_units(readings);
+  if (scale_3.is_ready()) currentWeight.corner_3 = scale_3.get_units(readings);
+  if (scale_4.is_ready()) currentWeight.corner_4 = scale_4.get_units(readings);
   
   // Gesamt-Gewicht berechnen
   currentWeight.total = currentWeight.corner_1 + currentWeight.corner_2 + 
@@ -307,6 +387,49 @@ void measureWeight() {
   currentWeight.timestamp = millis();
 }
 
+void appendSample() {
+  if (batchCount == 0) batchBase = currentWeight.timestamp;
+  
+  FrameSample& sample = batchSamples[batchCount++];
+  sample.dt_ms = currentWeight.timestamp - batchBase;
+  sample.cells[0] = currentWeight.corner_1;
+  sample.cells[1] = currentWeight.corner_2;
+  sample.cells[2] = currentWeight.corner_3;
+  sample.cells[3] = currentWeight.corner_4;
+  
+  if (batchCount >= binaryBatch) {
+    sendBinaryFrame();
+  }
+}
+
+void sendBinaryFrame() {
+  static uint8_t buffer[sizeof(FrameHeader) + MAX_BATCH * sizeof(FrameSample)];
+  
+  FrameHeader header;
+  header.magic[0] = 'F';
+  header.magic[1] = 'K';
+  header.version = FRAME_VERSION;
+  header.cells = 4;
+  header.count = batchCount;
+  header.sequence = frameSequence++;
+  header.base_ms = batchBase;
+  header.battery_mv = (uint16_t)(currentWeight.battery * 1000);
+  header.rssi = (int8_t)WiFi.RSSI();
+  header.reserved = 0;
+  
+  size_t length = sizeof(FrameHeader) + batchCount * sizeof(FrameSample);
+  memcpy(buffer, &header, sizeof(FrameHeader));
+  memcpy(buffer + sizeof(FrameHeader), batchSamples, batchCount * sizeof(FrameSample));
+  batchCount = 0;
+  
+  if (!wifiConnected) return;
+  for (uint8_t num = 0; num < WEBSOCKETS_SERVER_CLIENT_MAX; num++) {
+    if (binaryClients & (1UL << num)) {
+      webSocket.sendBIN(num, buffer, length);
+    }
+  }
+}
+
 void sendWeightData() {
   if (!wifiConnected) return;
   
@@ -325,21 +448,55 @@ void sendWeightData() {
   doc["battery_v"] = round(currentWeight.battery * 100) / 100.0;
   doc["wifi_rssi"] = WiFi.RSSI();
   
-  // An alle Clients senden
+  // An alle Clients ohne Binärframes senden
   String jsonString;
   serializeJson(doc, jsonString);
-  webSocket.broadcastTXT(jsonString);
+  if (!binaryClients) {
+    webSocket.broadcastTXT(jsonString);
+    return;
+  }
+  for (uint8_t num = 0; num < WEBSOCKETS_SERVER_CLIENT_MAX; num++) {
+    if (!(binaryClients & (1UL << num)) && webSocket.clientIsConnected(num)) {
+      webSocket.sendTXT(num, jsonString);
+    }
+  }
 }
 
 // =================== KALIBRIERUNG ===================
 
+void runPendingCommand() {
+  PendingCommand cmd = pendingCommand;
+  pendingCommand.active = false;
+  commandRunning = true;
+  
+  if (cmd.isTare) {
+    performTare();
+    sendResponse(cmd.clientNum, "tare", "success", "Waage genullt", cmd.requestId);
+  } else {
+    performCalibration(cmd.weight);
+    sendResponse(cmd.clientNum, "calibrate", "success", "Kalibrierung abgeschlossen", cmd.requestId);
+  }
+  
+  commandRunning = false;
+}
+
+long readAveragePumped(HX711 &scale, byte times) {
+  // Wie HX711::read_average(), aber WebSocket bleibt zwischen den Messungen bedient
+  long sum = 0;
+  for (byte i = 0; i < times; i++) {
+    sum += scale.read();
+    webSocket.loop();
+  }
+  return sum / times;
+}
+
 void performTare() {
   Serial.println("🎯 Waage wird genullt (Tare)...");
   
-  scale_1.tare();
-  scale_2.tare();
-  scale_3.tare();
-  scale_4.tare();
+  scale_1.set_offset(readAveragePumped(scale_1, CALIBRATION_READINGS));
+  scale_2.set_offset(readAveragePumped(scale_2, CALIBRATION_READINGS));
+  scale_3.set_offset(readAveragePumped(scale_3, CALIBRATION_READINGS));
+  scale_4.set_offset(readAveragePumped(scale_4, CALIBRATION_READINGS));
   
   // Neue Offsets speichern
   calibration.scale_1_offset = scale_1.get_offset();
@@ -356,10 +513,10 @@ void performCalibration(float knownWeight) {
   Serial.printf("📏 Kalibrierung mit %0.2f kg...\n", knownWeight);
   
   // Mehrere Messungen für Genauigkeit
-  long raw_1 = scale_1.get_value(10);
-  long raw_2 = scale_2.get_value(10);
-  long raw_3 = scale_3.get_value(10);
-  long raw_4 = scale_4.get_value(10);
+  long raw_1 = readAveragePumped(scale_1, CALIBRATION_READINGS) - scale_1.get_offset();
+  long raw_2 = readAveragePumped(scale_2, CALIBRATION_READINGS) - scale_2.get_offset();
+  long raw_3 = readAveragePumped(scale_3, CALIBRATION_READINGS) - scale_3.get_offset();
+  long raw_4 = readAveragePumped(scale_4, CALIBRATION_READINGS) - scale_4.get_offset();
   
   // Neue Kalibrierungs-Faktoren berechnen
   // Annahme: Gewicht gleichmäßig auf alle 4 Ecken verteilt
@@ -515,17 +672,18 @@ void sendWelcomeMessage(uint8_t clientNum) {
   doc["type"] = "welcome";
   doc["device"] = DEVICE_NAME;
   doc["version"] = "1.0";
-  doc["features"] = "4x HX711, WiFi, Battery, Deep Sleep";
+  doc["features"] = "4x HX711, WiFi, Battery, Deep Sleep, Binary Frames";
   
   String jsonString;
   serializeJson(doc, jsonString);
   webSocket.sendTXT(clientNum, jsonString);
 }
 
-void sendResponse(uint8_t clientNum, String command, String status, String message) {
-  StaticJsonDocument<150> doc;
+void sendResponse(uint8_t clientNum, String command, String status, String message, long requestId) {
+  StaticJsonDocument<200> doc;
   doc["type"] = "response";
   doc["command"] = command;
+  if (requestId >= 0) doc["id"] = requestId;
   doc["status"] = status;
   doc["message"] = message;
   doc["timestamp"] = millis();
@@ -535,9 +693,10 @@ void sendResponse(uint8_t clientNum, String command, String status, String messa
   webSocket.sendTXT(clientNum, jsonString);
 }
 
-void sendStatusData(uint8_t clientNum) {
+void sendStatusData(uint8_t clientNum, long requestId) {
   StaticJsonDocument<300> doc;
   doc["type"] = "status";
+  if (requestId >= 0) doc["id"] = requestId;
   doc["uptime_ms"] = millis();
   doc["wifi_connected"] = wifiConnected;
   doc["wifi_rssi"] = WiFi.RSSI();
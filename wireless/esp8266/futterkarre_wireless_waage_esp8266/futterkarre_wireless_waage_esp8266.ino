@@ -36,6 +36,7 @@
 
 #include <ESP8266WiFi.h>
 #include <ESP8266WebServer.h>
+#include <WiFiUdp.h>
 #include <WebSocketsServer.h>
 #include <ArduinoJson.h>
 #include <HX711.h>
@@ -57,6 +58,10 @@ int current_wifi_mode; // 0 = AP Mode, 1 = Station Mode
 WebSocketsServer webSocket = WebSocketsServer(81);
 ESP8266WebServer httpServer(80);
 
+// UDP-Discovery (Pi sendet Broadcast, Waage antwortet mit IP/Modus)
+const uint16_t DISCOVERY_PORT = 4210;
+WiFiUDP discoveryUdp;
+
 // HX711 Pin-Definitionen (ESP8266 NodeMCU)
 #define HX711_1_CLK  5   // D1
 #define HX711_1_DT   4   // D2
@@ -146,6 +151,10 @@ void setup() {
   httpServer.begin();
   Serial.println("🌐 HTTP-Server gestartet (Port 80)");
   
+  // Discovery-Responder starten
+  discoveryUdp.begin(DISCOVERY_PORT);
+  Serial.printf("📣 Discovery aktiv (UDP %u)\n", DISCOVERY_PORT);
+  
   // Bereit-Signal
   blinkLED(LED_POWER, 3, 200);
   Serial.println("✅ System bereit!");
@@ -384,6 +393,9 @@ void loop() {
   // HTTP-Server verarbeiten
   httpServer.handleClient();
   
+  // Discovery-Anfragen beantworten
+  handleDiscovery();
+  
   // WiFi-Verbindung prüfen
   checkWiFiConnection();
   
@@ -415,6 +427,48 @@ void loop() {
   delay(10);
 }
 
+// =================== UDP DISCOVERY ===================
+
+void handleDiscovery() {
+  int packetSize = discoveryUdp.parsePacket();
+  if (packetSize <= 0) return;
+  
+  char buffer[256];
+  int len = discoveryUdp.read(buffer, sizeof(buffer) - 1);
+  if (len <= 0) return;
+  buffer[len] = 0;
+  
+  JsonDocument query;
+  if (deserializeJson(query, buffer)) return;
+  if (strcmp(query["type"] | "", "futterkarre_discover") != 0) return;
+  
+  // Anfrage aus dem Stall-Netz (192.168.4.x) -> AP-IP melden, sonst Heimnetz-IP
+  IPAddress remote = discoveryUdp.remoteIP();
+  IPAddress ap = WiFi.softAPIP();
+  bool stall = remote[0] == ap[0] && remote[1] == ap[1] && remote[2] == ap[2];
+  
+  JsonDocument reply;
+  reply["type"] = "futterkarre_announce";
+  reply["nonce"] = query["nonce"];
+  reply["device_name"] = DEVICE_NAME;
+  reply["device_id"] = String(ESP.getChipId(), HEX);
+  reply["firmware_version"] = FIRMWARE_VERSION;
+  reply["ip"] = stall ? ap.toString() : WiFi.localIP().toString();
+  reply["mode"] = stall ? "stall" : "haus";
+  reply["http_port"] = 80;
+  reply["ws_port"] = 81;
+  JsonArray capabilities = reply["capabilities"].to<JsonArray>();
+  capabilities.add("http");
+  capabilities.add("websocket");
+  capabilities.add("live-values");
+  
+  String response;
+  serializeJson(reply, response);
+  discoveryUdp.beginPacket(remote, discoveryUdp.remotePort());
+  discoveryUdp.write((const uint8_t*)response.c_str(), response.length());
+  discoveryUdp.endPacket();
+}
+
 // =================== WEBSOCKET HANDLER ===================
 
 void webSocketEvent(uint8_t num, WStype_t type, uint8_t * payload, size_t length) {
@@ -12,9 +12,11 @@ import json
 import logging
 from typing import Optional, Tuple
 import time
-import urllib.request
-import urllib.error
-import socket
+
+from wireless.http_client import get_http_client
+from wireless.subnet_scan import probe_status, scan_for_esp8266
+from wireless.udp_discovery import get_udp_discovery
+from wireless.device_cache import PersistentDeviceCache, get_device_cache
 
 # Websockets optional - fallback für Entwicklung
 try:
@@ -26,8 +28,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Heimnetz-Bereich für den Haus-Modus (CIDR oder "a.b.c.x-y")
+HAUS_NETWORK = "192.168.2.100-199"
+
 class ESP8266Discovery:
-    def __init__(self):
+    def __init__(self, haus_network: str = HAUS_NETWORK,
+                 device_cache: Optional[PersistentDeviceCache] = None):
+        self.haus_network = haus_network
+        self.device_cache = device_cache or get_device_cache()
         self.esp8266_ip = None
         self.connection_mode = None
         self.last_scan_time = 0
@@ -36,50 +44,68 @@ class ESP8266Discovery:
         """
         Findet ESP8266 in beiden Modi
         
+        Reihenfolge: In-Memory-Cache (30 s) -> Probe auf die zuletzt bekannte
+        Waage (persistiert) -> UDP-Discovery -> Stall-IP -> Heimnetz-Scan.
+        force_rescan überspringt nur den In-Memory-Cache; die Probe prüft
+        die gespeicherte Adresse ohnehin live.
+        
         Returns:
             (ip, mode) oder None falls nicht gefunden
             mode: "stall" oder "haus"
         """
-        # WebSockets-Check
-        if not WEBSOCKETS_AVAILABLE:
-            logger.warning("ESP8266Discovery: websockets-Modul fehlt")
-            return None
-            
         # Cache für 30 Sekunden
         if not force_rescan and time.time() - self.last_scan_time < 30:
             if self.esp8266_ip and self.connection_mode:
                 return (self.esp8266_ip, self.connection_mode)
         
+        # Zuletzt bekannte Waage: eine schnelle Probe statt voller Suche
+        known = self.device_cache.load()
+        if known:
+            started = time.monotonic()
+            if await probe_status(known.ip, connect_timeout=0.3, http_timeout=1.0):
+                logger.debug(f"ESP8266 unter bekannter Adresse {known.ip} erreichbar")
+                return self._remember(known.ip, known.mode, time.monotonic() - started)
+            logger.info(f"ESP8266 nicht mehr unter {known.ip} - starte Discovery")
+        
         logger.info("🔍 ESP8266 Auto-Discovery gestartet...")
         
+        # 0. UDP-Broadcast: eine Anfrage, die Waage meldet IP und Modus selbst
+        device = await asyncio.get_running_loop().run_in_executor(None, get_udp_discovery().find_scale)
+        if device:
+            logger.info(f"✅ ESP8266 gefunden: {device.ip} ({device.mode}-Modus, UDP-Discovery)")
+            return self._remember(device.ip, device.mode, device.rtt)
+        
         # 1. Prüfe Stall-Modus (Futterkarre_WiFi)
+        started = time.monotonic()
         stall_ip = await self.check_stall_mode()
         if stall_ip:
-            self.esp8266_ip = stall_ip
-            self.connection_mode = "stall"
-            self.last_scan_time = time.time()
             logger.info(f"✅ ESP8266 gefunden: {stall_ip} (Stall-Modus)")
-            return (stall_ip, "stall")
+            return self._remember(stall_ip, "stall", time.monotonic() - started)
         
         # 2. Prüfe Haus-Modus (Heimnetz)
         haus_ip = await self.check_haus_mode()
         if haus_ip:
-            self.esp8266_ip = haus_ip
-            self.connection_mode = "haus"
-            self.last_scan_time = time.time()
             logger.info(f"✅ ESP8266 gefunden: {haus_ip} (Haus-Modus)")
-            return (haus_ip, "haus")
+            return self._remember(haus_ip, "haus", 0.0)
         
         logger.warning("❌ ESP8266 nicht gefunden")
         return None
     
+    def _remember(self, ip: str, mode: str, rtt: float) -> Tuple[str, str]:
+        """Merkt sich die gefundene Waage im Speicher und auf der Platte"""
+        self.esp8266_ip = ip
+        self.connection_mode = mode
+        self.last_scan_time = time.time()
+        self.device_cache.save(ip, mode, rtt)
+        return (ip, mode)
+    
     async def check_stall_mode(self) -> Optional[str]:
         """Prüft ob Futterkarre_WiFi verfügbar ist"""
         try:
             # Prüfe ob wir mit Futterkarre_WiFi verbunden sind
             if await self.is_connected_to_futterkarre_wifi():
                 # Teste direkte Verbindung zu ESP8266 via HTTP
-                if self.test_http_status("192.168.4.1"):
+                if await probe_status("192.168.4.1", connect_timeout=1.0, http_timeout=3.0):
                     return "192.168.4.1"
             
             return None
@@ -91,16 +117,9 @@ class ESP8266Discovery:
     async def check_haus_mode(self) -> Optional[str]:
         """Scannt Heimnetz nach ESP8266"""
         try:
-            # Bestimme Heimnetz-Range
-            network_base = "192.168.2"  # Dein Heimnetz
-            
-            # Teste gängige ESP8266 IP-Bereiche mit HTTP
-            for i in range(100, 200):
-                ip = f"{network_base}.{i}"
-                if self.test_http_status(ip):
-                    return ip
-            
-            return None
+            # Paralleler Scan, erster Treffer gewinnt
+            result = await scan_for_esp8266(self.haus_network)
+            return result[0] if result else None
             
         except Exception as e:
             logger.debug(f"Haus-Modus Test Fehler: {e}")
@@ -109,10 +128,11 @@ class ESP8266Discovery:
     async def is_connected_to_futterkarre_wifi(self) -> bool:
         """Prüft ob Pi5 mit Futterkarre_WiFi verbunden ist"""
         try:
-            # Prüfe aktuelle WiFi-Verbindung
-            result = subprocess.run(['iwgetid', '-r'], 
-                                 capture_output=True, text=True, timeout=5)
-            current_ssid = result.stdout.strip()
+            # Prüfe aktuelle WiFi-Verbindung (ohne den Event-Loop zu blockieren)
+            process = await asyncio.create_subprocess_exec(
+                'iwgetid', '-r', stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5)
+            current_ssid = stdout.decode(errors='replace').strip()
             
             return current_ssid == "Futterkarre_WiFi"
             
@@ -122,21 +142,16 @@ class ESP8266Discovery:
     def test_http_status(self, ip: str, timeout: float = 3.0) -> Optional[dict]:
         """Testet HTTP /status API und gibt ESP8266-Status zurück"""
         try:
-            url = f"http://{ip}/status"
+            # Keep-Alive-Verbindung aus dem gemeinsamen Pool
+            data = get_http_client().get_json(ip, "/status", timeout=timeout)
             
-            # HTTP Request mit Timeout
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    
-                    # Prüfe ob es wirklich ein ESP8266 ist
-                    if data.get("device_name") == "FutterWaage_ESP8266":
-                        return data
+            # Prüfe ob es wirklich ein ESP8266 ist
+            if isinstance(data, dict) and data.get("device_name") == "FutterWaage_ESP8266":
+                return data
             
             return None
             
-        except (urllib.error.URLError, socket.timeout, json.JSONDecodeError):
+        except (OSError, ValueError):
             return None
     
     async def test_websocket(self, ip: str, timeout: float = 2.0) -> bool:
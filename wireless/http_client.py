@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Gemeinsamer HTTP-Client für die ESP8266-Waage
+
+Jeder urlopen-Aufruf baute bisher eine neue TCP-Verbindung auf - über das
+wackelige Stall-WLAN kostet der Handshake oft mehr als die Abfrage selbst.
+Der Client hält pro Gerät Keep-Alive-Verbindungen offen und verwendet sie
+modulübergreifend wieder (Discovery, Gewichtsquelle, Konfigurationsseite).
+
+- Deadline pro Anfrage: gilt für Verbindungsaufbau, Senden und Antwort zusammen
+- Eingeschlafene Verbindungen (ESP hat geschlossen) werden einmal mit
+  frischer Verbindung wiederholt
+- Alle Fehler sind OSError (Timeout = TimeoutError), JSON-Fehler ValueError
+"""
+
+import http.client
+import json
+import logging
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Futterkarre-Pi5'
+
+
+class HttpClientError(OSError):
+    """Protokollfehler oder unerwarteter HTTP-Status"""
+
+
+@dataclass
+class HttpResponse:
+    """Vollständig gelesene Antwort (die Verbindung ist bereits zurückgegeben)"""
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode('utf-8'))
+
+
+# Fehler, an denen eine wiederverwendete Verbindung als vom Gerät geschlossen erkannt wird
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+
+
+class DeviceHttpClient:
+    """
+    Verbindungs-Pool mit Keep-Alive pro Gerät (host:port)
+
+    Threadsicher: eine Verbindung gehört während einer Anfrage genau einem
+    Thread und wandert danach zurück in den Pool.
+
+    Args:
+        max_idle_per_host: Offen gehaltene Verbindungen pro Gerät
+        idle_timeout: Ältere ungenutzte Verbindungen werden verworfen
+            (der ESP8266-Webserver schließt Keep-Alive nach wenigen Sekunden)
+    """
+
+    def __init__(self, max_idle_per_host: int = 2, idle_timeout: float = 4.0):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[Tuple[str, int], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'errors': 0, 'connections_opened': 0,
+                       'connections_reused': 0, 'retries': 0}
+
+    def request(self, method: str, host: str, path: str, params: Optional[dict] = None,
+                body: Optional[bytes] = None, headers: Optional[dict] = None,
+                timeout: float = 5.0, port: int = 80) -> HttpResponse:
+        """
+        Führt eine Anfrage aus und liest die Antwort vollständig
+
+        Args:
+            host: IP oder Hostname des Geräts
+            path: Pfad inkl. führendem "/"
+            params: Query-Parameter
+            timeout: Deadline in Sekunden für die gesamte Anfrage
+
+        Returns:
+            HttpResponse (auch bei Status != 200)
+
+        Raises:
+            TimeoutError: Deadline überschritten
+            OSError: Netzwerk-/Protokollfehler
+        """
+        if params:
+            path = f"{path}?{urllib.parse.urlencode(params)}"
+        all_headers = {'User-Agent': USER_AGENT, 'Connection': 'keep-alive'}
+        all_headers.update(headers or {})
+
+        key = (host, port)
+        deadline = time.monotonic() + timeout
+        self._stats['requests'] += 1
+
+        conn, reused = self._acquire(key, deadline)
+        try:
+            try:
+                return self._send(key, conn, method, path, body, all_headers, deadline)
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                # Gerät hat die Keep-Alive-Verbindung inzwischen geschlossen
+                conn.close()
+                self._stats['retries'] += 1
+                conn = self._connect(key, deadline)
+                return self._send(key, conn, method, path, body, all_headers, deadline)
+        except http.client.HTTPException as e:
+            conn.close()
+            self._stats['errors'] += 1
+            raise HttpClientError(f"{host}{path}: {e}") from e
+        except OSError:
+            conn.close()
+            self._stats['errors'] += 1
+            raise
+
+    def get(self, host: str, path: str, params: Optional[dict] = None,
+            timeout: float = 5.0, port: int = 80) -> HttpResponse:
+        return self.request('GET', host, path, params=params, timeout=timeout, port=port)
+
+    def get_json(self, host: str, path: str, params: Optional[dict] = None,
+                 timeout: float = 5.0, port: int = 80) -> Any:
+        """GET mit JSON-Antwort; Status != 2xx wirft HttpClientError"""
+        response = self.get(host, path, params=params, timeout=timeout, port=port)
+        if not response.ok:
+            raise HttpClientError(f"{host}{path}: HTTP {response.status}")
+        return response.json()
+
+    def post_json(self, host: str, path: str, data: Any,
+                  timeout: float = 5.0, port: int = 80) -> HttpResponse:
+        body = json.dumps(data).encode('utf-8')
+        return self.request('POST', host, path, body=body, timeout=timeout, port=port,
+                            headers={'Content-Type': 'application/json'})
+
+    def _send(self, key: Tuple[str, int], conn: http.client.HTTPConnection, method: str,
+              path: str, body: Optional[bytes], headers: dict, deadline: float) -> HttpResponse:
+        self._set_timeout(conn, deadline)
+        conn.request(method, path, body=body, headers=headers)
+        self._set_timeout(conn, deadline)
+        response = conn.getresponse()
+        data = response.read()
+
+        result = HttpResponse(status=response.status, body=data,
+                              headers={k.lower(): v for k, v in response.getheaders()})
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return result
+
+    def _acquire(self, key: Tuple[str, int], deadline: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Freie Verbindung aus dem Pool oder neue Verbindung"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used < self.idle_timeout:
+                    self._stats['connections_reused'] += 1
+                    return conn, True
+                conn.close()
+        return self._connect(key, deadline), False
+
+    def _connect(self, key: Tuple[str, int], deadline: float) -> http.client.HTTPConnection:
+        host, port = key
+        conn = http.client.HTTPConnection(host, port, timeout=self._remaining(deadline))
+        try:
+            conn.connect()
+        except OSError:
+            conn.close()
+            self._stats['errors'] += 1
+            raise
+        self._stats['connections_opened'] += 1
+        return conn
+
+    def _release(self, key: Tuple[str, int], conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _set_timeout(self, conn: http.client.HTTPConnection, deadline: float):
+        remaining = self._remaining(deadline)
+        conn.timeout = remaining
+        if conn.sock is not None:
+            conn.sock.settimeout(remaining)
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("HTTP-Deadline überschritten")
+        return remaining
+
+    def close_host(self, host: str, port: int = 80):
+        """Schließt alle offenen Verbindungen zu einem Gerät (z.B. nach Deep Sleep)"""
+        with self._lock:
+            idle = self._idle.pop((host, port), [])
+        for conn, _ in idle:
+            conn.close()
+
+    def close(self):
+        """Schließt alle offenen Verbindungen"""
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for idle in pools:
+            for conn, _ in idle:
+                conn.close()
+
+    def get_stats(self) -> dict:
+        """Zähler für Diagnose: geöffnete vs. wiederverwendete Verbindungen"""
+        with self._lock:
+            idle = sum(len(v) for v in self._idle.values())
+        return dict(self._stats, idle_connections=idle)
+
+
+# Globale Instanz - späte Initialisierung
+_http_client_instance: Optional[DeviceHttpClient] = None
+
+def get_http_client() -> DeviceHttpClient:
+    """Gibt den gemeinsamen HTTP-Client zurück (Lazy Loading)"""
+    global _http_client_instance
+    if _http_client_instance is None:
+        _http_client_instance = DeviceHttpClient()
+    return _http_client_instance
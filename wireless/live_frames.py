@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Gemeinsamer Kurzzeit-Cache für ESP8266 /live-values-data Frames
+
+Ein Frame enthält Gesamt- und Einzelzellwerte zugleich. Statt dass jede
+Seite (Kalibrierung, ESP8266-Konfiguration, Gewichtsquelle) eigene
+Anfragen stellt, wird ein Frame pro Gerät höchstens einmal je max_age
+geholt und von allen Lesern geteilt. Laufen zwei Abfragen gleichzeitig
+an, wartet die zweite auf das Ergebnis der ersten. Läuft ein Live-Stream
+(wireless/live_stream.py), schreibt er seine Frames per put() hinein.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict
+
+from wireless.http_client import DeviceHttpClient, get_http_client
+
+logger = logging.getLogger(__name__)
+
+CELL_KEYS = ('vl_value', 'vr_value', 'hl_value', 'hr_value')
+
+
+@dataclass(frozen=True)
+class LiveFrame:
+    """Ein vollständiger Messwert-Frame eines Geräts"""
+    host: str
+    timestamp: float   # time.monotonic() beim Empfang
+    data: dict
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.timestamp
+
+    def cells(self, scale: float = 1.0) -> list:
+        """Einzelzellen [VL, VR, HL, HR], Rohwert / scale"""
+        return [float(self.data.get(key, 0)) / scale for key in CELL_KEYS]
+
+    def total(self, scale: float = 1.0) -> float:
+        return sum(self.cells(scale))
+
+
+class LiveFrameCache:
+    """
+    Pro Gerät der zuletzt empfangene Frame
+
+    Args:
+        max_age: Frames jünger als max_age Sekunden werden ohne Anfrage geliefert
+        client: HTTP-Client (Standard: gemeinsamer Keep-Alive-Client)
+    """
+
+    def __init__(self, max_age: float = 1.0, client: Optional[DeviceHttpClient] = None):
+        self.max_age = max_age
+        self._client = client
+        self._frames: Dict[str, LiveFrame] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.hits = 0
+
+    def get(self, host: str, max_age: Optional[float] = None, timeout: float = 2.0) -> LiveFrame:
+        """
+        Frame des Geräts - aus dem Cache oder frisch geholt
+
+        Args:
+            max_age: Überschreibt das Standard-Höchstalter (0 = immer neu holen)
+            timeout: HTTP-Deadline falls eine Anfrage nötig ist
+
+        Raises:
+            OSError: Gerät nicht erreichbar / HTTP-Fehler
+            ValueError: Antwort ist kein JSON
+        """
+        max_age = self.max_age if max_age is None else max_age
+        frame = self._fresh(host, max_age)
+        if frame:
+            return frame
+
+        with self._host_lock(host):
+            # Ein anderer Leser hat eventuell gerade geholt
+            frame = self._fresh(host, max_age)
+            if frame:
+                return frame
+
+            client = self._client or get_http_client()
+            data = client.get_json(host, '/live-values-data', timeout=timeout)
+            if not isinstance(data, dict):
+                raise ValueError(f"Unerwartete Antwort von {host}: {type(data).__name__}")
+            frame = LiveFrame(host=host, timestamp=time.monotonic(), data=data)
+            self._frames[host] = frame
+            self.fetches += 1
+            return frame
+
+    def put(self, frame: LiveFrame):
+        """Gepushten Frame übernehmen (Live-Stream) - Leser brauchen keine Anfrage"""
+        self._frames[frame.host] = frame
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[LiveFrame]:
+        """Jüngster Frame irgendeines Geräts ohne Netzwerkzugriff (None wenn zu alt)"""
+        max_age = self.max_age if max_age is None else max_age
+        frames = [f for f in self._frames.values() if f.age <= max_age]
+        return max(frames, key=lambda f: f.timestamp) if frames else None
+
+    def invalidate(self, host: Optional[str] = None):
+        """Verwirft gecachte Frames (z.B. nach Tara auf dem ESP)"""
+        if host is None:
+            self._frames.clear()
+        else:
+            self._frames.pop(host, None)
+
+    def _fresh(self, host: str, max_age: float) -> Optional[LiveFrame]:
+        frame = self._frames.get(host)
+        if frame is not None and frame.age < max_age:
+            self.hits += 1
+            return frame
+        return None
+
+    def _host_lock(self, host: str) -> threading.Lock:
+        with self._lock:
+            return self._host_locks.setdefault(host, threading.Lock())
+
+
+# Globale Instanz - späte Initialisierung
+_live_frame_cache_instance: Optional[LiveFrameCache] = None
+
+def get_live_frame_cache() -> LiveFrameCache:
+    """Gibt den gemeinsamen Frame-Cache zurück (Lazy Loading)"""
+    global _live_frame_cache_instance
+    if _live_frame_cache_instance is None:
+        _live_frame_cache_instance = LiveFrameCache()
+    return _live_frame_cache_instance
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Push-Stream der ESP8266-Messwerte (Server-Sent Events)
+
+Statt /live-values-data und /status per Timer abzufragen, hält der Pi
+eine einzige HTTP-Verbindung auf /live-values-stream offen. Der ESP8266
+schreibt jeden Messwert als SSE-Event hinein:
+
+    data: {"vl_value":"12345","vr_value":"...","hl_value":"...","hr_value":"...","timestamp":123}
+
+    : ping
+
+Der Verbindungsaufbau fällt einmal an, nicht pro Abfrage; die Latenz
+sinkt vom Abfrageintervall auf die Netzwerk-Laufzeit. Empfangene Frames
+landen im gemeinsamen LiveFrameCache - ESP8266HttpSource, die
+Konfigurationsseite und die Kalibrierung lesen sie ohne eigene Anfrage.
+
+Ältere Firmware ohne Stream antwortet mit 404; dann bleibt es beim
+Abfragen über den Cache, der Stream wird nur selten neu versucht.
+"""
+
+import json
+import logging
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from wireless.live_frames import LiveFrame, LiveFrameCache, get_live_frame_cache
+from wireless.wireless_weight_manager import ReconnectBackoff
+
+logger = logging.getLogger(__name__)
+
+STREAM_PATH = '/live-values-stream'
+CONNECT_TIMEOUT = 2.0       # Sekunden für den TCP-Verbindungsaufbau
+STREAM_TIMEOUT = 3.0        # Sekunden ohne Event oder Ping -> Verbindung tot
+STABLE_SESSION = 10.0       # Danach beginnt der Backoff wieder von vorne
+UNSUPPORTED_RETRY = 60.0    # Firmware ohne Stream: so selten erneut versuchen
+
+
+class StreamUnsupported(OSError):
+    """Gerät bietet keinen Event-Stream an (ältere Firmware)"""
+
+
+@dataclass(frozen=True)
+class SseEvent:
+    """Ein vollständiges Server-Sent Event"""
+    event: str
+    data: str
+    id: Optional[str] = None
+
+
+class SseParser:
+    """Zeilenweiser SSE-Parser (text/event-stream)"""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._event = 'message'
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+
+    def feed(self, line: str) -> Optional[SseEvent]:
+        """
+        Eine Zeile verarbeiten
+
+        Returns:
+            Das Event, sobald die abschließende Leerzeile kommt, sonst None
+        """
+        line = line.rstrip('\r\n')
+        if not line:
+            event = SseEvent(self._event, '\n'.join(self._data), self._id) if self._data else None
+            self._reset()
+            return event
+        if line.startswith(':'):
+            return None  # Kommentar - dient der Firmware als Heartbeat
+
+        field, _, value = line.partition(':')
+        if value.startswith(' '):
+            value = value[1:]
+        if field == 'data':
+            self._data.append(value)
+        elif field == 'event':
+            self._event = value
+        elif field == 'id':
+            self._id = value
+        return None
+
+
+class LiveStreamClient:
+    """
+    Hält den Event-Stream eines ESP8266 offen und verbindet unbegrenzt neu
+
+    Observer laufen im Stream-Thread - für Widgets per Qt-Signal weiterreichen.
+
+    Args:
+        host: IP-Adresse des ESP8266
+        port: HTTP-Port
+        receive_timeout: Sekunden ohne Event/Ping, nach denen die
+            Verbindung als tot gilt (Firmware pingt jede Sekunde)
+        cache: Frame-Cache, in den empfangene Frames geschrieben werden
+    """
+
+    def __init__(self, host: str, port: int = 80, path: str = STREAM_PATH,
+                 receive_timeout: float = STREAM_TIMEOUT, cache: Optional[LiveFrameCache] = None,
+                 backoff: Optional[ReconnectBackoff] = None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.receive_timeout = receive_timeout
+        self.backoff = backoff or ReconnectBackoff(initial=0.2, maximum=5.0)
+        self._cache = cache
+        self._observers: List[Callable[[LiveFrame], None]] = []
+        self._state_observers: List[Callable[[bool, str], None]] = []
+
+        self.connected = False
+        self.supported: Optional[bool] = None   # None = noch nicht versucht
+        self.events = 0
+        self.reconnects = 0
+        self._last_frame: Optional[LiveFrame] = None
+
+        self._state = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sock: Optional[socket.socket] = None
+
+    # Observer
+
+    def add_observer(self, callback: Callable[[LiveFrame], None]):
+        """Observer für jeden empfangenen Frame"""
+        self._observers.append(callback)
+
+    def remove_observer(self, callback: Callable[[LiveFrame], None]):
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def add_state_observer(self, callback: Callable[[bool, str], None]):
+        """Observer für Verbindungswechsel: callback(connected, host)"""
+        self._state_observers.append(callback)
+
+    def remove_state_observer(self, callback: Callable[[bool, str], None]):
+        if callback in self._state_observers:
+            self._state_observers.remove(callback)
+
+    # Steuerung
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"LiveStream[{self.host}]")
+        self._thread.start()
+        logger.info(f"Live-Stream zu {self.host} gestartet")
+
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # weckt das blockierende readline()
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info(f"Live-Stream zu {self.host} gestoppt")
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def latest(self, max_age: float = STREAM_TIMEOUT) -> Optional[LiveFrame]:
+        """Zuletzt gepushter Frame, solange er nicht älter als max_age ist"""
+        frame = self._last_frame
+        if frame is None or frame.age > max_age:
+            return None
+        return frame
+
+    def wait_for_state(self, connected: bool, timeout: Optional[float] = None) -> bool:
+        """Blockiert, bis der Stream verbunden/getrennt ist (oder timeout abläuft)"""
+        with self._state:
+            return self._state.wait_for(lambda: self.connected == connected, timeout)
+
+    def get_stats(self) -> dict:
+        frame = self._last_frame
+        return {
+            'host': self.host,
+            'connected': self.connected,
+            'supported': self.supported,
+            'events': self.events,
+            'reconnects': self.reconnects,
+            'frame_age': frame.age if frame else None,
+        }
+
+    # Stream-Thread
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self._stream_once()
+                delay = None
+            except StreamUnsupported as e:
+                if self.supported is not False:
+                    logger.info(f"{self.host} ohne Live-Stream ({e}) - Abfrage bleibt aktiv")
+                self.supported = False
+                delay = UNSUPPORTED_RETRY
+            except (OSError, ValueError) as e:
+                # Bei dauerhaftem Ausfall nicht bei jedem Versuch das Log füllen
+                log = logger.warning if self.backoff.attempt == 0 else logger.debug
+                log(f"Live-Stream zu {self.host} unterbrochen: {e}")
+                delay = None
+
+            self._set_connected(False)
+            if self._stop_event.is_set():
+                break
+            if time.monotonic() - started >= STABLE_SESSION:
+                self.backoff.reset()
+            self.reconnects += 1
+            self._stop_event.wait(self.backoff.next_delay() if delay is None else delay)
+
+    def _stream_once(self):
+        """Eine Stream-Verbindung - kehrt zurück bzw. wirft, sobald sie endet"""
+        sock = socket.create_connection((self.host, self.port), timeout=CONNECT_TIMEOUT)
+        self._sock = sock
+        try:
+            if self._stop_event.is_set():
+                return
+            sock.settimeout(self.receive_timeout)
+            sock.sendall((f"GET {self.path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                          f"Accept: text/event-stream\r\nCache-Control: no-cache\r\n\r\n").encode('ascii'))
+            reader = sock.makefile('rb')
+            self._read_headers(reader)
+
+            self.supported = True
+            self._set_connected(True)
+            parser = SseParser()
+            while not self._stop_event.is_set():
+                line = reader.readline()  # socket.timeout = kein Event/Ping -> tot
+                if not line:
+                    raise ConnectionError("Stream vom Gerät beendet")
+                event = parser.feed(line.decode('utf-8', 'replace'))
+                if event is not None:
+                    self._dispatch(event)
+        finally:
+            self._sock = None
+            sock.close()
+
+    def _read_headers(self, reader):
+        status_line = reader.readline().decode('latin-1').strip()
+        parts = status_line.split(' ', 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise ConnectionError(f"Ungültige Antwort: {status_line!r}")
+        status = int(parts[1])
+        if status == 404:
+            raise StreamUnsupported(f"HTTP {status}")
+        if status != 200:
+            raise ConnectionError(f"HTTP {status}")
+
+        content_type = ''
+        while True:
+            line = reader.readline().decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-type':
+                content_type = value.strip().lower()
+        if 'text/event-stream' not in content_type:
+            raise StreamUnsupported(f"Content-Type {content_type or '-'}")
+
+    def _dispatch(self, event: SseEvent):
+        try:
+            data = json.loads(event.data)
+        except ValueError:
+            logger.debug(f"Stream-Event ohne JSON verworfen: {event.data[:80]!r}")
+            return
+        if not isinstance(data, dict):
+            return
+
+        frame = LiveFrame(host=self.host, timestamp=time.monotonic(), data=data)
+        self._last_frame = frame
+        self.events += 1
+        (self._cache or get_live_frame_cache()).put(frame)
+
+        for callback in list(self._observers):
+            try:
+                callback(frame)
+            except Exception as e:
+                logger.error(f"Stream-Observer-Fehler: {e}")
+
+    def _set_connected(self, connected: bool):
+        with self._state:
+            if self.connected == connected:
+                return
+            self.connected = connected
+            self._state.notify_all()
+        logger.info(f"Live-Stream {self.host}: {'verbunden' if connected else 'getrennt'}")
+        for callback in list(self._state_observers):
+            try:
+                callback(connected, self.host)
+            except Exception as e:
+                logger.error(f"Stream-Status-Observer-Fehler: {e}")
+
+
+# Globale Instanzen - ein Stream pro Gerät, läuft nur solange ihn jemand nutzt
+_live_streams: Dict[str, LiveStreamClient] = {}
+_live_stream_users: Dict[str, int] = {}
+_live_streams_lock = threading.Lock()
+
+def get_live_stream(host: str) -> LiveStreamClient:
+    """
+    Gibt den (laufenden) Stream des Geräts zurück und startet ihn bei Bedarf
+
+    Jeder Aufruf zählt als Nutzer - mit release_live_stream() wieder
+    freigeben, sonst verbindet der Stream-Thread unbegrenzt weiter neu.
+    """
+    with _live_streams_lock:
+        client = _live_streams.get(host)
+        if client is None:
+            client = _live_streams[host] = LiveStreamClient(host)
+        _live_stream_users[host] = _live_stream_users.get(host, 0) + 1
+        if not client.is_running:
+            client.start()
+        return client
+
+
+def release_live_stream(host: str):
+    """Gibt einen Nutzer des Streams frei; der letzte beendet ihn"""
+    with _live_streams_lock:
+        users = _live_stream_users.get(host, 0) - 1
+        if users > 0:
+            _live_stream_users[host] = users
+            return
+        _live_stream_users.pop(host, None)
+        client = _live_streams.pop(host, None)
+    if client is not None:
+        client.stop()
+
+
+def stop_live_streams():
+    """Beendet alle Streams (Programmende)"""
+    with _live_streams_lock:
+        clients = list(_live_streams.values())
+        _live_streams.clear()
+        _live_stream_users.clear()
+    for client in clients:
+        client.stop()
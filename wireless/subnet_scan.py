@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Asynchroner Netzwerk-Scan nach der ESP8266-Waage
+
+Statt 100 blockierender urlopen-Aufrufe nacheinander (bis zu 5 Minuten)
+werden die Adressen parallel mit begrenzter Nebenläufigkeit abgefragt:
+kurzer TCP-Connect, nur bei offenem Port 80 die /status-Anfrage. Der
+erste Treffer beendet den Scan, alle übrigen Abfragen werden abgebrochen.
+
+Adressbereich als CIDR ("192.168.2.0/24"), Bereich im letzten Oktett
+("192.168.2.100-199"), Von-Bis ("192.168.2.10-192.168.2.50") oder
+einzelne IP.
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+from typing import Optional, Tuple, List
+
+logger = logging.getLogger(__name__)
+
+DEVICE_NAME = "FutterWaage_ESP8266"
+
+
+def parse_targets(spec: str) -> List[str]:
+    """
+    Wandelt eine Bereichsangabe in eine Liste von IP-Adressen
+
+    Raises:
+        ValueError: Ungültige Angabe
+    """
+    spec = spec.strip()
+    if '/' in spec:
+        network = ipaddress.ip_network(spec, strict=False)
+        hosts = list(network.hosts()) or [network.network_address]
+        return [str(ip) for ip in hosts]
+
+    if '-' in spec:
+        start_text, end_text = (part.strip() for part in spec.split('-', 1))
+        start = ipaddress.ip_address(start_text)
+        if '.' in end_text:
+            end = ipaddress.ip_address(end_text)
+        else:
+            # Kurzform: nur das letzte Oktett
+            end = ipaddress.ip_address(start_text.rsplit('.', 1)[0] + '.' + end_text)
+        if int(end) < int(start):
+            raise ValueError(f"Ungültiger Bereich: {spec}")
+        return [str(ipaddress.ip_address(i)) for i in range(int(start), int(end) + 1)]
+
+    return [str(ipaddress.ip_address(spec))]
+
+
+async def probe_status(ip: str, port: int = 80, connect_timeout: float = 0.3,
+                       http_timeout: float = 1.5) -> Optional[dict]:
+    """
+    Fragt /status eines Geräts ab, ohne den Event-Loop zu blockieren
+
+    Returns:
+        Status-Dict, wenn es die Futterwaage ist - sonst None
+    """
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), connect_timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+    try:
+        request = (f"GET /status HTTP/1.1\r\nHost: {ip}\r\n"
+                   f"User-Agent: Futterkarre-Pi5\r\nConnection: close\r\n\r\n")
+        writer.write(request.encode('ascii'))
+        await writer.drain()
+        raw = await asyncio.wait_for(reader.read(), http_timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    return _parse_status(raw)
+
+
+def _parse_status(raw: bytes) -> Optional[dict]:
+    head, _, body = raw.partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].split()
+    if len(status_line) < 2 or status_line[1] != b"200":
+        return None
+    if b"transfer-encoding: chunked" in head.lower():
+        return None  # Der ESP-Webserver antwortet mit Content-Length
+    try:
+        data = json.loads(body.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("device_name") == DEVICE_NAME:
+        return data
+    return None
+
+
+async def scan_for_esp8266(spec: str, port: int = 80, concurrency: int = 64,
+                           connect_timeout: float = 0.3,
+                           http_timeout: float = 1.5) -> Optional[Tuple[str, dict]]:
+    """
+    Durchsucht einen Adressbereich parallel nach der Futterwaage
+
+    Args:
+        spec: CIDR, Bereich oder einzelne IP (siehe parse_targets)
+        concurrency: Höchstzahl gleichzeitig offener Verbindungsversuche
+
+    Returns:
+        (ip, status) des ersten Treffers oder None
+    """
+    targets = parse_targets(spec)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def probe(ip: str) -> Optional[Tuple[str, dict]]:
+        async with semaphore:
+            status = await probe_status(ip, port, connect_timeout, http_timeout)
+        return (ip, status) if status else None
+
+    tasks = [asyncio.ensure_future(probe(ip)) for ip in targets]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                logger.debug(f"ESP8266-Scan: Treffer {result[0]} ({len(targets)} Adressen)")
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+UDP-Broadcast-Discovery für die Futterwaage
+
+Statt feste IPs oder ganze Adressbereiche per HTTP abzuklopfen, schickt der
+Pi eine einzige UDP-Anfrage per Broadcast. Jede Waage antwortet direkt mit
+Identität, IP-Adresse und Fähigkeiten - eine Runde statt dutzender
+TCP-Versuche. Ergebnisse landen in einem TTL-Cache.
+
+Protokoll (JSON, UDP-Port 4210):
+    Anfrage: {"type": "futterkarre_discover", "version": 1, "nonce": "..."}
+    Antwort: {"type": "futterkarre_announce", "nonce": "...",
+              "device_name": "FutterWaage_ESP8266", "device_id": "...",
+              "ip": "192.168.4.1", "mode": "stall" | "haus",
+              "http_port": 80, "ws_port": 81, "firmware_version": "...",
+              "capabilities": ["http", "websocket", "live-values"]}
+
+DiscoveryResponder ist ein Python-Stellvertreter der Firmware-Seite
+(Tests, Entwicklung ohne ESP):
+    python -m wireless.udp_discovery --responder
+"""
+
+import argparse
+import json
+import logging
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_PORT = 4210
+PROTOCOL_VERSION = 1
+QUERY_TYPE = "futterkarre_discover"
+ANNOUNCE_TYPE = "futterkarre_announce"
+
+
+@dataclass(frozen=True)
+class DiscoveredDevice:
+    """Antwort eines Geräts auf die Discovery-Anfrage"""
+    device_id: str
+    device_name: str
+    ip: str
+    mode: str                       # "stall" oder "haus"
+    capabilities: Tuple[str, ...] = ()
+    http_port: int = 80
+    ws_port: int = 81
+    firmware_version: str = ""
+    rtt: float = 0.0                # Sekunden von Anfrage bis Antwort
+    seen: float = 0.0               # time.monotonic() beim Empfang
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+
+class DeviceCache:
+    """
+    Gefundene Geräte mit Ablaufzeit
+
+    Args:
+        ttl: Sekunden, die ein Eintrag ohne neue Antwort gültig bleibt
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._devices: Dict[str, DiscoveredDevice] = {}
+        self._lock = threading.Lock()
+
+    def put(self, device: DiscoveredDevice):
+        with self._lock:
+            self._devices[device.device_id] = device
+
+    def get(self, device_id: str) -> Optional[DiscoveredDevice]:
+        with self._lock:
+            device = self._devices.get(device_id)
+        if device is None or self._expired(device):
+            return None
+        return device
+
+    def devices(self) -> List[DiscoveredDevice]:
+        """Gültige Einträge, schnellste Antwort zuerst"""
+        with self._lock:
+            self._devices = {k: d for k, d in self._devices.items() if not self._expired(d)}
+            return sorted(self._devices.values(), key=lambda d: d.rtt)
+
+    def clear(self):
+        with self._lock:
+            self._devices.clear()
+
+    def _expired(self, device: DiscoveredDevice) -> bool:
+        return time.monotonic() - device.seen > self.ttl
+
+
+class UdpDiscovery:
+    """
+    Sendet Discovery-Anfragen und sammelt die Antworten
+
+    Args:
+        port: UDP-Port der Geräte
+        broadcast_addrs: Zieladressen (Broadcast oder einzelne IPs)
+        timeout: Wartezeit auf Antworten pro Runde in Sekunden
+        ttl: Gültigkeit der Cache-Einträge
+    """
+
+    def __init__(self, port: int = DISCOVERY_PORT,
+                 broadcast_addrs: Sequence[str] = ("255.255.255.255",),
+                 timeout: float = 0.5, ttl: float = 60.0):
+        self.port = port
+        self.broadcast_addrs = list(broadcast_addrs)
+        self.timeout = timeout
+        self.cache = DeviceCache(ttl)
+
+    def discover(self, timeout: Optional[float] = None, first_only: bool = False) -> List[DiscoveredDevice]:
+        """
+        Eine Discovery-Runde: Anfrage senden, Antworten bis timeout sammeln
+
+        Args:
+            first_only: Nach der ersten gültigen Antwort sofort zurückkehren
+
+        Returns:
+            Gefundene Geräte (auch im Cache abgelegt)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        nonce = uuid.uuid4().hex[:12]
+        query = json.dumps({"type": QUERY_TYPE, "version": PROTOCOL_VERSION, "nonce": nonce}).encode()
+        found: Dict[str, DiscoveredDevice] = {}
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.bind(("", 0))
+            sent = time.monotonic()
+            for addr in self.broadcast_addrs:
+                try:
+                    sock.sendto(query, (addr, self.port))
+                except OSError as e:
+                    logger.debug(f"Discovery an {addr} nicht sendbar: {e}")
+
+            deadline = sent + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                sock.settimeout(remaining)
+                try:
+                    data, (sender, _) = sock.recvfrom(2048)
+                except socket.timeout:
+                    break
+                except OSError as e:
+                    logger.debug(f"Discovery-Empfang fehlgeschlagen: {e}")
+                    break
+
+                device = self._parse(data, nonce, sender, time.monotonic() - sent)
+                if device is None:
+                    continue
+                found[device.device_id] = device
+                self.cache.put(device)
+                if first_only:
+                    break
+
+        return sorted(found.values(), key=lambda d: d.rtt)
+
+    def find_scale(self, timeout: Optional[float] = None,
+                   max_age: Optional[float] = None) -> Optional[DiscoveredDevice]:
+        """
+        Gültiger Cache-Eintrag oder eine kurze Discovery-Runde
+
+        Args:
+            max_age: Cache-Einträge nur verwenden, wenn ihre letzte Antwort
+                höchstens so alt ist (Sekunden, statt ttl) - 0 erzwingt eine
+                neue Runde, z.B. für Verbindungsanzeigen
+        """
+        now = time.monotonic()
+        cached = [device for device in self.cache.devices()
+                  if max_age is None or now - device.seen <= max_age]
+        if cached:
+            return cached[0]
+        devices = self.discover(timeout, first_only=True)
+        return devices[0] if devices else None
+
+    @staticmethod
+    def _parse(data: bytes, nonce: str, sender: str, rtt: float) -> Optional[DiscoveredDevice]:
+        try:
+            message = json.loads(data.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            return None
+        if not isinstance(message, dict) or message.get("type") != ANNOUNCE_TYPE:
+            return None
+        if message.get("nonce") != nonce:
+            return None  # Antwort auf eine ältere Runde
+
+        try:
+            return DiscoveredDevice(
+                device_id=str(message.get("device_id") or sender),
+                device_name=str(message.get("device_name", "")),
+                ip=str(message.get("ip") or sender),
+                mode=str(message.get("mode", "haus")),
+                capabilities=tuple(message.get("capabilities", ())),
+                http_port=int(message.get("http_port", 80)),
+                ws_port=int(message.get("ws_port", 81)),
+                firmware_version=str(message.get("firmware_version", "")),
+                rtt=rtt,
+                seen=time.monotonic()
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+class DiscoveryResponder:
+    """
+    Python-Stellvertreter der Firmware: beantwortet Discovery-Anfragen
+
+    Args:
+        device_id: Eindeutige Kennung (Firmware: Chip-ID)
+        ip: Gemeldete Adresse (None = Empfänger nimmt die Absenderadresse)
+        bind: Lokale Adresse, auf der gelauscht wird
+        port: UDP-Port (0 = freier Port, siehe .port nach start())
+    """
+
+    def __init__(self, device_id: str = "sim-esp8266", device_name: str = "FutterWaage_ESP8266",
+                 ip: Optional[str] = None, mode: str = "haus",
+                 capabilities: Sequence[str] = ("http", "websocket", "live-values"),
+                 http_port: int = 80, ws_port: int = 81, firmware_version: str = "sim",
+                 bind: str = "0.0.0.0", port: int = DISCOVERY_PORT):
+        self.announce = {
+            "type": ANNOUNCE_TYPE,
+            "device_id": device_id,
+            "device_name": device_name,
+            "ip": ip,
+            "mode": mode,
+            "capabilities": list(capabilities),
+            "http_port": http_port,
+            "ws_port": ws_port,
+            "firmware_version": firmware_version,
+        }
+        self.bind = bind
+        self.port = port
+        self.queries = 0
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((self.bind, self.port))
+        self._sock.settimeout(0.2)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True, name="DiscoveryResponder")
+        self._thread.start()
+        logger.info(f"Discovery-Responder lauscht auf UDP {self.bind}:{self.port}")
+
+    def stop(self):
+        sock, self._sock = self._sock, None
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if sock:
+            sock.close()
+
+    def _serve(self):
+        while self._sock is not None:
+            try:
+                data, addr = self._sock.recvfrom(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                query = json.loads(data.decode('utf-8'))
+            except (UnicodeDecodeError, ValueError):
+                continue
+            if not isinstance(query, dict) or query.get("type") != QUERY_TYPE:
+                continue
+
+            self.queries += 1
+            # ip=None: der Empfänger nimmt die Absenderadresse des Pakets
+            reply = dict(self.announce, nonce=query.get("nonce"))
+            try:
+                self._sock.sendto(json.dumps(reply).encode(), addr)
+            except (OSError, AttributeError):
+                break
+
+
+# Globale Instanz - späte Initialisierung
+_udp_discovery_instance: Optional[UdpDiscovery] = None
+
+def get_udp_discovery() -> UdpDiscovery:
+    """Gibt die gemeinsame Discovery-Instanz zurück (Cache wird geteilt)"""
+    global _udp_discovery_instance
+    if _udp_discovery_instance is None:
+        _udp_discovery_instance = UdpDiscovery()
+    return _udp_discovery_instance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Futterwaage UDP-Discovery")
+    parser.add_argument("--responder", action="store_true", help="Als simulierte Waage antworten")
+    parser.add_argument("--port", type=int, default=DISCOVERY_PORT)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.responder:
+        responder = DiscoveryResponder(port=args.port)
+        responder.start()
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            responder.stop()
+        return
+
+    devices = UdpDiscovery(port=args.port).discover(args.timeout)
+    for device in devices:
+        print(json.dumps(dict(asdict(device), rtt_ms=round(device.rtt * 1000, 1)), ensure_ascii=False))
+    if not devices:
+        print("Keine Waage gefunden")
+
+
+if __name__ == "__main__":
+    main()
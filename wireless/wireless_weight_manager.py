@@ -6,12 +6,85 @@ Waage her und integriert sich nahtlos in die bestehende Futterkarre-Architektur.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import random
 import time
-from typing import List, Optional, Callable
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Callable, Tuple
 from threading import Thread, Event
-import websockets
+
+from wireless.binary_frames import BinaryFrame, FrameFormatError, DEFAULT_BATCH, decode_frame, lost_frames
+
+# Websockets optional - ohne Modul schlägt nur connect() fehl
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+    _CONNECTION_CLOSED = (websockets.exceptions.ConnectionClosed,)
+except ImportError:
+    websockets = None
+    WEBSOCKETS_AVAILABLE = False
+    _CONNECTION_CLOSED = ()
+
+# Verbindungsüberwachung (ESP32 sendet Gewichte mit 2 Hz)
+CONNECT_TIMEOUT = 2.0      # Sekunden für den Verbindungsaufbau
+HEARTBEAT_INTERVAL = 1.0   # Sekunden zwischen WebSocket-Pings
+HEARTBEAT_TIMEOUT = 1.0    # Sekunden ohne Pong -> Verbindung tot
+RECEIVE_TIMEOUT = 1.5      # Sekunden ohne jede Nachricht -> Verbindung tot
+STABLE_SESSION = 10.0      # Nach so langer Verbindung beginnt der Backoff wieder von vorne
+
+# Kommandos (Antwort kommt über denselben Reader-Loop wie die Gewichte)
+COMMAND_TIMEOUT = 2.0      # Sekunden bis ein Kommando ohne Antwort aufgegeben wird
+TARE_TIMEOUT = 6.0         # Tare misst 4 Zellen x 10 Werte bei 10 Hz (~4 s)
+CALIBRATE_TIMEOUT = 6.0    # Kalibrierung misst genauso lange
+# Während dieser Kommandos schickt der ESP32 keine Gewichte - kein Zeichen für einen toten Link
+LONG_COMMANDS = frozenset({"tare", "calibrate"})
+
+
+@dataclass(frozen=True)
+class WirelessReading:
+    """Zuletzt empfangener Messwert mit Empfangszeitpunkt"""
+    total: float
+    corners: Optional[List[float]]
+    timestamp: float           # time.time() beim Empfang, 0.0 = noch nie
+
+    @property
+    def age(self) -> float:
+        """Sekunden seit dem Empfang (unendlich, solange nichts empfangen wurde)"""
+        return time.time() - self.timestamp if self.timestamp else float('inf')
+
+    def is_stale(self, max_age: float) -> bool:
+        return self.age > max_age
+
+
+class ReconnectBackoff:
+    """
+    Exponentieller Backoff mit Jitter, ohne Obergrenze für die Versuche
+
+    Args:
+        initial: Erste Wartezeit in Sekunden
+        maximum: Längste Wartezeit - klein halten, damit die Waage nach
+            einem WLAN-Aussetzer in unter einer Sekunde zurück ist
+        jitter: Anteil, um den jede Wartezeit zufällig verkürzt wird
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 1.0, factor: float = 2.0,
+                 jitter: float = 0.5, rng: Callable[[], float] = random.random):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self._rng = rng
+        self.attempt = 0
+
+    def reset(self):
+        self.attempt = 0
+
+    def next_delay(self) -> float:
+        base = min(self.maximum, self.initial * self.factor ** self.attempt)
+        self.attempt += 1
+        return base * (1.0 - self.jitter * self._rng())
 
 
 class WirelessWeightManager:
@@ -21,17 +94,37 @@ class WirelessWeightManager:
     Verwaltet WebSocket-Verbindung zu ESP32 und empfängt Gewichtsdaten
     """
     
-    def __init__(self, esp32_ip: str, port: int = 81):
+    def __init__(self, esp32_ip: str, port: int = 81, prefer_binary: bool = True,
+                 batch_size: int = DEFAULT_BATCH):
         self.esp32_ip = esp32_ip
         self.port = port
         self.websocket = None
         self._is_connected = False
         self.observers: List[Callable[[float, Optional[List[float]]], None]] = []
+        
+        # Binärformat (siehe wireless/binary_frames.py) - pro Verbindung ausgehandelt
+        self.prefer_binary = prefer_binary
+        self.batch_size = batch_size
+        self.frame_format = "json"
+        self.batch_observers: List[Callable[[BinaryFrame], None]] = []
+        self.last_frame: Optional[BinaryFrame] = None
+        self.frames_lost = 0
+        self._last_sequence: Optional[int] = None
         self.last_weight = 0.0
         self.last_corners = None
+        self.last_update = 0.0          # time.time() der letzten Gewichtsdaten
+        self.connected_since: Optional[float] = None
         self.connection_status = "disconnected"
         self.battery_voltage = 0.0
         self.wifi_rssi = 0
+        self.receive_timeout = RECEIVE_TIMEOUT
+        
+        # Kommandos, die nach jedem (Wieder-)Verbinden erneut gesendet werden
+        self.subscriptions: List[dict] = []
+        
+        # Offene Kommandos: ID -> (Kommandoname, Future); aufgelöst im Message-Loop
+        self._command_ids = itertools.count(1)
+        self._pending: Dict[int, Tuple[str, asyncio.Future, float]] = {}  # id -> (Name, Future, Deadline)
         
         # Logging
         self.logger = logging.getLogger(f"WirelessWeightManager[{esp32_ip}]")
@@ -57,26 +150,77 @@ class WirelessWeightManager:
             self.observers.remove(callback)
             self.logger.debug(f"Observer entfernt: {callback.__name__}")
     
+    def add_batch_observer(self, callback: Callable[[BinaryFrame], None]):
+        """Observer für komplette Binärframes (alle Samples, nicht nur das letzte)"""
+        self.batch_observers.append(callback)
+    
+    def remove_batch_observer(self, callback: Callable[[BinaryFrame], None]):
+        if callback in self.batch_observers:
+            self.batch_observers.remove(callback)
+    
+    def get_reading(self) -> WirelessReading:
+        """Letzter Messwert mit Empfangszeit (für Alters-/Staleness-Prüfung)"""
+        return WirelessReading(self.last_weight, self.last_corners, self.last_update)
+    
     async def connect(self):
-        """Verbindung zu ESP32 herstellen"""
+        """
+        Verbindung zu ESP32 herstellen und Nachrichten verarbeiten
+        
+        Kehrt zurück, sobald die Verbindung endet (geschlossen, Ping ohne
+        Pong oder zu lange keine Daten). Wiederverbinden übernimmt der
+        Supervisor im WirelessWeightManagerAdapter.
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ConnectionError("websockets-Modul fehlt")
+        
+        uri = f"ws://{self.esp32_ip}:{self.port}"
+        self.logger.debug(f"Verbinde zu {uri}...")
         try:
-            uri = f"ws://{self.esp32_ip}:{self.port}"
-            self.logger.info(f"Verbinde zu {uri}...")
-            
-            self.websocket = await websockets.connect(uri)
-            self._is_connected = True
-            self.connection_status = "connected"
-            
-            self.logger.info("✅ Verbindung zu ESP32 hergestellt")
-            
-            # Message-Loop starten
-            await self._message_loop()
-            
+            self.websocket = await asyncio.wait_for(
+                websockets.connect(uri, ping_interval=HEARTBEAT_INTERVAL, ping_timeout=HEARTBEAT_TIMEOUT),
+                CONNECT_TIMEOUT
+            )
         except Exception as e:
-            self.logger.error(f"❌ Verbindung fehlgeschlagen: {e}")
             self._is_connected = False
             self.connection_status = f"error: {e}"
             raise
+        
+        self._is_connected = True
+        self.connected_since = time.monotonic()
+        self.connection_status = "connected"
+        self.logger.info("✅ Verbindung zu ESP32 hergestellt")
+        
+        await self._resubscribe()
+        
+        # Aushandlung braucht den laufenden Message-Loop für die Antwort
+        negotiation = asyncio.create_task(self._negotiate_format()) if self.prefer_binary else None
+        try:
+            await self._message_loop()
+        finally:
+            if negotiation:
+                negotiation.cancel()
+    
+    async def _negotiate_format(self):
+        """Binärframes anfordern; ältere Firmware antwortet mit Fehler -> JSON bleibt"""
+        reply = await self.send_command({"command": "set_format", "format": "binary",
+                                         "batch": self.batch_size})
+        if reply and reply.get("status") == "success":
+            self.frame_format = "binary"
+            self.logger.info(f"Binärframes aktiv ({self.batch_size} Samples/Frame)")
+        else:
+            self.logger.debug("Firmware ohne Binärframes - bleibe bei JSON")
+    
+    async def subscribe(self, command: dict):
+        """Kommando senden und nach jedem Wiederverbinden automatisch wiederholen"""
+        if command not in self.subscriptions:
+            self.subscriptions.append(command)
+        if self._is_connected and self.websocket:
+            await self.websocket.send(json.dumps(command))
+    
+    async def _resubscribe(self):
+        for command in self.subscriptions:
+            await self.websocket.send(json.dumps(command))
+            self.logger.debug(f"Abo erneuert: {command}")
     
     async def disconnect(self):
         """Verbindung trennen"""
@@ -87,49 +231,150 @@ class WirelessWeightManager:
         self.connection_status = "disconnected"
         self.logger.info("Verbindung getrennt")
     
-    async def send_command(self, command: dict) -> Optional[dict]:
-        """Kommando an ESP32 senden"""
+    async def send_command(self, command: dict, timeout: float = COMMAND_TIMEOUT) -> Optional[dict]:
+        """
+        Kommando an ESP32 senden und auf die zugehörige Antwort warten
+        
+        Jedes Kommando bekommt eine ID, die der ESP32 in der Antwort
+        zurückschickt. Empfangen wird ausschließlich im Message-Loop, der die
+        Antwort dem wartenden Future zuordnet - Gewichtsdaten und Antworten
+        können sich so nicht mehr gegenseitig "stehlen", und mehrere
+        Kommandos dürfen gleichzeitig unterwegs sein.
+        
+        Returns:
+            Antwort des ESP32 oder None bei Timeout/Verbindungsabbruch
+        """
         if not self.websocket:
             raise ConnectionError("Nicht mit ESP32 verbunden")
-            
+        
+        command_id = next(self._command_ids)
+        name = str(command.get("command", ""))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[command_id] = (name, future, time.monotonic() + timeout)
         try:
-            message = json.dumps(command)
-            await self.websocket.send(message)
-            self.logger.debug(f"Kommando gesendet: {command}")
-            
-            # Antwort empfangen (mit Timeout)
-            response = await asyncio.wait_for(self.websocket.recv(), timeout=5.0)
-            return json.loads(response)
+            await self.websocket.send(json.dumps(dict(command, id=command_id)))
+            self.logger.debug(f"Kommando #{command_id} gesendet: {command}")
+            return await asyncio.wait_for(future, timeout=timeout)
             
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Kommando #{command_id} '{name}' ohne Antwort nach {timeout:.1f}s")
+            return None
         except Exception as e:
-            self.logger.error(f"Kommando fehlgeschlagen: {e}")
+            self.logger.error(f"Kommando #{command_id} '{name}' fehlgeschlagen: {e}")
             return None
+        finally:
+            self._pending.pop(command_id, None)
     
     async def send_tare(self) -> Optional[dict]:
         """Waage nullen (Tare)"""
-        return await self.send_command({"command": "tare"})
+        return await self.send_command({"command": "tare"}, timeout=TARE_TIMEOUT)
     
     async def send_calibrate(self, weight: float) -> Optional[dict]:
         """Kalibrierung mit bekanntem Gewicht"""
-        return await self.send_command({"command": "calibrate", "weight": weight})
+        return await self.send_command({"command": "calibrate", "weight": weight}, timeout=CALIBRATE_TIMEOUT)
     
     async def get_status(self) -> Optional[dict]:
         """ESP32-Status abfragen"""
         return await self.send_command({"command": "get_status"})
     
+    def _resolve_command(self, data: dict) -> bool:
+        """Antwort dem wartenden Kommando zuordnen"""
+        entry = self._pending.get(data.get("id"))
+        if entry is None:
+            # Ältere Firmware ohne ID-Echo: ältestes offenes Kommando gleichen Namens
+            name = data.get("command", "get_status" if data.get("type") == "status" else None)
+            entry = next((e for e in self._pending.values() if e[0] == name and not e[1].done()), None)
+        if entry is None or entry[1].done():
+            return False
+        entry[1].set_result(data)
+        return True
+    
+    def _fail_pending(self, reason: str):
+        """Offene Kommandos sofort beenden statt sie in den Timeout laufen zu lassen"""
+        for _, future, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+    
+    def _long_command_remaining(self) -> float:
+        """
+        Sekunden bis zum Timeout des längsten offenen Tare/Kalibrier-Kommandos
+        
+        Solange eines läuft, misst der ESP32 und sendet keine Gewichte - die
+        Stille ist dann erwartet und beendet die Verbindung nicht.
+        """
+        now = time.monotonic()
+        return max([0.0] + [deadline - now for name, future, deadline in self._pending.values()
+                             if name in LONG_COMMANDS and not future.done()])
+    
     async def _message_loop(self):
-        """Haupt-Message-Loop für WebSocket"""
+        """Haupt-Message-Loop für WebSocket - endet, wenn die Verbindung tot ist"""
         try:
             while self._is_connected and self.websocket:
-                message = await self.websocket.recv()
-                await self._handle_message(str(message))
+                timeout = max(self.receive_timeout, self._long_command_remaining())
+                try:
+                    message = await asyncio.wait_for(self.websocket.recv(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    if self._long_command_remaining() > 0:
+                        continue  # Kommando kam erst während des Wartens dazu
+                    raise
+                if isinstance(message, (bytes, bytearray, memoryview)):
+                    self._handle_binary(message)
+                else:
+                    await self._handle_message(message)
                 
-        except websockets.exceptions.ConnectionClosed:
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Seit {self.receive_timeout:.1f}s keine Daten - Verbindung gilt als tot")
+        except _CONNECTION_CLOSED:
             self.logger.warning("WebSocket-Verbindung geschlossen")
-            self._is_connected = False
         except Exception as e:
             self.logger.error(f"Message-Loop Fehler: {e}")
+        finally:
             self._is_connected = False
+            self.connected_since = None
+            self.connection_status = "disconnected"
+            self.frame_format = "json"
+            self._last_sequence = None
+            self._fail_pending("Verbindung zu ESP32 verloren")
+            websocket, self.websocket = self.websocket, None
+            if websocket:
+                try:
+                    await asyncio.wait_for(websocket.close(), timeout=0.5)
+                except Exception:
+                    pass
+    
+    def _handle_binary(self, message):
+        """Binärframe verarbeiten: Observer bekommen das letzte Sample, Batch-Observer alles"""
+        try:
+            frame = decode_frame(message)
+        except FrameFormatError as e:
+            self.logger.warning(f"Binärframe verworfen: {e}")
+            return
+        if len(frame) == 0:
+            return
+        
+        self.frame_format = "binary"  # Frame kann vor der Aushandlungs-Antwort verarbeitet sein
+        self.frames_lost += lost_frames(self._last_sequence, frame.sequence)
+        self._last_sequence = frame.sequence
+        
+        corners = frame.cells[-1].tolist()
+        total_weight = float(sum(corners))
+        self.last_frame = frame
+        self.last_weight = total_weight
+        self.last_corners = corners
+        self.last_update = time.time()
+        self.battery_voltage = frame.battery_v
+        self.wifi_rssi = frame.wifi_rssi
+        
+        for observer in self.batch_observers:
+            try:
+                observer(frame)
+            except Exception as e:
+                self.logger.error(f"Batch-Observer-Fehler: {e}")
+        for observer in self.observers:
+            try:
+                observer(total_weight, corners)
+            except Exception as e:
+                self.logger.error(f"Observer-Fehler: {e}")
     
     async def _handle_message(self, message: str):
         """WebSocket-Message verarbeiten"""
@@ -143,6 +388,7 @@ class WirelessWeightManager:
                 
                 self.last_weight = total_weight
                 self.last_corners = corners if corners else None
+                self.last_update = time.time()
                 self.battery_voltage = data.get("battery_v", 0.0)
                 self.wifi_rssi = data.get("wifi_rssi", 0)
                 
@@ -153,9 +399,16 @@ class WirelessWeightManager:
                     except Exception as e:
                         self.logger.error(f"Observer-Fehler: {e}")
                         
-            elif data.get("type") == "response":
-                # Kommando-Antwort (wird von send_command verarbeitet)
-                pass
+            elif data.get("type") in ("response", "status"):
+                # Kommando-Antwort an das wartende send_command() weiterreichen
+                if data.get("type") == "status":
+                    self.battery_voltage = data.get("battery_voltage", self.battery_voltage)
+                    self.wifi_rssi = data.get("wifi_rssi", self.wifi_rssi)
+                if not self._resolve_command(data):
+                    self.logger.debug(f"Antwort ohne wartendes Kommando: {data}")
+                
+            elif data.get("type") == "welcome":
+                self.logger.debug(f"ESP32 meldet sich: {data}")
                 
             else:
                 self.logger.warning(f"Unbekannte Message: {data}")
@@ -172,19 +425,24 @@ class WirelessWeightManagerAdapter:
     aber nutzt intern die ESP32-WebSocket-Verbindung.
     """
     
-    def __init__(self, esp32_ip: str, port: int = 81):
+    def __init__(self, esp32_ip: str, port: int = 81, prefer_binary: bool = True):
         self.esp32_ip = esp32_ip
         self.port = port
-        self.wireless_manager = WirelessWeightManager(esp32_ip, port)
+        self.wireless_manager = WirelessWeightManager(esp32_ip, port, prefer_binary=prefer_binary)
         self.observers: List[Callable[[float, Optional[List[float]]], None]] = []
         
         # Threading für async Operations
         self._loop = None
         self._thread = None
         self._running = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._disconnect_task: Optional[asyncio.Future] = None
+        self._supervising = False
         
         # Status
         self.connection_status = "disconnected"
+        self.backoff = ReconnectBackoff()
+        self.reconnects = 0
         
         # Logging
         self.logger = logging.getLogger(f"WirelessAdapter[{esp32_ip}]")
@@ -202,12 +460,26 @@ class WirelessWeightManagerAdapter:
     def stop(self):
         """Adapter stoppen"""
         self._running = False
-        if self._loop:
-            asyncio.run_coroutine_threadsafe(self.wireless_manager.disconnect(), self._loop)
+        loop = self._loop
+        if loop and not loop.is_closed():
+            try:
+                # Nur einen Callback einreihen: eine hier erzeugte Coroutine bliebe
+                # unerwartet liegen, wenn der Loop vor ihrer Ausführung endet
+                loop.call_soon_threadsafe(self._request_stop)
+            except RuntimeError:
+                pass  # Loop wurde gerade beendet
         if self._thread:
             self._thread.join(timeout=2)
         self.logger.info("Wireless Weight Adapter gestoppt")
     
+    def _request_stop(self):
+        """Unterbricht Backoff-Wartezeit und Verbindung (läuft im Event-Loop)"""
+        if self._wakeup:
+            self._wakeup.set()
+        if self._supervising and self._disconnect_task is None:
+            # _supervise() wartet diesen Task vor dem Ende ab
+            self._disconnect_task = asyncio.ensure_future(self.wireless_manager.disconnect())
+    
     def _run_async_loop(self):
         """Async Event Loop in separatem Thread"""
         self._loop = asyncio.new_event_loop()
@@ -217,35 +489,52 @@ class WirelessWeightManagerAdapter:
             # Observer weiterleiten
             self.wireless_manager.add_observer(self._forward_weight_data)
             
-            # Verbindung starten
-            self._loop.run_until_complete(self._connect_with_retry())
+            # Verbindung starten und dauerhaft überwachen
+            self._loop.run_until_complete(self._supervise())
             
         except Exception as e:
             self.logger.error(f"Async Loop Fehler: {e}")
         finally:
             self._loop.close()
     
-    async def _connect_with_retry(self):
-        """Verbindung mit Retry-Logik"""
-        max_retries = 5
-        retry_delay = 2
+    async def _supervise(self):
+        """
+        Verbindet unbegrenzt neu, bis stop() aufgerufen wird
         
-        for attempt in range(max_retries):
+        connect() kehrt erst zurück, wenn die Verbindung tot ist - danach
+        wird nach kurzem Backoff (mit Jitter) neu verbunden. Observer und
+        Abos bleiben über alle Wiederverbindungen erhalten.
+        """
+        self._wakeup = asyncio.Event()
+        self._disconnect_task = None
+        self._supervising = True
+        while self._running:
+            started = time.monotonic()
             try:
                 await self.wireless_manager.connect()
-                self.connection_status = "connected"
-                break
-                
             except Exception as e:
-                self.logger.warning(f"Verbindungsversuch {attempt+1}/{max_retries} fehlgeschlagen: {e}")
-                self.connection_status = f"retry {attempt+1}/{max_retries}"
-                
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    self.connection_status = "failed"
-                    self.logger.error("Alle Verbindungsversuche fehlgeschlagen")
+                # Bei dauerhaftem Ausfall nicht jede Sekunde das Log füllen
+                log = self.logger.warning if self.backoff.attempt == 0 else self.logger.debug
+                log(f"Verbindung zu ESP32 fehlgeschlagen: {e}")
+            
+            if not self._running:
+                break
+            if time.monotonic() - started >= STABLE_SESSION:
+                self.backoff.reset()
+            
+            delay = self.backoff.next_delay()
+            self.reconnects += 1
+            self.connection_status = f"reconnecting (Versuch {self.backoff.attempt})"
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        
+        if self._disconnect_task is not None:
+            await self._disconnect_task
+        # Ab hier kein await mehr - _request_stop() erzeugt danach keinen Task
+        self._supervising = False
+        self.connection_status = "stopped"
     
     def _forward_weight_data(self, total_weight: float, corner_weights: Optional[List[float]] = None):
         """Gewichtsdaten an registrierte Observer weiterleiten"""
@@ -275,35 +564,52 @@ class WirelessWeightManagerAdapter:
         """Eckgewichte lesen (WeightManager-kompatibel)"""
         return self.wireless_manager.last_corners
     
+    def add_batch_observer(self, callback: Callable[[BinaryFrame], None]):
+        """Observer für komplette Binärframes (läuft im WebSocket-Thread)"""
+        self.wireless_manager.add_batch_observer(callback)
+    
+    def remove_batch_observer(self, callback: Callable[[BinaryFrame], None]):
+        self.wireless_manager.remove_batch_observer(callback)
+    
+    def get_reading(self) -> WirelessReading:
+        """Letzter Messwert mit Empfangszeit - veraltete Werte erkennbar machen"""
+        return self.wireless_manager.get_reading()
+    
+    def subscribe(self, command: dict):
+        """Abo-Kommando senden; wird nach jedem Wiederverbinden wiederholt"""
+        if self._loop and self._running:
+            asyncio.run_coroutine_threadsafe(self.wireless_manager.subscribe(command), self._loop)
+        elif command not in self.wireless_manager.subscriptions:
+            self.wireless_manager.subscriptions.append(command)
+    
+    def send_command(self, command: dict, timeout: float = COMMAND_TIMEOUT) -> Optional[dict]:
+        """Kommando aus einem beliebigen Thread senden und auf die Antwort warten"""
+        return self._run_command(self.wireless_manager.send_command(command, timeout), timeout)
+    
     def tare(self):
         """Waage nullen (WeightManager-kompatibel)"""
-        if self._loop and self._running:
-            future = asyncio.run_coroutine_threadsafe(
-                self.wireless_manager.send_tare(), 
-                self._loop
-            )
-            try:
-                result = future.result(timeout=5)
-                self.logger.info(f"Tare-Kommando: {result}")
-                return result
-            except Exception as e:
-                self.logger.error(f"Tare fehlgeschlagen: {e}")
-                return None
+        result = self._run_command(self.wireless_manager.send_tare(), TARE_TIMEOUT)
+        self.logger.info(f"Tare-Kommando: {result}")
+        return result
     
     def calibrate(self, weight: float):
         """Kalibrierung (WeightManager-kompatibel)"""
-        if self._loop and self._running:
-            future = asyncio.run_coroutine_threadsafe(
-                self.wireless_manager.send_calibrate(weight), 
-                self._loop
-            )
-            try:
-                result = future.result(timeout=10)
-                self.logger.info(f"Kalibrierung ({weight}kg): {result}")
-                return result
-            except Exception as e:
-                self.logger.error(f"Kalibrierung fehlgeschlagen: {e}")
-                return None
+        result = self._run_command(self.wireless_manager.send_calibrate(weight), CALIBRATE_TIMEOUT)
+        self.logger.info(f"Kalibrierung ({weight}kg): {result}")
+        return result
+    
+    def _run_command(self, coro, timeout: float) -> Optional[dict]:
+        """Kommando-Coroutine im Adapter-Loop ausführen (Timeout regelt send_command)"""
+        if not (self._loop and self._running):
+            coro.close()
+            return None
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout + 1.0)
+        except Exception as e:
+            future.cancel()
+            self.logger.error(f"Kommando fehlgeschlagen: {e}")
+            return None
     
     @property
     def is_connected(self) -> bool:
@@ -312,11 +618,17 @@ class WirelessWeightManagerAdapter:
     
     def get_connection_status(self) -> dict:
         """Detaillierte Verbindungsinfo"""
+        reading = self.get_reading()
         return {
             'connected': self.is_connected,
-            'status': self.connection_status,
+            'status': 'connected' if self.is_connected else self.connection_status,
             'esp32_ip': self.esp32_ip,
-            'last_weight': self.read_weight(),
+            'last_weight': reading.total,
+            'last_update': reading.timestamp,
+            'data_age': reading.age,
+            'reconnects': self.reconnects,
+            'frame_format': self.wireless_manager.frame_format,
+            'frames_lost': self.wireless_manager.frames_lost,
             'battery_voltage': self.wireless_manager.battery_voltage,
             'wifi_rssi': self.wireless_manager.wifi_rssi
         }
\ No newline at end of file